@@ -1,36 +1,298 @@
 import sys
 import os
+import io
+import gzip
+import hashlib
+import json
+import inspect
+import logging
+import math
+import functools
+import collections
+import itertools
+import copy
+import http.client
+import urllib.parse
+import shutil
 import sqlite3
 import datetime
+import tempfile
+import re
+import textwrap
+import threading
+import time
+from functools import lru_cache
+from xml.sax.saxutils import escape, unescape
+from decimal import Decimal, ROUND_HALF_UP
 from datetime import date
-from PyQt5.QtCore import Qt, QSettings, QSize
+from PyQt5.QtCore import Qt, QDir, QSettings, QSize, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
                              QHBoxLayout, QFormLayout, QLineEdit, QLabel, QPushButton, 
                              QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
                              QFileDialog, QDateEdit, QSpinBox, QDoubleSpinBox, QGroupBox,
                              QScrollArea, QFrame, QGridLayout, QComboBox, QDialog, QTextEdit,
-                             QProgressBar, QDialogButtonBox, QAction, QToolBar)
+                             QProgressBar, QDialogButtonBox, QAction, QToolBar, QCheckBox)
 from PyQt5.QtGui import QPixmap, QFont, QIcon, QPalette, QColor
 from PyQt5.QtCore import Qt, QTimer, QDate
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import Image
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase import pdfdoc, pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFError
 from fpdf import FPDF
 from num2words import num2words
 import pandas as pd
+from PIL import Image as PILImage
 
+# Icons compiled into Qt resources by generate_icon.py, registered on import
+try:
+    import icons_rc  # noqa: F401
+except ImportError:
+    icons_rc = None
 
-def amount_to_words(amount):
-    """Convert numeric amount to words dynamically."""
-    return num2words(amount, to='currency', lang='en_IN').replace("euro", "rupees").replace("cents", "paise")
 
-def get_dynamic_invoice_data(bill_to, ship_to, ship_from, bill_no, bill_date, items, taxable_value, sgst_rate, sgst_amount, cgst_rate, cgst_amount, total, amount_in_words, signature_path):
-    return {
-        # Static company info
-        "company_gstin": "07ABCDE1234F1Z5",
+# Tracing of hot paths. While tracing is off a span costs a single attribute
+# check; while it is on, every finished span is kept with its start, duration
+# and thread so a session can be saved as Chrome trace events (open in
+# chrome://tracing or ui.perfetto.dev) or summarised as latency histograms.
+TRACE_MAX_EVENTS = 200000  # oldest spans are dropped beyond this
+TRACE_HISTOGRAM_BUCKETS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list, e.g. fraction=0.9.
+
+    The smallest value with at least `fraction` of the values at or below it:
+
+    >>> percentile(list(range(1, 11)), 0.5), percentile(list(range(1, 11)), 0.9)
+    (5, 9)
+    >>> percentile(list(range(1, 101)), 0.95), percentile(list(range(1, 101)), 0.99)
+    (95, 99)
+    >>> percentile([1, 2], 0.5), percentile([1, 2], 1.0), percentile([7], 0.01)
+    (1, 2, 7)
+    """
+    if not sorted_values:
+        return 0.0
+    # Rounded first so that e.g. 0.07 * 100 = 7.000000000000001 is rank 7
+    rank = math.ceil(round(fraction * len(sorted_values), 9))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = time.perf_counter_ns()
+
+    def finish(self):
+        end = time.perf_counter_ns()
+        self.tracer.events.append((self.name, self.start, end - self.start,
+                                   threading.get_ident(), self.args))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.finish()
+
+class _NullSpan:
+    """Stands in for a span while tracing is off."""
+    __slots__ = ()
+
+    def finish(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = collections.deque(maxlen=TRACE_MAX_EVENTS)
+        self.origin = time.perf_counter_ns()
+
+    def start(self):
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def clear(self):
+        self.events.clear()
+        self.origin = time.perf_counter_ns()
+
+    def span(self, name, **args):
+        """Time a block: `with TRACER.span("pdf.build"):`, or keep the
+        returned span and call finish() on it."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def chrome_trace(self):
+        """Recorded spans in Chrome trace-event format."""
+        pid = os.getpid()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        events = []
+        for tid in sorted({event[3] for event in self.events}):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": thread_names.get(tid, str(tid))}})
+        for name, start, duration, tid, args in list(self.events):
+            events.append({"name": name, "cat": name.split(".")[0], "ph": "X", "pid": pid, "tid": tid,
+                           "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+                           "args": {key: str(value) for key, value in args.items()}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def latency_summary(self):
+        """Count, total, percentiles and a histogram of durations per span name,
+        slowest total first. Durations are in milliseconds; the histogram maps
+        each bucket's upper bound (or "inf") to the number of spans in it."""
+        durations = {}
+        for name, _, duration, _, _ in list(self.events):
+            durations.setdefault(name, []).append(duration / 1e6)
+        summary = []
+        for name, values in durations.items():
+            values.sort()
+            histogram = dict.fromkeys([str(bound) for bound in TRACE_HISTOGRAM_BUCKETS_MS] + ["inf"], 0)
+            for value in values:
+                bound = next((bound for bound in TRACE_HISTOGRAM_BUCKETS_MS if value <= bound), "inf")
+                histogram[str(bound)] += 1
+            summary.append({
+                "name": name,
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "mean_ms": round(sum(values) / len(values), 3),
+                "p50_ms": round(percentile(values, 0.5), 3),
+                "p90_ms": round(percentile(values, 0.9), 3),
+                "p99_ms": round(percentile(values, 0.99), 3),
+                "max_ms": round(values[-1], 3),
+                "histogram": histogram,
+            })
+        summary.sort(key=lambda row: row["total_ms"], reverse=True)
+        return summary
+
+TRACER = Tracer()
+
+def traced(name=None):
+    """Decorator recording a span named after the function for every call."""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with _Span(TRACER, span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def trace_methods(prefix):
+    """Class decorator applying traced() to every method defined on the class,
+    with span names like "db.create_invoice". Generator methods are left as is
+    since their work happens after the call returns."""
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if (inspect.isfunction(value) and not attr.startswith("__")
+                    and not inspect.isgeneratorfunction(value)):
+                setattr(cls, attr, traced(f"{prefix}.{attr}")(value))
+        return cls
+    return decorate
+
+
+# Output profiles for generate_bill_pdf. "screen" is small enough to email,
+# "print" keeps signatures sharp on office printers and "archive" stores
+# lossless images together with full document metadata.
+PDF_PROFILES = {
+    "screen": {
+        "image_dpi": 150,
+        "image_format": "JPEG",
+        "jpeg_quality": 60,
+        "full_metadata": False,
+    },
+    "print": {
+        "image_dpi": 300,
+        "image_format": "JPEG",
+        "jpeg_quality": 85,
+        "full_metadata": True,
+    },
+    "archive": {
+        "image_dpi": 300,
+        "image_format": "PNG",
+        "jpeg_quality": None,
+        "full_metadata": True,
+    },
+}
+DEFAULT_PDF_PROFILE = "print"
+
+# How generate_bill_pdf lays invoices out. "auto" draws an invoice that fits
+# on one page straight onto the canvas and hands anything else to platypus;
+# "canvas" raises instead of falling back and "platypus" always uses it.
+PDF_RENDERERS = ("auto", "canvas", "platypus")
+DEFAULT_PDF_RENDERER = "auto"
+# Margin around the invoice on every side, in points
+PDF_PAGE_MARGIN = 20
+# Page content is always deflated, whatever the profile: it costs about 0.5 ms
+# an invoice and makes the file about 45% smaller
+PDF_PAGE_COMPRESSION = 1
+
+# TrueType fonts for the characters Helvetica has no glyph for, such as the
+# rupee sign and Devanagari or Odia names. Invoices in Latin text keep using
+# the built-in Helvetica and embed nothing. Each family lists candidate
+# (regular, bold) file names, looked up in the fonts directory next to the
+# application and then in PDF_FONT_DIRS. Families are tried in this order
+# for every character; the first one with a glyph for it is used. The fonts
+# directory ships subsets of Noto Serif Devanagari and Oriya, made by
+# generate_fonts.py, for machines with neither Noto Sans nor Nirmala UI.
+PDF_FONTS = {
+    "InvoiceDevanagari": (["NotoSansDevanagari-Regular.ttf", "Nirmala.ttf", "NotoSerifDevanagari-Regular.ttf"],
+                          ["NotoSansDevanagari-Bold.ttf", "NirmalaB.ttf"]),
+    "InvoiceOdia": (["NotoSansOriya-Regular.ttf", "Nirmala.ttf", "NotoSerifOriya-Regular.ttf"],
+                    ["NotoSansOriya-Bold.ttf", "NirmalaB.ttf"]),
+    "InvoiceSans": (["NotoSans-Regular.ttf", "DejaVuSans.ttf", "arial.ttf"],
+                    ["NotoSans-Bold.ttf", "DejaVuSans-Bold.ttf", "arialbd.ttf"]),
+}
+PDF_FONT_DIRS = [
+    os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+    "/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    "/usr/share/fonts/truetype/noto",
+    "/usr/share/fonts/truetype/dejavu",
+    "/usr/share/fonts/noto",
+    "/usr/share/fonts/dejavu",
+]
+pdf_logger = logging.getLogger("invoice_app.pdf")
+
+# GST rates applied to every invoice. Invoices are issued intra-state, so the
+# tax is split into CGST and SGST and no IGST is charged.
+SGST_RATE = 9
+CGST_RATE = 9
+
+# Size of the signature box in the invoice footer, in points
+SIGNATURE_WIDTH = 120
+SIGNATURE_HEIGHT = 40
+
+# Sellers invoices can be issued as, by GSTIN. Each one names the layout of
+# its invoices in INVOICE_LAYOUTS. Templates are compiled from these the first
+# time a seller is rendered, see invoice_template().
+SELLER_PROFILES = {
+    "07ABCDE1234F1Z5": {
         "company_name": "KROZTEK INTEGRATED SOLUTION",
         "office_address": "1983/0465, Badashabilata, Dhenkanal, Odisha - 759001",
         "contact_info": "Email: kroztekintegratedsolution@gmail.com\nPh: +91-9999999999",
@@ -38,6 +300,94 @@ def get_dynamic_invoice_data(bill_to, ship_to, ship_from, bill_no, bill_date, it
         "footer_bank_address": "Badashabilata, Dhenkanal, Odisha - 759001",
         "footer_note": "Thank you for your business!",
         "footer_signature_label": "Authorized Signatory",
+        "layout": "standard",
+    },
+    "21EQQS1807D1ZX": {
+        "company_name": "KROZTEK INTEGRATED SOLUTION",
+        "office_address": "1983/0465, Badashabilata, Dhenkanal, Odisha - 759001",
+        "contact_info": "Email: kroztekintegratedsolution@gmail.com\nPh: +91-9999999999",
+        "footer_bank_details": "Bank: XYZ Bank, A/c 123456789, IFSC: XYZB0001234",
+        "footer_bank_address": "Office: 1983/0465, Badashabilata, Dhenkanal, Odisha - 759001",
+        "footer_note": "Thank you for your business!",
+        "footer_signature_label": "Authorized Signatory",
+        "layout": "classic",
+    },
+}
+DEFAULT_SELLER = "07ABCDE1234F1Z5"
+
+# Invoice layouts. "seller_block" puts the seller details in a shaded band
+# under the header ("band") or inside the header table ("header"); "shade" is
+# the reportlab colour of shaded cells, None for none. Item columns are
+# (heading, item key or "index", width, alignment, wrap); only wrapped columns
+# are laid out as paragraphs.
+INVOICE_LAYOUTS = {
+    "standard": {
+        "seller_block": "band",
+        "banner": True,
+        "shade": "lightgrey",
+        "item_font_size": 9,
+        "amount_format": "{:.2f}",
+        "items": [
+            ("Sl No.", "index", 40, "CENTER", False),
+            ("SKU", "sku_code", 80, "CENTER", False),
+            ("Product", "product_name", 150, "CENTER", True),
+            ("HSN", "hsn_code", 80, "CENTER", False),
+            ("Qty", "quantity", 50, "CENTER", False),
+            ("Price per Unit", "price_per_unit", 70, "CENTER", False),
+            ("Amount", "amount", 80, "CENTER", False),
+        ],
+    },
+    "classic": {
+        "seller_block": "header",
+        "banner": False,
+        "shade": None,
+        "item_font_size": 10,
+        "amount_format": "{:,.2f}",
+        "items": [
+            ("S. No.", "index", 40, "LEFT", False),
+            ("Particulars", "product_name", 220, "LEFT", True),
+            ("HSN/SAC", "hsn_code", 80, "LEFT", False),
+            ("Qty", "quantity", 50, "RIGHT", False),
+            ("Price", "price_per_unit", 70, "RIGHT", False),
+            ("Amount", "amount", 80, "RIGHT", False),
+        ],
+    },
+}
+
+
+def calculate_invoice_totals(taxable_value, sgst_rate=SGST_RATE, cgst_rate=CGST_RATE):
+    """Tax breakdown of an invoice, with the grand total rounded off to the rupee.
+
+    Amounts are rounded half up like SQLite's ROUND, so values stored by the
+    backfill migration match the ones computed here.
+    """
+    def round_half_up(value, places):
+        return float(Decimal(str(value)).quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP))
+
+    taxable_value = round_half_up(taxable_value, 2)
+    sgst_amount = round_half_up(taxable_value * sgst_rate / 100, 2)
+    cgst_amount = round_half_up(taxable_value * cgst_rate / 100, 2)
+    exact_total = round_half_up(taxable_value + sgst_amount + cgst_amount, 2)
+    grand_total = round_half_up(exact_total, 0)
+    return {
+        "taxable_value": taxable_value,
+        "sgst_rate": sgst_rate,
+        "sgst_amount": sgst_amount,
+        "cgst_rate": cgst_rate,
+        "cgst_amount": cgst_amount,
+        "igst_amount": 0.0,
+        "round_off": round_half_up(grand_total - exact_total, 2),
+        "grand_total": grand_total,
+    }
+
+def amount_to_words(amount):
+    """Convert numeric amount to words dynamically."""
+    return num2words(amount, to='currency', lang='en_IN').replace("euro", "rupees").replace("cents", "paise")
+
+def get_dynamic_invoice_data(bill_to, ship_to, ship_from, bill_no, bill_date, items, taxable_value, sgst_rate, sgst_amount, cgst_rate, cgst_amount, total, amount_in_words, signature_path, round_off=0.0, seller=None):
+    return {
+        # Seller GSTIN, its details and layout come from SELLER_PROFILES
+        "seller": seller or DEFAULT_SELLER,
         # Dynamic fields
         "bill_to": bill_to,
         "ship_from": ship_from,
@@ -50,662 +400,4067 @@ def get_dynamic_invoice_data(bill_to, ship_to, ship_from, bill_no, bill_date, it
         "sgst_amount": sgst_amount,
         "cgst_rate": cgst_rate,
         "cgst_amount": cgst_amount,
+        "round_off": round_off,
         "total": total,
         "amount_in_words": amount_in_words,
         "signature_path": signature_path
     }
 
+def invoice_pdf_data(invoice):
+    """PDF data for a stored invoice, as returned by DatabaseManager.get_invoice_details.
 
-def generate_bill_pdf(data, filename="invoice_static.pdf"):
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        rightMargin=20,
-        leftMargin=20,
-        topMargin=20,
-        bottomMargin=20
+    Uses the totals saved with the invoice. Falls back to the default signature
+    when the one it was created with is no longer on disk.
+    """
+    signature_path = invoice['signature_path']
+    if not signature_path or not os.path.exists(signature_path):
+        signature_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "signatures", "Signature.png")
+        if not os.path.exists(signature_path):
+            raise ValueError(f"Signature file not found: {signature_path}")
+    
+    return get_dynamic_invoice_data(
+        bill_to=f"{invoice['bill_to_name']}\n{invoice['bill_to_address']}\nGSTIN: {invoice['bill_to_gst']}",
+        ship_to=f"{invoice['ship_to_name']}\n{invoice['ship_to_address']}\nGSTIN: {invoice['ship_to_gst']}",
+        ship_from=f"{invoice['ship_from_name']}\n{invoice['ship_from_address']}\nGSTIN: {invoice['ship_from_gst']}",
+        bill_no=invoice['bill_number'],
+        bill_date=invoice['bill_date'],
+        items=invoice['items'],
+        taxable_value=invoice['taxable_value'],
+        sgst_rate=invoice['sgst_rate'],
+        sgst_amount=invoice['sgst_amount'],
+        cgst_rate=invoice['cgst_rate'],
+        cgst_amount=invoice['cgst_amount'],
+        round_off=invoice['round_off'],
+        total=invoice['grand_total'],
+        amount_in_words=amount_to_words(invoice['grand_total']),
+        signature_path=signature_path,
+        seller=invoice.get('seller_gstin')
     )
 
-    styles = getSampleStyleSheet()
-    # Define custom styles
-    styles.add(ParagraphStyle(
-        name="TableHeader",
-        fontSize=8,
-        textColor=colors.white,
-        alignment=1,  # Center alignment
-        fontName='Helvetica-Bold'
-    ))
-    styles.add(ParagraphStyle(
-        name="NormalBold",
-        fontName='Helvetica-Bold',
-        fontSize=10
-    ))
-    styles.add(ParagraphStyle(
-        name="TaxInvoiceStyle",
-        fontSize=14,
-        fontName="Helvetica-Bold",
-        alignment=1
-    ))
-    styles.add(ParagraphStyle(
-        name="TableContent",
-        fontSize=9,
-        alignment=1  # Center alignment
-    ))
-    elements = []
-
-    # ----------------------------
-    # (A) HEADER SECTION with Borders
-    # ----------------------------
-    header_data = [
-        [
-            Paragraph(f"GSTIN: <b>{data['company_gstin']}</b>", styles["Normal"]),
-            Paragraph("<b>TAX INVOICE</b>", styles["TaxInvoiceStyle"]),
-            Paragraph(f"<b>Bill No:</b> {data['bill_no']}<br/><b>Date:</b> {data['bill_date']}", styles["Normal"]),
-        ]
-    ]
-    header_table = Table(header_data, colWidths=[200, 140, 200])
-    header_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
-        ("BACKGROUND", (1, 0), (1, 0), colors.grey),  # Grey background for TAX INVOICE
-        ("TEXTCOLOR", (1, 0), (1, 0), colors.white),  # White text for TAX INVOICE
-        ("TOPPADDING", (0, 0), (-1, -1), 8),  # Add top padding
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),  # Add bottom padding
-    ]))
-    elements.append(header_table)
-    elements.append(Spacer(1, 10))
-
-    # ----------------------------
-    # (B) COMPANY INFO SECTION at the Top with Borders
-    # ----------------------------
-    company_info_data = [
-        [
-            Paragraph(f"<b>{data['company_name']}</b>", ParagraphStyle(
-                'CompanyName',
-                fontSize=16,
-                alignment=1,
-                spaceAfter=6
-            ))
-        ],
-        [
-            Paragraph(data['office_address'], ParagraphStyle(
-                'OfficeAddress',
-                fontSize=11,
-                alignment=1,
-                spaceAfter=4
-            ))
-        ],
-        [
-            Paragraph(data['contact_info'], ParagraphStyle(
-                'ContactInfo',
-                fontSize=11,
-                alignment=1,
-            ))
+def invoice_export_frame(invoices):
+    """One row per invoice line, as exported to Excel from the Display Bills tab.
+
+    `invoices` are the dicts returned by DatabaseManager.get_all_invoice_details.
+    """
+    # Create a list to store all invoice data
+    excel_data = []
+    
+    for invoice in invoices:
+        # Add invoice header information
+        for item in invoice['items']:
+            excel_data.append({
+                'Bill Number': invoice['bill_number'],
+                'Date': invoice['bill_date'],
+                'Bill To': invoice['bill_to_name'],
+                'Bill To GST': invoice['bill_to_gst'],
+                'Ship To': invoice['ship_to_name'],
+                'Ship To GST': invoice['ship_to_gst'],
+                'Ship From': invoice['ship_from_name'],
+                'Ship From GST': invoice['ship_from_gst'],
+                'SKU': item['sku_code'],
+                'Product': item['product_name'],
+                'HSN': item['hsn_code'],
+                'Quantity': item['quantity'],
+                'Price per Unit': item['price_per_unit'],
+                'Amount': item['amount'],
+                'Taxable Value': invoice['taxable_value'],
+                'SGST': invoice['sgst_amount'],
+                'CGST': invoice['cgst_amount'],
+                'Round Off': invoice['round_off'],
+                'Total Amount': invoice['grand_total'],
+                'Advance Amount': invoice['advance_amount']
+            })
+    
+    # Create DataFrame
+    return pd.DataFrame(excel_data)
+
+def invoice_changes_frames(changes):
+    """(changed, deleted) DataFrames of a delta export.
+
+    `changes` is returned by DatabaseManager.get_invoice_changes. Changed
+    invoices have the rows of invoice_export_frame with whether each was
+    inserted or updated and when; deleted ones only their bill number.
+    """
+    changed = invoice_export_frame(changes['invoices'])
+    if not changed.empty:
+        by_bill = {invoice['bill_number']: invoice for invoice in changes['invoices']}
+        changed.insert(0, 'Change', [by_bill[bill]['change'] for bill in changed['Bill Number']])
+        changed.insert(2, 'Updated At', [by_bill[bill]['updated_at'] for bill in changed['Bill Number']])
+    deleted = pd.DataFrame([{'Bill Number': row['bill_number'], 'Deleted At': row['deleted_at']}
+                            for row in changes['deleted']], columns=['Bill Number', 'Deleted At'])
+    return changed, deleted
+
+
+@lru_cache(maxsize=32)
+def _load_signature_image(path, mtime, width_px, height_px, image_format, jpeg_quality):
+    """Downsample a signature to the pixel size it is printed at and re-encode it.
+
+    The result is cached per file version and profile, so repeated invoices with
+    the same signature only pay for the resize once.
+    """
+    with PILImage.open(path) as img:
+        img.load()
+        if img.width > width_px or img.height > height_px:
+            img = img.resize((width_px, height_px), PILImage.LANCZOS)
+
+        buffer = io.BytesIO()
+        if image_format == "JPEG":
+            # JPEG has no alpha channel, flatten transparent signatures onto white
+            if img.mode in ("RGBA", "LA", "P"):
+                img = img.convert("RGBA")
+                background = PILImage.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[-1])
+                img = background
+            elif img.mode != "RGB":
+                img = img.convert("RGB")
+            img.save(buffer, format="JPEG", quality=jpeg_quality, optimize=True)
+        else:
+            img.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+def _find_font_file(names, directories):
+    for name in names:
+        for directory in directories:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
+    return None
+
+@lru_cache(maxsize=None)
+def register_pdf_fonts():
+    """Register the PDF_FONTS available on this machine with reportlab.
+
+    Runs once per process, the first time a character needs one of them.
+    Returns the registered (family, TTFont) pairs in lookup order. Only the
+    glyphs a document uses are embedded in it.
+    """
+    directories = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")] + PDF_FONT_DIRS
+    registered = []
+    paths = set()
+    for family, (regular, bold) in PDF_FONTS.items():
+        regular_path = _find_font_file(regular, directories)
+        # A font covering several scripts is registered under the first family only
+        if regular_path is None or regular_path in paths:
+            continue
+        paths.add(regular_path)
+        bold_path = _find_font_file(bold, directories) or regular_path
+        try:
+            # These fonts only draw the non-Latin runs, so subsets need not
+            # carry the ASCII glyphs reportlab adds by default
+            font = TTFont(family, regular_path, asciiReadable=False)
+            bold_font = TTFont(f"{family}-Bold", bold_path, asciiReadable=False)
+        except TTFError as e:
+            pdf_logger.warning("Cannot use font %s: %s", regular_path, e)
+            continue
+        for face in {font.face, bold_font.face}:
+            # Subsets copy the name table, which is read at load time and can
+            # hold kilobytes of licence text PDF viewers never use; leave it out
+            face.table.pop('name', None)
+        pdfmetrics.registerFont(font)
+        pdfmetrics.registerFont(bold_font)
+        pdfmetrics.registerFontFamily(family, normal=family, bold=f"{family}-Bold",
+                                      italic=family, boldItalic=f"{family}-Bold")
+        registered.append((family, font))
+        pdf_logger.info("Registered PDF font %s from %s", family, regular_path)
+    return tuple(registered)
+
+@lru_cache(maxsize=4096)
+def _pdf_font_for(char):
+    """Family of PDF_FONTS to draw a character with, or None for Helvetica."""
+    try:
+        char.encode("cp1252")  # what Helvetica can show
+        return None
+    except UnicodeEncodeError:
+        pass
+    code = ord(char)
+    for family, font in register_pdf_fonts():
+        if code in font.face.charToGlyph:
+            return family
+    pdf_logger.warning("No PDF font has a glyph for %r (U+%04X); it is left to Helvetica", char, code)
+    return None
+
+_MARKUP_TAG = re.compile(r"(<[^>]*>)")
+
+def pdf_markup(text, bold=False):
+    """Paragraph markup for `text`, with every run of characters Helvetica
+    cannot show wrapped in a <font> tag of an embedded font that can.
+
+    Tags in `text` are kept; runs inside <b>, or everywhere when `bold` is
+    set for a bold paragraph style, use the bold font, since reportlab picks
+    the bold face when the <b> opens. ASCII text is returned unchanged
+    without looking at the fonts.
+
+    reportlab only joins consonant clusters (with uharfbuzz installed) in a
+    paragraph whose own font can be shaped. Text with a run in such a font
+    therefore starts with a <para> tag making it the paragraph font, and its
+    Helvetica runs get <font> tags of their own.
+    """
+    if text.isascii():
+        return text
+    # (family, bold, text) runs, with None as the family of tags and of text
+    # left to the paragraph font
+    runs = []
+    bold = int(bold)
+    shapable = {family: font for family, font in register_pdf_fonts() if font.shapable}
+    for token in _MARKUP_TAG.split(text):
+        if not token:
+            continue
+        if token.startswith("<"):
+            if token.strip("</> ").split(" ")[0].lower() in ("b", "strong"):
+                bold += -1 if token.startswith("</") else 1
+            runs.append((None, bold, token))
+            continue
+        current, start = None, 0
+        for index, char in enumerate(token):
+            if char.isspace():
+                # Spaces stay in the current run, so a line of Odia is one run
+                family = current
+            elif current in shapable and not token[index - 1].isspace() \
+                    and ord(char) in shapable[current].face.charToGlyph:
+                # reportlab shapes a word with the font it starts in, so the
+                # rest of the word, such as a trailing comma, stays in it
+                family = current
+            else:
+                family = _pdf_font_for(char)
+            if family != current and index:
+                runs.append((current, bold, token[start:index]))
+                start = index
+            current = family
+        runs.append((current, bold, token[start:]))
+
+    shaped = next((family for family, _, _ in runs if family in shapable), None)
+    parts = [f'<para face="{shaped}" shaping="1">'] if shaped else []
+    for family, run_bold, run in runs:
+        if family is None and (not shaped or run.startswith("<")):
+            parts.append(run)
+        else:
+            face = family or "Helvetica"
+            face = f"{face}-Bold" if run_bold else face
+            parts.append(f'<font face="{face}">{run}</font>')
+    if shaped:
+        parts.append("</para>")
+    return "".join(parts)
+
+def get_signature_image(signature_path, profile):
+    """Encoded bytes of the signature, downsampled for the given profile."""
+    settings = PDF_PROFILES[profile]
+    width_px = max(1, round(SIGNATURE_WIDTH / 72 * settings["image_dpi"]))
+    height_px = max(1, round(SIGNATURE_HEIGHT / 72 * settings["image_dpi"]))
+    return _load_signature_image(
+        os.path.abspath(signature_path),
+        os.path.getmtime(signature_path),
+        width_px,
+        height_px,
+        settings["image_format"],
+        settings["jpeg_quality"],
+    )
+
+class _CanvasUnsupported(Exception):
+    """Raised while laying out an invoice the canvas renderer cannot draw
+    exactly like platypus. Nothing has been drawn when it is raised."""
+
+# Platypus frames keep this much padding inside the page margins
+_FRAME_PADDING = 6
+_CANVAS_SPACE = re.compile(r"[ \t\r\n]+")
+# Entities other than these, and an & not followed by a space, are read by
+# the platypus markup parser in ways the canvas renderer does not follow
+_CANVAS_ENTITY = re.compile(r"&(?!(?:amp|lt|gt|quot|apos);|\s|$)")
+# Cell style of a platypus Table cell no TableStyle command applies to
+_CELL_DEFAULTS = {
+    "fontname": "Helvetica",
+    "fontsize": 10,
+    "leading": 12,
+    "color": colors.black,
+    "alignment": "LEFT",
+    "valign": "BOTTOM",
+    "leftPadding": 6,
+    "rightPadding": 6,
+    "topPadding": 3,
+    "bottomPadding": 3,
+}
+_CELL_COMMANDS = {
+    "FONTNAME": "fontname",
+    "FONTSIZE": "fontsize",
+    "LEADING": "leading",
+    "TEXTCOLOR": "color",
+    "ALIGN": "alignment",
+    "VALIGN": "valign",
+    "LEFTPADDING": "leftPadding",
+    "RIGHTPADDING": "rightPadding",
+    "TOPPADDING": "topPadding",
+    "BOTTOMPADDING": "bottomPadding",
+}
+
+@lru_cache(maxsize=16384)
+def _string_width(text, font, size):
+    return pdfmetrics.stringWidth(text, font, size)
+
+class _CanvasText:
+    """Paragraph markup drawn straight onto a canvas.
+
+    Lines are broken and placed as a platypus Paragraph of the same style
+    would break and place them. Only <b>, <strong> and <br/> tags and text
+    the standard fonts can show are understood, anything else raises
+    _CanvasUnsupported.
+    """
+    def __init__(self, markup, style):
+        if style.alignment not in (0, 1, 2) or _CANVAS_ENTITY.search(markup):
+            raise _CanvasUnsupported("paragraph needs platypus")
+        try:
+            family, style_bold, italic = ps2tt(style.fontName)
+        except ValueError:
+            raise _CanvasUnsupported(f"font {style.fontName}")
+        self.font_size = style.fontSize
+        self.leading = style.leading
+        self.alignment = style.alignment
+        self.color = style.textColor
+
+        # Words of every line started by a <br/>, as [runs, width] where the
+        # runs are [font, text] pairs
+        lines = [[]]
+        word = None
+        bold = 0
+        for token in _MARKUP_TAG.split(markup):
+            if token.startswith("<") and token.endswith(">"):
+                tag = token.strip("</> ").lower()
+                if tag in ("b", "strong"):
+                    bold += -1 if token.startswith("</") else 1
+                elif tag == "br":
+                    lines.append([])
+                    word = None
+                else:
+                    raise _CanvasUnsupported(f"tag {token}")
+                continue
+            font = tt2ps(family, 1 if bold > 0 or style_bold else 0, italic)
+            for index, piece in enumerate(_CANVAS_SPACE.split(token)):
+                if index:
+                    word = None
+                if not piece:
+                    continue
+                text = unescape(piece)
+                # Platypus treats these as breaking or hyphenation points
+                if "<" in piece or ">" in piece or any(char.isspace() or char == "\xad" for char in text):
+                    raise _CanvasUnsupported(f"text {piece!r}")
+                try:
+                    text.encode("cp1252")
+                except UnicodeEncodeError:
+                    raise _CanvasUnsupported(f"text {piece!r}")
+                if word is None:
+                    word = [[], 0]
+                    lines[-1].append(word)
+                if word[0] and word[0][-1][0] == font:
+                    word[0][-1][1] += text
+                else:
+                    word[0].append([font, text])
+                word[1] += _string_width(text, font, self.font_size)
+
+        # Like platypus, a trailing <br/> does not start an empty line and
+        # text without words has no lines at all
+        if len(lines) > 1 and not lines[-1]:
+            lines.pop()
+        self.lines = lines if any(lines) else []
+        self._wrapped = {}
+
+    def wrap(self, width):
+        """The lines of the text broken to fit `width`, as (runs, line width,
+        word count). Cached per width."""
+        wrapped = self._wrapped.get(width)
+        if wrapped is not None:
+            return wrapped
+        wrapped = []
+        for words in self.lines:
+            runs, line_width, count = [], 0, 0
+            for word_runs, word_width in words:
+                if word_width >= width:
+                    # Platypus splits words wider than the column
+                    raise _CanvasUnsupported("word wider than its column")
+                if count:
+                    space = _string_width(" ", runs[-1][0], self.font_size)
+                    # Spaces may shrink a little to fit one more word on a line
+                    if line_width + space + word_width > width + rl_config.spaceShrinkage * space * count:
+                        wrapped.append((runs, line_width, count))
+                        runs, line_width, count = [], 0, 0
+                    else:
+                        runs[-1][1] += " "
+                        line_width += space
+                for font, text in word_runs:
+                    if runs and runs[-1][0] == font:
+                        runs[-1][1] += text
+                    else:
+                        runs.append([font, text])
+                line_width += word_width
+                count += 1
+            wrapped.append((runs, line_width, count))
+        self._wrapped[width] = wrapped
+        return wrapped
+
+    def height(self, width):
+        return len(self.wrap(width)) * self.leading
+
+    def draw(self, canv, x, y, width):
+        """Draw the text wrapped to `width` with its bottom left corner at (x, y)."""
+        lines = self.wrap(width)
+        # Position the lines the way Paragraph.drawOn does, so viewers round
+        # glyph positions to the same pixels
+        canv.saveState()
+        canv.translate(x, y)
+        text = canv.beginText(0, len(lines) * self.leading - self.font_size)
+        current = None
+        for runs, line_width, count in lines:
+            if not runs:
+                text.moveCursor(0, self.leading)
+                continue
+            extra = width - line_width
+            squeezed = extra < -1e-8 and count > 1
+            offset = 0 if squeezed else extra * self.alignment / 2
+            if offset:
+                text.setXPos(offset)
+            if squeezed:
+                text.setWordSpace(extra / (count - 1))
+            for index, (font, chunk) in enumerate(runs, 1):
+                if font != current:
+                    text.setFont(font, self.font_size, self.leading)
+                    current = font
+                # textLine moves to the next line without measuring the run
+                if index == len(runs):
+                    text.textLine(chunk)
+                else:
+                    text.textOut(chunk)
+            if squeezed:
+                text.setWordSpace(0)
+            if offset:
+                text.setXPos(-offset)
+        canv.setFillColor(self.color)
+        canv.drawText(text)
+        canv.restoreState()
+
+@lru_cache(maxsize=32)
+def _pdf_image(image_bytes):
+    """The PDF image object of encoded image bytes, built once and shared by
+    every canvas invoice that draws them. None for images with an alpha
+    channel, whose soft mask belongs to a single document."""
+    image = pdfdoc.PDFImageXObject(f"Img{hashlib.md5(image_bytes).hexdigest()}",
+                                   ImageReader(io.BytesIO(image_bytes)), mask="auto")
+    if getattr(image, "_smask", None) is not None:
+        return None
+    image.XObjects = None
+    return image
+
+class _CanvasImage:
+    """An image cell of a _CanvasTable."""
+    def __init__(self, image_bytes, width, height):
+        self.image_bytes = image_bytes
+        self.width = width
+        self.height = height
+
+    def draw(self, canv, x, y, width):
+        image = _pdf_image(self.image_bytes)
+        if image is None:
+            canv.drawImage(ImageReader(io.BytesIO(self.image_bytes)), x, y, self.width, self.height, mask="auto")
+            return
+        if not canv.hasForm(image.name):
+            # What drawImage does, without decoding and encoding the image
+            # again. Documents mark the objects they hold, so each gets a copy.
+            image = copy.copy(image)
+            canv._doc.Reference(image, canv._doc.getXObjectName(image.name))
+            canv._doc.addForm(image.name, image)
+        canv.saveState()
+        canv.translate(x, y)
+        canv.scale(self.width, self.height)
+        canv.doForm(image.name)
+        canv.restoreState()
+
+class _CanvasTable:
+    """Rows of strings, _CanvasText and _CanvasImage cells, sized and drawn
+    like a platypus Table with the same column widths and TableStyle.
+
+    Understands the style commands of the invoice templates: cell fonts,
+    colours, alignment and padding, BACKGROUND, BOX, INNERGRID, GRID and
+    single row SPANs. Other commands raise _CanvasUnsupported.
+    """
+    def __init__(self, rows, col_widths, style):
+        n_rows, n_cols = len(rows), len(col_widths)
+        styles = [[dict(_CELL_DEFAULTS) for _ in range(n_cols)] for _ in range(n_rows)]
+        self.backgrounds = []
+        self.lines = []
+        spans = {}
+        hidden = set()
+        for command in style.getCommands():
+            op, (sc, sr), (ec, er) = command[:3]
+            if isinstance(sr, str) or isinstance(er, str):
+                raise _CanvasUnsupported(f"{op} on split rows")
+            sc, ec = (sc + n_cols if sc < 0 else sc), (ec + n_cols if ec < 0 else ec)
+            sr, er = (sr + n_rows if sr < 0 else sr), (er + n_rows if er < 0 else er)
+            if op in _CELL_COMMANDS:
+                key, value = _CELL_COMMANDS[op], command[3]
+                if key == "color":
+                    value = colors.toColor(value)
+                elif (key == "alignment" and value not in ("LEFT", "RIGHT", "CENTER", "CENTRE")
+                      or key == "valign" and value not in ("TOP", "MIDDLE", "BOTTOM")):
+                    raise _CanvasUnsupported(f"{op} {value}")
+                for row in styles[sr:er + 1]:
+                    for cell in row[sc:ec + 1]:
+                        cell[key] = value
+            elif op == "BACKGROUND" and not isinstance(command[3], (list, tuple)):
+                self.backgrounds.append((sc, sr, min(ec + 1, n_cols), min(er + 1, n_rows),
+                                         colors.toColor(command[3])))
+            elif op in ("BOX", "INNERGRID", "GRID") and len(command) == 5:
+                self.lines.append((op, sc, sr, ec, er, command[3], colors.toColor(command[4])))
+            elif op == "SPAN" and sr == er:
+                spans[sc, sr] = ec
+                hidden.update((col, sr) for col in range(sc + 1, ec + 1))
+            else:
+                raise _CanvasUnsupported(f"table command {op}")
+        if spans and any(line[0] != "BOX" for line in self.lines):
+            # Platypus leaves inner lines out of spanned cells
+            raise _CanvasUnsupported("grid lines across spanned cells")
+
+        self.col_positions = [0]
+        for width in col_widths:
+            self.col_positions.append(self.col_positions[-1] + width)
+        self.width = self.col_positions[-1]
+        # (row, column, value, cell style, width) of every cell that is drawn
+        self.cells = []
+        self.row_heights = []
+        for row_index, row in enumerate(rows):
+            row_height = 0
+            for col_index, value in enumerate(row):
+                if (col_index, row_index) in hidden:
+                    continue
+                cell = styles[row_index][col_index]
+                width = (self.col_positions[spans.get((col_index, row_index), col_index) + 1]
+                         - self.col_positions[col_index])
+                if isinstance(value, _CanvasText):
+                    height = value.height(width - cell["leftPadding"] - cell["rightPadding"])
+                elif isinstance(value, _CanvasImage):
+                    height = value.height
+                else:
+                    height = (cell["leading"] or 1.2 * cell["fontsize"]) * len(str(value).split("\n"))
+                row_height = max(row_height, height + cell["topPadding"] + cell["bottomPadding"])
+                self.cells.append((row_index, col_index, value, cell, width))
+            self.row_heights.append(row_height)
+        self.height = sum(self.row_heights)
+
+    def draw(self, canv, x, y, width=None):
+        """Draw the table with its bottom left corner at (x, y)."""
+        canv.saveState()
+        canv.translate(x, y)
+        cols = self.col_positions
+        rows = [self.height]
+        for row_height in self.row_heights:
+            rows.append(rows[-1] - row_height)
+
+        for sc, sr, ec, er, color in self.backgrounds:
+            canv.setFillColor(color)
+            canv.rect(cols[sc], rows[sr], cols[ec] - cols[sc], rows[er] - rows[sr], stroke=0, fill=1)
+
+        strings = canv.beginText()
+        font = color = None
+        for row_index, col_index, value, cell, width in self.cells:
+            left, bottom, row_height = cols[col_index], rows[row_index + 1], self.row_heights[row_index]
+            align, valign = cell["alignment"], cell["valign"]
+            if isinstance(value, (_CanvasText, _CanvasImage)):
+                inner = width - cell["leftPadding"] - cell["rightPadding"]
+                if isinstance(value, _CanvasText):
+                    content_width, content_height = inner, value.height(inner)
+                else:
+                    content_width, content_height = value.width, value.height
+                if valign == "TOP":
+                    y0 = bottom + row_height - cell["topPadding"] - content_height
+                elif valign == "BOTTOM":
+                    y0 = bottom + cell["bottomPadding"]
+                else:
+                    y0 = bottom + (row_height + cell["bottomPadding"] - cell["topPadding"] - content_height) / 2
+                if align == "LEFT":
+                    x0 = left + cell["leftPadding"]
+                elif align == "RIGHT":
+                    x0 = left + width - cell["rightPadding"] - content_width
+                else:
+                    x0 = left + (width + cell["leftPadding"] - cell["rightPadding"] - content_width) / 2
+                value.draw(canv, x0, y0, inner)
+                continue
+
+            # Plain cells share one text object instead of one per string
+            if cell["color"] is not color:
+                color = cell["color"]
+                strings.setFillColor(color)
+            if (cell["fontname"], cell["fontsize"], cell["leading"]) != font:
+                font = (cell["fontname"], cell["fontsize"], cell["leading"])
+                strings.setFont(*font)
+            if align == "LEFT":
+                x0, shift = left + cell["leftPadding"], 0
+            elif align == "RIGHT":
+                x0, shift = left + width - cell["rightPadding"], 1
+            else:
+                x0, shift = left + (width + cell["leftPadding"] - cell["rightPadding"]) * 0.5, 0.5
+            lines = str(value).split("\n")
+            leading, font_size = cell["leading"], cell["fontsize"]
+            if valign == "BOTTOM":
+                y0 = bottom + cell["bottomPadding"] + len(lines) * leading - font_size
+            elif valign == "TOP":
+                y0 = bottom + row_height - cell["topPadding"] - font_size
+            else:
+                y0 = bottom + (cell["bottomPadding"] + row_height - cell["topPadding"] + len(lines) * leading) / 2 - font_size
+            for line in lines:
+                strings.setTextOrigin(x0 - shift * _string_width(line, font[0], font_size) if shift else x0, y0)
+                strings.textLine(line)
+                y0 -= leading
+        canv.drawText(strings)
+
+        # Platypus draws table lines with round caps and joins
+        canv.setLineCap(1)
+        canv.setLineJoin(1)
+        for op, sc, sr, ec, er, weight, color in self.lines:
+            canv.setStrokeColor(color)
+            canv.setLineWidth(weight)
+            h_lines, v_lines = [], []
+            if op != "INNERGRID":
+                h_lines += [sr, er + 1]
+                v_lines += [sc, ec + 1]
+            if op != "BOX":
+                h_lines += range(sr + 1, er + 1)
+                v_lines += range(sc + 1, ec + 1)
+            for row in h_lines:
+                canv.line(cols[sc], rows[row], cols[ec + 1], rows[row])
+            for col in v_lines:
+                canv.line(cols[col], rows[er + 1], cols[col], rows[sr])
+        canv.restoreState()
+
+class InvoiceTemplate:
+    """A seller and a layout compiled into everything their invoices share.
+
+    Paragraph and table styles, column widths and the seller's paragraphs
+    (parsed once) are built here; flowables() and canvas_blocks() only lay out
+    the fields of the invoice itself. Use invoice_template(), which compiles
+    each seller and layout once.
+    """
+    def __init__(self, gstin, seller, layout):
+        self.gstin = gstin
+        self.seller = seller
+        self.layout = layout
+        self.amount_format = layout["amount_format"]
+        self.item_columns = layout["items"]
+        shade = getattr(colors, layout["shade"]) if layout["shade"] else None
+        padding = [
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 4),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
         ]
-    ]
-
-    company_info_table = Table(company_info_data, colWidths=[540])
-    company_info_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("LEFTPADDING", (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("BACKGROUND", (0, 0), (-1, -1), colors.lightgrey),  # Light grey background
-    ]))
-
-    elements.append(company_info_table)
-    elements.append(Spacer(1, 10))
-
-    # ----------------------------
-    # (C) BILL TO / SHIP FROM / SHIP TO with Borders
-    # ----------------------------
-    addresses_data = [
-        [
-            Paragraph("<b>BILL TO</b><br/>" + data["bill_to"], styles["Normal"]),
-            Paragraph("<b>SHIP FROM</b><br/>" + data["ship_from"], styles["Normal"]),
-            Paragraph("<b>SHIP TO</b><br/>" + data["ship_to"], styles["Normal"]),
+        grid = [
+            ("BOX", (0, 0), (-1, -1), 1, colors.black),
+            ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
         ]
-    ]
-    addresses_table = Table(addresses_data, colWidths=[180, 180, 180])
-    addresses_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
-        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),  # Light grey background for headers
-    ]))
-    elements.append(addresses_table)
-    elements.append(Spacer(1, 10))
-
-    # ----------------------------
-    # (D) ITEMS TABLE with Updated Dynamic Fields
-    # ----------------------------
-    items_data = [[
-        Paragraph("<b>Sl No.</b>", styles["TableHeader"]),
-        Paragraph("<b>SKU</b>", styles["TableHeader"]),
-        Paragraph("<b>Product</b>", styles["TableHeader"]),
-        Paragraph("<b>HSN</b>", styles["TableHeader"]),
-        Paragraph("<b>Qty</b>", styles["TableHeader"]),
-        Paragraph("<b>Price per Unit</b>", styles["TableHeader"]),
-        Paragraph("<b>Amount</b>", styles["TableHeader"]),
-    ]]
-
-    if data["items"]:
-        for idx, item in enumerate(data["items"], 1):
-            items_data.append([
-                Paragraph(str(idx), styles["TableContent"]),
-                Paragraph(item.get("sku_code", "N/A"), styles["TableContent"]),
-                Paragraph(item.get("product_name", "N/A"), styles["TableContent"]),
-                Paragraph(item.get("hsn_code", "N/A"), styles["TableContent"]),
-                Paragraph(str(item.get("quantity", 0)), styles["TableContent"]),
-                Paragraph(f"{item.get('price_per_unit', 0):.2f}", styles["TableContent"]),
-                Paragraph(f"{item.get('amount', 0):.2f}", styles["TableContent"]),
+        shaded = [("BACKGROUND", (0, 0), (-1, -1), shade)] if shade else []
+
+        self.normal = getSampleStyleSheet()["Normal"]
+        title_style = ParagraphStyle("TaxInvoiceStyle", fontSize=14, fontName="Helvetica-Bold", alignment=1)
+        heading_style = ParagraphStyle("TableHeader", fontSize=8, textColor=colors.white, alignment=1,
+                                       fontName="Helvetica-Bold")
+        alignments = {"LEFT": 0, "CENTER": 1, "RIGHT": 2}
+        self.wrap_styles = {
+            align: ParagraphStyle(f"TableContent{align}", fontSize=layout["item_font_size"], leading=12,
+                                  alignment=alignments[align])
+            for align in alignments
+        }
+
+        # Seller details never change between invoices, parse them once
+        self._static = {}
+        self._canvas_static = {}
+        self._parse("gstin", f"GSTIN: <b>{gstin}</b>", self.normal)
+        self._parse("title", "<b>TAX INVOICE</b>", title_style if layout["banner"] else self.normal)
+        if layout["seller_block"] == "band":
+            self._parse("company_name", f"<b>{seller['company_name']}</b>",
+                        ParagraphStyle("CompanyName", fontSize=16, alignment=1, spaceAfter=6))
+            self._parse("office_address", seller["office_address"],
+                        ParagraphStyle("OfficeAddress", fontSize=11, alignment=1, spaceAfter=4))
+            self._parse("contact_info", seller["contact_info"],
+                        ParagraphStyle("ContactInfo", fontSize=11, alignment=1))
+        else:
+            self._parse("company_name", f"<b>{seller['company_name']}</b>", self.normal)
+            self._parse("office_address", seller["office_address"], self.normal)
+            self._parse("contact_info", seller["contact_info"], self.normal)
+        self._parse("bank_details", f"<b>Bank Details:</b><br/>{seller['footer_bank_details']}"
+                                    f"<br/><br/>{seller['footer_bank_address']}", self.normal)
+        self._parse("footer_note", seller["footer_note"], self.normal)
+        self._parse("signature_label", f"<br/><b>{seller['footer_signature_label']}</b>", self.normal)
+        for index, (heading, _, _, _, _) in enumerate(self.item_columns):
+            self._parse(f"heading_{index}", f"<b>{heading}</b>", heading_style)
+
+        self.header_widths = [200, 140, 200]
+        if layout["seller_block"] == "band":
+            self.header_style = TableStyle(grid + [
+                ("BACKGROUND", (1, 0), (1, 0), colors.grey),
+                ("TEXTCOLOR", (1, 0), (1, 0), colors.white),
+                ("TOPPADDING", (0, 0), (-1, -1), 8),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
             ])
-    else:
-        items_data.append([
-            Paragraph("", styles["TableContent"]),
-            Paragraph("No products available", styles["TableContent"]),
-            Paragraph("", styles["TableContent"]),
-            Paragraph("", styles["TableContent"]),
-            Paragraph("", styles["TableContent"]),
-            Paragraph("", styles["TableContent"]),
-            Paragraph("", styles["TableContent"]),
-        ])
+            self.band_style = TableStyle([("BOX", (0, 0), (-1, -1), 1, colors.black)] + padding + shaded)
+        else:
+            self.header_style = TableStyle([
+                ("SPAN", (1, 1), (2, 1)),
+                ("SPAN", (1, 2), (2, 2)),
+                ("BOX", (0, 0), (-1, -1), 1, colors.black),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ] + padding)
+            self.band_style = None
+        self.addresses_style = TableStyle(grid + ([("BACKGROUND", (0, 0), (-1, 0), shade)] if shade else []))
 
-    items_table = Table(items_data, colWidths=[40, 80, 150, 80, 50, 70, 80])
-    items_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
-        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-        ("LEFTPADDING", (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-        ("FONTSIZE", (0, 0), (-1, -1), 9),
-    ]))
-    elements.append(items_table)
-    elements.append(Spacer(1, 10))
-
-    # ----------------------------
-    # (E) TAX DETAILS & TOTALS with Borders
-    # ----------------------------
-    totals_data = [
-        ["Taxable Value", f"{data['taxable_value']:.2f}"],
-        [f"SGST {data['sgst_rate']}% on {data['taxable_value']:.2f}", f"{data['sgst_amount']:.2f}"],
-        [f"CGST {data['cgst_rate']}% on {data['taxable_value']:.2f}", f"{data['cgst_amount']:.2f}"],
-        ["Total", f"{data['total']:.2f}"]
-    ]
-    totals_table = Table(totals_data, colWidths=[400, 140])
-    totals_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
-        ("BACKGROUND", (-1, -1), (-1, -1), colors.lightgrey),  # Light grey background for total
-        ("FONTNAME", (-1, -1), (-1, -1), "Helvetica-Bold"),  # Bold for total
-        ("ALIGN", (0, 0), (-1, -1), "RIGHT"),  # Right align all cells
-        ("LEFTPADDING", (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-    ]))
-
-    elements.append(Spacer(1, 10))
-    elements.append(totals_table)
-    elements.append(Spacer(1, 10))
-
-    # Amount in words
-    elements.append(Paragraph(f"<b>Amount in Words:</b> {data['amount_in_words']}", styles["Normal"]))
-    elements.append(Spacer(1, 10))
-
-    # ----------------------------
-    # (F) FOOTER with Borders
-    # ----------------------------
-    signature_path = data.get("signature_path")
-    signature_img = Image(signature_path, width=120, height=40)
-
-    footer_data = [
-        [
-            Paragraph(f"<b>Bank Details:</b><br/>{data['footer_bank_details']}<br/><br/>{data['footer_bank_address']}", styles["Normal"]),
-            signature_img
-        ],
-        [
-            Paragraph(f"{data['footer_note']}", styles["Normal"]),
-            Paragraph(f"<br/><b>{data['footer_signature_label']}</b>", styles["Normal"]),
+        body_font = [
+            ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), layout["item_font_size"]),
+            ("LEADING", (0, 1), (-1, -1), 12),
+        ]
+        self.items_style = TableStyle(grid + [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ] + [("ALIGN", (index, 0), (index, -1), column[3]) for index, column in enumerate(self.item_columns)]
+          + padding + body_font)
+        self.item_widths = [column[2] for column in self.item_columns]
+
+        self.totals_style = TableStyle(grid + [
+            ("FONTNAME", (-1, -1), (-1, -1), "Helvetica-Bold"),
+            ("ALIGN", (0, 0), (-1, -1), "RIGHT"),
+        ] + padding + ([("BACKGROUND", (-1, -1), (-1, -1), shade)] if shade else []))
+        self.footer_style = TableStyle(grid + padding + shaded)
+
+    def _parse(self, name, markup, style):
+        markup = pdf_markup(markup, bold=style.fontName.endswith("-Bold"))
+        self._static[name] = Paragraph(markup, style)
+        try:
+            self._canvas_static[name] = _CanvasText(markup, style)
+        except _CanvasUnsupported:
+            # Invoices of this seller are always laid out by platypus
+            self._canvas_static[name] = None
+
+    def _paragraph(self, name):
+        """A new Paragraph sharing the parsed text of a static one."""
+        parsed = self._static[name]
+        return Paragraph(parsed.text, parsed.style, frags=parsed.frags)
+
+    def _canvas_text(self, name):
+        """The _CanvasText of a static paragraph. It is drawn as is and can be
+        shared by every invoice."""
+        text = self._canvas_static[name]
+        if text is None:
+            raise _CanvasUnsupported(f"{name} needs platypus")
+        return text
+
+    def metadata(self, data, profile):
+        """Document info dictionary entries for the given profile."""
+        metadata = {
+            "title": f"Tax Invoice {data['bill_no']}",
+            "creator": "Invoice Management System",
+        }
+        if PDF_PROFILES[profile]["full_metadata"]:
+            metadata.update({
+                "author": self.seller["company_name"],
+                "subject": f"Tax invoice {data['bill_no']} dated {data['bill_date']}",
+                "keywords": f"invoice, GST, {data['bill_no']}, {self.gstin}",
+            })
+        return metadata
+
+    def item_rows(self, items, canvas=False):
+        text, static = (_CanvasText, self._canvas_text) if canvas else (Paragraph, self._paragraph)
+        rows = [[static(f"heading_{index}") for index in range(len(self.item_columns))]]
+        for number, item in enumerate(items, 1):
+            row = []
+            for _, key, _, align, wrap in self.item_columns:
+                if key == "index":
+                    value = str(number)
+                elif key in ("price_per_unit", "amount"):
+                    value = self.amount_format.format(item.get(key, 0))
+                else:
+                    value = str(item.get(key, 0 if key == "quantity" else "N/A"))
+                # Only wrapped columns and text Helvetica cannot show pay for a
+                # Paragraph, the rest are plain cells
+                if wrap or not value.isascii():
+                    value = text(pdf_markup(escape(value)), self.wrap_styles[align])
+                row.append(value)
+            rows.append(row)
+        if not items:
+            rows.append([""] * len(self.item_columns))
+            rows[-1][1] = "No products available"
+        return rows
+
+    def _blocks(self, data, signature, canvas=False):
+        """The invoice from top to bottom as ("table", rows, widths, style,
+        repeat rows), ("text", paragraph) and ("space", height) blocks. Text is
+        made of Paragraphs, or of _CanvasText for the canvas renderer."""
+        text, static = (_CanvasText, self._canvas_text) if canvas else (Paragraph, self._paragraph)
+        amount = self.amount_format.format
+        bill = text(pdf_markup(f"<b>Bill No:</b> {data['bill_no']}<br/><b>Date:</b> {data['bill_date']}"),
+                    self.normal)
+        blocks = []
+
+        # (A) Header, with the seller details in a band below it or inside it
+        if self.band_style is not None:
+            blocks.append(("table", [[static("gstin"), static("title"), bill]],
+                           self.header_widths, self.header_style, 0))
+            blocks.append(("space", 10))
+            blocks.append(("table", [[static("company_name")], [static("office_address")],
+                                     [static("contact_info")]],
+                           [sum(self.header_widths)], self.band_style, 0))
+        else:
+            blocks.append(("table", [
+                [static("gstin"), static("title"), bill],
+                [static("company_name"), "", ""],
+                [static("office_address"), static("contact_info"), ""],
+            ], self.header_widths, self.header_style, 0))
+        blocks.append(("space", 10))
+
+        # (B) Bill to / ship from / ship to
+        blocks.append(("table", [[
+            text(pdf_markup("<b>BILL TO</b><br/>" + data["bill_to"]), self.normal),
+            text(pdf_markup("<b>SHIP FROM</b><br/>" + data["ship_from"]), self.normal),
+            text(pdf_markup("<b>SHIP TO</b><br/>" + data["ship_to"]), self.normal),
+        ]], [180, 180, 180], self.addresses_style, 0))
+        blocks.append(("space", 10))
+
+        # (C) Items
+        blocks.append(("table", self.item_rows(data["items"], canvas), self.item_widths, self.items_style, 1))
+        blocks.append(("space", 10))
+
+        # (D) Tax details and totals
+        totals_data = [
+            ["Taxable Value", amount(data['taxable_value'])],
+            [f"SGST {data['sgst_rate']}% on {amount(data['taxable_value'])}", amount(data['sgst_amount'])],
+            [f"CGST {data['cgst_rate']}% on {amount(data['taxable_value'])}", amount(data['cgst_amount'])],
         ]
-    ]
-
-    footer_table = Table(footer_data, colWidths=[380, 160])
-    footer_table.setStyle(TableStyle([
-        ("BOX", (0, 0), (-1, -1), 1, colors.black),
-        ("INNERGRID", (0, 0), (-1, -1), 0.5, colors.black),
-        ("BACKGROUND", (0, 0), (-1, -1), colors.lightgrey),  # Light grey background
-        ("LEFTPADDING", (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-    ]))
-    elements.append(footer_table)
+        if data.get("round_off"):
+            totals_data.append(["Round Off", f"{data['round_off']:+.2f}"])
+        totals_data.append(["Total", amount(data['total'])])
+        blocks.append(("space", 10))
+        blocks.append(("table", totals_data, [400, 140], self.totals_style, 0))
+        blocks.append(("space", 10))
+        blocks.append(("text", text(pdf_markup(f"<b>Amount in Words:</b> {data['amount_in_words']}"),
+                                    self.normal)))
+        blocks.append(("space", 10))
+
+        # (E) Footer
+        blocks.append(("table", [
+            [static("bank_details"), signature],
+            [static("footer_note"), static("signature_label")],
+        ], [380, 160], self.footer_style, 0))
+        return blocks
+
+    def flowables(self, data, signature_img):
+        elements = []
+        for block in self._blocks(data, signature_img):
+            if block[0] == "table":
+                _, rows, widths, style, repeat_rows = block
+                elements.append(Table(rows, colWidths=widths, style=style, repeatRows=repeat_rows))
+            elif block[0] == "text":
+                elements.append(block[1])
+            else:
+                elements.append(Spacer(1, block[1]))
+        return elements
+
+    def canvas_blocks(self, data, signature_bytes):
+        """The invoice laid out on a single page for draw_canvas(), as
+        (table or text, x, y, width) with the bottom left corner of each.
+
+        Raises _CanvasUnsupported for invoices that need platypus: more than
+        a page long, or with text _CanvasText cannot draw exactly like it.
+        """
+        left = PDF_PAGE_MARGIN + _FRAME_PADDING
+        frame_width = A4[0] - 2 * left
+        top = A4[1] - left
+        signature = _CanvasImage(signature_bytes, SIGNATURE_WIDTH, SIGNATURE_HEIGHT)
+        placed = []
+        for block in self._blocks(data, signature, canvas=True):
+            if block[0] == "space":
+                top -= block[1]
+                continue
+            if block[0] == "table":
+                item = _CanvasTable(block[1], block[2], block[3])
+                # Platypus centres tables in the frame, even ones wider than it
+                x, width, height = left + (frame_width - item.width) / 2, item.width, item.height
+            else:
+                item = block[1]
+                x, width, height = left, frame_width, item.height(frame_width)
+            top -= height
+            if top < left:
+                raise _CanvasUnsupported("invoice does not fit on one page")
+            placed.append((item, x, top, width))
+        return placed
+
+    def draw_canvas(self, blocks, filename, data, profile):
+        """Draw the canvas_blocks() of an invoice into a one page PDF."""
+        canv = Canvas(filename, pagesize=A4, pageCompression=PDF_PAGE_COMPRESSION)
+        metadata = self.metadata(data, profile)
+        # The document info SimpleDocTemplate would write
+        canv.setAuthor(metadata.get("author"))
+        canv.setTitle(metadata.get("title"))
+        canv.setSubject(metadata.get("subject"))
+        canv.setCreator(metadata.get("creator"))
+        canv.setProducer(None)
+        canv.setKeywords(metadata.get("keywords", []))
+        for item, x, y, width in blocks:
+            item.draw(canv, x, y, width)
+        canv.showPage()
+        canv.save()
+
+@lru_cache(maxsize=None)
+def _compile_invoice_template(seller, layout):
+    return InvoiceTemplate(seller, SELLER_PROFILES[seller], INVOICE_LAYOUTS[layout])
+
+def invoice_template(seller=None, layout=None):
+    """The compiled template of a seller GSTIN (DEFAULT_SELLER if None), in the
+    seller's own layout unless `layout` is given. Call
+    _compile_invoice_template.cache_clear() after changing SELLER_PROFILES or
+    INVOICE_LAYOUTS at runtime."""
+    seller = seller or DEFAULT_SELLER
+    if seller not in SELLER_PROFILES:
+        raise ValueError(f"Unknown seller GSTIN: {seller}")
+    layout = layout or SELLER_PROFILES[seller]["layout"]
+    if layout not in INVOICE_LAYOUTS:
+        raise ValueError(f"Unknown invoice layout: {layout}")
+    return _compile_invoice_template(seller, layout)
+
+@traced("pdf.generate_bill_pdf")
+def generate_bill_pdf(data, filename="invoice_static.pdf", profile=DEFAULT_PDF_PROFILE,
+                      renderer=DEFAULT_PDF_RENDERER):
+    if profile not in PDF_PROFILES:
+        raise ValueError(f"Unknown PDF profile: {profile}")
+    if renderer not in PDF_RENDERERS:
+        raise ValueError(f"Unknown PDF renderer: {renderer}")
+
+    template = invoice_template(data.get("seller"))
+    with TRACER.span("pdf.signature"):
+        signature = get_signature_image(data.get("signature_path"), profile)
+
+    if renderer != "platypus":
+        # Most invoices fit on one page; draw those straight onto the canvas
+        try:
+            with TRACER.span("pdf.canvas_layout", items=len(data["items"])):
+                blocks = template.canvas_blocks(data, signature)
+        except _CanvasUnsupported as e:
+            if renderer == "canvas":
+                raise ValueError(f"Invoice {data['bill_no']} cannot be drawn on the canvas: {e}")
+            pdf_logger.debug("Laying out invoice %s with platypus: %s", data['bill_no'], e)
+        else:
+            with TRACER.span("pdf.canvas_draw"):
+                template.draw_canvas(blocks, filename, data, profile)
+            return filename
+
+    setup = TRACER.span("pdf.setup")
+    doc = SimpleDocTemplate(
+        filename,
+        pagesize=A4,
+        rightMargin=PDF_PAGE_MARGIN,
+        leftMargin=PDF_PAGE_MARGIN,
+        topMargin=PDF_PAGE_MARGIN,
+        bottomMargin=PDF_PAGE_MARGIN,
+        pageCompression=PDF_PAGE_COMPRESSION,
+        **template.metadata(data, profile)
+    )
+    signature_img = Image(io.BytesIO(signature), width=SIGNATURE_WIDTH, height=SIGNATURE_HEIGHT)
+    setup.finish()
+
+    with TRACER.span("pdf.layout", items=len(data["items"])):
+        elements = template.flowables(data, signature_img)
 
     # Save PDF
-    doc.build(elements)
+    with TRACER.span("pdf.build"):
+        doc.build(elements)
     return filename
 
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+@lru_cache(maxsize=None)
+def resource_icon(name):
+    """Icon with every size of :/icons/<name> from icons_rc, built once.
 
-class DatabaseManager:
-    def __init__(self, db_file="invoice_app.db"):
-        self.db_file = db_file
-        self.create_tables()
+    The sizes are read from memory, so this works the same from source and
+    from a PyInstaller build. Empty if icons_rc.py was not generated.
+    """
+    icon = QIcon()
+    for entry in QDir(f":/icons/{name}").entryList(QDir.Files):
+        size = int(os.path.splitext(entry)[0])
+        icon.addFile(f":/icons/{name}/{entry}", QSize(size, size))
+    return icon
+
+# Catalogue imports: the table each kind of catalogue goes to, its unique key
+# and the spreadsheet headers accepted for every column (matched ignoring case).
+CATALOGUE_IMPORTS = {
+    "products": {
+        "table": "products",
+        "key": "sku_code",
+        "columns": {
+            "sku_code": ["sku", "sku code", "sku_code"],
+            "product_name": ["product", "product name", "product_name", "name", "description"],
+            "hsn_code": ["hsn", "hsn code", "hsn_code"],
+            "price_per_unit": ["price", "price per unit", "price_per_unit", "rate", "unit price"],
+        },
+        "numeric": ["price_per_unit"],
+    },
+    "companies": {
+        "table": "companies",
+        "key": "gst_number",
+        "columns": {
+            "gst_number": ["gst", "gstin", "gst number", "gst_number"],
+            "company_name": ["company", "company name", "company_name", "name"],
+            "address": ["address"],
+        },
+        "numeric": [],
+    },
+}
+
+def read_catalogue_file(path, kind):
+    """Read a CSV or Excel catalogue into rows for DatabaseManager.import_catalogue.
+
+    Returns (rows, problems). Rows missing a value or with an invalid number are
+    skipped and reported in problems; when a key appears more than once the last
+    row wins.
+    """
+    spec = CATALOGUE_IMPORTS[kind]
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    else:
+        df = pd.read_excel(path, dtype=str, keep_default_na=False)
     
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_file)
-        conn.row_factory = sqlite3.Row
-        return conn
+    headers = {str(header).strip().lower(): header for header in df.columns}
+    sources = {}
+    for column, aliases in spec["columns"].items():
+        source = next((headers[alias] for alias in aliases if alias in headers), None)
+        if source is None:
+            raise ValueError(f"Column '{aliases[0]}' not found in {os.path.basename(path)}")
+        sources[column] = source
     
-    def create_tables(self):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Companies table (for bill_to, ship_to, and ship_from)
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS companies (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            address TEXT NOT NULL,
-            gst_number TEXT UNIQUE NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Products table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS products (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sku_code TEXT UNIQUE NOT NULL,
-            product_name TEXT NOT NULL,
-            hsn_code TEXT NOT NULL,
-            price_per_unit REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Invoices table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS invoices (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            bill_number TEXT UNIQUE NOT NULL,
-            bill_date DATE NOT NULL,
-            bill_to_company_id INTEGER NOT NULL,
-            ship_to_company_id INTEGER NOT NULL,
-            ship_from_company_id INTEGER NOT NULL,
-            signature_path TEXT,
-            advance_amount REAL DEFAULT 0,
-            total_amount REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (bill_to_company_id) REFERENCES companies (id),
-            FOREIGN KEY (ship_to_company_id) REFERENCES companies (id),
-            FOREIGN KEY (ship_from_company_id) REFERENCES companies (id)
-        )
-        ''')
-        
-        # Invoice items table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS invoice_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            invoice_id INTEGER NOT NULL,
-            product_id INTEGER NOT NULL,
-            quantity INTEGER NOT NULL,
-            price_per_unit REAL NOT NULL,
-            amount REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (invoice_id) REFERENCES invoices (id),
-            FOREIGN KEY (product_id) REFERENCES products (id)
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
+    rows = {}
+    problems = []
+    for line, record in enumerate(df.to_dict("records"), start=2):
+        row = {column: str(record[source]).strip() for column, source in sources.items()}
+        if not all(row.values()):
+            if any(row.values()):
+                problems.append(f"Row {line}: missing value")
+            continue
+        try:
+            for column in spec["numeric"]:
+                row[column] = round(float(row[column].replace(",", "")), 2)
+        except ValueError:
+            problems.append(f"Row {line}: invalid number")
+            continue
+        rows[row[spec["key"]]] = row
+    return list(rows.values()), problems
+
+def _gst_line_tax_sql(amount, rate):
+    """Tax on one invoice line, rounded to the paisa like calculate_invoice_totals."""
+    return f"ROUND({amount} * {rate} / 100.0, 2)"
+
+def _gst_item_delta_sql(row, sign):
+    """Upsert adding (sign '+') or removing (sign '-') one invoice line in the HSN summary."""
+    return f'''
+        INSERT INTO gst_hsn_summary (period, product_id, line_count, quantity,
+                                     taxable_value, cgst_amount, sgst_amount, igst_amount)
+        SELECT strftime('%Y-%m', i.bill_date), {row}.product_id, {sign}1, {sign}{row}.quantity,
+               {sign}{row}.amount, {sign}{_gst_line_tax_sql(f"{row}.amount", CGST_RATE)},
+               {sign}{_gst_line_tax_sql(f"{row}.amount", SGST_RATE)}, 0
+        FROM invoices i WHERE i.id = {row}.invoice_id
+        ON CONFLICT (period, product_id) DO UPDATE SET
+            line_count = line_count + excluded.line_count,
+            quantity = quantity + excluded.quantity,
+            taxable_value = taxable_value + excluded.taxable_value,
+            cgst_amount = cgst_amount + excluded.cgst_amount,
+            sgst_amount = sgst_amount + excluded.sgst_amount,
+            igst_amount = igst_amount + excluded.igst_amount;'''
+
+def _gst_invoice_delta_sql(row, sign):
+    """Upserts adding or removing a whole invoice, with all its lines, in the GST
+    summaries. The recipient's row takes the tax stored on the invoice."""
+    return f'''
+        INSERT INTO gst_hsn_summary (period, product_id, line_count, quantity,
+                                     taxable_value, cgst_amount, sgst_amount, igst_amount)
+        SELECT strftime('%Y-%m', {row}.bill_date), ii.product_id, {sign}COUNT(*), {sign}SUM(ii.quantity),
+               {sign}SUM(ii.amount), {sign}SUM({_gst_line_tax_sql("ii.amount", CGST_RATE)}),
+               {sign}SUM({_gst_line_tax_sql("ii.amount", SGST_RATE)}), 0
+        FROM invoice_items ii WHERE ii.invoice_id = {row}.id
+        GROUP BY ii.product_id
+        ON CONFLICT (period, product_id) DO UPDATE SET
+            line_count = line_count + excluded.line_count,
+            quantity = quantity + excluded.quantity,
+            taxable_value = taxable_value + excluded.taxable_value,
+            cgst_amount = cgst_amount + excluded.cgst_amount,
+            sgst_amount = sgst_amount + excluded.sgst_amount,
+            igst_amount = igst_amount + excluded.igst_amount;
+        INSERT INTO gst_b2b_summary (period, company_id, invoice_count,
+                                     taxable_value, cgst_amount, sgst_amount, igst_amount)
+        VALUES (strftime('%Y-%m', {row}.bill_date), {row}.bill_to_company_id, {sign}1,
+                {sign}COALESCE({row}.taxable_value, 0), {sign}COALESCE({row}.cgst_amount, 0),
+                {sign}COALESCE({row}.sgst_amount, 0), {sign}COALESCE({row}.igst_amount, 0))
+        ON CONFLICT (period, company_id) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            taxable_value = taxable_value + excluded.taxable_value,
+            cgst_amount = cgst_amount + excluded.cgst_amount,
+            sgst_amount = sgst_amount + excluded.sgst_amount,
+            igst_amount = igst_amount + excluded.igst_amount;'''
+
+def _gst_invoice_cleanup_sql(row):
+    """Remove summary rows emptied by an invoice change. Only the rows of the
+    invoice's own period, products and recipient are looked at, so bulk changes
+    stay linear."""
+    return f'''
+        DELETE FROM gst_hsn_summary
+        WHERE period = strftime('%Y-%m', {row}.bill_date)
+          AND product_id IN (SELECT product_id FROM invoice_items WHERE invoice_id = {row}.id)
+          AND line_count <= 0;
+        DELETE FROM gst_b2b_summary
+        WHERE period = strftime('%Y-%m', {row}.bill_date) AND company_id = {row}.bill_to_company_id
+          AND invoice_count <= 0;'''
+
+def _gst_item_cleanup_sql(row):
+    return f'''
+        DELETE FROM gst_hsn_summary
+        WHERE period = (SELECT strftime('%Y-%m', bill_date) FROM invoices WHERE id = {row}.invoice_id)
+          AND product_id = {row}.product_id AND line_count <= 0;'''
+
+# Triggers keeping gst_b2b_summary and gst_hsn_summary in step with invoices and
+# their lines. Recipients are summed from the tax stored on each invoice, so the
+# B2B rows add up to the invoices; products from their lines. Line triggers only
+# apply while the parent invoice exists, so lines removed together with their
+# invoice are accounted for once, by the invoice trigger.
+GST_SUMMARY_TRIGGERS = {
+    "trg_gst_invoice_insert": f'''
+    CREATE TRIGGER trg_gst_invoice_insert AFTER INSERT ON invoices
+    BEGIN{_gst_invoice_delta_sql("NEW", "+")}
+    END''',
+    "trg_gst_invoice_update": f'''
+    CREATE TRIGGER trg_gst_invoice_update
+    AFTER UPDATE OF bill_date, bill_to_company_id, taxable_value, cgst_amount, sgst_amount, igst_amount
+    ON invoices
+    WHEN strftime('%Y-%m', OLD.bill_date) IS NOT strftime('%Y-%m', NEW.bill_date)
+        OR OLD.bill_to_company_id IS NOT NEW.bill_to_company_id
+        OR OLD.taxable_value IS NOT NEW.taxable_value OR OLD.cgst_amount IS NOT NEW.cgst_amount
+        OR OLD.sgst_amount IS NOT NEW.sgst_amount OR OLD.igst_amount IS NOT NEW.igst_amount
+    BEGIN{_gst_invoice_delta_sql("OLD", "-")}{_gst_invoice_delta_sql("NEW", "+")}{_gst_invoice_cleanup_sql("OLD")}
+    END''',
+    "trg_gst_invoice_delete": f'''
+    CREATE TRIGGER trg_gst_invoice_delete BEFORE DELETE ON invoices
+    BEGIN{_gst_invoice_delta_sql("OLD", "-")}{_gst_invoice_cleanup_sql("OLD")}
+    END''',
+    "trg_gst_item_insert": f'''
+    CREATE TRIGGER trg_gst_item_insert AFTER INSERT ON invoice_items
+    BEGIN{_gst_item_delta_sql("NEW", "+")}
+    END''',
+    "trg_gst_item_update": f'''
+    CREATE TRIGGER trg_gst_item_update
+    AFTER UPDATE OF invoice_id, product_id, quantity, amount ON invoice_items
+    BEGIN{_gst_item_delta_sql("OLD", "-")}{_gst_item_delta_sql("NEW", "+")}{_gst_item_cleanup_sql("OLD")}
+    END''',
+    "trg_gst_item_delete": f'''
+    CREATE TRIGGER trg_gst_item_delete AFTER DELETE ON invoice_items
+    BEGIN{_gst_item_delta_sql("OLD", "-")}{_gst_item_cleanup_sql("OLD")}
+    END''',
+}
+
+# Full recomputation of the GST summaries, per database so that archived years
+# are counted too. Rows of one period and party or product may come from the
+# main database and an archive, hence the upserts.
+_GST_AGGREGATE_SQL = {
+    "b2b": '''
+    SELECT strftime('%Y-%m', bill_date), bill_to_company_id, COUNT(*),
+           COALESCE(SUM(taxable_value), 0), COALESCE(SUM(cgst_amount), 0),
+           COALESCE(SUM(sgst_amount), 0), COALESCE(SUM(igst_amount), 0)
+    FROM {schema}.invoices
+    WHERE 1 GROUP BY 1, 2''',
+    "hsn": f'''
+    SELECT strftime('%Y-%m', i.bill_date), ii.product_id, COUNT(*), SUM(ii.quantity),
+           SUM(ii.amount), SUM({_gst_line_tax_sql("ii.amount", CGST_RATE)}),
+           SUM({_gst_line_tax_sql("ii.amount", SGST_RATE)}), 0
+    FROM {{schema}}.invoice_items ii
+    JOIN {{schema}}.invoices i ON i.id = ii.invoice_id
+    WHERE 1 GROUP BY 1, 2''',
+}
+_GST_UPSERT_SQL = {
+    "b2b": '''
+    INSERT INTO gst_b2b_summary (period, company_id, invoice_count,
+                                 taxable_value, cgst_amount, sgst_amount, igst_amount)
+    {rows}
+    ON CONFLICT (period, company_id) DO UPDATE SET
+        invoice_count = invoice_count + excluded.invoice_count,
+        taxable_value = taxable_value + excluded.taxable_value,
+        cgst_amount = cgst_amount + excluded.cgst_amount,
+        sgst_amount = sgst_amount + excluded.sgst_amount,
+        igst_amount = igst_amount + excluded.igst_amount''',
+    "hsn": '''
+    INSERT INTO gst_hsn_summary (period, product_id, line_count, quantity,
+                                 taxable_value, cgst_amount, sgst_amount, igst_amount)
+    {rows}
+    ON CONFLICT (period, product_id) DO UPDATE SET
+        line_count = line_count + excluded.line_count,
+        quantity = quantity + excluded.quantity,
+        taxable_value = taxable_value + excluded.taxable_value,
+        cgst_amount = cgst_amount + excluded.cgst_amount,
+        sgst_amount = sgst_amount + excluded.sgst_amount,
+        igst_amount = igst_amount + excluded.igst_amount''',
+}
+
+# Tax breakdown columns stored on each invoice row, see calculate_invoice_totals
+INVOICE_TAX_COLUMNS = ["taxable_value", "sgst_rate", "sgst_amount", "cgst_rate",
+                       "cgst_amount", "igst_amount", "round_off", "grand_total"]
+
+def _invoice_due_sql(row):
+    """Amount a client owes for an invoice: its grand total including taxes."""
+    return f"COALESCE({row}.grand_total, 0)"
+
+def _ledger_entry_sql(company, entry_date, entry_type, invoice_id, payment_id, invoiced, paid, condition="1"):
+    """Post one entry to client_ledger and roll it into the client's materialised balance.
+
+    `invoiced` and `paid` are the signed changes to what the client was billed and
+    what they paid; the entry is a debit or credit of their difference. Nothing is
+    posted when the difference is zero or `condition` is false.
+    """
+    net = f"(({invoiced}) - ({paid}))"
+    condition = f"{net} <> 0 AND ({condition})"
+    return f'''
+        INSERT INTO client_ledger (company_id, entry_date, entry_type, invoice_id, payment_id,
+                                   debit, credit, running_balance)
+        SELECT {company}, {entry_date}, '{entry_type}', {invoice_id}, {payment_id},
+               MAX({net}, 0), MAX(-{net}, 0),
+               COALESCE((SELECT balance FROM client_balances WHERE company_id = {company}), 0) + {net}
+        WHERE {condition};
+        INSERT INTO client_balances (company_id, total_invoiced, total_paid, balance, last_entry_date)
+        SELECT {company}, {invoiced}, {paid}, {net}, {entry_date}
+        WHERE {condition}
+        ON CONFLICT (company_id) DO UPDATE SET
+            total_invoiced = total_invoiced + excluded.total_invoiced,
+            total_paid = total_paid + excluded.total_paid,
+            balance = balance + excluded.balance,
+            last_entry_date = MAX(COALESCE(last_entry_date, excluded.last_entry_date),
+                                  excluded.last_entry_date);'''
+
+_LEDGER_INVOICE_CHANGED = ("OLD.bill_to_company_id IS NOT NEW.bill_to_company_id"
+                           " OR OLD.grand_total IS NOT NEW.grand_total")
+_LEDGER_ADVANCE_CHANGED = ("OLD.bill_to_company_id IS NOT NEW.bill_to_company_id"
+                           " OR OLD.advance_amount IS NOT NEW.advance_amount")
+
+# Triggers posting invoices, advances and payments to the client ledger. Changes
+# never rewrite history: an edited or deleted record is reversed and re-posted,
+# so every running balance stays valid and each change is O(1).
+LEDGER_TRIGGERS = {
+    "trg_ledger_invoice_insert": f'''
+    CREATE TRIGGER trg_ledger_invoice_insert AFTER INSERT ON invoices
+    BEGIN{_ledger_entry_sql("NEW.bill_to_company_id", "NEW.bill_date", "invoice", "NEW.id", "NULL", _invoice_due_sql("NEW"), "0")}{_ledger_entry_sql("NEW.bill_to_company_id", "NEW.bill_date", "advance", "NEW.id", "NULL", "0", "COALESCE(NEW.advance_amount, 0)")}
+        INSERT INTO invoice_receivables (invoice_id, company_id, bill_date, amount_due, amount_paid)
+        VALUES (NEW.id, NEW.bill_to_company_id, NEW.bill_date, {_invoice_due_sql("NEW")},
+                COALESCE(NEW.advance_amount, 0));
+    END''',
+    "trg_ledger_invoice_update": f'''
+    CREATE TRIGGER trg_ledger_invoice_update
+    AFTER UPDATE OF bill_date, bill_to_company_id, grand_total, advance_amount ON invoices
+    WHEN OLD.bill_date IS NOT NEW.bill_date
+        OR OLD.bill_to_company_id IS NOT NEW.bill_to_company_id
+        OR OLD.grand_total IS NOT NEW.grand_total
+        OR OLD.advance_amount IS NOT NEW.advance_amount
+    BEGIN{_ledger_entry_sql("OLD.bill_to_company_id", "NEW.bill_date", "invoice reversal", "OLD.id", "NULL", "-" + _invoice_due_sql("OLD"), "0", _LEDGER_INVOICE_CHANGED)}{_ledger_entry_sql("OLD.bill_to_company_id", "NEW.bill_date", "advance reversal", "OLD.id", "NULL", "0", "-COALESCE(OLD.advance_amount, 0)", _LEDGER_ADVANCE_CHANGED)}{_ledger_entry_sql("NEW.bill_to_company_id", "NEW.bill_date", "invoice", "NEW.id", "NULL", _invoice_due_sql("NEW"), "0", _LEDGER_INVOICE_CHANGED)}{_ledger_entry_sql("NEW.bill_to_company_id", "NEW.bill_date", "advance", "NEW.id", "NULL", "0", "COALESCE(NEW.advance_amount, 0)", _LEDGER_ADVANCE_CHANGED)}
+        UPDATE invoice_receivables
+        SET company_id = NEW.bill_to_company_id,
+            bill_date = NEW.bill_date,
+            amount_due = {_invoice_due_sql("NEW")},
+            amount_paid = amount_paid - COALESCE(OLD.advance_amount, 0) + COALESCE(NEW.advance_amount, 0)
+        WHERE invoice_id = NEW.id;
+    END''',
+    "trg_ledger_invoice_delete": f'''
+    CREATE TRIGGER trg_ledger_invoice_delete AFTER DELETE ON invoices
+    BEGIN{_ledger_entry_sql("OLD.bill_to_company_id", "date('now')", "invoice reversal", "OLD.id", "NULL", "-" + _invoice_due_sql("OLD"), "0")}{_ledger_entry_sql("OLD.bill_to_company_id", "date('now')", "advance reversal", "OLD.id", "NULL", "0", "-COALESCE(OLD.advance_amount, 0)")}
+        DELETE FROM invoice_receivables WHERE invoice_id = OLD.id;
+        UPDATE payments SET invoice_id = NULL WHERE invoice_id = OLD.id;
+    END''',
+    "trg_ledger_payment_insert": f'''
+    CREATE TRIGGER trg_ledger_payment_insert AFTER INSERT ON payments
+    BEGIN{_ledger_entry_sql("NEW.company_id", "NEW.payment_date", "payment", "NEW.invoice_id", "NEW.id", "0", "NEW.amount")}
+        UPDATE invoice_receivables SET amount_paid = amount_paid + NEW.amount
+        WHERE invoice_id = NEW.invoice_id;
+    END''',
+    "trg_ledger_payment_update": f'''
+    CREATE TRIGGER trg_ledger_payment_update
+    AFTER UPDATE OF company_id, payment_date, amount ON payments
+    WHEN OLD.company_id IS NOT NEW.company_id
+        OR OLD.payment_date IS NOT NEW.payment_date
+        OR OLD.amount IS NOT NEW.amount
+    BEGIN{_ledger_entry_sql("OLD.company_id", "NEW.payment_date", "payment reversal", "OLD.invoice_id", "OLD.id", "0", "-OLD.amount")}{_ledger_entry_sql("NEW.company_id", "NEW.payment_date", "payment", "NEW.invoice_id", "NEW.id", "0", "NEW.amount")}
+    END''',
+    "trg_receivables_payment_update": '''
+    CREATE TRIGGER trg_receivables_payment_update AFTER UPDATE OF invoice_id, amount ON payments
+    WHEN OLD.invoice_id IS NOT NEW.invoice_id OR OLD.amount IS NOT NEW.amount
+    BEGIN
+        UPDATE invoice_receivables SET amount_paid = amount_paid - OLD.amount
+        WHERE invoice_id = OLD.invoice_id;
+        UPDATE invoice_receivables SET amount_paid = amount_paid + NEW.amount
+        WHERE invoice_id = NEW.invoice_id;
+    END''',
+    "trg_ledger_payment_delete": f'''
+    CREATE TRIGGER trg_ledger_payment_delete AFTER DELETE ON payments
+    BEGIN{_ledger_entry_sql("OLD.company_id", "date('now')", "payment reversal", "OLD.invoice_id", "OLD.id", "0", "-OLD.amount")}
+        UPDATE invoice_receivables SET amount_paid = amount_paid - OLD.amount
+        WHERE invoice_id = OLD.invoice_id;
+    END''',
+}
+
+SEARCH_AUTOMERGE = 4  # FTS5 default, segments merged by each write
+# Temp tables delete_invoices and update_invoices work in
+BULK_TEMP_TABLES = ("bulk_invoices", "bulk_updated", "bulk_lines", "bulk_ledger")
+
+_SEARCH_PARTIES_SQL = '''(SELECT COALESCE(group_concat(company_name || ' ' || gst_number || ' ' || address, ' '), '')
+             FROM companies WHERE id IN ({row}.bill_to_company_id, {row}.ship_to_company_id,
+                                         {row}.ship_from_company_id))'''
+_SEARCH_PRODUCTS_SQL = '''(SELECT COALESCE(group_concat(p.sku_code || ' ' || p.product_name || ' ' || p.hsn_code, ' '), '')
+             FROM invoice_items ii JOIN products p ON p.id = ii.product_id
+             WHERE ii.invoice_id = {invoice_id})'''
+
+# Triggers keeping the invoice_search full-text index (one document per invoice,
+# rowid = invoice id) in step with invoices, their lines, companies and products.
+SEARCH_TRIGGERS = {
+    "trg_search_invoice_insert": f'''
+    CREATE TRIGGER trg_search_invoice_insert AFTER INSERT ON invoices
+    BEGIN
+        INSERT INTO invoice_search (rowid, bill_number, parties, products)
+        VALUES (NEW.id, NEW.bill_number, {_SEARCH_PARTIES_SQL.format(row="NEW")},
+                {_SEARCH_PRODUCTS_SQL.format(invoice_id="NEW.id")});
+    END''',
+    "trg_search_invoice_update": f'''
+    CREATE TRIGGER trg_search_invoice_update
+    AFTER UPDATE OF bill_number, bill_to_company_id, ship_to_company_id, ship_from_company_id ON invoices
+    BEGIN
+        UPDATE invoice_search
+        SET bill_number = NEW.bill_number, parties = {_SEARCH_PARTIES_SQL.format(row="NEW")}
+        WHERE rowid = NEW.id;
+    END''',
+    "trg_search_invoice_delete": '''
+    CREATE TRIGGER trg_search_invoice_delete AFTER DELETE ON invoices
+    BEGIN
+        DELETE FROM invoice_search WHERE rowid = OLD.id;
+    END''',
+    "trg_search_item_insert": f'''
+    CREATE TRIGGER trg_search_item_insert AFTER INSERT ON invoice_items
+    BEGIN
+        UPDATE invoice_search SET products = {_SEARCH_PRODUCTS_SQL.format(invoice_id="NEW.invoice_id")}
+        WHERE rowid = NEW.invoice_id;
+    END''',
+    "trg_search_item_update": f'''
+    CREATE TRIGGER trg_search_item_update AFTER UPDATE OF invoice_id, product_id ON invoice_items
+    BEGIN
+        UPDATE invoice_search SET products = {_SEARCH_PRODUCTS_SQL.format(invoice_id="OLD.invoice_id")}
+        WHERE rowid = OLD.invoice_id;
+        UPDATE invoice_search SET products = {_SEARCH_PRODUCTS_SQL.format(invoice_id="NEW.invoice_id")}
+        WHERE rowid = NEW.invoice_id;
+    END''',
+    "trg_search_item_delete": f'''
+    CREATE TRIGGER trg_search_item_delete AFTER DELETE ON invoice_items
+    WHEN EXISTS (SELECT 1 FROM invoices WHERE id = OLD.invoice_id)
+    BEGIN
+        UPDATE invoice_search SET products = {_SEARCH_PRODUCTS_SQL.format(invoice_id="OLD.invoice_id")}
+        WHERE rowid = OLD.invoice_id;
+    END''',
+    "trg_search_company_update": f'''
+    CREATE TRIGGER trg_search_company_update AFTER UPDATE OF company_name, address, gst_number ON companies
+    BEGIN
+        UPDATE invoice_search
+        SET parties = (SELECT {_SEARCH_PARTIES_SQL.format(row="i")}
+                       FROM invoices i WHERE i.id = invoice_search.rowid)
+        WHERE rowid IN (SELECT id FROM invoices
+                        WHERE bill_to_company_id = NEW.id OR ship_to_company_id = NEW.id
+                           OR ship_from_company_id = NEW.id);
+    END''',
+    "trg_search_product_update": f'''
+    CREATE TRIGGER trg_search_product_update AFTER UPDATE OF sku_code, product_name, hsn_code ON products
+    BEGIN
+        UPDATE invoice_search SET products = {_SEARCH_PRODUCTS_SQL.format(invoice_id="invoice_search.rowid")}
+        WHERE rowid IN (SELECT invoice_id FROM invoice_items WHERE product_id = NEW.id);
+    END''',
+}
+
+_DASHBOARD_COUNTED_SQL = "(SELECT watermark_id FROM dashboard_state WHERE id = 1)"
+
+def _dashboard_invoice_delta_sql(row, sign):
+    """Upserts adding (sign '+') or removing (sign '-') an invoice in the monthly
+    and client totals of the dashboard cache, if the cache has counted it."""
+    return f'''
+        INSERT INTO dashboard_monthly (period, invoice_count, taxable_value, grand_total)
+        SELECT strftime('%Y-%m', {row}.bill_date), {sign}1, {sign}COALESCE({row}.taxable_value, 0),
+               {sign}COALESCE({row}.grand_total, 0)
+        WHERE {row}.id <= {_DASHBOARD_COUNTED_SQL}
+        ON CONFLICT (period) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            taxable_value = taxable_value + excluded.taxable_value,
+            grand_total = grand_total + excluded.grand_total;
+        INSERT INTO dashboard_clients (company_id, invoice_count, grand_total)
+        SELECT {row}.bill_to_company_id, {sign}1, {sign}COALESCE({row}.grand_total, 0)
+        WHERE {row}.id <= {_DASHBOARD_COUNTED_SQL}
+        ON CONFLICT (company_id) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            grand_total = grand_total + excluded.grand_total;
+        DELETE FROM dashboard_monthly WHERE period = strftime('%Y-%m', {row}.bill_date) AND invoice_count = 0;
+        DELETE FROM dashboard_clients WHERE company_id = {row}.bill_to_company_id AND invoice_count = 0;'''
+
+def _dashboard_item_delta_sql(row, sign):
+    """Upserts adding or removing one invoice line in the product totals of the
+    dashboard cache, if the cache has counted its invoice."""
+    return f'''
+        INSERT INTO dashboard_products (product_id, quantity, amount)
+        SELECT {row}.product_id, {sign}{row}.quantity, {sign}{row}.amount
+        WHERE {row}.invoice_id <= {_DASHBOARD_COUNTED_SQL}
+        ON CONFLICT (product_id) DO UPDATE SET
+            quantity = quantity + excluded.quantity,
+            amount = amount + excluded.amount;
+        DELETE FROM dashboard_products WHERE product_id = {row}.product_id AND quantity = 0;'''
+
+# Triggers applying edits and deletes of invoices the dashboard cache has
+# already counted as signed deltas, like the GST summary triggers. Invoices
+# created since the last refresh are added by refresh_dashboard_cache.
+DASHBOARD_TRIGGERS = {
+    "trg_dashboard_invoice_update": f'''
+    CREATE TRIGGER trg_dashboard_invoice_update
+    AFTER UPDATE OF bill_date, bill_to_company_id, taxable_value, grand_total ON invoices
+    WHEN OLD.bill_date IS NOT NEW.bill_date
+        OR OLD.bill_to_company_id IS NOT NEW.bill_to_company_id
+        OR OLD.taxable_value IS NOT NEW.taxable_value
+        OR OLD.grand_total IS NOT NEW.grand_total
+    BEGIN{_dashboard_invoice_delta_sql("OLD", "-")}{_dashboard_invoice_delta_sql("NEW", "+")}
+    END''',
+    "trg_dashboard_invoice_delete": f'''
+    CREATE TRIGGER trg_dashboard_invoice_delete AFTER DELETE ON invoices
+    BEGIN{_dashboard_invoice_delta_sql("OLD", "-")}
+    END''',
+    "trg_dashboard_item_insert": f'''
+    CREATE TRIGGER trg_dashboard_item_insert AFTER INSERT ON invoice_items
+    BEGIN{_dashboard_item_delta_sql("NEW", "+")}
+    END''',
+    "trg_dashboard_item_update": f'''
+    CREATE TRIGGER trg_dashboard_item_update
+    AFTER UPDATE OF invoice_id, product_id, quantity, amount ON invoice_items
+    WHEN OLD.invoice_id IS NOT NEW.invoice_id
+        OR OLD.product_id IS NOT NEW.product_id
+        OR OLD.quantity IS NOT NEW.quantity
+        OR OLD.amount IS NOT NEW.amount
+    BEGIN{_dashboard_item_delta_sql("OLD", "-")}{_dashboard_item_delta_sql("NEW", "+")}
+    END''',
+    "trg_dashboard_item_delete": f'''
+    CREATE TRIGGER trg_dashboard_item_delete AFTER DELETE ON invoice_items
+    BEGIN{_dashboard_item_delta_sql("OLD", "-")}
+    END''',
+}
+
+def _export_change_sql(change, invoices):
+    """Log `change` for the invoices selected by `invoices`, a query of their id
+    and bill_number. Each logging statement takes the next change id."""
+    inserted = "s.last_change_id" if change == "insert" else "NULL"
+    return f'''
+        UPDATE export_state SET last_change_id = last_change_id + 1 WHERE id = 1;
+        INSERT INTO invoice_changes (invoice_id, bill_number, change, change_id, inserted_id)
+        SELECT i.id, i.bill_number, '{change}', s.last_change_id, {inserted}
+        FROM ({invoices}) i, export_state s WHERE s.id = 1
+        ON CONFLICT (invoice_id) DO UPDATE SET
+            bill_number = excluded.bill_number,
+            change = excluded.change,
+            change_id = excluded.change_id,
+            changed_at = CURRENT_TIMESTAMP;'''
+
+def _export_touch_sql(invoice_id):
+    """Stamp an invoice whose lines changed and log it as updated."""
+    return f'''
+        UPDATE invoices SET updated_at = CURRENT_TIMESTAMP
+        WHERE id = {invoice_id} AND updated_at IS NOT CURRENT_TIMESTAMP;{_export_change_sql(
+        "update", f"SELECT id, bill_number FROM invoices WHERE id = {invoice_id}")}'''
+
+_EXPORT_COMPANY_INVOICES_SQL = '''SELECT id, bill_number FROM invoices
+                  WHERE bill_to_company_id = NEW.id OR ship_to_company_id = NEW.id
+                     OR ship_from_company_id = NEW.id'''
+_EXPORT_PRODUCT_INVOICES_SQL = '''SELECT id, bill_number FROM invoices
+                  WHERE id IN (SELECT invoice_id FROM invoice_items WHERE product_id = NEW.id)'''
+
+# Triggers keeping invoices.updated_at current and recording the latest change
+# of each invoice in invoice_changes for delta exports. Line changes count as
+# edits of their invoice, and so do renamed clients and products, which change
+# the exported rows.
+EXPORT_TRIGGERS = {
+    "trg_export_invoice_insert": f'''
+    CREATE TRIGGER trg_export_invoice_insert AFTER INSERT ON invoices
+    BEGIN
+        UPDATE invoices SET updated_at = COALESCE(NEW.created_at, CURRENT_TIMESTAMP)
+        WHERE id = NEW.id AND updated_at IS NULL;{_export_change_sql("insert", "SELECT NEW.id AS id, NEW.bill_number AS bill_number")}
+    END''',
+    "trg_export_invoice_update": f'''
+    CREATE TRIGGER trg_export_invoice_update AFTER UPDATE ON invoices
+    WHEN NEW.updated_at IS OLD.updated_at
+    BEGIN
+        UPDATE invoices SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;{_export_change_sql("update", "SELECT NEW.id AS id, NEW.bill_number AS bill_number")}
+    END''',
+    "trg_export_invoice_delete": f'''
+    CREATE TRIGGER trg_export_invoice_delete AFTER DELETE ON invoices
+    BEGIN{_export_change_sql("delete", "SELECT OLD.id AS id, OLD.bill_number AS bill_number")}
+    END''',
+    "trg_export_item_insert": f'''
+    CREATE TRIGGER trg_export_item_insert AFTER INSERT ON invoice_items
+    BEGIN{_export_touch_sql("NEW.invoice_id")}
+    END''',
+    "trg_export_item_update": f'''
+    CREATE TRIGGER trg_export_item_update
+    AFTER UPDATE OF invoice_id, product_id, quantity, price_per_unit, amount ON invoice_items
+    BEGIN{_export_touch_sql("OLD.invoice_id")}{_export_touch_sql("NEW.invoice_id")}
+    END''',
+    "trg_export_item_delete": f'''
+    CREATE TRIGGER trg_export_item_delete AFTER DELETE ON invoice_items
+    WHEN EXISTS (SELECT 1 FROM invoices WHERE id = OLD.invoice_id)
+    BEGIN{_export_touch_sql("OLD.invoice_id")}
+    END''',
+    "trg_export_company_update": f'''
+    CREATE TRIGGER trg_export_company_update AFTER UPDATE OF company_name, gst_number ON companies
+    BEGIN{_export_change_sql("update", _EXPORT_COMPANY_INVOICES_SQL)}
+    END''',
+    "trg_export_product_update": f'''
+    CREATE TRIGGER trg_export_product_update AFTER UPDATE OF sku_code, product_name, hsn_code ON products
+    BEGIN{_export_change_sql("update", _EXPORT_PRODUCT_INVOICES_SQL)}
+    END''',
+}
+
+INVOICE_ITEMS_TABLE_SQL = '''
+CREATE TABLE {table} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    invoice_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    price_per_unit REAL NOT NULL,
+    amount REAL NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (invoice_id) REFERENCES invoices (id) ON DELETE CASCADE,
+    FOREIGN KEY (product_id) REFERENCES products (id)
+)
+'''
+
+# Dashboard cache rows per month, client and product, and how to add them to the cache
+_DASHBOARD_AGGREGATE_SQL = {
+    "monthly": '''
+    SELECT strftime('%Y-%m', bill_date), COUNT(*), SUM(taxable_value), SUM(grand_total)
+    FROM {schema}.invoices WHERE {condition} GROUP BY 1''',
+    "clients": '''
+    SELECT bill_to_company_id, COUNT(*), SUM(grand_total)
+    FROM {schema}.invoices WHERE {condition} GROUP BY 1''',
+    "products": '''
+    SELECT product_id, SUM(quantity), SUM(amount)
+    FROM {schema}.invoice_items WHERE {condition} GROUP BY 1''',
+}
+_DASHBOARD_UPSERT_SQL = {
+    "monthly": '''
+    INSERT INTO dashboard_monthly (period, invoice_count, taxable_value, grand_total)
+    {rows}
+    ON CONFLICT (period) DO UPDATE SET
+        invoice_count = invoice_count + excluded.invoice_count,
+        taxable_value = taxable_value + excluded.taxable_value,
+        grand_total = grand_total + excluded.grand_total''',
+    "clients": '''
+    INSERT INTO dashboard_clients (company_id, invoice_count, grand_total)
+    {rows}
+    ON CONFLICT (company_id) DO UPDATE SET
+        invoice_count = invoice_count + excluded.invoice_count,
+        grand_total = grand_total + excluded.grand_total''',
+    "products": '''
+    INSERT INTO dashboard_products (product_id, quantity, amount)
+    {rows}
+    ON CONFLICT (product_id) DO UPDATE SET
+        quantity = quantity + excluded.quantity,
+        amount = amount + excluded.amount''',
+}
+
+# Ageing buckets for the Outstanding view: (label, lower bound, upper bound) in days
+AGEING_BUCKETS = [
+    ("0-30 Days", 0, 30),
+    ("31-60 Days", 31, 60),
+    ("61-90 Days", 61, 90),
+    ("Over 90 Days", 91, None),
+]
+
+# Closed financial years (April to March) can be moved out of the main
+# database into one file per year in this directory, next to the database.
+ARCHIVE_DIR_NAME = "archive"
+
+# Start year of the financial year a bill_date falls in
+_FINANCIAL_YEAR_SQL = "(CAST(strftime('%Y', {column}) AS INTEGER) - (strftime('%m', {column}) < '04'))"
+
+# Online backups: gzip-compressed snapshots in this directory next to the
+# database, taken with the SQLite backup API a few pages at a time so other
+# connections can keep writing in between steps.
+BACKUP_DIR_NAME = "backups"
+BACKUP_KEEP = 10
+BACKUP_INTERVAL = 24 * 60 * 60  # seconds between scheduled backups
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_PAUSE = 0.005  # seconds the database is left unlocked between steps
+BACKUP_MAX_RESTARTS = 3
+BACKUP_COMPRESS_LEVEL = 3  # level 9 is ~20x slower for a few percent smaller files
+
+# Idle-time maintenance. Every connection counts the rows it changed; once
+# enough have changed and nothing has been written for a while, a background
+# thread refreshes the query planner statistics and hands free pages back.
+MAINTENANCE_CHECK_INTERVAL = 60  # seconds between checks
+MAINTENANCE_IDLE_SECONDS = 30  # seconds without writes before maintenance starts
+MAINTENANCE_OPTIMIZE_CHANGES = 1000  # changed rows before PRAGMA optimize
+MAINTENANCE_ANALYZE_CHANGES = 20000  # changed rows before every table is analyzed
+MAINTENANCE_ANALYSIS_LIMIT = 1000  # rows sampled per index, keeps each ANALYZE short
+MAINTENANCE_VACUUM_FREE_PAGES = 256  # free pages before an incremental vacuum
+MAINTENANCE_VACUUM_PAGES_PER_STEP = 128
+MAINTENANCE_STEP_PAUSE = 0.05  # seconds the database is left alone between steps
+MAINTENANCE_LOG_KEEP = 200
+
+# Every statement run on a DatabaseManager connection is timed, including
+# fetching its rows. Statements slower than the threshold are logged together
+# with their query plan.
+SQL_SLOW_QUERY_MS = 100
+SQL_LATENCY_SAMPLES = 1000  # most recent runs kept per statement for percentiles
+SQL_SLOW_LOG_KEEP = 100
+sql_logger = logging.getLogger("invoice_app.sql")
+
+# Shared database service. invoice_server.py serves DatabaseManager over
+# HTTP/JSON; a workstation started with INVOICE_APP_SERVER set to its URL uses
+# RemoteDatabaseManager instead of opening the database file.
+SERVER_PORT = 8765
+SERVER_TIMEOUT = 120  # seconds a call may take, archiving a year can be slow
+SERVER_TOKEN_HEADER = "X-Invoice-Token"
+
+# Schema version kept in PRAGMA user_version. create_tables returns straight
+# away once a database is at this version, so bump it whenever the tables,
+# indexes or triggers created there change, adding a step to
+# SCHEMA_MIGRATIONS if existing rows need converting.
+SCHEMA_VERSION = 8
+
+# Version -> DatabaseManager method run once when a database is upgraded past it
+SCHEMA_MIGRATIONS = {
+    1: "_migrate_legacy_tables",
+    2: "_enable_incremental_vacuum",
+    3: "_add_invoice_seller",
+}
+
+# Databases older than this get their GST summaries rebuilt: the recipients'
+# rows used to be taxed from the line amounts rather than taken from the invoices.
+GST_SUMMARY_VERSION = 8
+
+# Tables of the original single-window app, replaced by companies, invoices
+# and invoice_items
+LEGACY_TABLES = ("bill_items", "bills", "clients")
+
+# Columnar export for analytics (needs pyarrow). Invoices and their lines are
+# written as Parquet files partitioned by month, PARQUET_CHUNK_ROWS rows at a
+# time. Columns are (name, SQL expression, type): dates and timestamps come out
+# of SQLite as days and seconds since 1970 and are stored as date32 and
+# timestamp[s].
+PARQUET_CHUNK_ROWS = 50000
+_PARQUET_DAYS_SQL = "CAST(julianday({column}) - 2440587.5 AS INTEGER)"
+_PARQUET_SECONDS_SQL = "CAST(strftime('%s', {column}) AS INTEGER)"
+PARQUET_INVOICE_COLUMNS = [
+    ("invoice_id", "i.id", "int64"),
+    ("bill_number", "i.bill_number", "string"),
+    ("bill_date", _PARQUET_DAYS_SQL.format(column="i.bill_date"), "date32"),
+    ("seller_gstin", "i.seller_gstin", "string"),
+    ("bill_to_name", "b.company_name", "string"),
+    ("bill_to_gst", "b.gst_number", "string"),
+    ("ship_to_name", "s.company_name", "string"),
+    ("ship_to_gst", "s.gst_number", "string"),
+    ("ship_from_name", "f.company_name", "string"),
+    ("ship_from_gst", "f.gst_number", "string"),
+] + [(column, f"i.{column}", "float64") for column in INVOICE_TAX_COLUMNS] + [
+    ("advance_amount", "i.advance_amount", "float64"),
+    ("created_at", _PARQUET_SECONDS_SQL.format(column="i.created_at"), "timestamp[s]"),
+    ("updated_at", _PARQUET_SECONDS_SQL.format(column="i.updated_at"), "timestamp[s]"),
+    ("archived_year", "?", "int32"),
+]
+PARQUET_ITEM_COLUMNS = [
+    ("line_id", "ii.id", "int64"),
+    ("invoice_id", "ii.invoice_id", "int64"),
+    ("bill_number", "i.bill_number", "string"),
+    ("bill_date", _PARQUET_DAYS_SQL.format(column="i.bill_date"), "date32"),
+    ("product_id", "ii.product_id", "int64"),
+    ("sku_code", "p.sku_code", "string"),
+    ("product_name", "p.product_name", "string"),
+    ("hsn_code", "p.hsn_code", "string"),
+    ("quantity", "ii.quantity", "int64"),
+    ("price_per_unit", "ii.price_per_unit", "float64"),
+    ("amount", "ii.amount", "float64"),
+    ("archived_year", "?", "int32"),
+]
+# Rows come out in bill date order, which idx_invoices_bill_date makes a scan
+# instead of a sort, so every month is written in one go
+_PARQUET_SQL = {
+    "invoices": '''
+    SELECT {columns}, strftime('%Y-%m', i.bill_date)
+    FROM {schema}.invoices i
+    JOIN companies b ON i.bill_to_company_id = b.id
+    JOIN companies s ON i.ship_to_company_id = s.id
+    JOIN companies f ON i.ship_from_company_id = f.id
+    ORDER BY i.bill_date, i.id
+    ''',
+    "invoice_items": '''
+    SELECT {columns}, strftime('%Y-%m', i.bill_date)
+    FROM {schema}.invoices i
+    JOIN {schema}.invoice_items ii ON ii.invoice_id = i.id
+    JOIN products p ON ii.product_id = p.id
+    ORDER BY i.bill_date, i.id, ii.id
+    ''',
+}
+
+def financial_year_label(start_year):
+    """Label for the financial year starting in April of `start_year`, e.g. 2023-24."""
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+def current_financial_year():
+    today = date.today()
+    return today.year if today.month >= 4 else today.year - 1
+
+class _StatementStats:
+    __slots__ = ("sql", "count", "total", "rows", "samples")
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.samples = collections.deque(maxlen=SQL_LATENCY_SAMPLES)
+
+class _Execution:
+    """One run of a statement; fetching its rows adds to its time."""
+    __slots__ = ("stats", "seconds", "rows", "slow_entry")
+
+    def __init__(self, stats, seconds):
+        self.stats = stats
+        self.seconds = seconds
+        self.rows = 0
+        # Slow query log entry, kept up to date as the remaining rows are fetched
+        self.slow_entry = None
+
+class SqlStatistics:
+    """Counts, latency and rows returned per SQL statement, plus a log of the
+    statements that took longer than slow_query_ms with their query plans."""
+
+    def __init__(self, slow_query_ms=SQL_SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self.statements = {}
+        self.slow_queries = collections.deque(maxlen=SQL_SLOW_LOG_KEEP)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.statements = {}
+            self.slow_queries.clear()
+
+    def begin(self, sql, seconds):
+        stats = self.statements.get(sql)
+        with self._lock:
+            if stats is None:
+                stats = self.statements.setdefault(sql, _StatementStats(" ".join(sql.split())))
+            execution = _Execution(stats, seconds)
+            stats.count += 1
+            stats.total += seconds
+            stats.samples.append(execution)
+        return execution
+
+    def add(self, execution, seconds, rows):
+        with self._lock:
+            execution.seconds += seconds
+            execution.rows += rows
+            execution.stats.total += seconds
+            execution.stats.rows += rows
+            if execution.slow_entry is not None:
+                execution.slow_entry['duration_ms'] = round(execution.seconds * 1000, 1)
+                execution.slow_entry['rows'] = execution.rows
+
+    def check_slow(self, connection, execution, sql, parameters):
+        if execution.slow_entry is not None or execution.seconds * 1000 < self.slow_query_ms:
+            return
+        execution.slow_entry = entry = {
+            'logged_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'sql': execution.stats.sql,
+            'duration_ms': round(execution.seconds * 1000, 1),
+            'rows': execution.rows,
+            'plan': self.explain(connection, sql, parameters),
+        }
+        self.slow_queries.append(entry)
+        sql_logger.warning("Slow query (%.1f ms): %s\n%s", entry['duration_ms'], entry['sql'], entry['plan'])
+
+    @staticmethod
+    def explain(connection, sql, parameters=()):
+        """EXPLAIN QUERY PLAN output as an indented tree."""
+        try:
+            # A plain cursor, so the EXPLAIN itself is not recorded
+            rows = sqlite3.Cursor(connection).execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        except sqlite3.Error as e:
+            return f"(no plan: {e})"
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return "\n".join(lines)
+
+    def summary(self):
+        """One row per distinct statement, most total time first. Percentiles
+        cover the last SQL_LATENCY_SAMPLES runs of the statement."""
+        merged = {}
+        with self._lock:
+            for stats in self.statements.values():
+                row = merged.setdefault(stats.sql, {'sql': stats.sql, 'count': 0, 'total': 0.0,
+                                                    'rows': 0, 'samples': []})
+                row['count'] += stats.count
+                row['total'] += stats.total
+                row['rows'] += stats.rows
+                row['samples'].extend(execution.seconds for execution in stats.samples)
+        summary = []
+        for row in merged.values():
+            samples = sorted(row.pop('samples'))
+            total = row.pop('total')
+            summary.append({
+                **row,
+                'total_ms': round(total * 1000, 2),
+                'mean_ms': round(total * 1000 / row['count'], 3),
+                'p50_ms': round(percentile(samples, 0.5) * 1000, 3),
+                'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+                'p99_ms': round(percentile(samples, 0.99) * 1000, 3),
+                'max_ms': round(samples[-1] * 1000, 3) if samples else 0.0,
+            })
+        summary.sort(key=lambda row: row['total_ms'], reverse=True)
+        return summary
+
+SQL_STATS = SqlStatistics()
+
+class _StatsCursor(sqlite3.Cursor):
+    """Cursor recording every statement it runs in SQL_STATS. Time spent
+    fetching rows counts towards the statement that produced them."""
+    _execution = None
+    _sql = None
+    _parameters = ()
+
+    def _run(self, method, sql, parameters, explain_parameters):
+        start = time.perf_counter()
+        try:
+            return method(sql, parameters)
+        finally:
+            self._execution = SQL_STATS.begin(sql, time.perf_counter() - start)
+            self._sql, self._parameters = sql, explain_parameters
+            SQL_STATS.check_slow(self.connection, self._execution, sql, explain_parameters)
+
+    def _fetched(self, start, rows):
+        if self._execution is not None:
+            SQL_STATS.add(self._execution, time.perf_counter() - start, rows)
+            SQL_STATS.check_slow(self.connection, self._execution, self._sql, self._parameters)
+
+    def execute(self, sql, parameters=()):
+        return self._run(super().execute, sql, parameters, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        # The parameters may be a generator that is used up by now, so slow
+        # batches are explained with unbound (NULL) parameters
+        return self._run(super().executemany, sql, seq_of_parameters, ())
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, row is not None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, len(rows))
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(start, 0)
+            raise
+        self._fetched(start, 1)
+        return row
+
+class _TrackedConnection(sqlite3.Connection):
+    """Connection that records every statement in SQL_STATS and reports how
+    many rows it changed when it is closed."""
+    on_close = None
+
+    def cursor(self, factory=_StatsCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self):
+        if self.on_close is not None:
+            changes = self.total_changes
+            if changes:
+                self.on_close(changes)
+            self.on_close = None
+        super().close()
+
+def _write_parquet_months(cursor, columns, directory, label, chunk_rows):
+    """Stream the rows of an executed _PARQUET_SQL query, which end with their
+    month and come in month order, into directory/month=YYYY-MM/<label>.parquet.
+    Returns (rows written, months written)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, pa.type_for_alias(type_name)) for name, _, type_name in columns])
+    # Dates and timestamps arrive as numbers, build them as such and cast
+    read_types = [pa.int32() if pa.types.is_date(field.type) else
+                  pa.int64() if pa.types.is_timestamp(field.type) else field.type for field in schema]
+    rows_written = 0
+    months = []
+    writer = None
+    try:
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            values = list(zip(*rows))
+            month_values = values.pop()
+            start = 0
+            for month, group in itertools.groupby(month_values):
+                end = start + sum(1 for _ in group)
+                if not months or months[-1] != month:
+                    if writer is not None:
+                        writer.close()
+                    folder = os.path.join(directory, f"month={month or 'unknown'}")
+                    os.makedirs(folder, exist_ok=True)
+                    writer = pq.ParquetWriter(os.path.join(folder, f"{label}.parquet"), schema)
+                    months.append(month)
+                writer.write_batch(pa.record_batch(
+                    [pa.array(column[start:end], read_type).cast(field.type)
+                     for column, read_type, field in zip(values, read_types, schema)], schema=schema))
+                rows_written += end - start
+                start = end
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_written, months
+
+@trace_methods("db")
+class DatabaseManager:
+    def __init__(self, db_file="invoice_app.db"):
+        self.db_file = db_file
+        self._backup_stop = None
+        # Held while a backup is taken or restored, by the scheduler or the GUI
+        self._backup_lock = threading.RLock()
+        self._maintenance_stop = None
+        # Rows changed since the counts were last saved to maintenance_state
+        self._write_lock = threading.Lock()
+        self._pending_writes = 0
+        self._last_write = time.monotonic()
+        self.create_tables()
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_file, factory=_TrackedConnection)
+        conn.on_close = self._record_writes
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys = ON')
+        return conn
+
+    def _record_writes(self, changes):
+        with self._write_lock:
+            self._pending_writes += changes
+            self._last_write = time.monotonic()
+
+    def seconds_since_last_write(self):
+        return time.monotonic() - self._last_write
+    
+    def create_tables(self):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA user_version')
+        version = cursor.fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            try:
+                cursor.execute('SELECT 1 FROM invoice_search LIMIT 0')
+                self.search_enabled = True
+            except sqlite3.OperationalError:
+                self.search_enabled = False
+            conn.close()
+            return
+        
+        # Migrations below rebuild tables, which must not trigger foreign key actions
+        cursor.execute('PRAGMA foreign_keys = OFF')
+        
+        # Companies table (for bill_to, ship_to, and ship_from)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_name TEXT NOT NULL,
+            address TEXT NOT NULL,
+            gst_number TEXT UNIQUE NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Products table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            sku_code TEXT UNIQUE NOT NULL,
+            product_name TEXT NOT NULL,
+            hsn_code TEXT NOT NULL,
+            price_per_unit REAL NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        
+        # Invoices table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bill_number TEXT UNIQUE NOT NULL,
+            bill_date DATE NOT NULL,
+            bill_to_company_id INTEGER NOT NULL,
+            ship_to_company_id INTEGER NOT NULL,
+            ship_from_company_id INTEGER NOT NULL,
+            signature_path TEXT,
+            advance_amount REAL DEFAULT 0,
+            total_amount REAL NOT NULL,
+            taxable_value REAL,
+            sgst_rate REAL,
+            sgst_amount REAL,
+            cgst_rate REAL,
+            cgst_amount REAL,
+            igst_amount REAL,
+            round_off REAL,
+            grand_total REAL,
+            seller_gstin TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (bill_to_company_id) REFERENCES companies (id),
+            FOREIGN KEY (ship_to_company_id) REFERENCES companies (id),
+            FOREIGN KEY (ship_from_company_id) REFERENCES companies (id)
+        )
+        ''')
+        
+        # Invoice items table
+        cursor.execute(INVOICE_ITEMS_TABLE_SQL.format(table="IF NOT EXISTS invoice_items"))
+        self._add_invoice_items_cascade(cursor)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_invoice_items_invoice_id ON invoice_items (invoice_id)')
+        tax_columns_added = self._add_invoice_tax_columns(cursor)
+        self._add_invoice_updated_at(cursor)
+        
+        # GST summary tables, one row per month and recipient / product
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'gst_b2b_summary'")
+        gst_summaries_exist = cursor.fetchone() is not None
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS gst_b2b_summary (
+            period TEXT NOT NULL,
+            company_id INTEGER NOT NULL,
+            invoice_count INTEGER NOT NULL DEFAULT 0,
+            taxable_value REAL NOT NULL DEFAULT 0,
+            cgst_amount REAL NOT NULL DEFAULT 0,
+            sgst_amount REAL NOT NULL DEFAULT 0,
+            igst_amount REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, company_id)
+        ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS gst_hsn_summary (
+            period TEXT NOT NULL,
+            product_id INTEGER NOT NULL,
+            line_count INTEGER NOT NULL DEFAULT 0,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            taxable_value REAL NOT NULL DEFAULT 0,
+            cgst_amount REAL NOT NULL DEFAULT 0,
+            sgst_amount REAL NOT NULL DEFAULT 0,
+            igst_amount REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, product_id)
+        ) WITHOUT ROWID
+        ''')
+        
+        # Payments and the per-client receivables ledger
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS payments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL,
+            invoice_id INTEGER,
+            payment_date DATE NOT NULL,
+            amount REAL NOT NULL,
+            reference TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (company_id) REFERENCES companies (id),
+            FOREIGN KEY (invoice_id) REFERENCES invoices (id) ON DELETE SET NULL
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_company_id ON payments (company_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_invoice_id ON payments (invoice_id)')
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'client_ledger'")
+        ledger_exists = cursor.fetchone() is not None
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS client_ledger (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL,
+            entry_date DATE NOT NULL,
+            entry_type TEXT NOT NULL,
+            invoice_id INTEGER,
+            payment_id INTEGER,
+            debit REAL NOT NULL DEFAULT 0,
+            credit REAL NOT NULL DEFAULT 0,
+            running_balance REAL NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_client_ledger_company_id ON client_ledger (company_id, id)')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS client_balances (
+            company_id INTEGER PRIMARY KEY,
+            total_invoiced REAL NOT NULL DEFAULT 0,
+            total_paid REAL NOT NULL DEFAULT 0,
+            balance REAL NOT NULL DEFAULT 0,
+            last_entry_date DATE
+        )
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoice_receivables (
+            invoice_id INTEGER PRIMARY KEY,
+            company_id INTEGER NOT NULL,
+            bill_date DATE NOT NULL,
+            amount_due REAL NOT NULL,
+            amount_paid REAL NOT NULL DEFAULT 0
+        )
+        ''')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_invoice_receivables_open
+        ON invoice_receivables (company_id, bill_date) WHERE amount_due - amount_paid > 0.005
+        ''')
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_invoice_items_product_id ON invoice_items (product_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_invoices_bill_date ON invoices (bill_date)')
+        
+        # Full-text index over invoices. The trigram tokenizer matches any
+        # substring of three or more characters, e.g. part of a GSTIN or SKU.
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'invoice_search'")
+        search_index_exists = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS invoice_search
+            USING fts5(bill_number, parties, products, tokenize='trigram')
+            ''')
+            self.search_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 or the trigram tokenizer (older than 3.34)
+            self.search_enabled = False
+        
+        # Dashboard KPI cache, refreshed incrementally by refresh_dashboard_cache
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dashboard_monthly (
+            period TEXT PRIMARY KEY,
+            invoice_count INTEGER NOT NULL DEFAULT 0,
+            taxable_value REAL NOT NULL DEFAULT 0,
+            grand_total REAL NOT NULL DEFAULT 0
+        )
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dashboard_clients (
+            company_id INTEGER PRIMARY KEY,
+            invoice_count INTEGER NOT NULL DEFAULT 0,
+            grand_total REAL NOT NULL DEFAULT 0
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dashboard_clients_total ON dashboard_clients (grand_total)')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dashboard_products (
+            product_id INTEGER PRIMARY KEY,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            amount REAL NOT NULL DEFAULT 0
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dashboard_products_amount ON dashboard_products (amount)')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dashboard_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            watermark_id INTEGER NOT NULL DEFAULT 0,
+            watermark_created_at TIMESTAMP,
+            needs_rebuild INTEGER NOT NULL DEFAULT 0,
+            refreshed_at TIMESTAMP
+        )
+        ''')
+        cursor.execute('INSERT OR IGNORE INTO dashboard_state (id) VALUES (1)')
+        
+        # Archived financial years and the bill numbers stored in each archive file
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoice_archives (
+            financial_year INTEGER PRIMARY KEY,
+            file_name TEXT NOT NULL,
+            invoice_count INTEGER NOT NULL DEFAULT 0,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS archived_invoices (
+            bill_number TEXT PRIMARY KEY,
+            invoice_id INTEGER NOT NULL,
+            financial_year INTEGER NOT NULL
+        ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_archived_invoices_invoice_id ON archived_invoices (invoice_id)')
+
+        # Rows changed since maintenance last ran, and what each run did
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            changes_since_optimize INTEGER NOT NULL DEFAULT 0,
+            changes_since_analyze INTEGER NOT NULL DEFAULT 0,
+            last_run_at TIMESTAMP
+        )
+        ''')
+        cursor.execute('INSERT OR IGNORE INTO maintenance_state (id) VALUES (1)')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            task TEXT NOT NULL,
+            detail TEXT,
+            duration_ms REAL NOT NULL
+        )
+        ''')
+        
+        # Latest change of each invoice since the last delta export, and where
+        # that export stopped. Deleted invoices keep their row until exported.
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS invoice_changes (
+            invoice_id INTEGER PRIMARY KEY,
+            bill_number TEXT NOT NULL,
+            change TEXT NOT NULL,
+            change_id INTEGER NOT NULL,
+            inserted_id INTEGER,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_invoice_changes_change_id ON invoice_changes (change_id)')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS export_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_change_id INTEGER NOT NULL DEFAULT 0,
+            checkpoint_id INTEGER,
+            exported_at TIMESTAMP
+        )
+        ''')
+        cursor.execute('INSERT OR IGNORE INTO export_state (id) VALUES (1)')
+
+        self._sync_triggers(cursor, self._app_triggers())
+        if not ledger_exists:
+            self._backfill_ledger(cursor)
+        elif tax_columns_added:
+            self._post_round_off_adjustments(cursor)
+        if self.search_enabled and not search_index_exists:
+            self._rebuild_search_index(cursor)
+        
+        # Run after the triggers exist so migrated rows are posted like new ones
+        vacuum = self._run_migrations(cursor, version)
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        conn.commit()
+        # Archive files can only be attached outside a transaction
+        self._extend_archives(cursor)
+        if not gst_summaries_exist or version < GST_SUMMARY_VERSION:
+            self._rebuild_gst_summaries(cursor)
+            conn.commit()
+        if vacuum:
+            conn.execute('VACUUM')
+        conn.close()
+    
+    def _run_migrations(self, cursor, version):
+        """Run the SCHEMA_MIGRATIONS steps newer than `version` in order.
+        Returns True if a step dropped enough data to be worth a VACUUM."""
+        vacuum = False
+        for step in sorted(SCHEMA_MIGRATIONS):
+            if step > version:
+                vacuum = getattr(self, SCHEMA_MIGRATIONS[step])(cursor) or vacuum
+        return vacuum
+    
+    def _migrate_legacy_tables(self, cursor):
+        """Move rows left in the clients, bills and bill_items tables of the
+        original app into companies, invoices and invoice_items, then drop them.
+        
+        Clients are matched on GST number and bill items on SKU; SKUs missing
+        from products are added with the SKU as their name. Returns True if any
+        legacy table was dropped.
+        """
+        cursor.execute(f'''
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND name IN ({", ".join("?" * len(LEGACY_TABLES))})
+        ''', LEGACY_TABLES)
+        legacy = {row['name'] for row in cursor.fetchall()}
+        if not legacy:
+            return False
+        
+        if 'clients' in legacy:
+            cursor.execute('''
+            INSERT INTO companies (company_name, address, gst_number)
+            SELECT company_name, address, gst_number FROM clients WHERE true
+            ON CONFLICT (gst_number) DO NOTHING
+            ''')
+        if 'bill_items' in legacy:
+            cursor.execute('''
+            INSERT INTO products (sku_code, product_name, hsn_code, price_per_unit)
+            SELECT sku_code, sku_code, '', ROUND(MAX(amount / quantity), 2)
+            FROM bill_items
+            WHERE sku_code IS NOT NULL AND quantity > 0
+            GROUP BY sku_code
+            ON CONFLICT (sku_code) DO NOTHING
+            ''')
+        if {'clients', 'bills'} <= legacy:
+            self._migrate_legacy_bills(cursor, 'bill_items' in legacy)
+        
+        for table in LEGACY_TABLES:
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+        return True
+    
+    def _enable_incremental_vacuum(self, cursor):
+        """Switch to incremental auto-vacuum so maintenance can hand free pages
+        back without rewriting the whole file. The new mode only takes effect
+        after a VACUUM, so returns True when it was changed."""
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] == 2:
+            return False
+        cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        return True
+
+    def _add_invoice_seller(self, cursor):
+        """Add the GSTIN each invoice was issued under. Invoices saved before it
+        existed keep NULL, which renders as DEFAULT_SELLER like they always have."""
+        cursor.execute('PRAGMA table_info(invoices)')
+        if 'seller_gstin' not in {row['name'] for row in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE invoices ADD COLUMN seller_gstin TEXT')
+
+    def _add_invoice_updated_at(self, cursor):
+        """Add the time each invoice last changed, starting at its creation time.
+        A column added to an existing table cannot default to the current time,
+        so trg_export_invoice_insert stamps new invoices in such databases."""
+        cursor.execute('PRAGMA table_info(invoices)')
+        if 'updated_at' not in {row['name'] for row in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE invoices ADD COLUMN updated_at TIMESTAMP')
+            cursor.execute('UPDATE invoices SET updated_at = created_at')
+
+    def _extend_archives(self, cursor):
+        """Add the invoice columns added since each archive file was written,
+        e.g. seller_gstin and updated_at, so queries naming them read every year."""
+        for schema, _ in self._attach_archives(cursor):
+            self._create_archive_tables(cursor, schema)
+
+    def _migrate_legacy_bills(self, cursor, with_items):
+        """Copy legacy bills into invoices, billed, shipped to and from the client.
+        
+        Bills keep their number as INV-XXXX unless that would not follow the
+        newest existing invoice, in which case they are numbered after it so
+        get_next_bill_number keeps counting up.
+        """
+        cursor.execute('''
+        SELECT b.id, b.bill_no, b.bill_date, b.advance_paid, b.signature_path, c.id as company_id
+        FROM bills b
+        JOIN clients l ON l.id = b.client_id
+        JOIN companies c ON c.gst_number = l.gst_number
+        ORDER BY b.bill_no, b.id
+        ''')
+        bills = cursor.fetchall()
+        next_number = self._next_bill_sequence(cursor)
+        
+        for bill in bills:
+            items = []
+            if with_items:
+                cursor.execute('''
+                SELECT p.id as product_id, bi.quantity, bi.amount
+                FROM bill_items bi
+                JOIN products p ON p.sku_code = bi.sku_code
+                WHERE bi.bill_id = ? AND bi.quantity > 0
+                ORDER BY bi.id
+                ''', (bill['id'],))
+                items = cursor.fetchall()
+            
+            number = max(bill['bill_no'] or 0, next_number)
+            next_number = number + 1
+            totals = calculate_invoice_totals(sum(item['amount'] for item in items))
+            cursor.execute('''
+            INSERT INTO invoices (bill_number, bill_date, bill_to_company_id,
+                                ship_to_company_id, ship_from_company_id,
+                                signature_path, advance_amount, total_amount,
+                                taxable_value, sgst_rate, sgst_amount, cgst_rate,
+                                cgst_amount, igst_amount, round_off, grand_total)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (f"INV-{number:04d}", bill['bill_date'], bill['company_id'], bill['company_id'],
+                  bill['company_id'], bill['signature_path'], bill['advance_paid'] or 0,
+                  totals['taxable_value'], *(totals[column] for column in INVOICE_TAX_COLUMNS)))
+            invoice_id = cursor.lastrowid
+            cursor.executemany('''
+            INSERT INTO invoice_items (invoice_id, product_id, quantity, price_per_unit, amount)
+            VALUES (?, ?, ?, ?, ?)
+            ''', [(invoice_id, item['product_id'], item['quantity'],
+                   round(item['amount'] / item['quantity'], 2), item['amount']) for item in items])
+    
+    def _add_invoice_items_cascade(self, cursor):
+        """Rebuild invoice_items from databases created before its foreign key to
+        invoices had ON DELETE CASCADE."""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'invoice_items'")
+        if 'ON DELETE CASCADE' in cursor.fetchone()[0]:
+            return
+        
+        # Triggers on invoices refer to invoice_items, which would block the rename
+        for name in {**GST_SUMMARY_TRIGGERS, **LEDGER_TRIGGERS, **SEARCH_TRIGGERS, **DASHBOARD_TRIGGERS,
+                     **EXPORT_TRIGGERS}:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'invoice_items'")
+        sequence = cursor.fetchone()
+        
+        cursor.execute(INVOICE_ITEMS_TABLE_SQL.format(table="invoice_items_new"))
+        cursor.execute('''
+        INSERT INTO invoice_items_new (id, invoice_id, product_id, quantity, price_per_unit, amount, created_at)
+        SELECT id, invoice_id, product_id, quantity, price_per_unit, amount, created_at FROM invoice_items
+        ''')
+        cursor.execute('DROP TABLE invoice_items')
+        cursor.execute('ALTER TABLE invoice_items_new RENAME TO invoice_items')
+        if sequence:
+            cursor.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'invoice_items'", (sequence[0],))
+    
+    def _add_invoice_tax_columns(self, cursor):
+        """One-off migration storing the tax breakdown on each invoice row.
+
+        Databases created before these columns existed only kept the pre-tax
+        total_amount; the new columns are added and backfilled from the line items.
+        Returns True if the migration ran.
+        """
+        cursor.execute('PRAGMA table_info(invoices)')
+        existing = {row['name'] for row in cursor.fetchall()}
+        missing = [column for column in INVOICE_TAX_COLUMNS if column not in existing]
+        if not missing:
+            return False
+        
+        for column in missing:
+            cursor.execute(f'ALTER TABLE invoices ADD COLUMN {column} REAL')
+        
+        cursor.execute(f'''
+        UPDATE invoices
+        SET taxable_value = ROUND(COALESCE((SELECT SUM(amount) FROM invoice_items
+                                            WHERE invoice_id = invoices.id), total_amount), 2),
+            sgst_rate = {SGST_RATE},
+            cgst_rate = {CGST_RATE},
+            igst_amount = 0
+        ''')
+        cursor.execute('''
+        UPDATE invoices
+        SET sgst_amount = ROUND(taxable_value * sgst_rate / 100.0, 2),
+            cgst_amount = ROUND(taxable_value * cgst_rate / 100.0, 2)
+        ''')
+        cursor.execute('''
+        UPDATE invoices
+        SET grand_total = ROUND(ROUND(taxable_value + sgst_amount + cgst_amount, 2), 0),
+            round_off = ROUND(ROUND(ROUND(taxable_value + sgst_amount + cgst_amount, 2), 0)
+                              - ROUND(taxable_value + sgst_amount + cgst_amount, 2), 2)
+        ''')
+        return True
+    
+    def _post_round_off_adjustments(self, cursor):
+        """Bring ledger balances in line with the backfilled grand totals.
+
+        Invoices posted before the migration were charged their unrounded total;
+        the difference to grand_total is posted as a round off entry.
+        """
+        cursor.execute('''
+        SELECT r.invoice_id, r.company_id, i.bill_date, i.grand_total - r.amount_due as difference
+        FROM invoice_receivables r
+        JOIN invoices i ON i.id = r.invoice_id
+        WHERE ABS(i.grand_total - r.amount_due) >= 0.005
+        ORDER BY r.invoice_id
+        ''')
+        for adjustment in cursor.fetchall():
+            difference = round(adjustment['difference'], 2)
+            cursor.execute('''
+            INSERT INTO client_ledger (company_id, entry_date, entry_type, invoice_id,
+                                       debit, credit, running_balance)
+            VALUES (?, ?, 'round off', ?, ?, ?,
+                    COALESCE((SELECT balance FROM client_balances WHERE company_id = ?), 0) + ?)
+            ''', (adjustment['company_id'], adjustment['bill_date'], adjustment['invoice_id'],
+                  max(difference, 0), max(-difference, 0), adjustment['company_id'], difference))
+            cursor.execute('''
+            UPDATE client_balances
+            SET total_invoiced = total_invoiced + ?, balance = balance + ?
+            WHERE company_id = ?
+            ''', (difference, difference, adjustment['company_id']))
+            cursor.execute('''
+            UPDATE invoice_receivables SET amount_due = amount_due + ? WHERE invoice_id = ?
+            ''', (difference, adjustment['invoice_id']))
+    
+    def _app_triggers(self):
+        triggers = {**GST_SUMMARY_TRIGGERS, **LEDGER_TRIGGERS, **DASHBOARD_TRIGGERS, **EXPORT_TRIGGERS}
+        if self.search_enabled:
+            triggers.update(SEARCH_TRIGGERS)
+        return triggers
+    
+    def _sync_triggers(self, cursor, triggers):
+        """Create the given triggers, replacing any whose definition has changed."""
+        for name, sql in triggers.items():
+            sql = textwrap.dedent(sql).strip()
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,))
+            existing = cursor.fetchone()
+            if existing and existing[0] == sql:
+                continue
+            cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(sql)
+    
+    def _rebuild_gst_summaries(self, cursor):
+        # Archived years are no longer in invoices but still count. Read them
+        # before writing, archives cannot be detached mid-transaction.
+        archived = []
+        for schema, _ in self._attach_archives(cursor):
+            rows = {}
+            for name, sql in _GST_AGGREGATE_SQL.items():
+                cursor.execute(sql.format(schema=schema))
+                rows[name] = [tuple(row) for row in cursor.fetchall()]
+            archived.append(rows)
+        cursor.execute('DELETE FROM gst_b2b_summary')
+        cursor.execute('DELETE FROM gst_hsn_summary')
+        for name, sql in _GST_AGGREGATE_SQL.items():
+            cursor.execute(_GST_UPSERT_SQL[name].format(rows=sql.format(schema="main")))
+        for rows in archived:
+            cursor.executemany(_GST_UPSERT_SQL['b2b'].format(rows="VALUES (?, ?, ?, ?, ?, ?, ?)"), rows['b2b'])
+            cursor.executemany(_GST_UPSERT_SQL['hsn'].format(rows="VALUES (?, ?, ?, ?, ?, ?, ?, ?)"), rows['hsn'])
+    
+    def _backfill_ledger(self, cursor):
+        """Post every existing invoice and advance to a freshly created ledger."""
+        cursor.execute(f'''
+        INSERT INTO client_ledger (company_id, entry_date, entry_type, invoice_id,
+                                   debit, credit, running_balance)
+        SELECT company_id, entry_date, entry_type, invoice_id, debit, credit,
+               SUM(debit - credit) OVER (PARTITION BY company_id ORDER BY seq)
+        FROM (
+            SELECT bill_to_company_id as company_id, bill_date as entry_date, 'invoice' as entry_type,
+                   id as invoice_id, {_invoice_due_sql("invoices")} as debit, 0 as credit, id * 2 as seq
+            FROM invoices
+            UNION ALL
+            SELECT bill_to_company_id, bill_date, 'advance', id, 0, advance_amount, id * 2 + 1
+            FROM invoices WHERE advance_amount > 0
+        )
+        ORDER BY seq
+        ''')
+        cursor.execute('''
+        INSERT INTO client_balances (company_id, total_invoiced, total_paid, balance, last_entry_date)
+        SELECT company_id, SUM(debit), SUM(credit), SUM(debit - credit), MAX(entry_date)
+        FROM client_ledger
+        GROUP BY company_id
+        ''')
+        cursor.execute(f'''
+        INSERT INTO invoice_receivables (invoice_id, company_id, bill_date, amount_due, amount_paid)
+        SELECT id, bill_to_company_id, bill_date, {_invoice_due_sql("invoices")}, COALESCE(advance_amount, 0)
+        FROM invoices
+        ''')
+    
+    def _rebuild_search_index(self, cursor):
+        cursor.execute('DELETE FROM invoice_search')
+        cursor.execute(f'''
+        INSERT INTO invoice_search (rowid, bill_number, parties, products)
+        SELECT i.id, i.bill_number, {_SEARCH_PARTIES_SQL.format(row="i")},
+               {_SEARCH_PRODUCTS_SQL.format(invoice_id="i.id")}
+        FROM invoices i
+        ''')
+    
+    def rebuild_gst_summaries(self):
+        """Recompute the GST summary tables from scratch, e.g. after restoring old data."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            self._rebuild_gst_summaries(cursor)
+            conn.commit()
+            conn.close()
+            return True, None
+        except Exception as e:
+            conn.rollback()
+            conn.close()
+            return False, str(e)
+    
+    def gst_report(self):
+        return GSTReport(self)
+    
+    def add_company(self, company_name, address, gst_number):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+            INSERT INTO companies (company_name, address, gst_number)
+            VALUES (?, ?, ?)
+            ''', (company_name, address, gst_number))
+            conn.commit()
+            company_id = cursor.lastrowid
+            conn.close()
+            return company_id, None
+        except sqlite3.IntegrityError:
+            conn.close()
+            return None, "GST Number already exists"
+    
+    def get_company_by_gst(self, gst_number):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT * FROM companies WHERE gst_number = ?
+        ''', (gst_number,))
+        
+        company = cursor.fetchone()
+        conn.close()
+        
+        if company:
+            return dict(company)
+        return None
+    
+    def get_all_companies(self):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM companies ORDER BY company_name')
+        
+        companies = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return companies
+    
+    def get_company_by_id(self, company_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM companies WHERE id = ?', (company_id,))
+        
+        company = cursor.fetchone()
+        conn.close()
+        
+        if company:
+            return dict(company)
+        return None
+    
+    def update_company(self, company_id, company_name, address, gst_number):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # First check if the new GST number conflicts with any other company
+            cursor.execute('''
+            SELECT id FROM companies 
+            WHERE gst_number = ? AND id != ?
+            ''', (gst_number, company_id))
+            
+            if cursor.fetchone():
+                conn.close()
+                return False, "GST Number already exists for another company"
+            
+            cursor.execute('''
+            UPDATE companies 
+            SET company_name = ?, address = ?, gst_number = ?
+            WHERE id = ?
+            ''', (company_name, address, gst_number, company_id))
+            
+            conn.commit()
+            conn.close()
+            return True, None
+        except Exception as e:
+            conn.close()
+            return False, str(e)
+    
+    def delete_company(self, company_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # Check if company is used in any invoice
+            cursor.execute('''
+            SELECT COUNT(*) FROM invoices 
+            WHERE bill_to_company_id = ? OR ship_to_company_id = ? OR ship_from_company_id = ?
+            ''', (company_id, company_id, company_id))
+            
+            count = cursor.fetchone()[0]
+            count += self._count_in_archives(cursor, '''
+            SELECT COUNT(*) FROM {schema}.invoices
+            WHERE bill_to_company_id = ? OR ship_to_company_id = ? OR ship_from_company_id = ?
+            ''', (company_id, company_id, company_id))
+            if count > 0:
+                conn.close()
+                return False, "Cannot delete company as it is used in invoices"
+            
+            cursor.execute('SELECT COUNT(*) FROM payments WHERE company_id = ?', (company_id,))
+            if cursor.fetchone()[0] > 0:
+                conn.close()
+                return False, "Cannot delete company as it has recorded payments"
+            
+            cursor.execute('DELETE FROM companies WHERE id = ?', (company_id,))
+            conn.commit()
+            conn.close()
+            return True, None
+        except Exception as e:
+            conn.close()
+            return False, str(e)
+    
+    def add_product(self, sku_code, product_name, hsn_code, price_per_unit):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+            INSERT INTO products (sku_code, product_name, hsn_code, price_per_unit)
+            VALUES (?, ?, ?, ?)
+            ''', (sku_code, product_name, hsn_code, price_per_unit))
+            conn.commit()
+            product_id = cursor.lastrowid
+            conn.close()
+            return product_id, None
+        except sqlite3.IntegrityError:
+            conn.close()
+            return None, "SKU Code already exists"
+    
+    def diff_catalogue(self, kind, rows):
+        """Compare catalogue rows with the database without changing anything.
+
+        Returns a dict with the new, changed and unchanged rows.
+        """
+        spec = CATALOGUE_IMPORTS[kind]
+        columns = list(spec["columns"])
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT {", ".join(columns)} FROM {spec["table"]}')
+        existing = {row[spec["key"]]: dict(row) for row in cursor.fetchall()}
+        conn.close()
+        
+        diff = {'new': [], 'changed': [], 'unchanged': []}
+        for row in rows:
+            current = existing.get(row[spec["key"]])
+            if current is None:
+                diff['new'].append(row)
+            elif any(current[column] != row[column] for column in columns):
+                diff['changed'].append({**row, 'previous': current})
+            else:
+                diff['unchanged'].append(row)
+        return diff
+    
+    def import_catalogue(self, kind, rows):
+        """Insert new and update changed catalogue rows in one transaction.
+
+        Unchanged rows are not written, so search index triggers only run for
+        records that actually changed. Returns (diff, error), see diff_catalogue.
+        """
+        spec = CATALOGUE_IMPORTS[kind]
+        columns = list(spec["columns"])
+        updates = [column for column in columns if column != spec["key"]]
+        diff = self.diff_catalogue(kind, rows)
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(f'''
+            INSERT INTO {spec["table"]} ({", ".join(columns)})
+            VALUES ({", ".join("?" for _ in columns)})
+            ON CONFLICT ({spec["key"]}) DO UPDATE SET
+                {", ".join(f"{column} = excluded.{column}" for column in updates)}
+            WHERE {" OR ".join(f"{column} IS NOT excluded.{column}" for column in updates)}
+            ''', [[row[column] for column in columns] for row in diff['new'] + diff['changed']])
+            conn.commit()
+            conn.close()
+            return diff, None
+        except Exception as e:
+            conn.rollback()
+            conn.close()
+            return None, str(e)
+    
+    def get_product_by_id(self, product_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM products WHERE id = ?', (product_id,))
+        
+        product = cursor.fetchone()
+        conn.close()
+        
+        if product:
+            return dict(product)
+        return None
+    
+    def get_all_products(self):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM products ORDER BY product_name')
+        
+        products = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return products
+    
+    def update_product(self, product_id, sku_code, product_name, hsn_code, price_per_unit):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+            UPDATE products 
+            SET sku_code = ?, product_name = ?, hsn_code = ?, price_per_unit = ?
+            WHERE id = ?
+            ''', (sku_code, product_name, hsn_code, price_per_unit, product_id))
+            conn.commit()
+            conn.close()
+            return True, None
+        except sqlite3.IntegrityError:
+            conn.close()
+            return False, "SKU Code already exists"
+    
+    def delete_product(self, product_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # Check if product is used in any invoice
+            cursor.execute('SELECT COUNT(*) FROM invoice_items WHERE product_id = ?', (product_id,))
+            
+            count = cursor.fetchone()[0]
+            count += self._count_in_archives(
+                cursor, 'SELECT COUNT(*) FROM {schema}.invoice_items WHERE product_id = ?', (product_id,))
+            if count > 0:
+                conn.close()
+                return False, "Cannot delete product as it is used in invoices"
+            
+            cursor.execute('DELETE FROM products WHERE id = ?', (product_id,))
+            conn.commit()
+            conn.close()
+            return True, None
+        except Exception as e:
+            conn.close()
+            return False, str(e)
+    
+    @property
+    def backup_dir(self):
+        return os.path.join(os.path.dirname(os.path.abspath(self.db_file)), BACKUP_DIR_NAME)
+    
+    def _copy_database(self, source, target_file):
+        """Copy the `source` connection into target_file, BACKUP_PAGES_PER_STEP pages at a time.
+
+        SQLite starts a stepped backup over whenever another connection writes
+        in between steps. If that keeps happening the copy is finished in one
+        step instead, holding the read lock for its duration.
+        """
+        progress_state = {'remaining': None, 'restarts': 0}
+        
+        def progress(status, remaining, total):
+            if progress_state['remaining'] is not None and remaining > progress_state['remaining']:
+                progress_state['restarts'] += 1
+                if progress_state['restarts'] > BACKUP_MAX_RESTARTS:
+                    raise InterruptedError("backup restarted too often")
+            progress_state['remaining'] = remaining
+            time.sleep(BACKUP_STEP_PAUSE)
+        
+        target = sqlite3.connect(target_file)
+        try:
+            try:
+                source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=progress)
+            except InterruptedError:
+                source.backup(target)
+        finally:
+            target.close()
+    
+    def _check_integrity(self, db_file):
+        """Problems reported by PRAGMA integrity_check, empty if the file is sound."""
+        conn = sqlite3.connect(db_file)
+        try:
+            results = [row[0] for row in conn.execute('PRAGMA integrity_check')]
+        finally:
+            conn.close()
+        return [] if results == ['ok'] else results
+    
+    def _decompress_backup(self, path):
+        fd, db_file = tempfile.mkstemp(suffix=".db", dir=self.backup_dir)
+        with os.fdopen(fd, 'wb') as f_out, gzip.open(path, 'rb') as f_in:
+            shutil.copyfileobj(f_in, f_out)
+        return db_file
+    
+    def _compress_backup(self, db_file, path):
+        with open(db_file, 'rb') as f_in, \
+                gzip.open(path + ".part", 'wb', compresslevel=BACKUP_COMPRESS_LEVEL) as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(path + ".part", path)
+    
+    @staticmethod
+    def _backup_archive_dir(path):
+        """Folder holding the compressed archive files of the backup at `path`."""
+        return path[:-len(".db.gz")] + ".archive"
+    
+    @staticmethod
+    def _archive_file_names(db_file):
+        """Archive files the invoice_archives table of `db_file` refers to."""
+        conn = sqlite3.connect(db_file)
+        try:
+            return [row[0] for row in conn.execute('SELECT file_name FROM invoice_archives')]
+        except sqlite3.OperationalError:
+            # Snapshot of a version without archives
+            return []
+        finally:
+            conn.close()
+    
+    def _archive_file_states(self):
+        """(modification time, size) of every file in the archive folder."""
+        if not os.path.isdir(self.archive_dir):
+            return {}
+        return {entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in os.scandir(self.archive_dir)}
+    
+    def _copy_archives(self, snapshot, target_dir):
+        """Copy, check and compress the archive files `snapshot` refers to into target_dir."""
+        for file_name in self._archive_file_names(snapshot):
+            path = os.path.join(self.archive_dir, file_name)
+            if not os.path.exists(path):
+                continue
+            copy = os.path.join(target_dir, file_name)
+            source = sqlite3.connect(path)
+            target = sqlite3.connect(copy)
+            try:
+                # Archives are only written while invoices are archived, so
+                # one step holds the read lock briefly
+                source.backup(target)
+            finally:
+                source.close()
+                target.close()
+            problems = self._check_integrity(copy)
+            if problems:
+                raise sqlite3.DatabaseError(f"{file_name}: {problems[0]}")
+            self._compress_backup(copy, copy + ".gz")
+            os.remove(copy)
+    
+    def create_backup(self, label=None):
+        """Take a verified, compressed snapshot of the database while it is in use.
+
+        The copy is checked with PRAGMA integrity_check before it is compressed
+        and only the newest BACKUP_KEEP snapshots are kept. The archive files
+        of earlier financial years are copied into a folder next to it; if
+        invoices are archived during the backup it is taken again, so both
+        hold the same invoices. Returns (path, error).
+        """
+        with self._backup_lock:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            name = os.path.splitext(os.path.basename(self.db_file))[0]
+            stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(self.backup_dir, f"{name}-{stamp}{'-' + label if label else ''}.db.gz")
+            snapshot = path[:-len(".gz")] + ".tmp"
+            archive_dir = self._backup_archive_dir(path)
+            
+            try:
+                for _ in range(BACKUP_MAX_RESTARTS + 1):
+                    archive_states = self._archive_file_states()
+                    source = self.get_connection()
+                    try:
+                        self._copy_database(source, snapshot)
+                    finally:
+                        source.close()
+                    
+                    problems = self._check_integrity(snapshot)
+                    if problems:
+                        return None, f"Backup failed the integrity check: {problems[0]}"
+                    
+                    shutil.rmtree(archive_dir + ".part", ignore_errors=True)
+                    os.makedirs(archive_dir + ".part")
+                    self._copy_archives(snapshot, archive_dir + ".part")
+                    if self._archive_file_states() == archive_states:
+                        break
+                else:
+                    return None, "Invoices kept being archived during the backup"
+                
+                # Like the database file, replaces a backup taken in the same second
+                shutil.rmtree(archive_dir, ignore_errors=True)
+                if os.listdir(archive_dir + ".part"):
+                    os.replace(archive_dir + ".part", archive_dir)
+                self._compress_backup(snapshot, path)
+                self._rotate_backups()
+                return path, None
+            except Exception as e:
+                return None, str(e)
+            finally:
+                for leftover in (snapshot, path + ".part"):
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
+                shutil.rmtree(archive_dir + ".part", ignore_errors=True)
+    
+    def list_backups(self):
+        """Backups of this database, newest first. The size includes their archive files."""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        name = os.path.splitext(os.path.basename(self.db_file))[0]
+        backups = []
+        for file_name in os.listdir(self.backup_dir):
+            if file_name.startswith(name + "-") and file_name.endswith(".db.gz"):
+                path = os.path.join(self.backup_dir, file_name)
+                archives = self._backup_archives(path)
+                backups.append({
+                    'path': path,
+                    'file_name': file_name,
+                    'size': os.path.getsize(path) + sum(os.path.getsize(archive) for archive in archives.values()),
+                    'archives': len(archives),
+                    'created': os.path.getmtime(path),
+                })
+        backups.sort(key=lambda backup: backup['created'], reverse=True)
+        return backups
+    
+    def _backup_archives(self, path):
+        """Archive file name -> compressed copy, for the backup at `path`."""
+        archive_dir = self._backup_archive_dir(path)
+        if not os.path.isdir(archive_dir):
+            return {}
+        return {file_name[:-len(".gz")]: os.path.join(archive_dir, file_name)
+                for file_name in os.listdir(archive_dir) if file_name.endswith(".db.gz")}
+    
+    def _rotate_backups(self):
+        for backup in self.list_backups()[BACKUP_KEEP:]:
+            os.remove(backup['path'])
+            shutil.rmtree(self._backup_archive_dir(backup['path']), ignore_errors=True)
+    
+    def _decompress_backup_files(self, path):
+        """Decompress a backup and its archive files and check them with PRAGMA
+        integrity_check. Returns the database file and a dict of archive file
+        name -> decompressed file; the caller removes them. Raises
+        sqlite3.DatabaseError naming the first damaged file."""
+        files = [self._decompress_backup(path)]
+        archives = {}
+        try:
+            for file_name, archive in self._backup_archives(path).items():
+                archives[file_name] = self._decompress_backup(archive)
+                files.append(archives[file_name])
+            for file_name, db_file in [(os.path.basename(path), files[0]), *archives.items()]:
+                problems = self._check_integrity(db_file)
+                if problems:
+                    raise sqlite3.DatabaseError(f"{file_name}: {problems[0]}")
+        except Exception:
+            for db_file in files:
+                os.remove(db_file)
+            raise
+        return files[0], archives
+    
+    def verify_backup(self, path):
+        """Decompress a backup and run PRAGMA integrity_check on it and its
+        archive files. Returns (ok, error)."""
+        try:
+            db_file, archives = self._decompress_backup_files(path)
+        except Exception as e:
+            return False, str(e)
+        for leftover in [db_file, *archives.values()]:
+            os.remove(leftover)
+        return True, None
+    
+    def restore_backup(self, path):
+        """Replace the database contents and its archive files with a backup.
+        The current data is backed up first, labelled "pre-restore". Archive
+        files the restored database does not refer to are removed, since their
+        invoices are back in it. Returns (success, error)."""
+        with self._backup_lock:
+            try:
+                db_file, archives = self._decompress_backup_files(path)
+            except sqlite3.DatabaseError as e:
+                return False, f"Backup failed the integrity check: {str(e)}"
+            except Exception as e:
+                return False, f"Could not read backup: {str(e)}"
+            
+            try:
+                _, error = self.create_backup(label="pre-restore")
+                if error:
+                    return False, f"Could not back up the current data: {error}"
+                
+                restores = [(db_file, self.db_file)]
+                restores += [(archive, os.path.join(self.archive_dir, file_name))
+                             for file_name, archive in archives.items()]
+                os.makedirs(self.archive_dir, exist_ok=True)
+                for source_file, target_file in restores:
+                    source = sqlite3.connect(source_file)
+                    target = sqlite3.connect(target_file)
+                    try:
+                        source.backup(target, pages=BACKUP_PAGES_PER_STEP)
+                    finally:
+                        source.close()
+                        target.close()
+                
+                # Backups taken before archives were included keep the
+                # current files of the years they name
+                kept = set(self._archive_file_names(db_file))
+                for file_name in os.listdir(self.archive_dir):
+                    if file_name.endswith(".db") and file_name not in kept:
+                        os.remove(os.path.join(self.archive_dir, file_name))
+                
+                # Bring snapshots taken by older versions up to the current schema
+                self.create_tables()
+                return True, None
+            except Exception as e:
+                return False, str(e)
+            finally:
+                for leftover in [db_file, *archives.values()]:
+                    os.remove(leftover)
     
-    def add_company(self, company_name, address, gst_number):
+    def start_backup_scheduler(self, interval=BACKUP_INTERVAL, on_backup=None):
+        """Back up in a background thread whenever the newest backup is older
+        than `interval` seconds. on_backup(path, error) is called from that
+        thread after every scheduled backup."""
+        if self._backup_stop is not None:
+            return
+        self._backup_stop = threading.Event()
+        stop = self._backup_stop
+        
+        def run():
+            while not stop.is_set():
+                backups = self.list_backups()
+                age = time.time() - backups[0]['created'] if backups else interval
+                if age >= interval:
+                    path, error = self.create_backup()
+                    if on_backup:
+                        on_backup(path, error)
+                    age = 0
+                stop.wait(interval - age)
+        
+        threading.Thread(target=run, name="backup-scheduler", daemon=True).start()
+    
+    def stop_backup_scheduler(self):
+        if self._backup_stop is not None:
+            self._backup_stop.set()
+            self._backup_stop = None
+
+    def _save_write_counts(self, cursor):
+        """Add the rows changed since the last call to maintenance_state."""
+        with self._write_lock:
+            changes, self._pending_writes = self._pending_writes, 0
+        if changes:
+            cursor.execute('''
+            UPDATE maintenance_state
+            SET changes_since_optimize = changes_since_optimize + ?,
+                changes_since_analyze = changes_since_analyze + ?
+            WHERE id = 1
+            ''', (changes, changes))
+
+    def run_maintenance(self, force=False, should_stop=None):
+        """Run whichever maintenance tasks are due, in short steps.
+
+        PRAGMA optimize runs once MAINTENANCE_OPTIMIZE_CHANGES rows have changed
+        and every table is analyzed once MAINTENANCE_ANALYZE_CHANGES have; free
+        pages are released by incremental vacuum once there are
+        MAINTENANCE_VACUUM_FREE_PAGES of them. `force` runs all of them
+        regardless. should_stop() is checked between steps, and whatever is
+        left over is picked up by the next run.
+
+        Returns (entries, error); each entry has the task, a detail and its
+        duration_ms, and is also kept in maintenance_log.
+        """
+        should_stop = should_stop or (lambda: False)
         conn = self.get_connection()
+        # Maintenance writes must not count towards the next run
+        conn.on_close = None
         cursor = conn.cursor()
-        
+        entries = []
+
+        def log(task, detail, seconds):
+            entries.append({'task': task, 'detail': detail, 'duration_ms': round(seconds * 1000, 1)})
+
         try:
-            cursor.execute('''
-            INSERT INTO companies (company_name, address, gst_number)
-            VALUES (?, ?, ?)
-            ''', (company_name, address, gst_number))
+            self._save_write_counts(cursor)
             conn.commit()
-            company_id = cursor.lastrowid
-            conn.close()
-            return company_id, None
-        except sqlite3.IntegrityError:
+            cursor.execute('SELECT * FROM maintenance_state WHERE id = 1')
+            state = cursor.fetchone()
+            cursor.execute(f'PRAGMA analysis_limit = {MAINTENANCE_ANALYSIS_LIMIT}')
+
+            if force or state['changes_since_analyze'] >= MAINTENANCE_ANALYZE_CHANGES:
+                cursor.execute('''
+                SELECT name FROM sqlite_master
+                WHERE type = 'table' AND name NOT LIKE 'sqlite_%' AND sql NOT LIKE 'CREATE VIRTUAL%'
+                ORDER BY name
+                ''')
+                tables = [row['name'] for row in cursor.fetchall()]
+                analyzed, elapsed = 0, 0.0
+                for table in tables:
+                    if should_stop():
+                        break
+                    start = time.perf_counter()
+                    cursor.execute(f'ANALYZE "{table}"')
+                    conn.commit()
+                    elapsed += time.perf_counter() - start
+                    analyzed += 1
+                    time.sleep(MAINTENANCE_STEP_PAUSE)
+                if analyzed == len(tables):
+                    cursor.execute('''
+                    UPDATE maintenance_state SET changes_since_optimize = 0, changes_since_analyze = 0
+                    WHERE id = 1
+                    ''')
+                if analyzed:
+                    log('analyze', f"{analyzed} of {len(tables)} tables", elapsed)
+            elif state['changes_since_optimize'] >= MAINTENANCE_OPTIMIZE_CHANGES:
+                start = time.perf_counter()
+                cursor.execute('PRAGMA optimize')
+                cursor.execute('UPDATE maintenance_state SET changes_since_optimize = 0 WHERE id = 1')
+                log('optimize', f"after {state['changes_since_optimize']} changed rows",
+                    time.perf_counter() - start)
+            conn.commit()
+
+            cursor.execute('PRAGMA auto_vacuum')
+            incremental = cursor.fetchone()[0] == 2
+            cursor.execute('PRAGMA freelist_count')
+            free_pages = cursor.fetchone()[0]
+            if incremental and free_pages and (force or free_pages >= MAINTENANCE_VACUUM_FREE_PAGES):
+                released, elapsed = 0, 0.0
+                while free_pages and not should_stop():
+                    start = time.perf_counter()
+                    # The sqlite3 module stops a statement without result columns
+                    # after its first step, which frees a single page, so each
+                    # step frees its pages one statement at a time
+                    cursor.execute('BEGIN IMMEDIATE')
+                    for _ in range(min(free_pages, MAINTENANCE_VACUUM_PAGES_PER_STEP)):
+                        cursor.execute('PRAGMA incremental_vacuum(1)')
+                    cursor.execute('PRAGMA freelist_count')
+                    remaining = cursor.fetchone()[0]
+                    conn.commit()
+                    elapsed += time.perf_counter() - start
+                    released += max(free_pages - remaining, 0)
+                    free_pages = remaining
+                    time.sleep(MAINTENANCE_STEP_PAUSE)
+                if released:
+                    log('incremental vacuum', f"{released} pages released, {free_pages} free", elapsed)
+
+            if entries:
+                cursor.executemany('''
+                INSERT INTO maintenance_log (task, detail, duration_ms) VALUES (?, ?, ?)
+                ''', [(entry['task'], entry['detail'], entry['duration_ms']) for entry in entries])
+                cursor.execute(f'''
+                DELETE FROM maintenance_log
+                WHERE id <= (SELECT MAX(id) FROM maintenance_log) - {MAINTENANCE_LOG_KEEP}
+                ''')
+                cursor.execute('UPDATE maintenance_state SET last_run_at = CURRENT_TIMESTAMP WHERE id = 1')
+                conn.commit()
+            return entries, None
+        except Exception as e:
+            conn.rollback()
+            return entries, str(e)
+        finally:
             conn.close()
-            return None, "GST Number already exists"
-    
-    def get_company_by_gst(self, gst_number):
+
+    def get_maintenance_log(self, limit=MAINTENANCE_LOG_KEEP):
         conn = self.get_connection()
         cursor = conn.cursor()
-        
-        cursor.execute('''
-        SELECT * FROM companies WHERE gst_number = ?
-        ''', (gst_number,))
-        
-        company = cursor.fetchone()
+        cursor.execute('SELECT * FROM maintenance_log ORDER BY id DESC LIMIT ?', (limit,))
+        entries = [dict(row) for row in cursor.fetchall()]
         conn.close()
-        
-        if company:
-            return dict(company)
-        return None
-    
-    def get_all_companies(self):
+        return entries
+
+    def start_maintenance_scheduler(self, interval=MAINTENANCE_CHECK_INTERVAL,
+                                    idle_seconds=MAINTENANCE_IDLE_SECONDS, on_maintenance=None):
+        """Check every `interval` seconds for due maintenance and run it in a
+        background thread once nothing has been written for `idle_seconds`.
+        A write in the meantime stops the run after its current step.
+        on_maintenance(entries, error) is called from that thread after every
+        run that did something or failed."""
+        if self._maintenance_stop is not None:
+            return
+        self._maintenance_stop = threading.Event()
+        stop = self._maintenance_stop
+
+        def busy():
+            return stop.is_set() or self.seconds_since_last_write() < idle_seconds
+
+        def run():
+            while not stop.wait(interval):
+                if busy():
+                    continue
+                entries, error = self.run_maintenance(should_stop=busy)
+                if on_maintenance and (entries or error):
+                    on_maintenance(entries, error)
+
+        threading.Thread(target=run, name="maintenance-scheduler", daemon=True).start()
+
+    def stop_maintenance_scheduler(self):
+        if self._maintenance_stop is not None:
+            self._maintenance_stop.set()
+            self._maintenance_stop = None
+        # Keep the write counts of this session for the next one
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM companies ORDER BY company_name')
-        
-        companies = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        return companies
+        conn.on_close = None
+        try:
+            self._save_write_counts(conn.cursor())
+            conn.commit()
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    @property
+    def archive_dir(self):
+        return os.path.join(os.path.dirname(os.path.abspath(self.db_file)), ARCHIVE_DIR_NAME)
     
-    def get_company_by_id(self, company_id):
+    def _attach_archives(self, cursor, financial_year=None):
+        """Attach archive files one at a time, yielding (schema, financial_year).
+
+        Each archive is detached again before the next one is attached, so any
+        number of years can be read without hitting SQLite's attach limit.
+        """
+        if financial_year is None:
+            cursor.execute('SELECT financial_year, file_name FROM invoice_archives ORDER BY financial_year')
+        else:
+            cursor.execute('''
+            SELECT financial_year, file_name FROM invoice_archives WHERE financial_year = ?
+            ''', (financial_year,))
+        for archive in cursor.fetchall():
+            path = os.path.join(self.archive_dir, archive['file_name'])
+            if not os.path.exists(path):
+                continue
+            schema = f"archive_{archive['financial_year']}"
+            cursor.execute(f'ATTACH DATABASE ? AS {schema}', (path,))
+            try:
+                yield schema, archive['financial_year']
+            finally:
+                if not cursor.connection.in_transaction:
+                    cursor.execute(f'DETACH DATABASE {schema}')
+    
+    def _count_in_archives(self, cursor, query, params):
+        count = 0
+        for schema, _ in self._attach_archives(cursor):
+            cursor.execute(query.format(schema=schema), params)
+            count += cursor.fetchone()[0]
+        return count
+    
+    def _create_archive_tables(self, cursor, schema):
+        """Create or extend the archive tables to match the current invoice columns."""
+        for table in ("invoices", "invoice_items"):
+            cursor.execute(f'PRAGMA main.table_info({table})')
+            columns = cursor.fetchall()
+            cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {schema}.{table} (
+                {", ".join(f"{c['name']} {c['type']}" + (" PRIMARY KEY" if c['pk'] else "") for c in columns)}
+            )
+            ''')
+            cursor.execute(f'PRAGMA {schema}.table_info({table})')
+            existing = {c['name'] for c in cursor.fetchall()}
+            for column in columns:
+                if column['name'] not in existing:
+                    cursor.execute(f"ALTER TABLE {schema}.{table} ADD COLUMN {column['name']} {column['type']}")
+        cursor.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS {schema}.idx_invoices_bill_number ON invoices (bill_number)')
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_invoice_items_invoice_id ON invoice_items (invoice_id)')
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_invoices_bill_date ON invoices (bill_date)')
+        if self.search_enabled:
+            cursor.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.invoice_search
+            USING fts5(bill_number, parties, products, tokenize='trigram')
+            ''')
+    
+    def get_financial_years(self):
+        """Invoice counts per financial year, in the main database and archived."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM companies WHERE id = ?', (company_id,))
-        
-        company = cursor.fetchone()
+        cursor.execute(f'''
+        SELECT {_FINANCIAL_YEAR_SQL.format(column="i.bill_date")} as financial_year,
+               COUNT(*) as invoice_count,
+               SUM(r.amount_due - r.amount_paid > 0.005) as open_count
+        FROM invoices i
+        LEFT JOIN invoice_receivables r ON r.invoice_id = i.id
+        GROUP BY 1
+        ''')
+        years = {row['financial_year']: {**dict(row), 'archived_count': 0} for row in cursor.fetchall()}
+        cursor.execute('SELECT financial_year, invoice_count FROM invoice_archives')
+        for row in cursor.fetchall():
+            year = years.setdefault(row['financial_year'], {
+                'financial_year': row['financial_year'], 'invoice_count': 0, 'open_count': 0})
+            year['archived_count'] = row['invoice_count']
         conn.close()
         
-        if company:
-            return dict(company)
-        return None
+        closed_before = current_financial_year()
+        for year in years.values():
+            year['label'] = financial_year_label(year['financial_year'])
+            year['open_count'] = year['open_count'] or 0
+            year['closed'] = year['financial_year'] < closed_before
+        return sorted(years.values(), key=lambda year: year['financial_year'], reverse=True)
     
-    def update_company(self, company_id, company_name, address, gst_number):
+    def archive_financial_year(self, financial_year):
+        """Move the settled invoices of a closed financial year to its archive file.
+
+        Invoices with an amount still due stay in the main database so payments
+        can be recorded against them; archiving the year again later moves them
+        once settled. Ledger entries, GST summaries and the dashboard are left as
+        they are, archiving does not change any figures.
+        Returns (number of invoices moved, error).
+        """
+        if financial_year >= current_financial_year():
+            return 0, f"Financial year {financial_year_label(financial_year)} is not closed yet"
+        
+        file_name = f"invoices_{financial_year_label(financial_year)}.db"
+        settled_sql = '''
+        SELECT i.id FROM invoices i
+        LEFT JOIN invoice_receivables r ON r.invoice_id = i.id
+        WHERE i.bill_date >= ? AND i.bill_date < ?
+          AND (r.invoice_id IS NULL OR r.amount_due - r.amount_paid <= 0.005)
+        '''
+        year_range = (f"{financial_year}-04-01", f"{financial_year + 1}-04-01")
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # First check if the new GST number conflicts with any other company
-            cursor.execute('''
-            SELECT id FROM companies 
-            WHERE gst_number = ? AND id != ?
-            ''', (gst_number, company_id))
-            
-            if cursor.fetchone():
+            cursor.execute(f'SELECT COUNT(*) FROM ({settled_sql})', year_range)
+            if cursor.fetchone()[0] == 0:
                 conn.close()
-                return False, "GST Number already exists for another company"
+                return 0, None
+            
+            os.makedirs(self.archive_dir, exist_ok=True)
+            # Payments keep pointing at archived invoices, ON DELETE SET NULL must not fire
+            cursor.execute('PRAGMA foreign_keys = OFF')
+            cursor.execute('ATTACH DATABASE ? AS archive', (os.path.join(self.archive_dir, file_name),))
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('CREATE TEMP TABLE archive_ids (id INTEGER PRIMARY KEY)')
+            cursor.execute(f'INSERT INTO archive_ids {settled_sql}', year_range)
+            moved = cursor.rowcount
             
+            self._create_archive_tables(cursor, "archive")
+            
+            # Moving invoices is not a financial change, so the summary, ledger,
+            # search and dashboard triggers must not see these deletes
+            triggers = self._app_triggers()
+            for name in triggers:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            
+            for table, key in (("invoices", "id"), ("invoice_items", "invoice_id")):
+                cursor.execute(f'PRAGMA main.table_info({table})')
+                columns = ", ".join(c['name'] for c in cursor.fetchall())
+                cursor.execute(f'''
+                INSERT INTO archive.{table} ({columns})
+                SELECT {columns} FROM main.{table} WHERE {key} IN (SELECT id FROM archive_ids)
+                ''')
+            if self.search_enabled:
+                cursor.execute('''
+                INSERT INTO archive.invoice_search (rowid, bill_number, parties, products)
+                SELECT rowid, bill_number, parties, products FROM main.invoice_search
+                WHERE rowid IN (SELECT id FROM archive_ids)
+                ''')
+                cursor.execute('DELETE FROM main.invoice_search WHERE rowid IN (SELECT id FROM archive_ids)')
             cursor.execute('''
-            UPDATE companies 
-            SET company_name = ?, address = ?, gst_number = ?
-            WHERE id = ?
-            ''', (company_name, address, gst_number, company_id))
+            INSERT INTO archived_invoices (bill_number, invoice_id, financial_year)
+            SELECT bill_number, id, ? FROM main.invoices WHERE id IN (SELECT id FROM archive_ids)
+            ''', (financial_year,))
+            cursor.execute('DELETE FROM invoice_receivables WHERE invoice_id IN (SELECT id FROM archive_ids)')
+            cursor.execute('DELETE FROM main.invoice_items WHERE invoice_id IN (SELECT id FROM archive_ids)')
+            cursor.execute('DELETE FROM main.invoices WHERE id IN (SELECT id FROM archive_ids)')
+            cursor.execute('''
+            INSERT INTO invoice_archives (financial_year, file_name, invoice_count)
+            VALUES (?, ?, ?)
+            ON CONFLICT (financial_year) DO UPDATE SET
+                invoice_count = invoice_count + excluded.invoice_count,
+                archived_at = CURRENT_TIMESTAMP
+            ''', (financial_year, file_name, moved))
             
+            self._sync_triggers(cursor, triggers)
             conn.commit()
-            conn.close()
-            return True, None
         except Exception as e:
+            conn.rollback()
+            self._end_archive(cursor)
             conn.close()
-            return False, str(e)
+            return 0, str(e)
+        
+        self._end_archive(cursor)
+        # Hand the freed pages back so the main database file actually shrinks
+        cursor.execute('VACUUM')
+        conn.close()
+        return moved, None
     
-    def delete_company(self, company_id):
+    def _end_archive(self, cursor):
+        """Undo what archive_financial_year set up on its connection, after the
+        commit or rollback, so that the connection can be used again."""
+        cursor.execute('DROP TABLE IF EXISTS temp.archive_ids')
+        cursor.execute('PRAGMA foreign_keys = ON')
+        cursor.execute('PRAGMA database_list')
+        if any(row['name'] == 'archive' for row in cursor.fetchall()):
+            cursor.execute('DETACH DATABASE archive')
+    
+    def get_next_bill_number(self):
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # Check if company is used in any invoice
-            cursor.execute('''
-            SELECT COUNT(*) FROM invoices 
-            WHERE bill_to_company_id = ? OR ship_to_company_id = ? OR ship_from_company_id = ?
-            ''', (company_id, company_id, company_id))
-            
-            count = cursor.fetchone()[0]
-            if count > 0:
-                conn.close()
-                return False, "Cannot delete company as it is used in invoices"
+            # Format: INV-XXXX (4 digits)
+            bill_number = f"INV-{self._next_bill_sequence(cursor):04d}"
             
-            cursor.execute('DELETE FROM companies WHERE id = ?', (company_id,))
-            conn.commit()
-            conn.close()
-            return True, None
+            return bill_number
+        
         except Exception as e:
+            # If any error occurs, start with INV-0001
+            return "INV-0001"
+        finally:
             conn.close()
-            return False, str(e)
     
-    def add_product(self, sku_code, product_name, hsn_code, price_per_unit):
+    def _next_bill_sequence(self, cursor):
+        # Get the last bill number from all invoices, including archived ones
+        cursor.execute('''
+        SELECT bill_number FROM (
+            SELECT id, bill_number FROM invoices
+            UNION ALL
+            SELECT invoice_id, bill_number FROM archived_invoices
+        )
+        ORDER BY id DESC
+        LIMIT 1
+        ''')
+        
+        result = cursor.fetchone()
+        
+        if result:
+            # Extract the sequence number from the last bill number
+            # Format is "INV-XXXX" where XXXX is the number
+            return int(result['bill_number'].split('-')[1]) + 1
+        # If no bills exist, start with 1
+        return 1
+    
+    def create_invoice(self, bill_date, bill_to_company_id, ship_to_company_id, 
+                      ship_from_company_id, signature_path, advance_amount, total_amount, items,
+                      seller_gstin=None):
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
+            bill_number = self.get_next_bill_number()
+            totals = calculate_invoice_totals(sum(item['amount'] for item in items))
+            
             cursor.execute('''
-            INSERT INTO products (sku_code, product_name, hsn_code, price_per_unit)
-            VALUES (?, ?, ?, ?)
-            ''', (sku_code, product_name, hsn_code, price_per_unit))
+            INSERT INTO invoices (bill_number, bill_date, bill_to_company_id, 
+                                ship_to_company_id, ship_from_company_id, 
+                                signature_path, advance_amount, total_amount,
+                                taxable_value, sgst_rate, sgst_amount, cgst_rate,
+                                cgst_amount, igst_amount, round_off, grand_total, seller_gstin)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (bill_number, bill_date, bill_to_company_id, ship_to_company_id, 
+                 ship_from_company_id, signature_path, advance_amount, total_amount,
+                 *(totals[column] for column in INVOICE_TAX_COLUMNS), seller_gstin or DEFAULT_SELLER))
+            
+            invoice_id = cursor.lastrowid
+            
+            # Add invoice items
+            for item in items:
+                cursor.execute('''
+                INSERT INTO invoice_items (invoice_id, product_id, quantity, 
+                                         price_per_unit, amount)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (invoice_id, item['product_id'], item['quantity'], 
+                     item['price_per_unit'], item['amount']))
+            
             conn.commit()
-            product_id = cursor.lastrowid
             conn.close()
-            return product_id, None
-        except sqlite3.IntegrityError:
+            return bill_number, None
+        except Exception as e:
+            conn.rollback()
             conn.close()
-            return None, "SKU Code already exists"
+            return None, str(e)
     
-    def get_product_by_id(self, product_id):
+    def get_all_invoices(self, include_archived=False):
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM products WHERE id = ?', (product_id,))
+        cursor.execute('''
+        SELECT i.*, 
+               b.company_name as bill_to_name, 
+               s.company_name as ship_to_name,
+               f.company_name as ship_from_name
+        FROM invoices i
+        JOIN companies b ON i.bill_to_company_id = b.id
+        JOIN companies s ON i.ship_to_company_id = s.id
+        JOIN companies f ON i.ship_from_company_id = f.id
+        ORDER BY i.bill_date DESC
+        ''')
+        
+        invoices = [dict(row) for row in cursor.fetchall()]
+        
+        if include_archived:
+            for schema, _ in self._attach_archives(cursor):
+                cursor.execute(f'''
+                SELECT i.*,
+                       b.company_name as bill_to_name,
+                       s.company_name as ship_to_name,
+                       f.company_name as ship_from_name
+                FROM {schema}.invoices i
+                JOIN companies b ON i.bill_to_company_id = b.id
+                JOIN companies s ON i.ship_to_company_id = s.id
+                JOIN companies f ON i.ship_from_company_id = f.id
+                ''')
+                invoices.extend(dict(row) for row in cursor.fetchall())
+            invoices.sort(key=lambda invoice: invoice['bill_date'], reverse=True)
         
-        product = cursor.fetchone()
         conn.close()
         
-        if product:
-            return dict(product)
-        return None
+        return invoices
     
-    def get_all_products(self):
+    def get_all_invoice_details(self, include_archived=False):
+        """Every invoice with its party details and line items, as returned by
+        get_invoice_details. Reads each database with two queries instead of
+        one lookup per invoice."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM products ORDER BY product_name')
-        
-        products = [dict(row) for row in cursor.fetchall()]
+        invoices = self._fetch_invoice_details(cursor, "main")
+        if include_archived:
+            for schema, financial_year in self._attach_archives(cursor):
+                invoices.extend(self._fetch_invoice_details(cursor, schema, archived_year=financial_year))
         conn.close()
         
-        return products
-    
-    def update_product(self, product_id, sku_code, product_name, hsn_code, price_per_unit):
+        invoices.sort(key=lambda invoice: invoice['bill_date'], reverse=True)
+        return invoices
+
+    def get_invoice_changes(self):
+        """Invoices inserted, updated or deleted since the last delta export.
+
+        Reads only the invoices logged in invoice_changes past the checkpoint
+        saved by save_export_checkpoint, so the cost follows the number of
+        changes rather than the number of invoices. Before the first checkpoint
+        every invoice, archived years included, is returned as inserted.
+        Invoices both created and deleted since the checkpoint are left out, and
+        invoices archived since they changed are read from their archive file.
+
+        Returns a dict with the `change_id` to pass to save_export_checkpoint
+        once the export is saved, `since` (when the previous export was saved, or
+        None), `invoices` as returned by get_invoice_details with a `change` of
+        'Inserted' or 'Updated', and `deleted`, the bill number and time of
+        each deleted invoice. An invoice changed while this runs may be
+        returned again by the next export, but is never missed.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
+        # Read the latest change id first: anything logged after it is left
+        # for the next export, even if its rows are already read below
+        cursor.execute('SELECT * FROM export_state WHERE id = 1')
+        state = cursor.fetchone()
+        checkpoint = state['checkpoint_id']
+        changes = {'change_id': state['last_change_id'], 'since': state['exported_at'],
+                   'invoices': [], 'deleted': []}
+
+        if checkpoint is None:
+            conn.close()
+            changes['since'] = None
+            changes['invoices'] = self.get_all_invoice_details(include_archived=True)
+            for invoice in changes['invoices']:
+                invoice['change'] = 'Inserted'
+            return changes
+
+        # The checkpoint prunes what it exported, rows left at or below it are
+        # invoices an earlier export could not find
+        cursor.execute('''
+        SELECT * FROM invoice_changes WHERE change_id <= ?
+        ''', (state['last_change_id'],))
+        inserted = set()
+        for row in cursor.fetchall():
+            created = row['inserted_id'] is not None and row['inserted_id'] > checkpoint
+            if row['change'] == 'delete':
+                if not created:
+                    changes['deleted'].append({'bill_number': row['bill_number'],
+                                               'deleted_at': row['changed_at']})
+            else:
+                if created:
+                    inserted.add(row['invoice_id'])
+                changes['invoices'].append(row['invoice_id'])
+
+        invoices = self._fetch_invoice_details(cursor, "main", changes['invoices'])
+        missing = sorted(set(changes['invoices']) - {invoice['id'] for invoice in invoices})
+        if missing:
+            cursor.execute('''
+            SELECT DISTINCT financial_year FROM archived_invoices
+            WHERE invoice_id IN (SELECT value FROM json_each(?))
+            ''', (json.dumps(missing),))
+            for year in [row['financial_year'] for row in cursor.fetchall()]:
+                for schema, financial_year in self._attach_archives(cursor, year):
+                    invoices.extend(self._fetch_invoice_details(
+                        cursor, schema, missing, archived_year=financial_year))
+        # An invoice deleted since the log was read is still missing, its
+        # deletion is picked up by the next export
+        conn.close()
+
+        for invoice in invoices:
+            invoice['change'] = 'Inserted' if invoice['id'] in inserted else 'Updated'
+        invoices.sort(key=lambda invoice: invoice['bill_date'], reverse=True)
+        changes['invoices'] = invoices
+        changes['deleted'].sort(key=lambda deleted: deleted['bill_number'])
+        return changes
+
+    def save_export_checkpoint(self, change_id):
+        """Mark the changes returned by get_invoice_changes up to `change_id` as
+        exported and drop them from the log. Changes of invoices found neither
+        in the main database nor in an archive stay logged for the next export.
+        Returns (True, None) or (False, error)."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
         try:
             cursor.execute('''
-            UPDATE products 
-            SET sku_code = ?, product_name = ?, hsn_code = ?, price_per_unit = ?
-            WHERE id = ?
-            ''', (sku_code, product_name, hsn_code, price_per_unit, product_id))
+            UPDATE export_state
+            SET checkpoint_id = MAX(COALESCE(checkpoint_id, 0), ?), exported_at = CURRENT_TIMESTAMP
+            WHERE id = 1
+            ''', (change_id,))
+            cursor.execute('''
+            DELETE FROM invoice_changes
+            WHERE change_id <= ?
+              AND (change = 'delete'
+                   OR invoice_id IN (SELECT id FROM invoices)
+                   OR invoice_id IN (SELECT invoice_id FROM archived_invoices))
+            ''', (change_id,))
             conn.commit()
             conn.close()
             return True, None
-        except sqlite3.IntegrityError:
+        except Exception as e:
+            conn.rollback()
             conn.close()
-            return False, "SKU Code already exists"
-    
-    def delete_product(self, product_id):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
+            return False, str(e)
+
+    def export_parquet(self, directory, chunk_rows=PARQUET_CHUNK_ROWS):
+        """Write every invoice and line item, archived years included, as
+        Parquet files under `directory`, which must not exist yet.
+
+        Invoices go to directory/invoices and lines to directory/invoice_items,
+        in one month=YYYY-MM folder per month, so pandas.read_parquet(directory +
+        "/invoices") loads them with the month as a column. Rows are streamed
+        from the database `chunk_rows` at a time with the types of
+        PARQUET_INVOICE_COLUMNS and PARQUET_ITEM_COLUMNS. Files are written to
+        directory + ".partial", which is renamed once complete.
+        Returns ({'invoices', 'items', 'months', 'files'}, error).
+        """
         try:
-            # Check if product is used in any invoice
-            cursor.execute('SELECT COUNT(*) FROM invoice_items WHERE product_id = ?', (product_id,))
-            
-            count = cursor.fetchone()[0]
-            if count > 0:
-                conn.close()
-                return False, "Cannot delete product as it is used in invoices"
-            
-            cursor.execute('DELETE FROM products WHERE id = ?', (product_id,))
-            conn.commit()
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None, "Parquet export needs pyarrow, install it with: pip install pyarrow"
+        if os.path.exists(directory):
+            return None, f"{directory} already exists"
+
+        partial = directory + ".partial"
+        shutil.rmtree(partial, ignore_errors=True)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        # Plain tuples, building a Row per result would cost more than writing it
+        rows_cursor = conn.cursor()
+        rows_cursor.row_factory = None
+        summary = {'invoices': 0, 'items': 0, 'months': set(), 'files': 0}
+        archives = None
+
+        try:
+            for table, columns, counter in (("invoices", PARQUET_INVOICE_COLUMNS, 'invoices'),
+                                            ("invoice_items", PARQUET_ITEM_COLUMNS, 'items')):
+                sql = _PARQUET_SQL[table].format(
+                    columns=", ".join(f"{expr} AS {name}" for name, expr, _ in columns), schema="{schema}")
+                archives = self._attach_archives(cursor)
+                sources = itertools.chain([("main", None)], archives)
+                for schema, financial_year in sources:
+                    rows_cursor.execute(sql.format(schema=schema), (financial_year,))
+                    label = financial_year_label(financial_year) if financial_year else "main"
+                    rows, months = _write_parquet_months(rows_cursor, columns, os.path.join(partial, table),
+                                                         label, chunk_rows)
+                    summary[counter] += rows
+                    summary['months'].update(months)
+                    summary['files'] += len(months)
             conn.close()
-            return True, None
+            os.rename(partial, directory)
         except Exception as e:
+            # Detach the archive being read before the connection goes away
+            if archives is not None:
+                archives.close()
             conn.close()
-            return False, str(e)
+            shutil.rmtree(partial, ignore_errors=True)
+            return None, str(e)
+
+        summary['months'] = len(summary['months'])
+        return summary, None
+
+    def _fetch_invoice_details(self, cursor, schema, invoice_ids=None, archived_year=None):
+        condition = "WHERE i.id IN (SELECT value FROM json_each(?))" if invoice_ids is not None else ""
+        params = (json.dumps(invoice_ids),) if invoice_ids is not None else ()
+        cursor.execute(f'''
+        SELECT i.*, 
+               b.company_name as bill_to_name, b.address as bill_to_address, b.gst_number as bill_to_gst,
+               s.company_name as ship_to_name, s.address as ship_to_address, s.gst_number as ship_to_gst,
+               f.company_name as ship_from_name, f.address as ship_from_address, f.gst_number as ship_from_gst
+        FROM {schema}.invoices i
+        JOIN companies b ON i.bill_to_company_id = b.id
+        JOIN companies s ON i.ship_to_company_id = s.id
+        JOIN companies f ON i.ship_from_company_id = f.id
+        {condition}
+        ''', params)
+        invoices = {}
+        for row in cursor.fetchall():
+            invoice = dict(row)
+            invoice['items'] = []
+            invoice['archived_year'] = archived_year
+            invoices[invoice['id']] = invoice
+        
+        if invoices:
+            condition = "WHERE ii.invoice_id IN (SELECT value FROM json_each(?))" if invoice_ids is not None else ""
+            cursor.execute(f'''
+            SELECT ii.*, p.sku_code, p.product_name, p.hsn_code
+            FROM {schema}.invoice_items ii
+            JOIN products p ON ii.product_id = p.id
+            {condition}
+            ORDER BY ii.invoice_id, ii.id
+            ''', params)
+            for row in cursor.fetchall():
+                invoice = invoices.get(row['invoice_id'])
+                if invoice is not None:
+                    invoice['items'].append(dict(row))
+        
+        return list(invoices.values())
     
-    def get_next_bill_number(self):
+    def search_invoices(self, query, limit=200):
+        """Invoices matching every word of `query`, best matches first.
+
+        Words are matched as substrings of bill numbers, party names, addresses
+        and GSTINs, and product names, SKUs and HSN codes. Words shorter than
+        three characters are ignored by the trigram index.
+        """
+        terms = [term for term in query.split() if len(term) >= 3]
+        if not terms:
+            return []
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        try:
-            # Get the last bill number from all invoices
+        if self.search_enabled:
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
             cursor.execute('''
-            SELECT bill_number 
-            FROM invoices 
-            ORDER BY id DESC 
-            LIMIT 1
-            ''')
-            
-            result = cursor.fetchone()
+            SELECT i.*,
+                   b.company_name as bill_to_name,
+                   s.company_name as ship_to_name,
+                   f.company_name as ship_from_name,
+                   bm25(invoice_search, 10.0, 2.0, 1.0) as rank
+            FROM invoice_search
+            JOIN invoices i ON i.id = invoice_search.rowid
+            JOIN companies b ON i.bill_to_company_id = b.id
+            JOIN companies s ON i.ship_to_company_id = s.id
+            JOIN companies f ON i.ship_from_company_id = f.id
+            WHERE invoice_search MATCH ?
+            ORDER BY bm25(invoice_search, 10.0, 2.0, 1.0)
+            LIMIT ?
+            ''', (match, limit))
+            ranked = [(row['rank'], dict(row)) for row in cursor.fetchall()]
             
-            if result:
-                # Extract the sequence number from the last bill number
-                # Format is "INV-XXXX" where XXXX is the number
-                last_number = int(result['bill_number'].split('-')[1])
-                next_number = last_number + 1
-            else:
-                # If no bills exist, start with 1
-                next_number = 1
-            
-            # Format: INV-XXXX (4 digits)
-            bill_number = f"INV-{next_number:04d}"
-            
-            return bill_number
+            # Archived years keep their own index; bm25 scores are comparable
+            # enough across them to merge the best matches
+            for schema, _ in self._attach_archives(cursor):
+                cursor.execute(f'''
+                SELECT i.*,
+                       b.company_name as bill_to_name,
+                       s.company_name as ship_to_name,
+                       f.company_name as ship_from_name,
+                       bm25(invoice_search, 10.0, 2.0, 1.0) as rank
+                FROM {schema}.invoice_search
+                JOIN {schema}.invoices i ON i.id = invoice_search.rowid
+                JOIN companies b ON i.bill_to_company_id = b.id
+                JOIN companies s ON i.ship_to_company_id = s.id
+                JOIN companies f ON i.ship_from_company_id = f.id
+                WHERE invoice_search MATCH ?
+                ORDER BY rank
+                LIMIT ?
+                ''', (match, limit))
+                ranked.extend((row['rank'], dict(row)) for row in cursor.fetchall())
+            ranked.sort(key=lambda entry: entry[0])
+            invoices = [invoice for _, invoice in ranked[:limit]]
+            for invoice in invoices:
+                invoice.pop('rank')
+        else:
+            conditions = " AND ".join(["(i.bill_number LIKE ? OR b.company_name LIKE ? OR b.gst_number LIKE ?)"] * len(terms))
+            params = []
+            for term in terms:
+                params.extend([f"%{term}%"] * 3)
+            cursor.execute(f'''
+            SELECT i.*,
+                   b.company_name as bill_to_name,
+                   s.company_name as ship_to_name,
+                   f.company_name as ship_from_name
+            FROM invoices i
+            JOIN companies b ON i.bill_to_company_id = b.id
+            JOIN companies s ON i.ship_to_company_id = s.id
+            JOIN companies f ON i.ship_from_company_id = f.id
+            WHERE {conditions}
+            ORDER BY i.bill_date DESC
+            LIMIT ?
+            ''', params + [limit])
+            invoices = [dict(row) for row in cursor.fetchall()]
             
-        except Exception as e:
-            # If any error occurs, start with INV-0001
-            return "INV-0001"
-        finally:
-            conn.close()
+            for schema, _ in self._attach_archives(cursor):
+                cursor.execute(f'''
+                SELECT i.*,
+                       b.company_name as bill_to_name,
+                       s.company_name as ship_to_name,
+                       f.company_name as ship_from_name
+                FROM {schema}.invoices i
+                JOIN companies b ON i.bill_to_company_id = b.id
+                JOIN companies s ON i.ship_to_company_id = s.id
+                JOIN companies f ON i.ship_from_company_id = f.id
+                WHERE {conditions}
+                ORDER BY i.bill_date DESC
+                LIMIT ?
+                ''', params + [limit])
+                invoices.extend(dict(row) for row in cursor.fetchall())
+            invoices.sort(key=lambda invoice: invoice['bill_date'], reverse=True)
+            invoices = invoices[:limit]
+        
+        conn.close()
+        
+        return invoices
     
-    def create_invoice(self, bill_date, bill_to_company_id, ship_to_company_id, 
-                      ship_from_company_id, signature_path, advance_amount, total_amount, items):
+    def refresh_dashboard_cache(self):
+        """Fold invoices created since the last refresh into the dashboard cache.
+
+        The cache remembers the created_at and id of the newest invoice it has
+        counted and only invoices past that watermark are aggregated. Edits and
+        deletes of invoices already counted are applied by DASHBOARD_TRIGGERS as
+        they happen. A cache flagged by an older version with needs_rebuild is
+        rebuilt once. Returns the number of invoices processed.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            bill_number = self.get_next_bill_number()
+            cursor.execute('SELECT watermark_id, needs_rebuild FROM dashboard_state WHERE id = 1')
+            state = cursor.fetchone()
+            watermark_id = state['watermark_id']
+            if state['needs_rebuild']:
+                # Archived years are no longer in invoices but still count. Read
+                # them before writing, archives cannot be detached mid-transaction.
+                archived = [self._dashboard_aggregates(cursor, schema, "1", "1", ())
+                            for schema, _ in self._attach_archives(cursor)]
+                cursor.execute('DELETE FROM dashboard_monthly')
+                cursor.execute('DELETE FROM dashboard_clients')
+                cursor.execute('DELETE FROM dashboard_products')
+                for monthly, clients, products in archived:
+                    cursor.executemany(_DASHBOARD_UPSERT_SQL['monthly'].format(rows="VALUES (?, ?, ?, ?)"), monthly)
+                    cursor.executemany(_DASHBOARD_UPSERT_SQL['clients'].format(rows="VALUES (?, ?, ?)"), clients)
+                    cursor.executemany(_DASHBOARD_UPSERT_SQL['products'].format(rows="VALUES (?, ?, ?)"), products)
+                watermark_id = 0
             
             cursor.execute('''
-            INSERT INTO invoices (bill_number, bill_date, bill_to_company_id, 
-                                ship_to_company_id, ship_from_company_id, 
-                                signature_path, advance_amount, total_amount)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (bill_number, bill_date, bill_to_company_id, ship_to_company_id, 
-                 ship_from_company_id, signature_path, advance_amount, total_amount))
-            
-            invoice_id = cursor.lastrowid
-            
-            # Add invoice items
-            for item in items:
+            SELECT id, created_at FROM invoices WHERE id > ? ORDER BY id DESC LIMIT 1
+            ''', (watermark_id,))
+            latest = cursor.fetchone()
+            if latest is None:
                 cursor.execute('''
-                INSERT INTO invoice_items (invoice_id, product_id, quantity, 
-                                         price_per_unit, amount)
-                VALUES (?, ?, ?, ?, ?)
-                ''', (invoice_id, item['product_id'], item['quantity'], 
-                     item['price_per_unit'], item['amount']))
+                UPDATE dashboard_state
+                SET watermark_id = ?, needs_rebuild = 0, refreshed_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+                ''', (watermark_id,))
+                conn.commit()
+                conn.close()
+                return 0
             
+            bounds = (watermark_id, latest['id'])
+            cursor.execute('''
+            SELECT COUNT(*) FROM invoices WHERE id > ? AND id <= ?
+            ''', bounds)
+            processed = cursor.fetchone()[0]
+            for name, sql in _DASHBOARD_AGGREGATE_SQL.items():
+                condition = "invoice_id > ? AND invoice_id <= ?" if name == 'products' else "id > ? AND id <= ?"
+                cursor.execute(_DASHBOARD_UPSERT_SQL[name].format(
+                    rows=sql.format(schema="main", condition=condition)), bounds)
+            cursor.execute('''
+            UPDATE dashboard_state
+            SET watermark_id = ?, watermark_created_at = ?, needs_rebuild = 0,
+                refreshed_at = CURRENT_TIMESTAMP
+            WHERE id = 1
+            ''', (latest['id'], latest['created_at']))
             conn.commit()
             conn.close()
-            return bill_number, None
-        except Exception as e:
+            return processed
+        except Exception:
             conn.rollback()
             conn.close()
-            return None, str(e)
+            raise
     
-    def get_all_invoices(self):
+    def _dashboard_aggregates(self, cursor, schema, condition, item_condition, params):
+        results = []
+        for name, sql in _DASHBOARD_AGGREGATE_SQL.items():
+            cursor.execute(sql.format(schema=schema, condition=item_condition if name == 'products' else condition), params)
+            results.append([tuple(row) for row in cursor.fetchall()])
+        return results
+    
+    def get_dashboard_data(self, months=12, top=10):
+        """KPIs for the dashboard, read from the cache only."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute('''
-        SELECT i.*, 
-               b.company_name as bill_to_name, 
-               s.company_name as ship_to_name,
-               f.company_name as ship_from_name
-        FROM invoices i
-        JOIN companies b ON i.bill_to_company_id = b.id
-        JOIN companies s ON i.ship_to_company_id = s.id
-        JOIN companies f ON i.ship_from_company_id = f.id
-        ORDER BY i.bill_date DESC
+        SELECT * FROM (
+            SELECT * FROM dashboard_monthly ORDER BY period DESC LIMIT ?
+        ) ORDER BY period
+        ''', (months,))
+        monthly = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute('''
+        SELECT c.company_name, c.gst_number, d.invoice_count, d.grand_total
+        FROM dashboard_clients d
+        JOIN companies c ON c.id = d.company_id
+        ORDER BY d.grand_total DESC
+        LIMIT ?
+        ''', (top,))
+        top_clients = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute('''
+        SELECT p.sku_code, p.product_name, d.quantity, d.amount
+        FROM dashboard_products d
+        JOIN products p ON p.id = d.product_id
+        ORDER BY d.amount DESC
+        LIMIT ?
+        ''', (top,))
+        top_products = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute('''
+        SELECT COALESCE(SUM(invoice_count), 0) as invoice_count,
+               COALESCE(SUM(grand_total), 0) as grand_total
+        FROM dashboard_monthly
         ''')
+        totals = dict(cursor.fetchone())
+        cursor.execute('SELECT COALESCE(SUM(balance), 0) FROM client_balances')
+        totals['outstanding'] = cursor.fetchone()[0]
+        
+        cursor.execute('SELECT * FROM dashboard_state WHERE id = 1')
+        state = dict(cursor.fetchone())
         
-        invoices = [dict(row) for row in cursor.fetchall()]
         conn.close()
         
-        return invoices
+        return {
+            'monthly': monthly,
+            'top_clients': top_clients,
+            'top_products': top_products,
+            'totals': totals,
+            'state': state,
+        }
     
     def get_invoice_details(self, invoice_id):
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        # Get invoice header
-        cursor.execute('''
-        SELECT i.*, 
-               b.company_name as bill_to_name, b.address as bill_to_address, b.gst_number as bill_to_gst,
-               s.company_name as ship_to_name, s.address as ship_to_address, s.gst_number as ship_to_gst,
-               f.company_name as ship_from_name, f.address as ship_from_address, f.gst_number as ship_from_gst
-        FROM invoices i
-        JOIN companies b ON i.bill_to_company_id = b.id
-        JOIN companies s ON i.ship_to_company_id = s.id
-        JOIN companies f ON i.ship_from_company_id = f.id
-        WHERE i.id = ?
-        ''', (invoice_id,))
-        
-        invoice = cursor.fetchone()
-        
-        if not invoice:
-            conn.close()
-            return None
+        invoices = self._fetch_invoice_details(cursor, "main", [invoice_id])
         
-        invoice_dict = dict(invoice)
-        
-        # Get invoice items
-        cursor.execute('''
-        SELECT ii.*, p.sku_code, p.product_name, p.hsn_code
-        FROM invoice_items ii
-        JOIN products p ON ii.product_id = p.id
-        WHERE ii.invoice_id = ?
-        ''', (invoice_id,))
+        conn.close()
+        return invoices[0] if invoices else None
+    
+    def get_invoices_details(self, invoice_ids):
+        """Details of several invoices in the main database, read with two queries."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
-        items = [dict(row) for row in cursor.fetchall()]
-        invoice_dict['items'] = items
+        invoices = self._fetch_invoice_details(cursor, "main", list(invoice_ids))
         
         conn.close()
-        return invoice_dict
+        return invoices
     
     def get_invoice_by_bill_number(self, bill_number):
+        """Invoice details by bill number, looking in the archive files for
+        invoices of archived years. `archived_year` is set on those."""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.execute('SELECT id FROM invoices WHERE bill_number = ?', (bill_number,))
         result = cursor.fetchone()
+        if result:
+            invoices = self._fetch_invoice_details(cursor, "main", [result['id']])
+            conn.close()
+            return invoices[0] if invoices else None
         
+        cursor.execute('''
+        SELECT invoice_id, financial_year FROM archived_invoices WHERE bill_number = ?
+        ''', (bill_number,))
+        result = cursor.fetchone()
         if not result:
             conn.close()
             return None
         
-        invoice_id = result['id']
+        invoices = []
+        for schema, financial_year in self._attach_archives(cursor, result['financial_year']):
+            invoices = self._fetch_invoice_details(cursor, schema, [result['invoice_id']], financial_year)
         conn.close()
         
-        return self.get_invoice_details(invoice_id)
+        return invoices[0] if invoices else None
 
     def get_product_details(self, product_id):
         conn = self.get_connection()
@@ -738,6 +4493,623 @@ class DatabaseManager:
         except Exception as e:
             conn.close()
             return False, str(e)
+    
+    def delete_invoices(self, invoice_ids):
+        """Delete invoices and their line items in one transaction. Archived
+        invoices are skipped. Returns (number deleted, error).
+
+        The row triggers are dropped for the statement, as when archiving, and the
+        GST summaries, ledger, search index, dashboard cache and export log are
+        updated once for the whole set instead of once per invoice and line.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # Lines and payments are handled below, the per-row ON DELETE
+            # actions would only look for them again
+            cursor.execute('PRAGMA foreign_keys = OFF')
+            cursor.execute('BEGIN IMMEDIATE')
+            deleted, triggers = self._begin_bulk_change(cursor, invoice_ids)
+            if deleted:
+                self._bulk_invoice_deltas(cursor, 'SELECT * FROM bulk_invoices', "-", with_lines=True)
+                self._post_bulk_ledger(cursor, f'''
+                SELECT id * 2 AS seq, bill_to_company_id AS company_id, date('now') AS entry_date,
+                       'invoice reversal' AS entry_type, id AS invoice_id,
+                       -{_invoice_due_sql("b")} AS invoiced, 0 AS paid
+                FROM bulk_invoices b
+                UNION ALL
+                SELECT id * 2 + 1, bill_to_company_id, date('now'), 'advance reversal', id,
+                       0, -COALESCE(advance_amount, 0)
+                FROM bulk_invoices
+                ''')
+                cursor.execute('DELETE FROM invoice_receivables WHERE invoice_id IN (SELECT id FROM bulk_invoices)')
+                cursor.execute('UPDATE payments SET invoice_id = NULL WHERE invoice_id IN (SELECT id FROM bulk_invoices)')
+                if self.search_enabled:
+                    # Segments are merged a little at a time by the following
+                    # writes instead of all at once during this statement
+                    cursor.execute("INSERT INTO invoice_search (invoice_search, rank) VALUES ('automerge', 0)")
+                    cursor.execute('DELETE FROM invoice_search WHERE rowid IN (SELECT id FROM bulk_invoices)')
+                    cursor.execute(f"INSERT INTO invoice_search (invoice_search, rank) VALUES ('automerge', {SEARCH_AUTOMERGE})")
+                self._log_bulk_changes(cursor, "delete", 'bulk_invoices')
+                cursor.execute('DELETE FROM invoice_items WHERE invoice_id IN (SELECT id FROM bulk_invoices)')
+                cursor.execute('DELETE FROM invoices WHERE id IN (SELECT id FROM bulk_invoices)')
+            
+            self._sync_triggers(cursor, triggers)
+            conn.commit()
+            return deleted, None
+        except Exception as e:
+            conn.rollback()
+            return 0, str(e)
+        finally:
+            self._end_bulk_change(cursor)
+            conn.close()
+    
+    def update_invoices(self, invoice_ids, bill_date=None, advance_amount=None):
+        """Set the bill date and/or advance amount of several invoices in one
+        transaction. Archived invoices are skipped. Returns (number updated, error).
+
+        Like delete_invoices, the derived tables are updated once for the whole
+        set with the row triggers dropped.
+        """
+        changes = {}
+        if bill_date is not None:
+            changes['bill_date'] = bill_date
+        if advance_amount is not None:
+            changes['advance_amount'] = advance_amount
+        if not changes:
+            return 0, None
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            updated, triggers = self._begin_bulk_change(cursor, invoice_ids)
+            if updated:
+                cursor.execute(f'''
+                UPDATE invoices
+                SET {", ".join(f"{column} = ?" for column in changes)}, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN (SELECT id FROM bulk_invoices)
+                ''', tuple(changes.values()))
+                cursor.execute('''
+                INSERT INTO bulk_updated
+                SELECT i.id, i.bill_number, i.bill_date, strftime('%Y-%m', i.bill_date), i.bill_to_company_id,
+                       i.taxable_value, i.cgst_amount, i.sgst_amount, i.igst_amount,
+                       i.grand_total, i.advance_amount
+                FROM bulk_invoices b JOIN invoices i ON i.id = b.id
+                ''')
+                
+                # Only a new month moves an invoice between summary rows
+                moved_sql = '''
+                SELECT * FROM {table} t
+                WHERE period IS NOT (SELECT period FROM {other} WHERE id = t.id)
+                '''
+                self._bulk_invoice_deltas(cursor, moved_sql.format(table="bulk_invoices", other="bulk_updated"),
+                                          "-", with_lines=False)
+                self._bulk_invoice_deltas(cursor, moved_sql.format(table="bulk_updated", other="bulk_invoices"),
+                                          "+", with_lines=False)
+                self._post_bulk_ledger(cursor, '''
+                SELECT b.id * 2 AS seq, b.bill_to_company_id AS company_id, u.bill_date AS entry_date,
+                       'advance reversal' AS entry_type, b.id AS invoice_id,
+                       0 AS invoiced, -COALESCE(b.advance_amount, 0) AS paid
+                FROM bulk_invoices b JOIN bulk_updated u ON u.id = b.id
+                WHERE b.advance_amount IS NOT u.advance_amount
+                UNION ALL
+                SELECT u.id * 2 + 1, u.bill_to_company_id, u.bill_date, 'advance', u.id,
+                       0, COALESCE(u.advance_amount, 0)
+                FROM bulk_invoices b JOIN bulk_updated u ON u.id = b.id
+                WHERE b.advance_amount IS NOT u.advance_amount
+                ''')
+                cursor.execute('''
+                UPDATE invoice_receivables
+                SET bill_date = (SELECT bill_date FROM bulk_updated WHERE id = invoice_id),
+                    amount_paid = amount_paid
+                        - (SELECT COALESCE(advance_amount, 0) FROM bulk_invoices WHERE id = invoice_id)
+                        + (SELECT COALESCE(advance_amount, 0) FROM bulk_updated WHERE id = invoice_id)
+                WHERE invoice_id IN (SELECT id FROM bulk_invoices)
+                ''')
+                self._log_bulk_changes(cursor, "update", 'bulk_updated')
+            
+            self._sync_triggers(cursor, triggers)
+            conn.commit()
+            return updated, None
+        except Exception as e:
+            conn.rollback()
+            return 0, str(e)
+        finally:
+            self._end_bulk_change(cursor)
+            conn.close()
+    
+    def _begin_bulk_change(self, cursor, invoice_ids):
+        """Start a bulk change of the given invoices and drop the row triggers,
+        which the caller recreates with _sync_triggers once it has updated the
+        derived tables for the whole set.
+
+        The invoices are copied as they are into the temp table bulk_invoices,
+        with their period, and their lines into bulk_lines. bulk_updated, with
+        the same columns, is left for the invoices as changed. Returns (number of invoices found, dropped triggers).
+        """
+        for table in ("bulk_invoices", "bulk_updated"):
+            cursor.execute(f'''
+            CREATE TEMP TABLE {table} (id INTEGER PRIMARY KEY, bill_number TEXT, bill_date DATE,
+                                       period TEXT, bill_to_company_id INTEGER, taxable_value REAL,
+                                       cgst_amount REAL, sgst_amount REAL, igst_amount REAL,
+                                       grand_total REAL, advance_amount REAL)
+            ''')
+        cursor.execute('''
+        INSERT INTO bulk_invoices
+        SELECT id, bill_number, bill_date, strftime('%Y-%m', bill_date), bill_to_company_id,
+               taxable_value, cgst_amount, sgst_amount, igst_amount, grand_total, advance_amount
+        FROM invoices WHERE id IN (SELECT value FROM json_each(?))
+        ''', (json.dumps(list(invoice_ids)),))
+        found = cursor.rowcount
+        cursor.execute('''
+        CREATE TEMP TABLE bulk_lines AS
+        SELECT invoice_id, product_id, quantity, amount FROM invoice_items
+        WHERE invoice_id IN (SELECT id FROM bulk_invoices)
+        ''')
+        
+        triggers = self._app_triggers()
+        for name in triggers:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+        return found, triggers
+    
+    def _end_bulk_change(self, cursor):
+        """Drop the temp tables of a bulk change and turn foreign keys back on,
+        after its commit or rollback, so that the connection can be used for
+        the next one."""
+        for table in BULK_TEMP_TABLES:
+            cursor.execute(f'DROP TABLE IF EXISTS temp.{table}')
+        cursor.execute('PRAGMA foreign_keys = ON')
+    
+    def _bulk_invoice_deltas(self, cursor, invoices, sign, with_lines):
+        """Add (sign '+') or remove (sign '-') the invoices selected by `invoices`,
+        a query of bulk_invoices columns, in the GST summaries and dashboard cache,
+        with one grouped upsert per table. Invoices only count towards the
+        dashboard once the cache has counted them. `with_lines` also updates the
+        client and product totals of the dashboard, for invoices deleted together
+        with their lines."""
+        cursor.execute(f'''
+        INSERT INTO gst_hsn_summary (period, product_id, line_count, quantity,
+                                     taxable_value, cgst_amount, sgst_amount, igst_amount)
+        SELECT i.period, ii.product_id, {sign}COUNT(*), {sign}SUM(ii.quantity),
+               {sign}SUM(ii.amount), {sign}SUM({_gst_line_tax_sql("ii.amount", CGST_RATE)}),
+               {sign}SUM({_gst_line_tax_sql("ii.amount", SGST_RATE)}), 0
+        FROM bulk_lines ii
+        JOIN ({invoices}) i ON i.id = ii.invoice_id
+        WHERE true
+        GROUP BY 1, 2
+        ON CONFLICT (period, product_id) DO UPDATE SET
+            line_count = line_count + excluded.line_count,
+            quantity = quantity + excluded.quantity,
+            taxable_value = taxable_value + excluded.taxable_value,
+            cgst_amount = cgst_amount + excluded.cgst_amount,
+            sgst_amount = sgst_amount + excluded.sgst_amount,
+            igst_amount = igst_amount + excluded.igst_amount
+        ''')
+        cursor.execute(f'''
+        INSERT INTO gst_b2b_summary (period, company_id, invoice_count,
+                                     taxable_value, cgst_amount, sgst_amount, igst_amount)
+        SELECT period, bill_to_company_id, {sign}COUNT(*), {sign}SUM(COALESCE(taxable_value, 0)),
+               {sign}SUM(COALESCE(cgst_amount, 0)), {sign}SUM(COALESCE(sgst_amount, 0)),
+               {sign}SUM(COALESCE(igst_amount, 0))
+        FROM ({invoices})
+        WHERE true
+        GROUP BY 1, 2
+        ON CONFLICT (period, company_id) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            taxable_value = taxable_value + excluded.taxable_value,
+            cgst_amount = cgst_amount + excluded.cgst_amount,
+            sgst_amount = sgst_amount + excluded.sgst_amount,
+            igst_amount = igst_amount + excluded.igst_amount
+        ''')
+        cursor.execute('DELETE FROM gst_hsn_summary WHERE line_count <= 0')
+        cursor.execute('DELETE FROM gst_b2b_summary WHERE invoice_count <= 0')
+        
+        counted_sql = f'SELECT * FROM ({invoices}) WHERE id <= {_DASHBOARD_COUNTED_SQL}'
+        cursor.execute(f'''
+        INSERT INTO dashboard_monthly (period, invoice_count, taxable_value, grand_total)
+        SELECT period, {sign}COUNT(*), {sign}SUM(COALESCE(taxable_value, 0)),
+               {sign}SUM(COALESCE(grand_total, 0))
+        FROM ({counted_sql})
+        WHERE true
+        GROUP BY 1
+        ON CONFLICT (period) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            taxable_value = taxable_value + excluded.taxable_value,
+            grand_total = grand_total + excluded.grand_total
+        ''')
+        cursor.execute('DELETE FROM dashboard_monthly WHERE invoice_count = 0')
+        if not with_lines:
+            return
+        cursor.execute(f'''
+        INSERT INTO dashboard_clients (company_id, invoice_count, grand_total)
+        SELECT bill_to_company_id, {sign}COUNT(*), {sign}SUM(COALESCE(grand_total, 0))
+        FROM ({counted_sql})
+        WHERE true
+        GROUP BY 1
+        ON CONFLICT (company_id) DO UPDATE SET
+            invoice_count = invoice_count + excluded.invoice_count,
+            grand_total = grand_total + excluded.grand_total
+        ''')
+        cursor.execute('DELETE FROM dashboard_clients WHERE invoice_count = 0')
+        cursor.execute(f'''
+        INSERT INTO dashboard_products (product_id, quantity, amount)
+        SELECT ii.product_id, {sign}SUM(ii.quantity), {sign}SUM(ii.amount)
+        FROM bulk_lines ii
+        JOIN ({counted_sql}) i ON i.id = ii.invoice_id
+        WHERE true
+        GROUP BY 1
+        ON CONFLICT (product_id) DO UPDATE SET
+            quantity = quantity + excluded.quantity,
+            amount = amount + excluded.amount
+        ''')
+        cursor.execute('DELETE FROM dashboard_products WHERE quantity = 0')
+    
+    def _post_bulk_ledger(self, cursor, entries):
+        """Post many ledger entries at once, given as a query of (seq, company_id,
+        entry_date, entry_type, invoice_id, invoiced, paid) in the order they apply.
+        Running balances continue from each client's balance, as _ledger_entry_sql
+        does for a single entry, and entries of zero are skipped."""
+        cursor.execute(f'''
+        CREATE TEMP TABLE bulk_ledger AS
+        SELECT * FROM ({entries}) WHERE invoiced - paid <> 0
+        ''')
+        cursor.execute('''
+        INSERT INTO client_ledger (company_id, entry_date, entry_type, invoice_id,
+                                   debit, credit, running_balance)
+        SELECT e.company_id, e.entry_date, e.entry_type, e.invoice_id,
+               MAX(e.invoiced - e.paid, 0), MAX(e.paid - e.invoiced, 0),
+               COALESCE(b.balance, 0)
+                   + SUM(e.invoiced - e.paid) OVER (PARTITION BY e.company_id ORDER BY e.seq)
+        FROM bulk_ledger e
+        LEFT JOIN client_balances b ON b.company_id = e.company_id
+        ORDER BY e.seq
+        ''')
+        cursor.execute('''
+        INSERT INTO client_balances (company_id, total_invoiced, total_paid, balance, last_entry_date)
+        SELECT company_id, SUM(invoiced), SUM(paid), SUM(invoiced - paid), MAX(entry_date)
+        FROM bulk_ledger
+        WHERE true
+        GROUP BY company_id
+        ON CONFLICT (company_id) DO UPDATE SET
+            total_invoiced = total_invoiced + excluded.total_invoiced,
+            total_paid = total_paid + excluded.total_paid,
+            balance = balance + excluded.balance,
+            last_entry_date = MAX(COALESCE(last_entry_date, excluded.last_entry_date),
+                                  excluded.last_entry_date)
+        ''')
+    
+    def _log_bulk_changes(self, cursor, change, table):
+        """Log `change` for the invoices in the bulk table `table`, taking
+        consecutive change ids in id order as the export triggers would one row
+        at a time."""
+        cursor.execute(f'''
+        INSERT INTO invoice_changes (invoice_id, bill_number, change, change_id)
+        SELECT i.id, i.bill_number, '{change}', s.last_change_id + ROW_NUMBER() OVER (ORDER BY i.id)
+        FROM {table} i, export_state s
+        WHERE s.id = 1
+        ON CONFLICT (invoice_id) DO UPDATE SET
+            bill_number = excluded.bill_number,
+            change = excluded.change,
+            change_id = excluded.change_id,
+            changed_at = CURRENT_TIMESTAMP
+        ''')
+        cursor.execute(f'''
+        UPDATE export_state SET last_change_id = last_change_id + (SELECT COUNT(*) FROM {table})
+        WHERE id = 1
+        ''')
+    
+    def add_payment(self, company_id, payment_date, amount, invoice_id=None, reference=None):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+            INSERT INTO payments (company_id, invoice_id, payment_date, amount, reference)
+            VALUES (?, ?, ?, ?, ?)
+            ''', (company_id, invoice_id, payment_date, amount, reference))
+            conn.commit()
+            payment_id = cursor.lastrowid
+            conn.close()
+            return payment_id, None
+        except Exception as e:
+            conn.rollback()
+            conn.close()
+            return None, str(e)
+    
+    def delete_payment(self, payment_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('DELETE FROM payments WHERE id = ?', (payment_id,))
+            conn.commit()
+            conn.close()
+            return True, None
+        except Exception as e:
+            conn.rollback()
+            conn.close()
+            return False, str(e)
+    
+    def get_payments(self, company_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT p.*, i.bill_number
+        FROM payments p
+        LEFT JOIN invoices i ON i.id = p.invoice_id
+        WHERE p.company_id = ?
+        ORDER BY p.payment_date DESC, p.id DESC
+        ''', (company_id,))
+        
+        payments = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return payments
+    
+    def get_open_invoices(self, company_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT r.invoice_id as id, i.bill_number, r.bill_date, r.amount_due, r.amount_paid,
+               r.amount_due - r.amount_paid as outstanding
+        FROM invoice_receivables r
+        JOIN invoices i ON i.id = r.invoice_id
+        WHERE r.company_id = ? AND r.amount_due - r.amount_paid > 0.005
+        ORDER BY r.bill_date
+        ''', (company_id,))
+        
+        invoices = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return invoices
+    
+    def get_client_balances(self, as_of=None):
+        """Current balance and ageing of every client with ledger activity.
+
+        Balances come straight from client_balances; ageing only reads the open
+        invoices in invoice_receivables. Payments not allocated to an invoice are
+        reported as on-account credit.
+        """
+        as_of = as_of or date.today().isoformat()
+        bucket_columns = ",\n".join(
+            f"SUM(CASE WHEN julianday(?) - julianday(bill_date) >= {low}"
+            + (f" AND julianday(?) - julianday(bill_date) < {high + 1}" if high is not None else "")
+            + f" THEN amount_due - amount_paid ELSE 0 END) as bucket_{index}"
+            for index, (_, low, high) in enumerate(AGEING_BUCKETS)
+        )
+        bucket_params = []
+        for _, low, high in AGEING_BUCKETS:
+            bucket_params.extend([as_of] if high is None else [as_of, as_of])
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute(f'''
+        SELECT c.id as company_id, c.company_name, c.gst_number,
+               b.total_invoiced, b.total_paid, b.balance, b.last_entry_date,
+               COALESCE(a.open_amount, 0) as open_amount,
+               {", ".join(f"COALESCE(a.bucket_{index}, 0) as bucket_{index}" for index in range(len(AGEING_BUCKETS)))}
+        FROM client_balances b
+        JOIN companies c ON c.id = b.company_id
+        LEFT JOIN (
+            SELECT company_id, SUM(amount_due - amount_paid) as open_amount,
+                   {bucket_columns}
+            FROM invoice_receivables
+            WHERE amount_due - amount_paid > 0.005
+            GROUP BY company_id
+        ) a ON a.company_id = b.company_id
+        ORDER BY b.balance DESC
+        ''', bucket_params)
+        
+        balances = []
+        for row in cursor.fetchall():
+            balance = dict(row)
+            balance['on_account'] = round(balance['open_amount'] - balance['balance'], 2)
+            balance['ageing'] = [balance.pop(f"bucket_{index}") for index in range(len(AGEING_BUCKETS))]
+            balances.append(balance)
+        conn.close()
+        
+        return balances
+    
+    def get_client_ledger(self, company_id):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT l.*, COALESCE(i.bill_number, a.bill_number) as bill_number, p.reference
+        FROM client_ledger l
+        LEFT JOIN invoices i ON i.id = l.invoice_id
+        LEFT JOIN archived_invoices a ON a.invoice_id = l.invoice_id
+        LEFT JOIN payments p ON p.id = l.payment_id
+        WHERE l.company_id = ?
+        ORDER BY l.id
+        ''', (company_id,))
+        
+        entries = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return entries
+
+class GSTReport:
+    """GSTR-1 style summaries read from the trigger-maintained GST summary tables.
+
+    Every query reads one pre-aggregated row per period and recipient or product,
+    so reports never scan the invoice line items.
+    """
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+    
+    def get_periods(self):
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT DISTINCT period FROM gst_b2b_summary ORDER BY period DESC')
+        
+        periods = [row['period'] for row in cursor.fetchall()]
+        conn.close()
+        
+        return periods
+    
+    def get_period_totals(self, start_period=None, end_period=None):
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT period,
+               SUM(invoice_count) as invoice_count,
+               ROUND(SUM(taxable_value), 2) as taxable_value,
+               ROUND(SUM(cgst_amount), 2) as cgst_amount,
+               ROUND(SUM(sgst_amount), 2) as sgst_amount,
+               ROUND(SUM(igst_amount), 2) as igst_amount
+        FROM gst_b2b_summary
+        WHERE (? IS NULL OR period >= ?) AND (? IS NULL OR period <= ?)
+        GROUP BY period
+        ORDER BY period
+        ''', (start_period, start_period, end_period, end_period))
+        
+        totals = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return totals
+    
+    def get_b2b_summary(self, period):
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT c.gst_number, c.company_name,
+               s.invoice_count,
+               ROUND(s.taxable_value, 2) as taxable_value,
+               ROUND(s.cgst_amount, 2) as cgst_amount,
+               ROUND(s.sgst_amount, 2) as sgst_amount,
+               ROUND(s.igst_amount, 2) as igst_amount
+        FROM gst_b2b_summary s
+        JOIN companies c ON c.id = s.company_id
+        WHERE s.period = ?
+        ORDER BY c.company_name
+        ''', (period,))
+        
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return rows
+    
+    def get_hsn_summary(self, period):
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+        SELECT p.hsn_code,
+               SUM(s.line_count) as line_count,
+               SUM(s.quantity) as quantity,
+               ROUND(SUM(s.taxable_value), 2) as taxable_value,
+               ROUND(SUM(s.cgst_amount), 2) as cgst_amount,
+               ROUND(SUM(s.sgst_amount), 2) as sgst_amount,
+               ROUND(SUM(s.igst_amount), 2) as igst_amount
+        FROM gst_hsn_summary s
+        JOIN products p ON p.id = s.product_id
+        WHERE s.period = ?
+        GROUP BY p.hsn_code
+        ORDER BY p.hsn_code
+        ''', (period,))
+        
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        
+        return rows
+
+class RemoteError(Exception):
+    """The invoice server could not be reached or could not run a call."""
+
+
+class RemoteDatabaseManager:
+    """Client for invoice_server.py with the methods of DatabaseManager.
+
+    Every public method is forwarded to the server as a JSON request, so
+    tuples come back as lists. Backups and maintenance are scheduled by the
+    server; the scheduler methods do nothing here and backups are restored on
+    the server itself.
+    """
+    backup_dir = None
+
+    def __init__(self, url, token=None, timeout=SERVER_TIMEOUT):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Invalid server URL: {url}")
+        self.url = url
+        self.host = parts.hostname
+        self.port = parts.port or SERVER_PORT
+        self.token = token
+        self.timeout = timeout
+        
+        info = self.call("server_info")
+        if info['schema_version'] != SCHEMA_VERSION:
+            raise RemoteError(f"The server at {url} uses database version {info['schema_version']}, "
+                              f"this application needs version {SCHEMA_VERSION}")
+        self.db_file = info['db_file']
+        self.search_enabled = info['search_enabled']
+
+    def call(self, method, *args, **kwargs):
+        """Run DatabaseManager.<method> on the server and return its result."""
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers[SERVER_TOKEN_HEADER] = self.token
+        body = json.dumps({"args": args, "kwargs": kwargs}).encode("utf-8")
+        
+        with TRACER.span(f"remote.{method}"):
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                conn.request("POST", f"/api/{method}", body, headers)
+                response = conn.getresponse()
+                payload = json.loads(response.read() or b"{}")
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                raise RemoteError(f"Could not reach the invoice server at {self.url}: {e}") from e
+            finally:
+                conn.close()
+        
+        if response.status != 200:
+            raise RemoteError(payload.get('error') or f"The invoice server answered {response.status}")
+        return payload['result']
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return functools.partial(self.call, name)
+
+    def gst_report(self):
+        return _RemoteGSTReport(self)
+
+    def export_parquet(self, directory, chunk_rows=PARQUET_CHUNK_ROWS):
+        return None, "Parquet export reads the database file directly, run it on the server's computer"
+
+    def start_backup_scheduler(self, interval=BACKUP_INTERVAL, on_backup=None):
+        pass
+
+    def stop_backup_scheduler(self):
+        pass
+
+    def start_maintenance_scheduler(self, interval=MAINTENANCE_CHECK_INTERVAL,
+                                    idle_seconds=MAINTENANCE_IDLE_SECONDS, on_maintenance=None):
+        pass
+
+    def stop_maintenance_scheduler(self):
+        pass
+
+
+class _RemoteGSTReport:
+    """GSTReport methods run on the invoice server."""
+    def __init__(self, remote):
+        self.remote = remote
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return functools.partial(self.remote.call, f"gst_report.{name}")
 
 class LoadingScreen(QDialog):
     def __init__(self, message="Processing...", parent=None):
@@ -774,13 +5146,16 @@ class InvoiceItem(QFrame):
         self.init_ui()
     
     def init_ui(self):
-        layout = QGridLayout()
+        layout = QGridLayout(self)
         
         # Serial Number (read-only)
         layout.addWidget(QLabel(f"{self.index + 1}"), 0, 0)
         
-        # SKU Code (Combobox for selection)
-        self.sku_combo = QComboBox()
+        # SKU Code (Combobox for selection). Created on this frame, which is
+        # itself created in place: a combo box reparented under the theme
+        # stylesheet builds its hidden popup, which every theme switch would
+        # then update as well
+        self.sku_combo = QComboBox(self)
         self.sku_combo.addItem("-- Select Product --", None)
         for product in self.all_products:
             self.sku_combo.addItem(f"{product['sku_code']} - {product['product_name']}", product['id'])
@@ -823,22 +5198,9 @@ class InvoiceItem(QFrame):
         self.remove_btn = QPushButton("✕")  # Using a unicode X symbol
         self.remove_btn.setFixedSize(30, 30)  # Make it square and larger
         self.remove_btn.setFont(QFont("Arial", 14))  # Larger font
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff4444;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                background-color: #ff6666;
-            }
-        """)
+        self.remove_btn.setProperty("role", "remove")  # styled by THEME_STYLESHEET
         self.remove_btn.clicked.connect(self.remove_item)
         layout.addWidget(self.remove_btn, 0, 7)
-        
-        self.setLayout(layout)
     
     def product_selected(self):
         product_id = self.sku_combo.currentData()
@@ -1076,6 +5438,28 @@ class GenerateBillTab(QWidget):
         advance_layout.addRow("Advance Amount:", self.advance_amount)
         bill_layout.addLayout(advance_layout)
         
+        # PDF Profile
+        profile_layout = QFormLayout()
+        self.pdf_profile = QComboBox()
+        for profile in PDF_PROFILES:
+            self.pdf_profile.addItem(profile.capitalize(), profile)
+        saved_profile = QSettings('KrozTek', 'InvoiceManager').value('pdf_profile', DEFAULT_PDF_PROFILE)
+        profile_index = self.pdf_profile.findData(saved_profile)
+        self.pdf_profile.setCurrentIndex(profile_index if profile_index >= 0 else 0)
+        self.pdf_profile.currentIndexChanged.connect(self.pdf_profile_changed)
+        profile_layout.addRow("PDF Profile:", self.pdf_profile)
+        
+        # Seller the invoice is issued as
+        self.seller = QComboBox()
+        for gstin, seller in SELLER_PROFILES.items():
+            self.seller.addItem(f"{seller['company_name']} ({gstin})", gstin)
+        saved_seller = QSettings('KrozTek', 'InvoiceManager').value('seller', DEFAULT_SELLER)
+        seller_index = self.seller.findData(saved_seller)
+        self.seller.setCurrentIndex(seller_index if seller_index >= 0 else 0)
+        self.seller.currentIndexChanged.connect(self.seller_changed)
+        profile_layout.addRow("Seller:", self.seller)
+        bill_layout.addLayout(profile_layout)
+        
         bill_group.setLayout(bill_layout)
         main_layout.addWidget(bill_group)
         
@@ -1107,15 +5491,7 @@ class GenerateBillTab(QWidget):
 
         # Create QLabel to show the PDF save path
         self.pdf_path_label = QLabel("", self)
-        self.pdf_path_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                font-size: 12pt;
-                padding: 5px;
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 3px;
-            }
-        """)
+        self.pdf_path_label.setProperty("role", "path")
         self.pdf_path_label.setGeometry(10, self.height() - 30, self.width() - 20, 20)
         self.pdf_path_label.setAlignment(Qt.AlignLeft)
         main_layout.addWidget(self.pdf_path_label)
@@ -1123,7 +5499,8 @@ class GenerateBillTab(QWidget):
         self.setLayout(main_layout)
     
     def add_product_item(self):
-        item = InvoiceItem(len(self.product_items), self.db_manager, self.all_products, self)
+        # Created in place, see InvoiceItem.init_ui
+        item = InvoiceItem(len(self.product_items), self.db_manager, self.all_products, self.product_container)
         self.product_items.append(item)
         self.product_container_layout.addWidget(item)
         
@@ -1145,6 +5522,12 @@ class GenerateBillTab(QWidget):
             
             self.calculate_total()
     
+    def pdf_profile_changed(self):
+        QSettings('KrozTek', 'InvoiceManager').setValue('pdf_profile', self.pdf_profile.currentData())
+    
+    def seller_changed(self):
+        QSettings('KrozTek', 'InvoiceManager').setValue('seller', self.seller.currentData())
+    
     def bill_to_gst_changed(self):
         gst = self.bill_to_gst.text()
         company = self.db_manager.get_company_by_gst(gst)
@@ -1170,6 +5553,7 @@ class GenerateBillTab(QWidget):
         # This is just to set up the companies comboboxes and autocomplete
         pass
     
+    @traced()
     def load_products(self):
         try:
             self.all_products = self.db_manager.get_all_products()
@@ -1210,6 +5594,8 @@ class GenerateBillTab(QWidget):
                 total += data['amount']
         self.total_amount.setValue(total)
 
+    @pyqtSlot()
+    @traced()
     def print_bill(self):
         # Show loading screen
         loading = LoadingScreen("Preparing Bill for Printing...", self)
@@ -1226,7 +5612,7 @@ class GenerateBillTab(QWidget):
             temp_pdf_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_bill.pdf")
             
             # Generate PDF
-            pdf_path = generate_bill_pdf(self.prepare_invoice_data(), temp_pdf_path)
+            pdf_path = generate_bill_pdf(self.prepare_invoice_data(), temp_pdf_path, profile="print")
             
             # Show print dialog
             printer = QPrinter(QPrinter.HighResolution)
@@ -1248,6 +5634,7 @@ class GenerateBillTab(QWidget):
         finally:
             loading.close()
 
+    @traced()
     def save_bill_to_database(self):
         try:
             # Validate company information
@@ -1307,7 +5694,8 @@ class GenerateBillTab(QWidget):
                 invoice_data['signature_path'],
                 invoice_data['advance_amount'],
                 invoice_data['total_amount'],
-                invoice_data['items']
+                invoice_data['items'],
+                seller_gstin=self.seller.currentData()
             )
 
             if error:
@@ -1319,6 +5707,7 @@ class GenerateBillTab(QWidget):
             QMessageBox.critical(self, "Error", str(e))
             return None
 
+    @traced()
     def prepare_invoice_data(self):
         # Calculate tax details dynamically
         items = []
@@ -1330,12 +5719,7 @@ class GenerateBillTab(QWidget):
                     data.update(product_details)
                     items.append(data)
 
-        taxable_value = sum(item['amount'] for item in items)
-        sgst_rate = 9  # Static for now; can be dynamic if needed
-        cgst_rate = 9  # Static for now; can be dynamic if needed
-        sgst_amount = taxable_value * sgst_rate / 100
-        cgst_amount = taxable_value * cgst_rate / 100
-        total = taxable_value + sgst_amount + cgst_amount
+        totals = calculate_invoice_totals(sum(item['amount'] for item in items))
 
         # Handle signature path
         signature_path = self.signature_path
@@ -1360,16 +5744,20 @@ class GenerateBillTab(QWidget):
             bill_no=self.bill_number.text(),
             bill_date=self.bill_date.date().toString("yyyy-MM-dd"),
             items=items,
-            taxable_value=taxable_value,
-            sgst_rate=sgst_rate,
-            sgst_amount=sgst_amount,
-            cgst_rate=cgst_rate,
-            cgst_amount=cgst_amount,
-            total=total,
-            amount_in_words=amount_to_words(total),
-            signature_path=signature_path
+            taxable_value=totals['taxable_value'],
+            sgst_rate=totals['sgst_rate'],
+            sgst_amount=totals['sgst_amount'],
+            cgst_rate=totals['cgst_rate'],
+            cgst_amount=totals['cgst_amount'],
+            round_off=totals['round_off'],
+            total=totals['grand_total'],
+            amount_in_words=amount_to_words(totals['grand_total']),
+            signature_path=signature_path,
+            seller=self.seller.currentData()
         )
 
+    @pyqtSlot()
+    @traced()
     def generate_bill(self):
         # Show loading screen
         loading = LoadingScreen("Generating Invoice...", self)
@@ -1389,7 +5777,8 @@ class GenerateBillTab(QWidget):
                     save_path += ".pdf"
 
                 # Generate PDF
-                pdf_path = generate_bill_pdf(self.prepare_invoice_data(), save_path)
+                pdf_path = generate_bill_pdf(self.prepare_invoice_data(), save_path,
+                                             profile=self.pdf_profile.currentData())
                 QMessageBox.information(self, "Success", f"Invoice saved and PDF generated at {pdf_path}!")
 
                 # Display the save path at the bottom of the app
@@ -1430,6 +5819,8 @@ class GenerateBillTab(QWidget):
         self.advance_amount.setValue(0.0)
         self.total_amount.setValue(0.0)
 
+    @pyqtSlot()
+    @traced()
     def refresh_data(self):
         # Show loading screen
         loading = LoadingScreen("Refreshing Data...", self)
@@ -1454,7 +5845,183 @@ class GenerateBillTab(QWidget):
         finally:
             loading.close()
 
+class GSTSummaryDialog(QDialog):
+    B2B_COLUMNS = [("gst_number", "Recipient GSTIN"), ("company_name", "Recipient"),
+                   ("invoice_count", "Invoices"), ("taxable_value", "Taxable Value"),
+                   ("cgst_amount", "CGST"), ("sgst_amount", "SGST"), ("igst_amount", "IGST")]
+    HSN_COLUMNS = [("hsn_code", "HSN"), ("line_count", "Lines"), ("quantity", "Quantity"),
+                   ("taxable_value", "Taxable Value"), ("cgst_amount", "CGST"),
+                   ("sgst_amount", "SGST"), ("igst_amount", "IGST")]
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.report = db_manager.gst_report()
+        self.setWindowTitle("GST Summary")
+        self.setMinimumSize(900, 600)
+        
+        layout = QVBoxLayout()
+        
+        period_layout = QHBoxLayout()
+        period_layout.addWidget(QLabel("Period:"))
+        self.period_combo = QComboBox()
+        for period in self.report.get_periods():
+            self.period_combo.addItem(period)
+        self.period_combo.currentIndexChanged.connect(self.load_period)
+        period_layout.addWidget(self.period_combo)
+        period_layout.addStretch()
+        export_btn = QPushButton("Export to Excel")
+        export_btn.clicked.connect(self.export_to_excel)
+        period_layout.addWidget(export_btn)
+        layout.addLayout(period_layout)
+        
+        layout.addWidget(QLabel("B2B Invoices"))
+        self.b2b_table = self.create_table(self.B2B_COLUMNS)
+        layout.addWidget(self.b2b_table)
+        
+        layout.addWidget(QLabel("HSN-wise Summary"))
+        self.hsn_table = self.create_table(self.HSN_COLUMNS)
+        layout.addWidget(self.hsn_table)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+        self.load_period()
+
+    def create_table(self, columns):
+        table = QTableWidget()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels([label for _, label in columns])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    def fill_table(self, table, columns, rows):
+        table.setRowCount(len(rows))
+        for row, record in enumerate(rows):
+            for column, (key, _) in enumerate(columns):
+                value = record[key]
+                text = f"{value:.2f}" if isinstance(value, float) else str(value)
+                table.setItem(row, column, QTableWidgetItem(text))
+
+    def load_period(self):
+        period = self.period_combo.currentText()
+        if not period:
+            return
+        self.fill_table(self.b2b_table, self.B2B_COLUMNS, self.report.get_b2b_summary(period))
+        self.fill_table(self.hsn_table, self.HSN_COLUMNS, self.report.get_hsn_summary(period))
+
+    @pyqtSlot()
+    @traced()
+    def export_to_excel(self):
+        period = self.period_combo.currentText()
+        if not period:
+            QMessageBox.warning(self, "Error", "No invoices to summarise")
+            return
+        
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, "Save GST Summary", f"GST_Summary_{period}.xlsx", "Excel Files (*.xlsx)"
+        )
+        if not save_path:
+            return
+        if not save_path.endswith('.xlsx'):
+            save_path += '.xlsx'
+        
+        try:
+            b2b = pd.DataFrame(self.report.get_b2b_summary(period), columns=[key for key, _ in self.B2B_COLUMNS])
+            hsn = pd.DataFrame(self.report.get_hsn_summary(period), columns=[key for key, _ in self.HSN_COLUMNS])
+            b2b.columns = [label for _, label in self.B2B_COLUMNS]
+            hsn.columns = [label for _, label in self.HSN_COLUMNS]
+            with pd.ExcelWriter(save_path, engine='openpyxl') as writer:
+                b2b.to_excel(writer, sheet_name='B2B', index=False)
+                hsn.to_excel(writer, sheet_name='HSN', index=False)
+            QMessageBox.information(self, "Success", f"GST summary exported successfully to {save_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export GST summary: {str(e)}")
+
 # Add remaining tabs
+class ArchiveDialog(QDialog):
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.setWindowTitle("Archive Financial Years")
+        self.setMinimumSize(600, 400)
+        
+        layout = QVBoxLayout()
+        
+        info = QLabel("Settled invoices of closed financial years are moved to a separate file per year "
+                      "in the archive folder. Archived invoices still show up in search and exports "
+                      "but can no longer be edited.")
+        info.setWordWrap(True)
+        layout.addWidget(info)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Financial Year", "Invoices", "Unpaid", "Archived"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+        
+        btn_layout = QHBoxLayout()
+        archive_btn = QPushButton("Archive Selected Year")
+        archive_btn.clicked.connect(self.archive_year)
+        btn_layout.addWidget(archive_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+        self.load_years()
+
+    def load_years(self):
+        self.years = self.db_manager.get_financial_years()
+        self.table.setRowCount(len(self.years))
+        for row, year in enumerate(self.years):
+            label = year['label'] if year['closed'] else f"{year['label']} (current)"
+            values = [label, str(year['invoice_count']), str(year['open_count']), str(year['archived_count'])]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+    def archive_year(self):
+        row = self.table.currentRow()
+        if row == -1:
+            QMessageBox.warning(self, "Error", "Please select a financial year to archive")
+            return
+        
+        year = self.years[row]
+        if not year['closed']:
+            QMessageBox.warning(self, "Error", f"Financial year {year['label']} is not closed yet")
+            return
+        
+        confirm = QMessageBox.question(
+            self,
+            "Confirm Archive",
+            f"Move the settled invoices of {year['label']} to the archive?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if confirm != QMessageBox.Yes:
+            return
+        
+        loading = LoadingScreen("Archiving Invoices...", self)
+        loading.show()
+        QApplication.processEvents()
+        try:
+            moved, error = self.db_manager.archive_financial_year(year['financial_year'])
+        finally:
+            loading.close()
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to archive invoices: {error}")
+            return
+        QMessageBox.information(self, "Success", f"{moved} invoice(s) from {year['label']} archived")
+        self.load_years()
+
 class DisplayBillsTab(QWidget):
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
@@ -1478,11 +6045,36 @@ class DisplayBillsTab(QWidget):
         delete_btn.clicked.connect(self.delete_invoice)
         btn_layout.addWidget(delete_btn)
         
+        # Re-render PDFs of the selected invoices
+        pdf_btn = QPushButton("Save PDFs")
+        pdf_btn.clicked.connect(self.save_invoice_pdfs)
+        btn_layout.addWidget(pdf_btn)
+        
         # Export to Excel button
         export_btn = QPushButton("Export to Excel")
         export_btn.clicked.connect(self.export_to_excel)
         btn_layout.addWidget(export_btn)
         
+        # Export only what changed since the last time
+        changes_btn = QPushButton("Export Changes")
+        changes_btn.clicked.connect(self.export_changes_to_excel)
+        btn_layout.addWidget(changes_btn)
+        
+        # Typed, month-partitioned files for loading into pandas and other tools
+        parquet_btn = QPushButton("Export to Parquet")
+        parquet_btn.clicked.connect(self.export_to_parquet)
+        btn_layout.addWidget(parquet_btn)
+        
+        # GST summary button
+        gst_btn = QPushButton("GST Summary")
+        gst_btn.clicked.connect(self.show_gst_summary)
+        btn_layout.addWidget(gst_btn)
+        
+        # Archive button
+        archive_btn = QPushButton("Archive Years")
+        archive_btn.clicked.connect(self.show_archive)
+        btn_layout.addWidget(archive_btn)
+        
         # Add some spacing
         btn_layout.addStretch()
         
@@ -1493,18 +6085,31 @@ class DisplayBillsTab(QWidget):
         
         layout.addLayout(btn_layout)
         
+        # Search bar
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search by bill number, client, GSTIN, address, product, SKU or HSN")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.load_invoices)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        layout.addWidget(self.search_input)
+        
         # Invoice table
         self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Bill Number", "Date", "Bill To", "Total", "Advance"])
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(["Bill Number", "Date", "Bill To", "Taxable Value", "Total", "Advance"])
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionMode(QTableWidget.ExtendedSelection)
         self.table.cellDoubleClicked.connect(self.show_invoice_details)
         layout.addWidget(self.table)
         
         self.setLayout(layout)
 
+    @pyqtSlot()
+    @traced()
     def export_to_excel(self):
         # Show loading screen
         loading = LoadingScreen("Preparing Excel Export...", self)
@@ -1512,39 +6117,9 @@ class DisplayBillsTab(QWidget):
         QApplication.processEvents()
 
         try:
-            # Get all invoices with details
-            invoices = self.db_manager.get_all_invoices()
-            
-            # Create a list to store all invoice data
-            excel_data = []
-            
-            for invoice in invoices:
-                # Get detailed invoice information
-                invoice_details = self.db_manager.get_invoice_by_bill_number(invoice['bill_number'])
-                if invoice_details:
-                    # Add invoice header information
-                    for item in invoice_details['items']:
-                        excel_data.append({
-                            'Bill Number': invoice['bill_number'],
-                            'Date': invoice['bill_date'],
-                            'Bill To': invoice['bill_to_name'],
-                            'Bill To GST': invoice_details['bill_to_gst'],
-                            'Ship To': invoice['ship_to_name'],
-                            'Ship To GST': invoice_details['ship_to_gst'],
-                            'Ship From': invoice['ship_from_name'],
-                            'Ship From GST': invoice_details['ship_from_gst'],
-                            'SKU': item['sku_code'],
-                            'Product': item['product_name'],
-                            'HSN': item['hsn_code'],
-                            'Quantity': item['quantity'],
-                            'Price per Unit': item['price_per_unit'],
-                            'Amount': item['amount'],
-                            'Total Amount': invoice['total_amount'],
-                            'Advance Amount': invoice['advance_amount']
-                        })
-            
-            # Create DataFrame
-            df = pd.DataFrame(excel_data)
+            # Get all invoices with details, including archived years
+            invoices = self.db_manager.get_all_invoice_details(include_archived=True)
+            df = invoice_export_frame(invoices)
             
             # Ask user where to save the Excel file
             save_path, _ = QFileDialog.getSaveFileName(
@@ -1564,29 +6139,139 @@ class DisplayBillsTab(QWidget):
         finally:
             loading.close()
 
+    @pyqtSlot()
+    @traced()
+    def export_changes_to_excel(self):
+        loading = LoadingScreen("Preparing Excel Export...", self)
+        loading.show()
+        QApplication.processEvents()
+
+        try:
+            changes = self.db_manager.get_invoice_changes()
+            if not changes['invoices'] and not changes['deleted']:
+                # Invoices created and deleted in between still move the checkpoint
+                self.db_manager.save_export_checkpoint(changes['change_id'])
+                QMessageBox.information(self, "Export Changes",
+                                        f"No invoices have changed since the last export on {changes['since']}")
+                return
+            changed, deleted = invoice_changes_frames(changes)
+            
+            save_path, _ = QFileDialog.getSaveFileName(
+                self, "Save Excel File", f"invoice_changes_{date.today().isoformat()}.xlsx",
+                "Excel Files (*.xlsx)"
+            )
+            
+            if save_path:
+                if not save_path.endswith('.xlsx'):
+                    save_path += '.xlsx'
+                
+                with pd.ExcelWriter(save_path, engine='openpyxl') as writer:
+                    changed.to_excel(writer, sheet_name='Changed', index=False)
+                    deleted.to_excel(writer, sheet_name='Deleted', index=False)
+                
+                message = (f"Exported {len(changes['invoices'])} new or edited and "
+                           f"{len(changes['deleted'])} deleted invoices to {save_path}")
+                if changes['since'] is None:
+                    message = f"First export of changes, every invoice is included. {message}"
+                saved, error = self.db_manager.save_export_checkpoint(changes['change_id'])
+                if saved:
+                    QMessageBox.information(self, "Success", message)
+                else:
+                    QMessageBox.warning(self, "Warning", f"{message}, but the checkpoint could not be saved "
+                                                         f"and the next export will repeat them: {error}")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export changes: {str(e)}")
+        finally:
+            loading.close()
+
+    @pyqtSlot()
+    @traced()
+    def export_to_parquet(self):
+        parent_dir = QFileDialog.getExistingDirectory(self, "Choose a Folder for the Parquet Export")
+        if not parent_dir:
+            return
+        directory = os.path.join(parent_dir, f"invoices_parquet_{datetime.datetime.now():%Y%m%d_%H%M%S}")
+        
+        loading = LoadingScreen("Exporting to Parquet...", self)
+        loading.show()
+        QApplication.processEvents()
+
+        try:
+            summary, error = self.db_manager.export_parquet(directory)
+        finally:
+            loading.close()
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to export data: {error}")
+        else:
+            QMessageBox.information(self, "Success",
+                                    f"Exported {summary['invoices']} invoices and {summary['items']} line items "
+                                    f"over {summary['months']} months to {directory}")
+
+    def show_gst_summary(self):
+        try:
+            dialog = GSTSummaryDialog(self.db_manager, self)
+            dialog.exec_()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load GST summary: {str(e)}")
+
+    def show_archive(self):
+        try:
+            dialog = ArchiveDialog(self.db_manager, self)
+            dialog.exec_()
+            self.load_invoices()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load financial years: {str(e)}")
+
+    @pyqtSlot()
+    @traced()
     def load_invoices(self):
+        query = self.search_input.text().strip()
+        if query:
+            # Search results come back in milliseconds, skip the loading screen
+            try:
+                self.populate_table(self.db_manager.search_invoices(query))
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to search invoices: {str(e)}")
+            return
+        
         # Show loading screen
         loading = LoadingScreen("Loading Invoices...", self)
         loading.show()
         QApplication.processEvents()
 
         try:
-            self.table.setRowCount(0)
-            invoices = self.db_manager.get_all_invoices()
-            for invoice in invoices:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                self.table.setItem(row, 0, QTableWidgetItem(invoice['bill_number']))
-                self.table.setItem(row, 1, QTableWidgetItem(invoice['bill_date']))
-                self.table.setItem(row, 2, QTableWidgetItem(invoice['bill_to_name']))
-                self.table.setItem(row, 3, QTableWidgetItem(f"{invoice['total_amount']:.2f}"))
-                self.table.setItem(row, 4, QTableWidgetItem(f"{invoice['advance_amount']:.2f}"))
+            self.populate_table(self.db_manager.get_all_invoices())
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load invoices: {str(e)}")
         finally:
             loading.close()
 
+    def populate_table(self, invoices):
+        self.table.setRowCount(0)
+        for invoice in invoices:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            bill_item = QTableWidgetItem(invoice['bill_number'])
+            bill_item.setData(Qt.UserRole, invoice['id'])
+            self.table.setItem(row, 0, bill_item)
+            self.table.setItem(row, 1, QTableWidgetItem(invoice['bill_date']))
+            self.table.setItem(row, 2, QTableWidgetItem(invoice['bill_to_name']))
+            self.table.setItem(row, 3, QTableWidgetItem(f"{invoice['taxable_value']:.2f}"))
+            self.table.setItem(row, 4, QTableWidgetItem(f"{invoice['grand_total']:.2f}"))
+            self.table.setItem(row, 5, QTableWidgetItem(f"{invoice['advance_amount']:.2f}"))
+
+    def selected_invoices(self):
+        """(invoice id, bill number) of the selected rows, in table order."""
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [(self.table.item(row, 0).data(Qt.UserRole), self.table.item(row, 0).text()) for row in rows]
+
     def edit_invoice(self):
+        if len(self.selected_invoices()) > 1:
+            self.edit_invoices()
+            return
+        
         selected = self.table.currentRow()
         if selected == -1:
             QMessageBox.warning(self, "Error", "Please select an invoice to edit")
@@ -1604,6 +6289,11 @@ class DisplayBillsTab(QWidget):
             if not invoice:
                 QMessageBox.critical(self, "Error", "Invoice not found")
                 return
+            if invoice['archived_year'] is not None:
+                QMessageBox.warning(self, "Archived Invoice",
+                                    f"Invoice {bill_number} is archived in financial year "
+                                    f"{financial_year_label(invoice['archived_year'])} and cannot be edited")
+                return
             
             # Create edit dialog
             dialog = QDialog(self)
@@ -1695,7 +6385,11 @@ class DisplayBillsTab(QWidget):
                           f"<td>{item['amount']:.2f}</td></tr>")
             
             text.append("</table>\n")
-            text.append(f"<b>Total Amount:</b> {invoice['total_amount']:.2f}")
+            text.append(f"<b>Taxable Value:</b> {invoice['taxable_value']:.2f}")
+            text.append(f"<b>SGST ({invoice['sgst_rate']:g}%):</b> {invoice['sgst_amount']:.2f}")
+            text.append(f"<b>CGST ({invoice['cgst_rate']:g}%):</b> {invoice['cgst_amount']:.2f}")
+            text.append(f"<b>Round Off:</b> {invoice['round_off']:+.2f}")
+            text.append(f"<b>Total Amount:</b> {invoice['grand_total']:.2f}")
             text.append(f"<b>Advance Amount:</b> {invoice['advance_amount']:.2f}")
             
             layout.addWidget(text)
@@ -1709,58 +6403,327 @@ class DisplayBillsTab(QWidget):
             dialog.exec_()
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load invoice details: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to load invoice details: {str(e)}")
+        finally:
+            loading.close()
+
+    def edit_invoices(self):
+        selected = self.selected_invoices()
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Edit {len(selected)} Invoices")
+        dialog.setMinimumWidth(400)
+        layout = QVBoxLayout()
+        
+        form_layout = QFormLayout()
+        date_check = QCheckBox("Bill Date:")
+        date_edit = QDateEdit()
+        date_edit.setDate(QDate.currentDate())
+        date_edit.setCalendarPopup(True)
+        date_edit.setEnabled(False)
+        date_check.toggled.connect(date_edit.setEnabled)
+        form_layout.addRow(date_check, date_edit)
+        
+        advance_check = QCheckBox("Advance Amount:")
+        advance = QDoubleSpinBox()
+        advance.setMaximum(999999.99)
+        advance.setEnabled(False)
+        advance_check.toggled.connect(advance.setEnabled)
+        form_layout.addRow(advance_check, advance)
+        layout.addLayout(form_layout)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        dialog.setLayout(layout)
+        
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        if not date_check.isChecked() and not advance_check.isChecked():
+            return
+        
+        loading = LoadingScreen("Saving Changes...", self)
+        loading.show()
+        QApplication.processEvents()
+        try:
+            updated, error = self.db_manager.update_invoices(
+                [invoice_id for invoice_id, _ in selected],
+                bill_date=date_edit.date().toString("yyyy-MM-dd") if date_check.isChecked() else None,
+                advance_amount=advance.value() if advance_check.isChecked() else None,
+            )
+        finally:
+            loading.close()
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to update invoices: {error}")
+            return
+        self.load_invoices()
+        message = f"{updated} invoice(s) updated successfully!"
+        if updated < len(selected):
+            message += f"\n{len(selected) - updated} archived invoice(s) were left unchanged."
+        QMessageBox.information(self, "Success", message)
+
+    def delete_invoice(self):
+        selected = self.selected_invoices()
+        if not selected:
+            QMessageBox.warning(self, "Error", "Please select an invoice to delete")
+            return
+        
+        if len(selected) == 1:
+            row = self.table.currentRow()
+            question = (f"Are you sure you want to delete invoice '{selected[0][1]}' "
+                        f"for '{self.table.item(row, 2).text()}'?")
+        else:
+            question = f"Are you sure you want to delete {len(selected)} invoices?"
+        
+        # Show confirmation dialog
+        confirm = QMessageBox.question(
+            self, 
+            "Confirm Delete", 
+            f"{question}\nThis action cannot be undone.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if confirm == QMessageBox.Yes:
+            # Show loading screen
+            loading = LoadingScreen("Deleting Invoices...", self)
+            loading.show()
+            QApplication.processEvents()
+
+            try:
+                deleted, error = self.db_manager.delete_invoices([invoice_id for invoice_id, _ in selected])
+            finally:
+                loading.close()
+            
+            if error:
+                QMessageBox.critical(self, "Error", f"Failed to delete invoices: {error}")
+                return
+            self.load_invoices()
+            message = f"{deleted} invoice(s) deleted successfully!"
+            if deleted < len(selected):
+                message += f"\n{len(selected) - deleted} archived invoice(s) were not deleted."
+            QMessageBox.information(self, "Success", message)
+
+    @pyqtSlot()
+    @traced()
+    def save_invoice_pdfs(self):
+        selected = self.selected_invoices()
+        if not selected:
+            QMessageBox.warning(self, "Error", "Please select the invoices to save as PDF")
+            return
+        
+        directory = QFileDialog.getExistingDirectory(self, "Save PDFs To")
+        if not directory:
+            return
+        
+        profile = QSettings('KrozTek', 'InvoiceManager').value('pdf_profile', DEFAULT_PDF_PROFILE)
+        if profile not in PDF_PROFILES:
+            profile = DEFAULT_PDF_PROFILE
+        
+        loading = LoadingScreen(f"Saving {len(selected)} PDFs...", self)
+        loading.progress_bar.setRange(0, len(selected))
+        loading.show()
+        QApplication.processEvents()
+        
+        failed = []
+        try:
+            invoices = {invoice['id']: invoice for invoice in
+                        self.db_manager.get_invoices_details([invoice_id for invoice_id, _ in selected])}
+            for done, (invoice_id, bill_number) in enumerate(selected, 1):
+                try:
+                    # Archived invoices are not in the main database, look them up by number
+                    invoice = invoices.get(invoice_id) or self.db_manager.get_invoice_by_bill_number(bill_number)
+                    generate_bill_pdf(invoice_pdf_data(invoice), os.path.join(directory, f"{bill_number}.pdf"),
+                                      profile=profile)
+                except Exception as e:
+                    failed.append(f"{bill_number}: {str(e)}")
+                loading.progress_bar.setValue(done)
+                QApplication.processEvents()
+        finally:
+            loading.close()
+        
+        if failed:
+            QMessageBox.warning(self, "Warning", f"{len(selected) - len(failed)} PDF(s) saved, "
+                                f"{len(failed)} failed:\n" + "\n".join(failed[:10]))
+        else:
+            QMessageBox.information(self, "Success", f"{len(selected)} PDF(s) saved to {directory}")
+
+class OutstandingDialog(QDialog):
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.setWindowTitle("Outstanding Balances")
+        self.setMinimumSize(1000, 600)
+        
+        layout = QVBoxLayout()
+        
+        self.table = QTableWidget()
+        headers = ["Company Name", "GST", "Invoiced", "Paid", "Balance", "On Account"]
+        headers += [label for label, _, _ in AGEING_BUCKETS]
+        self.table.setColumnCount(len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.cellDoubleClicked.connect(self.show_ledger)
+        layout.addWidget(self.table)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+        self.load_balances()
+
+    def load_balances(self):
+        self.balances = self.db_manager.get_client_balances()
+        self.table.setRowCount(len(self.balances))
+        for row, balance in enumerate(self.balances):
+            values = [balance['company_name'], balance['gst_number'],
+                      f"{balance['total_invoiced']:.2f}", f"{balance['total_paid']:.2f}",
+                      f"{balance['balance']:.2f}", f"{balance['on_account']:.2f}"]
+            values += [f"{amount:.2f}" for amount in balance['ageing']]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+    def show_ledger(self, row):
+        balance = self.balances[row]
+        entries = self.db_manager.get_client_ledger(balance['company_id'])
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Ledger - {balance['company_name']}")
+        dialog.setMinimumSize(800, 500)
+        layout = QVBoxLayout()
+        
+        table = QTableWidget()
+        table.setColumnCount(7)
+        table.setHorizontalHeaderLabels(["Date", "Type", "Bill Number", "Reference", "Debit", "Credit", "Balance"])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setRowCount(len(entries))
+        for index, entry in enumerate(entries):
+            values = [entry['entry_date'], entry['entry_type'].capitalize(), entry['bill_number'] or "",
+                      entry['reference'] or "", f"{entry['debit']:.2f}", f"{entry['credit']:.2f}",
+                      f"{entry['running_balance']:.2f}"]
+            for column, value in enumerate(values):
+                table.setItem(index, column, QTableWidgetItem(value))
+        layout.addWidget(table)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        dialog.setLayout(layout)
+        dialog.exec_()
+
+class CatalogueImportDialog(QDialog):
+    """Preview a product or client catalogue as a dry run, then import it."""
+    # Rows listed in the preview; the counts always cover the whole file
+    PREVIEW_LIMIT = 500
+
+    def __init__(self, db_manager, kind, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.kind = kind
+        self.rows = []
+        self.result = None
+        self.setWindowTitle(f"Import {kind.capitalize()}")
+        self.setMinimumSize(800, 500)
+        
+        layout = QVBoxLayout()
+        
+        file_layout = QHBoxLayout()
+        self.file_label = QLabel("Choose a CSV or Excel file")
+        file_layout.addWidget(self.file_label)
+        file_layout.addStretch()
+        browse_btn = QPushButton("Browse...")
+        browse_btn.clicked.connect(self.choose_file)
+        file_layout.addWidget(browse_btn)
+        layout.addLayout(file_layout)
+        
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(3)
+        self.table.setHorizontalHeaderLabels(["Change", "Key", "Details"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Cancel)
+        self.import_btn = buttons.addButton("Import", QDialogButtonBox.AcceptRole)
+        self.import_btn.setEnabled(False)
+        buttons.accepted.connect(self.run_import)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        self.setLayout(layout)
+
+    def choose_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Catalogue", "", "Catalogues (*.csv *.xlsx *.xls)"
+        )
+        if path:
+            self.preview(path)
+
+    def preview(self, path):
+        loading = LoadingScreen("Reading Catalogue...", self)
+        loading.show()
+        QApplication.processEvents()
+        try:
+            self.rows, problems = read_catalogue_file(path, self.kind)
+            diff = self.db_manager.diff_catalogue(self.kind, self.rows)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to read catalogue: {str(e)}")
+            return
         finally:
             loading.close()
-
-    def delete_invoice(self):
-        selected = self.table.currentRow()
-        if selected == -1:
-            QMessageBox.warning(self, "Error", "Please select an invoice to delete")
-            return
-        
-        bill_number = self.table.item(selected, 0).text()
-        bill_to = self.table.item(selected, 2).text()
         
-        # Show confirmation dialog
-        confirm = QMessageBox.question(
-            self, 
-            "Confirm Delete", 
-            f"Are you sure you want to delete invoice '{bill_number}' for '{bill_to}'?\nThis action cannot be undone.",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+        self.file_label.setText(os.path.basename(path))
+        self.summary_label.setText(
+            f"New: {len(diff['new'])}    Changed: {len(diff['changed'])}    "
+            f"Unchanged: {len(diff['unchanged'])}    Skipped: {len(problems)}"
         )
         
-        if confirm == QMessageBox.Yes:
-            # Show loading screen
-            loading = LoadingScreen("Deleting Invoice...", self)
-            loading.show()
-            QApplication.processEvents()
+        key = CATALOGUE_IMPORTS[self.kind]["key"]
+        entries = [("Skipped", "", problem) for problem in problems]
+        for row in diff['changed']:
+            details = ", ".join(f"{column}: {row['previous'][column]} -> {row[column]}"
+                                for column in CATALOGUE_IMPORTS[self.kind]["columns"]
+                                if row['previous'][column] != row[column])
+            entries.append(("Changed", row[key], details))
+        for row in diff['new']:
+            entries.append(("New", row[key], ", ".join(str(value) for column, value in row.items() if column != key)))
+        
+        entries = entries[:self.PREVIEW_LIMIT]
+        self.table.setRowCount(len(entries))
+        for index, entry in enumerate(entries):
+            for column, value in enumerate(entry):
+                self.table.setItem(index, column, QTableWidgetItem(value))
+        
+        self.import_btn.setEnabled(bool(diff['new'] or diff['changed']))
 
-            try:
-                # Get invoice ID
-                invoice = self.db_manager.get_invoice_by_bill_number(bill_number)
-                if not invoice:
-                    raise ValueError("Invoice not found")
-                
-                # Delete invoice items first
-                conn = self.db_manager.get_connection()
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM invoice_items WHERE invoice_id = ?', (invoice['id'],))
-                
-                # Delete invoice
-                cursor.execute('DELETE FROM invoices WHERE id = ?', (invoice['id'],))
-                conn.commit()
-                conn.close()
-                
-                self.load_invoices()
-                QMessageBox.information(self, "Success", "Invoice deleted successfully!")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete invoice: {str(e)}")
-            finally:
-                loading.close()
+    def run_import(self):
+        loading = LoadingScreen("Importing Catalogue...", self)
+        loading.show()
+        QApplication.processEvents()
+        try:
+            diff, error = self.db_manager.import_catalogue(self.kind, self.rows)
+        finally:
+            loading.close()
+        
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to import catalogue: {error}")
+            return
+        self.result = diff
+        self.accept()
 
 class ManageClientsTab(QWidget):
+    catalogue_imported = pyqtSignal()
+
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
@@ -1785,13 +6748,23 @@ class ManageClientsTab(QWidget):
         edit_btn.clicked.connect(self.edit_client)
         delete_btn = QPushButton("Delete Client")
         delete_btn.clicked.connect(self.delete_client)
+        payment_btn = QPushButton("Record Payment")
+        payment_btn.clicked.connect(self.record_payment)
+        outstanding_btn = QPushButton("Outstanding")
+        outstanding_btn.clicked.connect(self.show_outstanding)
         btn_layout.addWidget(add_btn)
         btn_layout.addWidget(edit_btn)
         btn_layout.addWidget(delete_btn)
+        import_btn = QPushButton("Import Catalogue")
+        import_btn.clicked.connect(self.import_catalogue)
+        btn_layout.addWidget(payment_btn)
+        btn_layout.addWidget(outstanding_btn)
+        btn_layout.addWidget(import_btn)
         layout.addLayout(btn_layout)
         
         self.setLayout(layout)
 
+    @traced()
     def load_clients(self):
         # Show loading screen
         loading = LoadingScreen("Loading Clients...", self)
@@ -1799,11 +6772,9 @@ class ManageClientsTab(QWidget):
         QApplication.processEvents()
 
         try:
-            self.table.setRowCount(0)
             clients = self.db_manager.get_all_companies()
-            for client in clients:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
+            self.table.setRowCount(len(clients))
+            for row, client in enumerate(clients):
                 self.table.setItem(row, 0, QTableWidgetItem(str(client['id'])))
                 self.table.setItem(row, 1, QTableWidgetItem(client['company_name']))
                 self.table.setItem(row, 2, QTableWidgetItem(client['address']))
@@ -1813,6 +6784,17 @@ class ManageClientsTab(QWidget):
         finally:
             loading.close()
 
+    def import_catalogue(self):
+        dialog = CatalogueImportDialog(self.db_manager, "companies", self)
+        if dialog.exec_() == QDialog.Accepted:
+            diff = dialog.result
+            self.load_clients()
+            self.catalogue_imported.emit()
+            QMessageBox.information(
+                self, "Success",
+                f"Imported {len(diff['new'])} new and {len(diff['changed'])} changed clients"
+            )
+
     def add_client(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Add New Client")
@@ -1927,6 +6909,75 @@ class ManageClientsTab(QWidget):
         finally:
             loading.close()
 
+    def record_payment(self):
+        selected = self.table.currentRow()
+        if selected == -1:
+            QMessageBox.warning(self, "Error", "Please select a client to record a payment for")
+            return
+        
+        client_id = int(self.table.item(selected, 0).text())
+        client_name = self.table.item(selected, 1).text()
+        
+        try:
+            open_invoices = self.db_manager.get_open_invoices(client_id)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load open invoices: {str(e)}")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Record Payment - {client_name}")
+        layout = QFormLayout()
+        
+        payment_date = QDateEdit()
+        payment_date.setDate(QDate.currentDate())
+        payment_date.setCalendarPopup(True)
+        amount = QDoubleSpinBox()
+        amount.setMaximum(9999999.99)
+        amount.setDecimals(2)
+        invoice = QComboBox()
+        invoice.addItem("On Account", None)
+        for open_invoice in open_invoices:
+            invoice.addItem(f"{open_invoice['bill_number']} ({open_invoice['outstanding']:.2f} due)", open_invoice['id'])
+        reference = QLineEdit()
+        reference.setPlaceholderText("Cheque / UTR number")
+        
+        layout.addRow("Payment Date:", payment_date)
+        layout.addRow("Amount:", amount)
+        layout.addRow("Against Invoice:", invoice)
+        layout.addRow("Reference:", reference)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(lambda: self.save_payment(
+            dialog, client_id, payment_date.date().toString("yyyy-MM-dd"), amount.value(),
+            invoice.currentData(), reference.text()))
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        dialog.setLayout(layout)
+        dialog.exec_()
+
+    def save_payment(self, dialog, client_id, payment_date, amount, invoice_id, reference):
+        if amount <= 0:
+            QMessageBox.warning(self, "Error", "Payment amount must be positive")
+            return
+        
+        try:
+            payment_id, error = self.db_manager.add_payment(client_id, payment_date, amount, invoice_id, reference or None)
+            if error:
+                QMessageBox.critical(self, "Error", error)
+            else:
+                QMessageBox.information(self, "Success", "Payment recorded successfully!")
+                dialog.close()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to record payment: {str(e)}")
+
+    def show_outstanding(self):
+        try:
+            dialog = OutstandingDialog(self.db_manager, self)
+            dialog.exec_()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load outstanding balances: {str(e)}")
+
     def delete_client(self):
         selected = self.table.currentRow()
         if selected == -1:
@@ -1964,6 +7015,8 @@ class ManageClientsTab(QWidget):
                 loading.close()
 
 class ManageProductsTab(QWidget):
+    catalogue_imported = pyqtSignal()
+
     def __init__(self, db_manager, parent=None):
         super().__init__(parent)
         self.db_manager = db_manager
@@ -1988,13 +7041,17 @@ class ManageProductsTab(QWidget):
         edit_btn.clicked.connect(self.edit_product)
         delete_btn = QPushButton("Delete Product")
         delete_btn.clicked.connect(self.delete_product)
+        import_btn = QPushButton("Import Catalogue")
+        import_btn.clicked.connect(self.import_catalogue)
         btn_layout.addWidget(add_btn)
         btn_layout.addWidget(edit_btn)
         btn_layout.addWidget(delete_btn)
+        btn_layout.addWidget(import_btn)
         layout.addLayout(btn_layout)
         
         self.setLayout(layout)
 
+    @traced()
     def load_products(self):
         # Show loading screen
         loading = LoadingScreen("Loading Products...", self)
@@ -2002,11 +7059,9 @@ class ManageProductsTab(QWidget):
         QApplication.processEvents()
 
         try:
-            self.table.setRowCount(0)
             products = self.db_manager.get_all_products()
-            for product in products:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
+            self.table.setRowCount(len(products))
+            for row, product in enumerate(products):
                 self.table.setItem(row, 0, QTableWidgetItem(str(product['id'])))
                 self.table.setItem(row, 1, QTableWidgetItem(product['sku_code']))
                 self.table.setItem(row, 2, QTableWidgetItem(product['product_name']))
@@ -2017,6 +7072,17 @@ class ManageProductsTab(QWidget):
         finally:
             loading.close()
 
+    def import_catalogue(self):
+        dialog = CatalogueImportDialog(self.db_manager, "products", self)
+        if dialog.exec_() == QDialog.Accepted:
+            diff = dialog.result
+            self.load_products()
+            self.catalogue_imported.emit()
+            QMessageBox.information(
+                self, "Success",
+                f"Imported {len(diff['new'])} new and {len(diff['changed'])} changed products"
+            )
+
     def add_product(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Add New Product")
@@ -2172,6 +7238,448 @@ class ManageProductsTab(QWidget):
             finally:
                 loading.close()
 
+class DashboardRefreshThread(QThread):
+    """Brings the dashboard cache up to date off the GUI thread."""
+    finished_refresh = pyqtSignal(object)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+
+    def run(self):
+        try:
+            self.db_manager.refresh_dashboard_cache()
+            self.finished_refresh.emit(None)
+        except Exception as e:
+            self.finished_refresh.emit(str(e))
+
+class BackupThread(QThread):
+    """Takes a backup, or restores the one at restore_path, off the GUI thread.
+
+    finished_backup carries the path of the backup taken or restored, or None,
+    and the error.
+    """
+    finished_backup = pyqtSignal(object, object)
+
+    def __init__(self, db_manager, restore_path=None, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.restore_path = restore_path
+
+    def run(self):
+        if self.restore_path:
+            success, error = self.db_manager.restore_backup(self.restore_path)
+            self.finished_backup.emit(self.restore_path if success else None, error)
+        else:
+            path, error = self.db_manager.create_backup()
+            self.finished_backup.emit(path, error)
+
+class MaintenanceThread(QThread):
+    """Runs database maintenance off the GUI thread."""
+    finished_maintenance = pyqtSignal(object, object)
+
+    def __init__(self, db_manager, force=False, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.force = force
+
+    def run(self):
+        entries, error = self.db_manager.run_maintenance(force=self.force)
+        self.finished_maintenance.emit(entries, error)
+
+class MaintenanceDialog(QDialog):
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.thread = None
+        self.setWindowTitle("Database Maintenance")
+        self.setMinimumSize(700, 400)
+        
+        layout = QVBoxLayout()
+        
+        info = QLabel("Query statistics are refreshed and unused space is released automatically "
+                      "while the application is idle. Recent runs are listed below.")
+        info.setWordWrap(True)
+        layout.addWidget(info)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Time", "Task", "Details", "Duration (ms)"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+        
+        btn_layout = QHBoxLayout()
+        self.run_btn = QPushButton("Run Now")
+        self.run_btn.clicked.connect(self.run_now)
+        btn_layout.addWidget(self.run_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+        self.load_log()
+
+    def load_log(self):
+        entries = self.db_manager.get_maintenance_log()
+        self.table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            self.table.setItem(row, 0, QTableWidgetItem(entry['run_at']))
+            self.table.setItem(row, 1, QTableWidgetItem(entry['task']))
+            self.table.setItem(row, 2, QTableWidgetItem(entry['detail'] or ""))
+            self.table.setItem(row, 3, QTableWidgetItem(f"{entry['duration_ms']:.1f}"))
+
+    def run_now(self):
+        self.run_btn.setEnabled(False)
+        self.run_btn.setText("Running...")
+        self.thread = MaintenanceThread(self.db_manager, force=True, parent=self)
+        self.thread.finished_maintenance.connect(self.maintenance_finished)
+        self.thread.start()
+
+    def maintenance_finished(self, entries, error):
+        self.run_btn.setEnabled(True)
+        self.run_btn.setText("Run Now")
+        if error:
+            QMessageBox.critical(self, "Error", f"Maintenance failed: {error}")
+        self.load_log()
+
+    def reject(self):
+        if self.thread is not None and self.thread.isRunning():
+            return
+        super().reject()
+
+class LatencySummaryDialog(QDialog):
+    """Per-operation latencies of the recorded trace."""
+    COLUMNS = [("Operation", "name"), ("Calls", "count"), ("Total ms", "total_ms"),
+               ("Mean ms", "mean_ms"), ("p50 ms", "p50_ms"), ("p90 ms", "p90_ms"),
+               ("p99 ms", "p99_ms"), ("Max ms", "max_ms")]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.summary = TRACER.latency_summary()
+        self.setWindowTitle("Latency Summary")
+        self.setMinimumSize(900, 500)
+        
+        layout = QVBoxLayout()
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS) + 1)
+        self.table.setHorizontalHeaderLabels([label for label, _ in self.COLUMNS] + ["Histogram"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setRowCount(len(self.summary))
+        for row, entry in enumerate(self.summary):
+            for column, (_, key) in enumerate(self.COLUMNS):
+                self.table.setItem(row, column, QTableWidgetItem(str(entry[key])))
+            # Non-empty buckets as "<=upper bound ms: count"
+            histogram = "  ".join(f"<={bound}: {count}" for bound, count in entry['histogram'].items() if count)
+            self.table.setItem(row, len(self.COLUMNS), QTableWidgetItem(histogram))
+        layout.addWidget(self.table)
+        
+        btn_layout = QHBoxLayout()
+        save_btn = QPushButton("Save as JSON...")
+        save_btn.clicked.connect(self.save_summary)
+        btn_layout.addWidget(save_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+
+    def save_summary(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Latency Summary", "latency.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            with open(path, "w") as f:
+                json.dump(self.summary, f, indent=2)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save summary: {str(e)}")
+
+class SqlStatisticsDialog(QDialog):
+    """Per-statement SQL statistics and the slow query log."""
+    COLUMNS = [("Statement", "sql"), ("Calls", "count"), ("Total ms", "total_ms"),
+               ("Mean ms", "mean_ms"), ("p50 ms", "p50_ms"), ("p95 ms", "p95_ms"),
+               ("p99 ms", "p99_ms"), ("Max ms", "max_ms"), ("Rows", "rows")]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("SQL Statistics")
+        self.setMinimumSize(1000, 650)
+        
+        layout = QVBoxLayout()
+        
+        threshold_layout = QHBoxLayout()
+        threshold_layout.addWidget(QLabel("Log statements slower than"))
+        self.threshold = QSpinBox()
+        self.threshold.setRange(1, 60000)
+        self.threshold.setSuffix(" ms")
+        self.threshold.setValue(int(SQL_STATS.slow_query_ms))
+        self.threshold.valueChanged.connect(self.set_threshold)
+        threshold_layout.addWidget(self.threshold)
+        threshold_layout.addStretch()
+        layout.addLayout(threshold_layout)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([label for label, _ in self.COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table, 2)
+        
+        layout.addWidget(QLabel("Slow statements"))
+        self.slow_table = QTableWidget()
+        self.slow_table.setColumnCount(4)
+        self.slow_table.setHorizontalHeaderLabels(["Time", "ms", "Rows", "Statement"])
+        self.slow_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.slow_table.horizontalHeader().setStretchLastSection(True)
+        self.slow_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.slow_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.slow_table.itemSelectionChanged.connect(self.show_plan)
+        layout.addWidget(self.slow_table, 1)
+        
+        self.plan = QTextEdit()
+        self.plan.setReadOnly(True)
+        self.plan.setPlaceholderText("Select a slow statement to see its query plan")
+        layout.addWidget(self.plan, 1)
+        
+        btn_layout = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_statistics)
+        btn_layout.addWidget(refresh_btn)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        btn_layout.addWidget(reset_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        self.setLayout(layout)
+        self.load_statistics()
+
+    def load_statistics(self):
+        summary = SQL_STATS.summary()
+        self.table.setRowCount(len(summary))
+        for row, entry in enumerate(summary):
+            for column, (_, key) in enumerate(self.COLUMNS):
+                item = QTableWidgetItem(str(entry[key]))
+                if key == "sql":
+                    item.setToolTip(entry[key])
+                self.table.setItem(row, column, item)
+        
+        self.slow_queries = list(reversed(SQL_STATS.slow_queries))
+        self.slow_table.setRowCount(len(self.slow_queries))
+        for row, entry in enumerate(self.slow_queries):
+            self.slow_table.setItem(row, 0, QTableWidgetItem(entry['logged_at']))
+            self.slow_table.setItem(row, 1, QTableWidgetItem(str(entry['duration_ms'])))
+            self.slow_table.setItem(row, 2, QTableWidgetItem(str(entry['rows'])))
+            self.slow_table.setItem(row, 3, QTableWidgetItem(entry['sql']))
+        self.plan.clear()
+
+    def show_plan(self):
+        rows = self.slow_table.selectionModel().selectedRows()
+        if rows:
+            entry = self.slow_queries[rows[0].row()]
+            self.plan.setPlainText(f"{entry['sql']}\n\n{entry['plan']}")
+
+    def set_threshold(self, value):
+        SQL_STATS.slow_query_ms = value
+        QSettings('KrozTek', 'InvoiceManager').setValue('slow_query_ms', value)
+
+    def reset(self):
+        SQL_STATS.reset()
+        self.load_statistics()
+
+class DashboardTab(QWidget):
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.refresh_thread = None
+        
+        layout = QVBoxLayout()
+        
+        # KPI summary
+        summary_layout = QHBoxLayout()
+        self.revenue_label = QLabel()
+        self.invoice_count_label = QLabel()
+        self.month_label = QLabel()
+        self.outstanding_label = QLabel()
+        for label in (self.revenue_label, self.invoice_count_label, self.month_label, self.outstanding_label):
+            label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 8px;")
+            summary_layout.addWidget(label)
+        layout.addLayout(summary_layout)
+        
+        # Revenue by month
+        monthly_group = QGroupBox("Revenue by Month")
+        monthly_layout = QVBoxLayout()
+        self.monthly_table = self.create_table(["Month", "Invoices", "Taxable Value", "Revenue"])
+        monthly_layout.addWidget(self.monthly_table)
+        monthly_group.setLayout(monthly_layout)
+        layout.addWidget(monthly_group)
+        
+        top_layout = QHBoxLayout()
+        clients_group = QGroupBox("Top Clients")
+        clients_layout = QVBoxLayout()
+        self.clients_table = self.create_table(["Company Name", "GST", "Invoices", "Revenue"])
+        clients_layout.addWidget(self.clients_table)
+        clients_group.setLayout(clients_layout)
+        top_layout.addWidget(clients_group)
+        
+        products_group = QGroupBox("Top Products")
+        products_layout = QVBoxLayout()
+        self.products_table = self.create_table(["SKU", "Product Name", "Quantity", "Revenue"])
+        products_layout.addWidget(self.products_table)
+        products_group.setLayout(products_layout)
+        top_layout.addWidget(products_group)
+        layout.addLayout(top_layout)
+        
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel()
+        status_layout.addWidget(self.status_label)
+        status_layout.addStretch()
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(self.refresh)
+        status_layout.addWidget(self.refresh_btn)
+        layout.addLayout(status_layout)
+        
+        self.setLayout(layout)
+
+    def create_table(self, headers):
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Show the cached figures straight away, then catch up in the background
+        self.load_dashboard()
+        self.refresh()
+
+    def refresh(self):
+        if self.refresh_thread is not None and self.refresh_thread.isRunning():
+            return
+        self.refresh_btn.setEnabled(False)
+        self.status_label.setText("Refreshing...")
+        self.refresh_thread = DashboardRefreshThread(self.db_manager, self)
+        self.refresh_thread.finished_refresh.connect(self.refresh_finished)
+        self.refresh_thread.start()
+
+    def refresh_finished(self, error):
+        self.refresh_btn.setEnabled(True)
+        if error:
+            self.status_label.setText(f"Refresh failed: {error}")
+            return
+        self.load_dashboard()
+
+    @traced()
+    def load_dashboard(self):
+        data = self.db_manager.get_dashboard_data()
+        totals = data['totals']
+        
+        self.revenue_label.setText(f"Revenue: ₹{totals['grand_total']:,.2f}")
+        self.invoice_count_label.setText(f"Invoices: {totals['invoice_count']}")
+        current_period = date.today().strftime('%Y-%m')
+        current = next((m for m in data['monthly'] if m['period'] == current_period), None)
+        self.month_label.setText(f"This Month: ₹{current['grand_total'] if current else 0:,.2f}")
+        self.outstanding_label.setText(f"Outstanding: ₹{totals['outstanding']:,.2f}")
+        
+        self.fill_table(self.monthly_table, [
+            [m['period'], str(m['invoice_count']), f"{m['taxable_value']:.2f}", f"{m['grand_total']:.2f}"]
+            for m in reversed(data['monthly'])
+        ])
+        self.fill_table(self.clients_table, [
+            [c['company_name'], c['gst_number'], str(c['invoice_count']), f"{c['grand_total']:.2f}"]
+            for c in data['top_clients']
+        ])
+        self.fill_table(self.products_table, [
+            [p['sku_code'], p['product_name'], str(p['quantity']), f"{p['amount']:.2f}"]
+            for p in data['top_products']
+        ])
+        
+        state = data['state']
+        if state['refreshed_at']:
+            self.status_label.setText(f"Last refreshed {state['refreshed_at']} UTC")
+        else:
+            self.status_label.setText("Not refreshed yet")
+
+    def fill_table(self, table, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(value))
+
+# The application stylesheet only sizes widgets and is set once. Colours come
+# from the theme palettes: Qt resolves stylesheet colours, palette(...) ones
+# included, when it polishes a widget, so changing them re-polishes every
+# widget, which took seconds with a long invoice open. Widgets that need a
+# style of their own get a "role" property and a rule here instead of a
+# stylesheet per widget.
+THEME_STYLESHEET = """
+    QToolBar {
+        border: none;
+        padding: 5px;
+    }
+    QToolBar QToolButton {
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QComboBox QAbstractItemView {
+        selection-background-color: #404040;
+        selection-color: white;
+    }
+    QComboBox::item:selected {
+        background-color: #404040;
+        color: white;
+    }
+    QComboBox::item:hover {
+        background-color: #505050;
+        color: white;
+    }
+    QTabBar::tab {
+        padding: 8px 20px;
+    }
+    QHeaderView::section {
+        padding: 5px;
+    }
+    QGroupBox {
+        margin-top: 10px;
+    }
+    QPushButton[role="remove"] {
+        background-color: #ff4444;
+        color: white;
+        border: none;
+        border-radius: 15px;
+        padding: 5px;
+    }
+    QPushButton[role="remove"]:hover {
+        background-color: #ff6666;
+    }
+    QPushButton[role="theme"] {
+        border: none;
+        padding: 4px;
+        border-radius: 3px;
+        margin: 2px 8px 0px 0px;
+    }
+    QLabel[role="path"] {
+        color: #666666;
+        font-size: 12pt;
+        padding: 5px;
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 3px;
+    }
+"""
+
 class ThemeManager:
     def __init__(self):
         self.settings = QSettings('KrozTek', 'InvoiceManager')
@@ -2188,12 +7696,20 @@ class ThemeManager:
         self.dark_palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
         self.dark_palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
         self.dark_palette.setColor(QPalette.Text, QColor(255, 255, 255))
-        self.dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
+        self.dark_palette.setColor(QPalette.Button, QColor(42, 42, 42))
         self.dark_palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
         self.dark_palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
         self.dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
         self.dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
         self.dark_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+        # Borders, grid lines and header sections
+        self.dark_palette.setColor(QPalette.Light, QColor(80, 80, 80))
+        self.dark_palette.setColor(QPalette.Midlight, QColor(72, 72, 72))
+        self.dark_palette.setColor(QPalette.Mid, QColor(64, 64, 64))
+        self.dark_palette.setColor(QPalette.Dark, QColor(35, 35, 35))
+        self.dark_palette.setColor(QPalette.Shadow, QColor(20, 20, 20))
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            self.dark_palette.setColor(QPalette.Disabled, role, QColor(127, 127, 127))
 
         # Light theme palette
         self.light_palette.setColor(QPalette.Window, QColor(240, 240, 240))
@@ -2203,172 +7719,51 @@ class ThemeManager:
         self.light_palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
         self.light_palette.setColor(QPalette.ToolTipText, QColor(0, 0, 0))
         self.light_palette.setColor(QPalette.Text, QColor(0, 0, 0))
-        self.light_palette.setColor(QPalette.Button, QColor(240, 240, 240))
+        self.light_palette.setColor(QPalette.Button, QColor(224, 224, 224))
         self.light_palette.setColor(QPalette.ButtonText, QColor(0, 0, 0))
         self.light_palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
         self.light_palette.setColor(QPalette.Link, QColor(0, 0, 255))
         self.light_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
         self.light_palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-
-    def get_stylesheet(self, is_dark):
-        common_styles = """
-            QToolBar {
-                border: none;
-                padding: 5px;
-            }
-            QToolBar QToolButton {
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QComboBox QAbstractItemView {
-                selection-background-color: #404040;
-                selection-color: white;
-            }
-            QComboBox::item:selected {
-                background-color: #404040;
-                color: white;
-            }
-            QComboBox::item:hover {
-                background-color: #505050;
-                color: white;
-            }
-        """
-
-        if is_dark:
-            return common_styles + """
-                QMainWindow, QDialog {
-                    background-color: #353535;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #2a2a2a;
-                    background-color: #353535;
-                }
-                QTabBar::tab {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    padding: 8px 20px;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #404040;
-                }
-                QPushButton {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    border: 1px solid #404040;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #404040;
-                }
-                QTableWidget {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    gridline-color: #404040;
-                }
-                QHeaderView::section {
-                    background-color: #404040;
-                    color: #ffffff;
-                    padding: 5px;
-                }
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QDateEdit, QComboBox {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    border: 1px solid #404040;
-                    padding: 3px;
-                    border-radius: 2px;
-                }
-                QGroupBox {
-                    border: 1px solid #404040;
-                    margin-top: 10px;
-                    color: #ffffff;
-                }
-                QGroupBox::title {
-                    color: #ffffff;
-                }
-                QToolBar {
-                    background-color: #2a2a2a;
-                }
-                QToolBar QToolButton {
-                    background-color: #353535;
-                    color: white;
-                }
-                QToolBar QToolButton:hover {
-                    background-color: #404040;
-                }
-            """
-        else:
-            return common_styles + """
-                QMainWindow, QDialog {
-                    background-color: #f0f0f0;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #d0d0d0;
-                }
-                QTabBar::tab {
-                    background-color: #e0e0e0;
-                    padding: 8px 20px;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #f0f0f0;
-                }
-                QPushButton {
-                    background-color: #e0e0e0;
-                    border: 1px solid #d0d0d0;
-                    padding: 5px 15px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #d0d0d0;
-                }
-                QTableWidget {
-                    gridline-color: #d0d0d0;
-                }
-                QHeaderView::section {
-                    background-color: #e0e0e0;
-                    padding: 5px;
-                }
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QDateEdit, QComboBox {
-                    background-color: white;
-                    border: 1px solid #d0d0d0;
-                    padding: 3px;
-                    border-radius: 2px;
-                }
-                QGroupBox {
-                    border: 1px solid #d0d0d0;
-                    margin-top: 10px;
-                }
-                QToolBar {
-                    background-color: #e0e0e0;
-                }
-                QToolBar QToolButton {
-                    background-color: #f0f0f0;
-                    color: black;
-                }
-                QToolBar QToolButton:hover {
-                    background-color: #d0d0d0;
-                }
-            """
+        self.light_palette.setColor(QPalette.Light, QColor(255, 255, 255))
+        self.light_palette.setColor(QPalette.Midlight, QColor(232, 232, 232))
+        self.light_palette.setColor(QPalette.Mid, QColor(208, 208, 208))
+        self.light_palette.setColor(QPalette.Dark, QColor(160, 160, 160))
+        self.light_palette.setColor(QPalette.Shadow, QColor(105, 105, 105))
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            self.light_palette.setColor(QPalette.Disabled, role, QColor(120, 120, 120))
 
     def apply_theme(self, app, is_dark):
+        """Switch to the dark or light palette, which only repaints widgets."""
+        if app.styleSheet() != THEME_STYLESHEET:
+            # Fusion draws everything from the palette, native styles do not.
+            # Without the attribute, widgets under a stylesheet keep the
+            # palette they were polished with instead of their parent's.
+            app.setAttribute(Qt.AA_UseStyleSheetPropagationInWidgetStyles)
+            app.setStyle("Fusion")
+            app.setStyleSheet(THEME_STYLESHEET)
         app.setPalette(self.dark_palette if is_dark else self.light_palette)
-        app.setStyleSheet(self.get_stylesheet(is_dark))
         self.settings.setValue('dark_mode', is_dark)
 
     def is_dark_mode(self):
         return self.settings.value('dark_mode', False, type=bool)
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Emitted from the backup scheduler thread, delivered on the GUI thread
+    scheduled_backup_finished = pyqtSignal(object, object)
+    # Emitted from the maintenance scheduler thread
+    scheduled_maintenance_finished = pyqtSignal(object, object)
+
+    def __init__(self, db_manager=None):
         super().__init__()
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or DatabaseManager()
         self.theme_manager = ThemeManager()
+        self.backup_thread = None
         
-        self.setWindowTitle("Invoice Management System")
+        if isinstance(self.db_manager, RemoteDatabaseManager):
+            self.setWindowTitle(f"Invoice Management System - {self.db_manager.url}")
+        else:
+            self.setWindowTitle("Invoice Management System")
         self.setGeometry(100, 100, 1200, 800)
         
         # Create main widget
@@ -2385,32 +7780,186 @@ class MainWindow(QMainWindow):
         self.theme_action.setCheckable(True)
         self.theme_action.setChecked(self.theme_manager.is_dark_mode())
         self.theme_action.clicked.connect(self.toggle_theme)
+        self.theme_action.setIconSize(QSize(20, 20))  # Smaller icon size
         self.theme_action.setFixedSize(28, 28)  # Even smaller size
-        self.theme_action.setStyleSheet("""
-            QPushButton {
-                border: none;
-                padding: 4px;
-                border-radius: 3px;
-                margin: 2px 8px 0px 0px;
-            }
-        """)
+        self.theme_action.setProperty("role", "theme")
         
         # Add the theme button to the tab corner
         self.tabs.setCornerWidget(self.theme_action, Qt.TopRightCorner)
         
         # Add tabs
-        self.tabs.addTab(GenerateBillTab(self.db_manager), "Generate Bill")
-        self.tabs.addTab(DisplayBillsTab(self.db_manager), "Display Bills")
-        self.tabs.addTab(ManageClientsTab(self.db_manager), "Manage Clients")
-        self.tabs.addTab(ManageProductsTab(self.db_manager), "Manage Products")
+        self.generate_tab = GenerateBillTab(self.db_manager)
+        self.display_tab = DisplayBillsTab(self.db_manager)
+        self.clients_tab = ManageClientsTab(self.db_manager)
+        self.products_tab = ManageProductsTab(self.db_manager)
+        self.products_tab.catalogue_imported.connect(self.generate_tab.load_products)
+        self.tabs.addTab(self.generate_tab, "Generate Bill")
+        self.tabs.addTab(self.display_tab, "Display Bills")
+        self.tabs.addTab(self.clients_tab, "Manage Clients")
+        self.tabs.addTab(self.products_tab, "Manage Products")
+        self.tabs.addTab(DashboardTab(self.db_manager), "Dashboard")
         
         main_layout.addWidget(self.tabs)
         self.setCentralWidget(main_widget)
         
+        # Backup menu
+        backup_menu = self.menuBar().addMenu("Backup")
+        backup_now_action = QAction("Back Up Now", self)
+        backup_now_action.triggered.connect(self.backup_now)
+        backup_menu.addAction(backup_now_action)
+        restore_action = QAction("Restore Backup...", self)
+        restore_action.triggered.connect(self.restore_backup)
+        # Backups of a shared database are restored on the server
+        restore_action.setEnabled(self.db_manager.backup_dir is not None)
+        backup_menu.addAction(restore_action)
+        
+        self.scheduled_backup_finished.connect(self.show_scheduled_backup)
+        self.db_manager.start_backup_scheduler(on_backup=self.scheduled_backup_finished.emit)
+        
+        # Maintenance menu
+        maintenance_menu = self.menuBar().addMenu("Maintenance")
+        maintenance_action = QAction("Database Maintenance...", self)
+        maintenance_action.triggered.connect(self.show_maintenance)
+        maintenance_menu.addAction(maintenance_action)
+        
+        self.scheduled_maintenance_finished.connect(self.show_scheduled_maintenance)
+        self.db_manager.start_maintenance_scheduler(on_maintenance=self.scheduled_maintenance_finished.emit)
+        
+        # Diagnostics menu
+        diagnostics_menu = self.menuBar().addMenu("Diagnostics")
+        self.trace_action = QAction("Record Trace", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(TRACER.enabled)
+        self.trace_action.toggled.connect(self.toggle_tracing)
+        diagnostics_menu.addAction(self.trace_action)
+        save_trace_action = QAction("Save Trace...", self)
+        save_trace_action.triggered.connect(self.save_trace)
+        diagnostics_menu.addAction(save_trace_action)
+        latency_action = QAction("Latency Summary...", self)
+        latency_action.triggered.connect(self.show_latency_summary)
+        diagnostics_menu.addAction(latency_action)
+        clear_trace_action = QAction("Clear Trace", self)
+        clear_trace_action.triggered.connect(TRACER.clear)
+        diagnostics_menu.addAction(clear_trace_action)
+        diagnostics_menu.addSeparator()
+        sql_stats_action = QAction("SQL Statistics...", self)
+        sql_stats_action.triggered.connect(self.show_sql_statistics)
+        diagnostics_menu.addAction(sql_stats_action)
+        SQL_STATS.slow_query_ms = int(QSettings('KrozTek', 'InvoiceManager').value('slow_query_ms', SQL_SLOW_QUERY_MS))
+        
         # Update theme button icon and apply initial theme
         self.update_theme_icon()
         self.apply_current_theme()
 
+    def backup_now(self):
+        if self.backup_thread is not None and self.backup_thread.isRunning():
+            return
+        self.statusBar().showMessage("Backing up...")
+        self.backup_thread = BackupThread(self.db_manager, parent=self)
+        self.backup_thread.finished_backup.connect(self.backup_finished)
+        self.backup_thread.start()
+
+    def backup_finished(self, path, error):
+        self.statusBar().clearMessage()
+        if error:
+            QMessageBox.critical(self, "Error", f"Backup failed: {error}")
+        else:
+            QMessageBox.information(self, "Success", f"Backup saved to {path}")
+
+    def show_scheduled_backup(self, path, error):
+        if error:
+            QMessageBox.warning(self, "Backup Failed", f"Scheduled backup failed: {error}")
+        else:
+            self.statusBar().showMessage(f"Backup saved to {os.path.basename(path)}", 10000)
+
+    def show_maintenance(self):
+        MaintenanceDialog(self.db_manager, self).exec_()
+
+    def show_scheduled_maintenance(self, entries, error):
+        if error:
+            self.statusBar().showMessage(f"Database maintenance failed: {error}", 10000)
+        else:
+            done = ", ".join(f"{entry['task']} ({entry['duration_ms']:.0f} ms)" for entry in entries)
+            self.statusBar().showMessage(f"Database maintenance: {done}", 10000)
+
+    def toggle_tracing(self, enabled):
+        if enabled:
+            TRACER.start()
+            self.statusBar().showMessage("Recording trace", 5000)
+        else:
+            TRACER.stop()
+            self.statusBar().showMessage(f"Trace stopped with {len(TRACER.events)} spans", 5000)
+
+    def save_trace(self):
+        if not TRACER.events:
+            QMessageBox.information(self, "Save Trace", "Nothing has been recorded yet. "
+                                    "Turn on Diagnostics > Record Trace and repeat the slow operation.")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Trace", f"trace-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.json",
+            "Chrome Trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            TRACER.save_chrome_trace(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save trace: {str(e)}")
+            return
+        self.statusBar().showMessage(f"Trace saved to {path}", 10000)
+
+    def show_latency_summary(self):
+        LatencySummaryDialog(self).exec_()
+
+    def show_sql_statistics(self):
+        SqlStatisticsDialog(self).exec_()
+
+    def restore_backup(self):
+        if self.backup_thread is not None and self.backup_thread.isRunning():
+            QMessageBox.information(self, "Restore Backup", "Wait for the backup in progress to finish.")
+            return
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Restore Backup", self.db_manager.backup_dir, "Backups (*.db.gz)"
+        )
+        if not path:
+            return
+        
+        confirm = QMessageBox.question(
+            self,
+            "Confirm Restore",
+            f"Replace all current data with the backup '{os.path.basename(path)}'?\n"
+            "The current data is backed up first.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if confirm != QMessageBox.Yes:
+            return
+        
+        self.restore_loading = LoadingScreen("Restoring Backup...", self)
+        # Nothing may be edited while the data is being replaced
+        self.restore_loading.setWindowModality(Qt.ApplicationModal)
+        self.restore_loading.show()
+        self.backup_thread = BackupThread(self.db_manager, restore_path=path, parent=self)
+        self.backup_thread.finished_backup.connect(self.restore_finished)
+        self.backup_thread.start()
+
+    def restore_finished(self, path, error):
+        self.restore_loading.close()
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to restore backup: {error}")
+            return
+        
+        self.generate_tab.load_products()
+        self.display_tab.load_invoices()
+        self.clients_tab.load_clients()
+        self.products_tab.load_products()
+        QMessageBox.information(self, "Success", "Backup restored successfully!")
+
+    def closeEvent(self, event):
+        self.db_manager.stop_backup_scheduler()
+        self.db_manager.stop_maintenance_scheduler()
+        super().closeEvent(event)
+
     def toggle_theme(self):
         is_dark = self.theme_action.isChecked()
         self.theme_manager.apply_theme(QApplication.instance(), is_dark)
@@ -2418,10 +7967,7 @@ class MainWindow(QMainWindow):
 
     def update_theme_icon(self):
         is_dark = self.theme_action.isChecked()
-        icon_path = resource_path("icons/moon.png" if is_dark else "icons/sun.png")
-        if os.path.exists(icon_path):
-            self.theme_action.setIcon(QIcon(icon_path))
-            self.theme_action.setIconSize(QSize(20, 20))  # Smaller icon size
+        self.theme_action.setIcon(resource_icon("moon" if is_dark else "sun"))
         self.theme_action.setToolTip("Dark Mode" if is_dark else "Light Mode")
 
     def apply_current_theme(self):
@@ -2431,7 +7977,27 @@ class MainWindow(QMainWindow):
         self.update_theme_icon()
 
 if __name__ == "__main__":
+    # Trace from startup, e.g. to see where tab loads spend their time
+    if os.environ.get("INVOICE_APP_TRACE"):
+        TRACER.start()
     app = QApplication(sys.argv)
-    window = MainWindow()
+    app.setWindowIcon(resource_icon("app"))
+    db_manager = None
+    server_url = os.environ.get("INVOICE_APP_SERVER")
+    if server_url:
+        try:
+            db_manager = RemoteDatabaseManager(server_url, token=os.environ.get("INVOICE_APP_TOKEN"))
+        except (RemoteError, ValueError) as e:
+            QMessageBox.critical(None, "Error", f"Failed to connect to the invoice server: {str(e)}")
+            sys.exit(1)
+        
+        # A lost connection must not close the application
+        def show_remote_error(exc_type, exc, tb):
+            if issubclass(exc_type, RemoteError):
+                QMessageBox.critical(None, "Error", str(exc))
+            else:
+                sys.__excepthook__(exc_type, exc, tb)
+        sys.excepthook = show_remote_error
+    window = MainWindow(db_manager)
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""asyncio facade over DatabaseManager and the PDF renderer.
+
+Every invoice, company and product operation of DatabaseManager is available
+as a coroutine method of AsyncInvoiceAPI, and render_pdf/render_invoice render
+PDFs in worker processes:
+
+    async with AsyncInvoiceAPI("invoice_app.db") as api:
+        invoice = await api.get_invoice_by_bill_number("INV-0042")
+        await api.render_invoice(invoice["id"], "INV-0042.pdf")
+
+Database calls run on a small thread pool. Reads run in parallel, while writes
+run one at a time because SQLite allows a single writer. Renders run on a pool
+of processes no larger than the number of CPUs. A call that finds its pool
+busy waits in the event loop without taking a thread, so thousands of
+concurrent requests queue up cheaply instead of piling onto SQLite or the CPUs.
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from app import DEFAULT_PDF_PROFILE, DatabaseManager, generate_bill_pdf, invoice_pdf_data
+
+DEFAULT_DB_THREADS = 4
+# Calls handed to a pool beyond its workers, so a worker never waits for
+# the event loop to give it the next call
+EXECUTOR_QUEUE = 2
+
+READ_METHODS = (
+    "get_all_companies", "get_company_by_gst", "get_company_by_id",
+    "get_all_products", "get_product_by_id", "get_product_details",
+    "get_next_bill_number", "get_all_invoices", "get_all_invoice_details", "search_invoices",
+    "get_invoice_details", "get_invoices_details", "get_invoice_by_bill_number", "get_invoice_changes",
+)
+WRITE_METHODS = (
+    "add_company", "update_company", "delete_company",
+    "add_product", "update_product", "delete_product", "import_catalogue",
+    "create_invoice", "update_invoice", "update_invoices", "delete_invoices", "save_export_checkpoint",
+)
+
+
+def _render(data, filename, profile):
+    return generate_bill_pdf(data, filename, profile=profile)
+
+
+class AsyncInvoiceAPI:
+    """Awaitable DatabaseManager operations and PDF rendering with bounded pools.
+
+    `db_threads` reads run at once, plus one write. `render_processes` PDFs
+    are rendered at once, one per CPU by default. Worker processes are
+    started on the first render.
+    """
+    def __init__(self, db_file="invoice_app.db", db_manager=None, db_threads=DEFAULT_DB_THREADS,
+                 render_processes=None):
+        self.db_manager = db_manager or DatabaseManager(db_file)
+        self.render_processes = render_processes or os.cpu_count() or 1
+        self._db_executor = ThreadPoolExecutor(max_workers=db_threads + 1, thread_name_prefix="invoice-db")
+        self._render_executor = None
+        self._read_slots = asyncio.Semaphore(db_threads)
+        self._write_slots = asyncio.Semaphore(1)
+        self._render_slots = asyncio.Semaphore(self.render_processes + EXECUTOR_QUEUE)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Wait for running calls to finish and stop the worker pools."""
+        executors = [self._db_executor, self._render_executor]
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [executor.shutdown(wait=True) for executor in executors if executor])
+
+    async def _call_db(self, write, name, args, kwargs):
+        async with (self._write_slots if write else self._read_slots):
+            call = functools.partial(getattr(self.db_manager, name), *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self._db_executor, call)
+
+    async def render_pdf(self, data, filename, profile=DEFAULT_PDF_PROFILE):
+        """generate_bill_pdf in a worker process. Returns the PDF path."""
+        if self._render_executor is None:
+            # Forking a process that runs database threads is unsafe
+            self._render_executor = ProcessPoolExecutor(max_workers=self.render_processes,
+                                                        mp_context=multiprocessing.get_context("spawn"))
+        async with self._render_slots:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._render_executor, _render, data, filename, profile)
+
+    async def render_invoice(self, invoice_id, filename, profile=DEFAULT_PDF_PROFILE):
+        """Render a saved invoice, as DisplayBillsTab.save_invoice_pdfs does."""
+        invoice = await self.get_invoice_details(invoice_id)
+        if not invoice:
+            raise ValueError(f"Invoice {invoice_id} not found")
+        return await self.render_pdf(invoice_pdf_data(invoice), filename, profile)
+
+
+def _awaitable(name, write):
+    method = getattr(DatabaseManager, name)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._call_db(write, name, args, kwargs)
+    return wrapper
+
+
+for _name in READ_METHODS:
+    setattr(AsyncInvoiceAPI, _name, _awaitable(_name, write=False))
+for _name in WRITE_METHODS:
+    setattr(AsyncInvoiceAPI, _name, _awaitable(_name, write=True))
@@ -0,0 +1,124 @@
+"""Compare the canvas and platypus invoice renderers.
+
+Renders the sample invoice of pdf_profiles.py for each seller layout and item
+count with renderer="platypus" and renderer="canvas", and reports invoices per
+second for each. With --check (needs PyMuPDF, `pip install pymupdf`) both PDFs
+are also rasterized and compared pixel by pixel, and their words and line
+drawings are compared. Item counts that do not fit one page fall back to
+platypus and are reported as such.
+
+Usage:
+    python benchmarks/canvas_renderer.py [--runs 20] [--items 1 10 15] [--check] [--json results.json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import SELLER_PROFILES, generate_bill_pdf
+from pdf_profiles import sample_invoice, sample_signatures
+
+RENDERERS = ("platypus", "canvas")
+CHECK_DPI = 150
+
+
+def invoices_per_second(data, filename, renderer, runs):
+    generate_bill_pdf(data, filename, renderer=renderer)
+    start = time.perf_counter()
+    for _ in range(runs):
+        generate_bill_pdf(data, filename, renderer=renderer)
+    return runs / (time.perf_counter() - start)
+
+
+def page_words(page):
+    # Cells are drawn in a different order, so compare positions and text only
+    return sorted((round(x0, 2), round(y0, 2), round(x1, 2), round(y1, 2), text)
+                  for x0, y0, x1, y1, text, *_ in page.get_text("words"))
+
+
+def page_drawings(page):
+    return sorted(repr(sorted((key, value) for key, value in drawing.items() if key != "seqno"))
+                  for drawing in page.get_drawings())
+
+
+def compare(platypus_pdf, canvas_pdf):
+    """Differing pixels and whether words and drawings match, page by page."""
+    try:
+        import pymupdf
+    except ImportError:
+        sys.exit("--check needs PyMuPDF: pip install pymupdf")
+    first, second = pymupdf.open(platypus_pdf), pymupdf.open(canvas_pdf)
+    if len(first) != len(second):
+        return {"pages": [len(first), len(second)], "pixels": None, "words": False, "drawings": False}
+    pixels, words, drawings = 0, True, True
+    for page_a, page_b in zip(first, second):
+        raster_a = page_a.get_pixmap(dpi=CHECK_DPI).samples
+        raster_b = page_b.get_pixmap(dpi=CHECK_DPI).samples
+        pixels += sum(1 for a, b in zip(raster_a, raster_b) if a != b) + abs(len(raster_a) - len(raster_b))
+        words = words and page_words(page_a) == page_words(page_b)
+        drawings = drawings and page_drawings(page_a) == page_drawings(page_b)
+    return {"pages": len(first), "pixels": pixels, "words": words, "drawings": drawings}
+
+
+def run(runs, item_counts, check):
+    signature = sample_signatures()[0]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for seller, profile in SELLER_PROFILES.items():
+            for item_count in item_counts:
+                data = dict(sample_invoice(signature, item_count), seller=seller)
+                filenames = {renderer: os.path.join(tmp_dir, f"{renderer}.pdf") for renderer in RENDERERS}
+                try:
+                    generate_bill_pdf(data, filenames["canvas"], renderer="canvas")
+                    fallback = None
+                except ValueError as e:
+                    fallback = str(e)
+                row = {"layout": profile["layout"], "items": item_count, "fallback": fallback}
+                for renderer in RENDERERS:
+                    if renderer == "canvas" and fallback:
+                        continue
+                    row[renderer] = round(invoices_per_second(data, filenames[renderer], renderer, runs), 1)
+                if not fallback:
+                    row["speedup"] = round(row["canvas"] / row["platypus"], 2)
+                    if check:
+                        row["check"] = compare(filenames["platypus"], filenames["canvas"])
+                results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="renders per renderer and case")
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 10, 15],
+                        help="line item counts of the sample invoices")
+    parser.add_argument("--check", action="store_true", help="compare the two PDFs with PyMuPDF")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.runs, args.items, args.check)
+
+    print(f"{'Layout':<10} {'Items':>5} {'Platypus/s':>11} {'Canvas/s':>9} {'Speedup':>8}  Parity")
+    for row in results:
+        if row["fallback"]:
+            print(f"{row['layout']:<10} {row['items']:>5} {row['platypus']:>11.1f} {'-':>9} {'-':>8}  "
+                  f"falls back: {row['fallback']}")
+            continue
+        check = row.get("check")
+        parity = "-" if check is None else (
+            f"{check['pixels']} pixels differ, words {'match' if check['words'] else 'differ'}, "
+            f"drawings {'match' if check['drawings'] else 'differ'}")
+        print(f"{row['layout']:<10} {row['items']:>5} {row['platypus']:>11.1f} {row['canvas']:>9.1f} "
+              f"{row['speedup']:>7.2f}x  {parity}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare the Excel and Parquet exports as inputs for analytics.
+
+On a synthetic database (built with generate_data.py and shared with
+hot_paths.py) writes the Excel export of the Display Bills tab and the
+Parquet export, then loads each back into pandas the way an analyst would.
+Reports the export time, the load time and the size on disk of each. Needs
+pyarrow. Excel takes minutes on the larger sizes, --skip-excel leaves it out.
+
+Usage:
+    python benchmarks/columnar_export.py [--size small] [--skip-excel] [--json results.json] [--data-dir DIR]
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from app import DatabaseManager, invoice_export_frame
+from generate_data import add_dataset_arguments, dataset_from_arguments
+from hot_paths import DEFAULT_DATA_DIR, environment, prepare_dataset
+
+
+def folder_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def run(db_file, skip_excel):
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Opening the database may upgrade it, keep the generated one pristine
+        scratch = os.path.join(work_dir, "bench.db")
+        shutil.copyfile(db_file, scratch)
+        db = DatabaseManager(scratch)
+        if not skip_excel:
+            path = os.path.join(work_dir, "invoices.xlsx")
+            start = time.perf_counter()
+            invoice_export_frame(db.get_all_invoice_details(include_archived=True)).to_excel(
+                path, index=False, engine="openpyxl")
+            export_s = time.perf_counter() - start
+            start = time.perf_counter()
+            rows = len(pd.read_excel(path, engine="openpyxl"))
+            results.append({"format": "excel", "export_s": round(export_s, 2),
+                            "load_s": round(time.perf_counter() - start, 2),
+                            "bytes": folder_size(path), "rows": rows})
+
+        path = os.path.join(work_dir, "parquet")
+        start = time.perf_counter()
+        _, error = db.export_parquet(path)
+        if error:
+            sys.exit(error)
+        export_s = time.perf_counter() - start
+        start = time.perf_counter()
+        invoices = pd.read_parquet(os.path.join(path, "invoices"))
+        items = pd.read_parquet(os.path.join(path, "invoice_items"))
+        results.append({"format": "parquet", "export_s": round(export_s, 2),
+                        "load_s": round(time.perf_counter() - start, 2),
+                        "bytes": folder_size(path), "rows": len(items), "invoices": len(invoices)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_dataset_arguments(parser)
+    parser.add_argument("--skip-excel", action="store_true", help="only time the Parquet export")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="where generated databases are kept")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    dataset = dataset_from_arguments(args)
+    db_file = prepare_dataset(args.data_dir, dataset)
+    results = run(db_file, args.skip_excel)
+
+    print(f"{'Format':<10} {'Export s':>9} {'Load s':>8} {'MB':>8} {'Line rows':>10}")
+    for row in results:
+        print(f"{row['format']:<10} {row['export_s']:>9.2f} {row['load_s']:>8.2f} "
+              f"{row['bytes'] / 1e6:>8.1f} {row['rows']:>10}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "dataset": dataset,
+                "environment": environment(),
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
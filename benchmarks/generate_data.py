@@ -0,0 +1,203 @@
+"""Build a synthetic invoice database for benchmarking.
+
+The same arguments and seed always produce the same database. Clients and
+products are loaded with DatabaseManager.import_catalogue; invoices and their
+line items are bulk inserted on a DatabaseManager connection, after which the
+GST summaries, ledger, search index and dashboard cache are built the same way
+the application builds them for an existing database.
+
+Usage:
+    python benchmarks/generate_data.py bench.db [--size small] [--invoices N]
+        [--products N] [--clients N] [--max-lines 12] [--seed 1]
+"""
+import argparse
+import datetime
+import itertools
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import DatabaseManager, calculate_invoice_totals, INVOICE_TAX_COLUMNS
+
+PRESETS = {
+    "small": {"invoices": 1000, "products": 10, "clients": 20},
+    "medium": {"invoices": 50000, "products": 2000, "clients": 300},
+    "large": {"invoices": 250000, "products": 20000, "clients": 2000},
+    "xlarge": {"invoices": 1000000, "products": 50000, "clients": 5000},
+}
+DEFAULT_SIZE = "small"
+DEFAULT_MAX_LINES = 12
+DEFAULT_SEED = 1
+
+# Invoices are spread over the financial years ending on this date, which is
+# fixed so the data does not depend on the day it is generated
+END_DATE = datetime.date(2025, 3, 31)
+YEARS = 3
+BATCH_SIZE = 10000
+
+
+def zipf_cum_weights(count, exponent=0.8):
+    """Cumulative weights favouring the first entries, like best sellers."""
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(count)))
+
+
+def catalogue(rng, products, clients):
+    product_rows = [{
+        "sku_code": f"SKU-{i:06d}",
+        "product_name": f"Product {i} {rng.choice(['Cable', 'Panel', 'Switch', 'Pump', 'Valve', 'Motor'])}",
+        "hsn_code": rng.choice(["8471", "8504", "8536", "8413", "8481", "8501"]),
+        "price_per_unit": round(rng.uniform(10, 25000), 2),
+    } for i in range(products)]
+    client_rows = [{
+        "gst_number": f"21AAAA{i:05d}A1Z{i % 10}",
+        "company_name": f"Client {i} Pvt Ltd",
+        "address": f"{rng.randint(1, 999)} Industrial Estate, Bhubaneswar, Odisha",
+    } for i in range(clients)]
+    return product_rows, client_rows
+
+
+def invoice_batches(rng, count, product_ids, prices, client_ids, max_lines):
+    """Yield (invoice rows, item rows) in batches of BATCH_SIZE invoices."""
+    product_weights = zipf_cum_weights(len(product_ids))
+    client_weights = zipf_cum_weights(len(client_ids))
+    # Mostly short invoices with the odd long one
+    line_counts = range(1, max_lines + 1)
+    line_weights = list(itertools.accumulate(0.6 ** k for k in range(max_lines)))
+    warehouses = client_ids[:3]
+    first_day = END_DATE.replace(year=END_DATE.year - YEARS) + datetime.timedelta(days=1)
+    days = (END_DATE - first_day).days
+
+    invoices, items = [], []
+    for invoice_id in range(1, count + 1):
+        lines = rng.choices(line_counts, cum_weights=line_weights)[0]
+        chosen = rng.choices(range(len(product_ids)), cum_weights=product_weights, k=lines)
+        taxable_value = 0
+        for index in chosen:
+            quantity = rng.randint(1, 20)
+            amount = round(quantity * prices[index], 2)
+            taxable_value += amount
+            items.append((invoice_id, product_ids[index], quantity, prices[index], amount))
+
+        totals = calculate_invoice_totals(round(taxable_value, 2))
+        bill_to = rng.choices(client_ids, cum_weights=client_weights)[0]
+        ship_to = bill_to if rng.random() < 0.8 else rng.choice(client_ids)
+        advance = round(totals["grand_total"] * rng.choice([0.1, 0.25, 0.5, 1.0]), 0) if rng.random() < 0.3 else 0
+        bill_date = first_day + datetime.timedelta(days=days * invoice_id // count)
+        invoices.append((invoice_id, f"INV-{invoice_id:04d}", bill_date.isoformat(), bill_to, ship_to,
+                         rng.choice(warehouses), None, advance, totals["taxable_value"],
+                         *(totals[column] for column in INVOICE_TAX_COLUMNS)))
+
+        if len(invoices) == BATCH_SIZE:
+            yield invoices, items
+            invoices, items = [], []
+    if invoices:
+        yield invoices, items
+
+
+def build_database(path, invoices, products, clients, max_lines=DEFAULT_MAX_LINES, seed=DEFAULT_SEED,
+                   progress=None):
+    """Create a new database at `path` and fill it. Returns a summary dict."""
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists")
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    db = DatabaseManager(path)
+
+    product_rows, client_rows = catalogue(rng, products, clients)
+    for kind, rows in (("products", product_rows), ("companies", client_rows)):
+        _, error = db.import_catalogue(kind, rows)
+        if error:
+            raise RuntimeError(f"Failed to import {kind}: {error}")
+
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, price_per_unit FROM products ORDER BY id")
+    product_ids, prices = zip(*cursor.fetchall())
+    cursor.execute("SELECT id FROM companies ORDER BY id")
+    client_ids = [row["id"] for row in cursor.fetchall()]
+
+    # Per-row triggers would dominate the load; the derived tables are built
+    # in bulk afterwards and the triggers put back
+    triggers = db._app_triggers()
+    for name in triggers:
+        cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    item_count = 0
+    for invoice_rows, item_rows in invoice_batches(rng, invoices, product_ids, prices, client_ids, max_lines):
+        cursor.executemany(f"""
+        INSERT INTO invoices (id, bill_number, bill_date, bill_to_company_id, ship_to_company_id,
+                              ship_from_company_id, signature_path, advance_amount, total_amount,
+                              {", ".join(INVOICE_TAX_COLUMNS)})
+        VALUES ({", ".join("?" * (9 + len(INVOICE_TAX_COLUMNS)))})
+        """, invoice_rows)
+        cursor.executemany("""
+        INSERT INTO invoice_items (invoice_id, product_id, quantity, price_per_unit, amount)
+        VALUES (?, ?, ?, ?, ?)
+        """, item_rows)
+        item_count += len(item_rows)
+        if progress:
+            progress(invoice_rows[-1][0], invoices)
+
+    db._rebuild_gst_summaries(cursor)
+    db._backfill_ledger(cursor)
+    if db.search_enabled:
+        db._rebuild_search_index(cursor)
+    db._sync_triggers(cursor, triggers)
+    conn.commit()
+    conn.close()
+
+    db.refresh_dashboard_cache()
+    db.run_maintenance(force=True)
+
+    return {
+        "invoices": invoices,
+        "items": item_count,
+        "products": products,
+        "clients": clients,
+        "max_lines": max_lines,
+        "seed": seed,
+        "seconds": round(time.perf_counter() - start, 2),
+        "bytes": os.path.getsize(path),
+    }
+
+
+def add_dataset_arguments(parser):
+    parser.add_argument("--size", choices=PRESETS, default=DEFAULT_SIZE, help="preset dataset size")
+    parser.add_argument("--invoices", type=int, help="number of invoices (overrides --size)")
+    parser.add_argument("--products", type=int, help="number of products (overrides --size)")
+    parser.add_argument("--clients", type=int, help="number of clients (overrides --size)")
+    parser.add_argument("--max-lines", type=int, default=DEFAULT_MAX_LINES, help="most line items on an invoice")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed")
+
+
+def dataset_from_arguments(args):
+    dataset = dict(PRESETS[args.size])
+    for key in dataset:
+        if getattr(args, key) is not None:
+            dataset[key] = getattr(args, key)
+    dataset["max_lines"] = args.max_lines
+    dataset["seed"] = args.seed
+    return dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="database file to create")
+    add_dataset_arguments(parser)
+    args = parser.parse_args()
+
+    def progress(done, total):
+        print(f"\r{done}/{total} invoices", end="", file=sys.stderr, flush=True)
+
+    summary = build_database(args.path, progress=progress, **dataset_from_arguments(args))
+    print(file=sys.stderr)
+    print(f"{summary['invoices']} invoices with {summary['items']} line items, {summary['products']} products "
+          f"and {summary['clients']} clients in {summary['seconds']} s ({summary['bytes'] // 1024} KiB)")
+
+
+if __name__ == "__main__":
+    main()
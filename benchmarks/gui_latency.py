@@ -0,0 +1,154 @@
+"""Time widget-heavy interactions under the offscreen Qt platform.
+
+Opens the Generate Bill and Display Bills tabs on a copy of a synthetic
+database (built with generate_data.py and shared with hot_paths.py) and drives
+them without a display: adding line items one by one up to --lines, picking a
+product on each new line, switching the theme with that long invoice open,
+and reloading the invoice table. Every interaction is timed twice: wall
+clock from the start of the call until the event loop has handled everything
+the call queued (layouts, polishing, repaints), and the event loop part alone,
+which is how long the window would stay unresponsive after the call returned.
+
+Usage:
+    python benchmarks/gui_latency.py [--size small] [--lines 200] [--repeat 5]
+        [--json results.json] [--compare baseline.json] [--data-dir DIR]
+"""
+import argparse
+import datetime
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QTabWidget
+
+from app import DatabaseManager, DisplayBillsTab, GenerateBillTab, ThemeManager, percentile
+from generate_data import add_dataset_arguments, dataset_from_arguments
+from hot_paths import DEFAULT_DATA_DIR, environment, prepare_dataset, print_comparison
+
+
+def interact(action):
+    """Run `action` and wait for the event loop to go idle.
+
+    Returns (wall ms, event loop ms). The zero timer fires once the events
+    posted by the action have been delivered."""
+    start = time.perf_counter()
+    action()
+    returned = time.perf_counter()
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+    done = time.perf_counter()
+    return (done - start) * 1000, (done - returned) * 1000
+
+
+def summarize(name, timings):
+    wall = sorted(t[0] for t in timings)
+    event_loop = sorted(t[1] for t in timings)
+    return {
+        "name": name,
+        "samples": len(timings),
+        "median_ms": round(statistics.median(wall), 3),
+        "p95_ms": round(percentile(wall, 0.95), 3),
+        "max_ms": round(wall[-1], 3),
+        "last_ms": round(timings[-1][0], 3),
+        "event_loop_median_ms": round(statistics.median(event_loop), 3),
+        "event_loop_p95_ms": round(percentile(event_loop, 0.95), 3),
+        "event_loop_max_ms": round(event_loop[-1], 3),
+    }
+
+
+def run(db_file, lines, repeat):
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    theme_manager = ThemeManager()
+    # apply_theme remembers the choice, put the user's setting back afterwards
+    was_dark = theme_manager.is_dark_mode()
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        scratch = os.path.join(work_dir, "bench.db")
+        shutil.copyfile(db_file, scratch)
+        db = DatabaseManager(scratch)
+        try:
+            window = QTabWidget()
+            window.resize(1200, 800)
+            generate_tab = GenerateBillTab(db)
+            display_tab = DisplayBillsTab(db)
+            window.addTab(generate_tab, "Generate Bill")
+            window.addTab(display_tab, "Display Bills")
+            window.show()
+            theme_manager.apply_theme(app, False)
+            interact(lambda: None)
+
+            # Grow one invoice line by line, choosing a product on each line
+            adds, selects = [], []
+            product_count = len(generate_tab.all_products)
+            while len(generate_tab.product_items) < lines:
+                adds.append(interact(generate_tab.add_product_item))
+                item = generate_tab.product_items[-1]
+                index = len(generate_tab.product_items) % product_count + 1 if product_count else 0
+                selects.append(interact(lambda: item.sku_combo.setCurrentIndex(index)))
+            results.append(summarize("add_product_item", adds))
+            results.append(summarize("select_product", selects))
+
+            toggles = []
+            for _ in range(repeat):
+                toggles.append(interact(lambda: theme_manager.apply_theme(app, True)))
+                toggles.append(interact(lambda: theme_manager.apply_theme(app, False)))
+            results.append(summarize("toggle_theme", toggles))
+
+            window.setCurrentWidget(display_tab)
+            interact(lambda: None)
+            results.append(summarize("load_invoices", [interact(display_tab.load_invoices) for _ in range(repeat)]))
+            results[-1]["rows"] = display_tab.table.rowCount()
+
+            window.close()
+        finally:
+            theme_manager.apply_theme(app, was_dark)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_dataset_arguments(parser)
+    parser.add_argument("--lines", type=int, default=200, help="line items to add to the invoice")
+    parser.add_argument("--repeat", type=int, default=5, help="theme switches and table reloads")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="where generated databases are kept")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run to compare medians with")
+    args = parser.parse_args()
+
+    dataset = dataset_from_arguments(args)
+    db_file = prepare_dataset(args.data_dir, dataset)
+    results = run(db_file, args.lines, args.repeat)
+
+    print(f"{'Interaction':<22} {'Samples':>8} {'Median ms':>10} {'p95 ms':>10} {'Max ms':>10} "
+          f"{'Last ms':>10} {'Loop p95 ms':>12}")
+    for row in results:
+        print(f"{row['name']:<22} {row['samples']:>8} {row['median_ms']:>10.3f} {row['p95_ms']:>10.3f} "
+              f"{row['max_ms']:>10.3f} {row['last_ms']:>10.3f} {row['event_loop_p95_ms']:>12.3f}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "dataset": dataset,
+                "lines": args.lines,
+                "repeat": args.repeat,
+                "environment": environment(),
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
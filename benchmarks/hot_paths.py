@@ -0,0 +1,279 @@
+"""Time the application's hot paths on a synthetic database.
+
+Builds a seeded database with generate_data.py, or reuses the one built
+earlier with the same arguments, and times each operation on a scratch copy
+without starting the GUI. Reports the min, median, p95 and mean of every
+operation in milliseconds. --json writes the results together with the dataset
+and environment so runs can be compared later with --compare.
+
+Usage:
+    python benchmarks/hot_paths.py [--size small] [--repeat 5] [--only NAME ...]
+        [--json results.json] [--compare baseline.json] [--data-dir DIR]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import (DatabaseManager, generate_bill_pdf, invoice_changes_frames, invoice_export_frame,
+                 invoice_pdf_data, percentile)
+from generate_data import add_dataset_arguments, build_database, dataset_from_arguments
+from invoice_server import ServerDatabaseManager
+
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "invoice-benchmarks")
+BULK_INVOICES = 10000  # invoices selected for the bulk edit and delete
+
+
+class Context:
+    """Scratch database and seeded inputs shared by the benchmarks."""
+
+    def __init__(self, db_file, work_dir, seed):
+        self.db = DatabaseManager(db_file)
+        self.work_dir = work_dir
+        self.rng = random.Random(seed)
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM invoices")
+        self.invoice_ids = [row["id"] for row in cursor.fetchall()]
+        cursor.execute("SELECT id, price_per_unit FROM products")
+        self.products = [dict(row) for row in cursor.fetchall()]
+        cursor.execute("SELECT id FROM companies")
+        self.company_ids = [row["id"] for row in cursor.fetchall()]
+        conn.close()
+
+    def random_invoice_id(self):
+        return self.rng.choice(self.invoice_ids)
+
+
+def bench_get_all_invoices(ctx):
+    ctx.db.get_all_invoices()
+
+
+def bench_get_invoice_details(ctx):
+    ctx.db.get_invoice_details(ctx.random_invoice_id())
+
+
+def bench_create_invoice(ctx):
+    items = []
+    for product in ctx.rng.sample(ctx.products, min(5, len(ctx.products))):
+        quantity = ctx.rng.randint(1, 20)
+        items.append({"product_id": product["id"], "quantity": quantity,
+                      "price_per_unit": product["price_per_unit"],
+                      "amount": round(quantity * product["price_per_unit"], 2)})
+    company_id = ctx.rng.choice(ctx.company_ids)
+    _, error = ctx.db.create_invoice(datetime.date.today().isoformat(), company_id, company_id,
+                                     ctx.company_ids[0], None, 0,
+                                     sum(item["amount"] for item in items), items)
+    if error:
+        raise RuntimeError(error)
+
+
+def bench_generate_bill_pdf(ctx):
+    invoice = ctx.db.get_invoice_details(ctx.random_invoice_id())
+    generate_bill_pdf(invoice_pdf_data(invoice), os.path.join(ctx.work_dir, "invoice.pdf"))
+
+
+def bench_export_frame(ctx):
+    invoice_export_frame(ctx.db.get_all_invoice_details(include_archived=True))
+
+
+def bench_export_changes(ctx):
+    # A day's edits, then a delta export of them. The warm-up call exports
+    # every invoice once and saves the first checkpoint.
+    _, error = ctx.db.update_invoices(ctx.rng.sample(ctx.invoice_ids, min(20, len(ctx.invoice_ids))),
+                                      advance_amount=0)
+    if error:
+        raise RuntimeError(error)
+    changes = ctx.db.get_invoice_changes()
+    invoice_changes_frames(changes)
+    ctx.db.save_export_checkpoint(changes["change_id"])
+
+
+def bench_bulk_update(ctx):
+    ids = ctx.rng.sample(ctx.invoice_ids, min(BULK_INVOICES, len(ctx.invoice_ids)))
+    _, error = ctx.db.update_invoices(ids, bill_date=f"2024-{ctx.rng.randint(1, 12):02d}-15",
+                                      advance_amount=ctx.rng.randint(0, 500))
+    if error:
+        raise RuntimeError(error)
+
+
+def bench_bulk_delete(ctx):
+    # Only the delete is timed. The database is put back afterwards, so every
+    # sample deletes from the full set of invoices.
+    ids = ctx.rng.sample(ctx.invoice_ids, min(BULK_INVOICES, len(ctx.invoice_ids)))
+    copy = os.path.join(ctx.work_dir, "before-delete.db")
+    shutil.copyfile(ctx.db.db_file, copy)
+    start = time.perf_counter()
+    _, error = ctx.db.delete_invoices(ids)
+    elapsed = time.perf_counter() - start
+    os.replace(copy, ctx.db.db_file)
+    if error:
+        raise RuntimeError(error)
+    return elapsed
+
+
+def bench_server_bulk_update(ctx):
+    # Two bulk edits back to back in one writer session of the server. Anything
+    # a call leaves on the pooled connection, such as its temp tables, fails the
+    # second one, and the session must hand the connection back clean.
+    db = ServerDatabaseManager(ctx.db.db_file, readers=1)
+    try:
+        with db.session(write=True) as conn:
+            start = time.perf_counter()
+            for _ in range(2):
+                ids = ctx.rng.sample(ctx.invoice_ids, min(BULK_INVOICES, len(ctx.invoice_ids)))
+                _, error = db.update_invoices(ids, bill_date=f"2024-{ctx.rng.randint(1, 12):02d}-15",
+                                              advance_amount=ctx.rng.randint(0, 500))
+                if error:
+                    raise RuntimeError(error)
+            elapsed = time.perf_counter() - start
+        if conn.execute("SELECT COUNT(*) FROM temp.sqlite_master").fetchone()[0]:
+            raise RuntimeError("temp tables left on the writer connection")
+        if not conn.execute("PRAGMA foreign_keys").fetchone()[0]:
+            raise RuntimeError("foreign keys left off on the writer connection")
+    finally:
+        db.close()
+    return elapsed
+
+
+# name -> (function, calls per sample). Fast operations are called several
+# times per sample so the timer resolution does not matter.
+BENCHMARKS = {
+    "get_all_invoices": (bench_get_all_invoices, 1),
+    "get_invoice_details": (bench_get_invoice_details, 20),
+    "create_invoice": (bench_create_invoice, 10),
+    "generate_bill_pdf": (bench_generate_bill_pdf, 1),
+    "export_frame": (bench_export_frame, 1),
+    "export_changes": (bench_export_changes, 1),
+    "bulk_update": (bench_bulk_update, 1),
+    "bulk_delete": (bench_bulk_delete, 1),
+    "server_bulk_update": (bench_server_bulk_update, 1),
+}
+
+
+def dataset_file(data_dir, dataset):
+    name = "bench-{invoices}i-{products}p-{clients}c-{max_lines}l-{seed}s.db".format(**dataset)
+    return os.path.join(data_dir, name)
+
+
+def prepare_dataset(data_dir, dataset):
+    """Path of the database for `dataset`, generating it if needed."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = dataset_file(data_dir, dataset)
+    if not os.path.exists(path):
+        print(f"Generating {os.path.basename(path)}...", file=sys.stderr)
+        partial = path + ".partial"
+        if os.path.exists(partial):
+            os.remove(partial)
+        build_database(partial, **dataset)
+        os.replace(partial, path)
+    return path
+
+
+def run(db_file, names, repeat, seed):
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        # The benchmarks write to the database, so keep the generated one pristine
+        scratch = os.path.join(work_dir, "bench.db")
+        shutil.copyfile(db_file, scratch)
+        ctx = Context(scratch, work_dir, seed)
+        for name in names:
+            func, calls = BENCHMARKS[name]
+            func(ctx)  # warm up caches
+            samples = []
+            for _ in range(repeat):
+                # A benchmark with setup it should not be timed for returns
+                # the seconds of the part it measures
+                elapsed = 0.0
+                for _ in range(calls):
+                    start = time.perf_counter()
+                    measured = func(ctx)
+                    elapsed += time.perf_counter() - start if measured is None else measured
+                samples.append(elapsed * 1000 / calls)
+            samples.sort()
+            results.append({
+                "name": name,
+                "samples": repeat,
+                "calls_per_sample": calls,
+                "min_ms": round(samples[0], 3),
+                "median_ms": round(statistics.median(samples), 3),
+                "p95_ms": round(percentile(samples, 0.95), 3),
+                "mean_ms": round(statistics.fmean(samples), 3),
+            })
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {row["name"]: row for row in json.load(f)["results"]}
+    print(f"\n{'Benchmark':<22} {'Baseline ms':>12} {'Now ms':>10} {'Change':>8}")
+    for row in results:
+        before = baseline.get(row["name"])
+        if before is None:
+            print(f"{row['name']:<22} {'-':>12} {row['median_ms']:>10.3f}")
+            continue
+        change = (row["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0
+        print(f"{row['name']:<22} {before['median_ms']:>12.3f} {row['median_ms']:>10.3f} {change:>+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_dataset_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, help="run only these benchmarks")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="where generated databases are kept")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run to compare medians with")
+    args = parser.parse_args()
+
+    dataset = dataset_from_arguments(args)
+    db_file = prepare_dataset(args.data_dir, dataset)
+    results = run(db_file, args.only or list(BENCHMARKS), args.repeat, args.seed)
+
+    print(f"{'Benchmark':<22} {'Min ms':>10} {'Median ms':>10} {'p95 ms':>10} {'Mean ms':>10}")
+    for row in results:
+        print(f"{row['name']:<22} {row['min_ms']:>10.3f} {row['median_ms']:>10.3f} "
+              f"{row['p95_ms']:>10.3f} {row['mean_ms']:>10.3f}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                "dataset": dataset,
+                "repeat": args.repeat,
+                "environment": environment(),
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Measure what embedded fonts cost per invoice.
+
+Renders the sample invoice of pdf_profiles.py twice with the same layout: in
+Latin text, drawn with the built-in Helvetica, and with the rupee sign and
+Hindi and Odia names and addresses, which are drawn with the embedded
+PDF_FONTS. Reports the one-time font registration, the first and median render
+time and the file size of each, and lists characters no installed font can
+show.
+
+Usage:
+    python benchmarks/pdf_fonts.py [--runs 10] [--items 10] [--json results.json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import DEFAULT_PDF_PROFILE, _pdf_font_for, generate_bill_pdf, register_pdf_fonts
+from pdf_profiles import sample_invoice, sample_signatures
+
+ADDRESSES = {
+    "latin": ("Shree Jagannath Enterprise\nBhubaneswar, Odisha\nGSTIN: 21AAAAA0000A1Z5",
+              "Ram Traders\nConnaught Place, New Delhi\nGSTIN: 07AAAAA0000A1Z5"),
+    "multilingual": ("ଶ୍ରୀ ଜଗନ୍ନାଥ ଏଣ୍ଟରପ୍ରାଇଜ\nଭୁବନେଶ୍ୱର, ଓଡ଼ିଶା\nGSTIN: 21AAAAA0000A1Z5",
+                     "राम ट्रेडर्स\nकनॉट प्लेस, नई दिल्ली\nGSTIN: 07AAAAA0000A1Z5"),
+}
+CURRENCY = {"latin": "Rs.", "multilingual": "₹"}
+
+
+def sample_case(data, case):
+    odia, hindi = ADDRESSES[case]
+    data = dict(data, bill_to=odia, ship_to=hindi, ship_from=odia)
+    data["items"] = [dict(item, product_name=f"{item['product_name']} "
+                                             f"({CURRENCY[case]}{item['price_per_unit']:.0f} MRP)")
+                     for item in data["items"]]
+    return data
+
+
+def missing_characters(data):
+    text = "".join([data["bill_to"], data["ship_to"], data["ship_from"]]
+                   + [item["product_name"] for item in data["items"]])
+    missing = set()
+    for char in text:
+        if char.isspace():
+            continue
+        try:
+            char.encode("cp1252")
+        except UnicodeEncodeError:
+            if _pdf_font_for(char) is None:
+                missing.add(char)
+    return "".join(sorted(missing))
+
+
+def run(runs, item_count):
+    sample = sample_invoice(sample_signatures()[0], item_count)
+    cases = [(case, sample_case(sample, case)) for case in ADDRESSES]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Warm the signature cache so only fonts differ between the cases
+        generate_bill_pdf(sample, os.path.join(tmp_dir, "warmup.pdf"))
+        start = time.perf_counter()
+        fonts = register_pdf_fonts()
+        registration_ms = (time.perf_counter() - start) * 1000
+        for name, data in cases:
+            filename = os.path.join(tmp_dir, f"{name}.pdf")
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                generate_bill_pdf(data, filename, profile=DEFAULT_PDF_PROFILE)
+                timings.append((time.perf_counter() - start) * 1000)
+            with open(filename, "rb") as f:
+                embedded = re.findall(rb"/BaseFont /(\w+\+\w+)", f.read())
+            results.append({
+                "case": name,
+                "pdf_bytes": os.path.getsize(filename),
+                "embedded_fonts": sorted({font.decode() for font in embedded}),
+                # The first multilingual render parses the glyph metrics it needs
+                "first_render_ms": round(timings[0], 2),
+                "median_render_ms": round(statistics.median(timings), 2),
+                "missing_characters": missing_characters(data),
+            })
+    return {
+        "fonts": [family for family, _ in fonts],
+        "registration_ms": round(registration_ms, 2),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="renders per case")
+    parser.add_argument("--items", type=int, default=10, help="line items on the sample invoice")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    report = run(args.runs, args.items)
+
+    print(f"Fonts found: {', '.join(report['fonts']) or 'none'} "
+          f"(registered once in {report['registration_ms']:.2f} ms)")
+    print(f"{'Case':<14} {'Bytes':>8} {'First ms':>9} {'Median ms':>10}  Embedded subsets")
+    for row in report["results"]:
+        print(f"{row['case']:<14} {row['pdf_bytes']:>8} {row['first_render_ms']:>9.2f} "
+              f"{row['median_render_ms']:>10.2f}  {', '.join(row['embedded_fonts']) or '-'}")
+        if row["missing_characters"]:
+            print(f"{'':<14} no font for: {row['missing_characters']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "items": args.items, **report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compare PDF output profiles on the sample signatures.
+
+Renders the same invoice once per signature and profile and reports the file
+size and render time of each combination.
+
+Usage:
+    python benchmarks/pdf_profiles.py [--runs 5] [--items 10] [--json results.json]
+"""
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app import PDF_PROFILES, generate_bill_pdf, get_dynamic_invoice_data, amount_to_words
+
+
+def sample_signatures():
+    """Unique signature images from the signatures directory."""
+    signature_dir = os.path.join(ROOT, "signatures")
+    seen = set()
+    signatures = []
+    for name in sorted(os.listdir(signature_dir)):
+        if not name.lower().endswith((".png", ".jpg", ".jpeg")):
+            continue
+        path = os.path.join(signature_dir, name)
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        if digest not in seen:
+            seen.add(digest)
+            signatures.append(path)
+    return signatures
+
+
+def sample_invoice(signature_path, item_count):
+    items = []
+    for i in range(item_count):
+        quantity = i % 5 + 1
+        price = 150.0 + i * 12.5
+        items.append({
+            "sku_code": f"SKU-{i:04d}",
+            "product_name": f"Sample Product {i}",
+            "hsn_code": "8471",
+            "quantity": quantity,
+            "price_per_unit": price,
+            "amount": quantity * price,
+        })
+    taxable_value = sum(item["amount"] for item in items)
+    sgst_amount = cgst_amount = taxable_value * 9 / 100
+    total = taxable_value + sgst_amount + cgst_amount
+    return get_dynamic_invoice_data(
+        bill_to="Sample Client\nBhubaneswar, Odisha\nGSTIN: 21AAAAA0000A1Z5",
+        ship_to="Sample Client\nBhubaneswar, Odisha\nGSTIN: 21AAAAA0000A1Z5",
+        ship_from="Sample Warehouse\nDhenkanal, Odisha\nGSTIN: 21BBBBB1111B1Z5",
+        bill_no="INV-0001",
+        bill_date="2025-03-14",
+        items=items,
+        taxable_value=taxable_value,
+        sgst_rate=9,
+        sgst_amount=sgst_amount,
+        cgst_rate=9,
+        cgst_amount=cgst_amount,
+        total=total,
+        amount_in_words=amount_to_words(total),
+        signature_path=signature_path,
+    )
+
+
+def run(runs, item_count):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for signature_path in sample_signatures():
+            data = sample_invoice(signature_path, item_count)
+            for profile in PDF_PROFILES:
+                filename = os.path.join(tmp_dir, f"{profile}.pdf")
+                timings = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    generate_bill_pdf(data, filename, profile=profile)
+                    timings.append((time.perf_counter() - start) * 1000)
+                results.append({
+                    "signature": os.path.basename(signature_path),
+                    "signature_bytes": os.path.getsize(signature_path),
+                    "profile": profile,
+                    "pdf_bytes": os.path.getsize(filename),
+                    # The first run includes decoding and resizing the signature
+                    "first_render_ms": round(timings[0], 2),
+                    "median_render_ms": round(statistics.median(timings), 2),
+                })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="renders per signature and profile")
+    parser.add_argument("--items", type=int, default=10, help="line items on the sample invoice")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.runs, args.items)
+
+    print(f"{'Signature':<36} {'Profile':<8} {'Bytes':>10} {'First ms':>9} {'Median ms':>10}")
+    for row in results:
+        print(f"{row['signature']:<36} {row['profile']:<8} {row['pdf_bytes']:>10} "
+              f"{row['first_render_ms']:>9.2f} {row['median_render_ms']:>10.2f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": args.runs, "items": args.items, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
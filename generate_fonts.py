@@ -0,0 +1,106 @@
+"""Build the subsets of the Noto fonts in fonts/ that draw Hindi and Odia text
+in invoice PDFs.
+
+Each subset keeps the letters of its script, the characters that join or
+separate them and the OpenType layout tables needed to shape conjuncts. The
+name table, with the SIL Open Font License notice, is kept too. CFF outlines
+are converted to TrueType ones, the only kind reportlab can embed.
+
+Needs fontTools (pip install fonttools).
+
+Usage:
+    python generate_fonts.py NotoSerifDevanagari-Regular.ttf NotoSerifOriya-Regular.ttf
+"""
+import os
+import sys
+
+from fontTools import subset
+from fontTools.pens.cu2quPen import Cu2QuPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import newTable
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+
+# Printable ASCII and no-break space, zero-width (non-)joiners and the dotted
+# circle a shaper draws under a stray vowel sign
+_COMMON = [*range(0x20, 0x7F), 0xA0, 0x200B, 0x200C, 0x200D, 0x25CC]
+# File name -> code points kept. Odia also uses the Devanagari dandas.
+SUBSETS = {
+    'NotoSerifDevanagari-Regular.ttf': _COMMON + [*range(0x0900, 0x0980), *range(0xA8E0, 0xA900)],
+    'NotoSerifOriya-Regular.ttf': _COMMON + [*range(0x0B00, 0x0B80), 0x0964, 0x0965],
+}
+# Largest distance in font units between a cubic curve and its quadratic copy
+MAX_CURVE_ERROR = 1.0
+
+def subset_font(path, unicodes):
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.notdef_outline = True
+    options.hinting = False
+    font = subset.load_font(path, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    return font
+
+def cff_to_truetype(font):
+    """Replace the CFF outlines of `font` with quadratic TrueType ones."""
+    glyph_order = font.getGlyphOrder()
+    glyph_set = font.getGlyphSet()
+    glyf = newTable('glyf')
+    glyf.glyphOrder = glyph_order
+    glyf.glyphs = {}
+    for name in glyph_order:
+        pen = TTGlyphPen(glyph_set)
+        glyph_set[name].draw(Cu2QuPen(pen, MAX_CURVE_ERROR, reverse_direction=True))
+        glyf.glyphs[name] = pen.glyph()
+    font['loca'] = newTable('loca')
+    font['glyf'] = glyf
+    del font['CFF ']
+    for glyph in glyf.glyphs.values():
+        glyph.recalcBounds(glyf)
+    glyf.compile(font)
+
+    # Left side bearings are the glyph's xMin in TrueType fonts
+    hmtx = font['hmtx']
+    for name, glyph in glyf.glyphs.items():
+        hmtx[name] = (hmtx[name][0], getattr(glyph, 'xMin', 0))
+
+    maxp = font['maxp']
+    maxp.tableVersion = 0x00010000
+    for field in ('maxTwilightPoints', 'maxStorage', 'maxFunctionDefs', 'maxInstructionDefs',
+                  'maxStackElements', 'maxSizeOfInstructions'):
+        setattr(maxp, field, 0)
+    maxp.maxZones = 1
+    maxp.recalc(font)
+    font['head'].indexToLocFormat = 0
+    font['head'].glyphDataFormat = 0
+    # Glyph names come from the CFF table, which is gone
+    font['post'].formatType = 2.0
+    font['post'].extraNames = []
+    font['post'].mapping = {}
+    font.sfntVersion = '\x00\x01\x00\x00'
+
+def main(paths):
+    if not paths:
+        print(__doc__)
+        return 1
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    for path in paths:
+        name = os.path.basename(path)
+        if name not in SUBSETS:
+            print(f"Skipping {name}: not one of {', '.join(SUBSETS)}")
+            continue
+        font = subset_font(path, SUBSETS[name])
+        if 'CFF ' in font:
+            cff_to_truetype(font)
+        output = os.path.join(FONTS_DIR, name)
+        font.save(output)
+        print(f"{output}: {len(font.getGlyphOrder())} glyphs, "
+              f"{os.path.getsize(path) // 1024} KB -> {os.path.getsize(output) // 1024} KB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
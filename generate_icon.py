@@ -1,5 +1,14 @@
 from PIL import Image, ImageDraw
 import os
+import subprocess
+import sys
+import tempfile
+
+# Sizes packed into the Qt resource module. The theme button shows its icon
+# at 20 px, 40 px on high-DPI screens; the app icon sizes match app.ico
+APP_ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+THEME_ICON_SIZES = (16, 20, 32, 40, 64)
+RESOURCE_MODULE = 'icons_rc.py'
 
 def create_directory(path):
     if not os.path.exists(path):
@@ -83,6 +92,34 @@ def create_moon_icon(size=32):
     
     return img
 
+def compile_resources(output=RESOURCE_MODULE):
+    """Pack every icon size into a Qt resource module that app.py imports.
+
+    The app icon sizes are scaled down from icons/app_icon.png like app.ico,
+    the theme icons are drawn at each size. Icons are then looked up as
+    :/icons/<name>/<size>.png from memory instead of from the disk.
+    """
+    app_icon = Image.open('icons/app_icon.png')
+    images = [('app', size, app_icon.resize((size, size), Image.LANCZOS)) for size in APP_ICON_SIZES]
+    for size in THEME_ICON_SIZES:
+        images.append(('sun', size, create_sun_icon(size)))
+        images.append(('moon', size, create_moon_icon(size)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        entries = []
+        for name, size, image in images:
+            filename = f'{name}_{size}.png'
+            image.save(os.path.join(tmp_dir, filename))
+            entries.append(f'    <file alias="{name}/{size}.png">{filename}</file>')
+        qrc = os.path.join(tmp_dir, 'icons.qrc')
+        with open(qrc, 'w') as f:
+            f.write('<!DOCTYPE RCC><RCC version="1.0">\n<qresource prefix="/icons">\n')
+            f.write('\n'.join(entries))
+            f.write('\n</qresource>\n</RCC>\n')
+        # Same as running pyrcc5, which is not always on the PATH
+        subprocess.run([sys.executable, '-m', 'PyQt5.pyrcc_main', '-o', os.path.abspath(output), qrc],
+                       check=True)
+
 def main():
     # Create icons directory
     create_directory('icons')
@@ -97,6 +134,9 @@ def main():
     moon_icon = create_moon_icon()
     sun_icon.save('icons/sun.png')
     moon_icon.save('icons/moon.png')
+
+    # Compile all sizes into the resource module loaded by app.py
+    compile_resources()
     
     print("Icons generated successfully!")
 
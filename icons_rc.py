@@ -0,0 +1,1671 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\x82\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x49\x49\x44\x41\x54\x78\x9c\x63\x60\x18\x68\xc0\x88\
+\x4b\xe2\xe3\x11\xfe\xff\xc8\x7c\x7e\x9b\x8f\x58\xd5\x32\x51\xa2\
+\x19\xab\x01\xa4\x68\xc6\x30\x80\x54\xcd\x28\x06\x90\xa3\x19\xc3\
+\x05\xe4\x80\xe1\x64\x00\x7a\xa0\xa1\x07\x2a\x51\x2e\x20\xc7\x10\
+\x0c\x2f\x90\x6a\x08\xd6\x30\x20\xd7\x3b\x64\x01\x00\xd3\xab\x24\
+\x1a\x29\x9d\x2c\x8c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x00\x95\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x5c\x49\x44\x41\x54\x78\x9c\x63\x60\x18\xec\x80\x91\
+\x90\x82\x8f\x47\xf8\xff\xa3\x8b\xf1\xdb\x7c\xc4\xa9\x0f\xa7\x04\
+\xa9\x06\xc1\x00\x13\x35\x0d\xc3\x6a\x20\x25\x86\x61\x18\x48\xa9\
+\x61\x18\x06\x52\x03\xc0\x0d\xa4\x86\xeb\x50\x0c\xa4\x16\x18\xc9\
+\x06\x62\x8b\x00\x6c\x11\x45\xb4\x81\xd4\x02\x28\x06\x52\xc3\x95\
+\x18\x2e\xa4\xd4\x50\xac\x5e\xa6\xc4\x50\xaa\x97\x87\x54\x07\x00\
+\x59\xfd\x2c\x20\x66\xe0\xf6\x0d\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x00\xbd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x84\x49\x44\x41\x54\x78\x9c\xed\x96\xcb\x11\x80\x20\
+\x0c\x05\x83\x0d\xd0\x10\xe5\xdb\x10\x15\xe8\xc9\x93\x21\x31\x68\
+\x9e\x30\x64\xaf\x7c\xde\x26\x0c\x03\x44\xc1\xea\xa4\x9e\x45\x75\
+\xcf\x47\x6b\x2c\x97\x6a\xda\xd3\x34\x59\x0a\xee\x09\x7f\x2c\xe0\
+\x11\x7c\xb1\xfd\x19\xae\x0a\x78\x87\x8b\x02\x88\x70\x51\x00\x05\
+\x2b\x80\xaa\xbe\x29\x80\xe4\x26\x80\xac\x9e\x15\x40\x13\x02\x21\
+\x30\x9e\x80\x76\xcd\xb4\x6b\xfa\x5a\x00\x0d\x2b\x80\xec\xc2\x98\
+\x1d\x20\xc2\x75\x41\xec\x00\x42\x42\x3d\x02\x6f\x89\x39\x7e\xc5\
+\x16\x91\xaf\x9f\xeb\xc0\x9d\x13\x44\x0a\x3c\x2e\x2a\x4d\x0b\xbd\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xe1\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x28\x00\x00\x00\x28\x08\x06\x00\x00\x00\x8c\xfe\xb8\x6d\
+\x00\x00\x00\xa8\x49\x44\x41\x54\x78\x9c\xed\x98\x41\x0e\x80\x20\
+\x0c\x04\x47\xe3\xdd\x0f\xf9\x7c\x3f\xc4\x0b\xf4\xe4\x4d\xb4\x15\
+\xc3\x96\xa4\x73\x15\x74\xd8\x82\x69\x80\x24\x49\x1e\x99\xfe\x78\
+\x49\xd9\xd7\xa3\xf6\x6c\xdd\x4a\xd3\x37\x96\xaf\x13\x9f\xa4\xfe\
+\xc4\xbd\x3a\xab\x58\x6b\x72\x17\xb3\x67\x70\x6f\x39\x70\x08\x2a\
+\xe4\xc0\x28\xa8\x92\x03\x83\xa0\x52\x0e\x5e\x04\xd5\x72\xe0\x3c\
+\x24\x0a\xaa\x82\x11\xd2\x83\x91\x13\x8c\xc2\xad\x60\x94\xf2\xc2\
+\xa8\x09\x46\x22\x05\x5b\x49\xc1\x56\x6e\x05\xad\xbf\x8f\x1e\x5d\
+\xf5\x98\x09\x46\xa2\x2a\x18\xa5\xcc\xe3\x26\x08\x31\x52\x7c\x4d\
+\x50\x2d\x69\x2a\xb1\x52\xd2\xbc\x07\x55\x92\xae\x43\xa2\x90\xfc\
+\xdc\x70\xf6\x6a\x6a\xc3\xdf\x6e\x25\x89\x9a\x13\xc4\x87\x4b\x00\
+\xcf\x12\x5a\x44\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\x38\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\xff\x49\x44\x41\x54\x78\x9c\xed\x9b\xc1\x11\x83\x30\
+\x0c\x04\x2f\x69\x80\x86\x52\x7e\x1a\xa2\x02\xf2\xe2\x1b\x6c\x64\
+\x23\x74\xec\xbe\x05\xb6\xd6\x67\x60\x20\x91\x00\x00\x00\xe0\xa9\
+\xbc\xae\x1e\x70\xfd\x2e\xdb\x51\xcd\xf2\x59\x2f\x9b\xd7\xf4\x81\
+\x5a\x1a\xfe\xc7\x6c\x19\xd3\x4e\x7e\xf7\xc6\x77\x86\x0f\x52\xa5\
+\xf1\x9d\xf7\xc8\x93\x55\x6b\x5e\x1a\x94\x80\x8a\x8d\xef\x84\x13\
+\x50\xb9\x79\x29\x28\xa0\x7a\xf3\x52\x40\x80\x43\xf3\xd2\x49\x01\
+\x2e\xcd\x4b\x83\xef\x02\x15\xe9\x16\xe0\xb4\xfa\x52\xa7\x00\xb7\
+\xe6\x25\xb6\x40\xbb\x00\xc7\xd5\x97\x48\x40\x9b\x00\xd7\xd5\x97\
+\x48\x00\x02\x10\x70\x54\xe0\xbc\xff\x25\x12\x80\x00\x04\x64\x4f\
+\x20\x1b\x04\x64\x4f\x20\x1b\x04\x64\x4f\x20\x9b\x43\x01\xd1\x07\
+\x99\xe8\x83\xd4\x6c\x48\x40\xf6\x04\xb2\x41\x40\x4b\x91\xf3\x75\
+\x80\x04\xb4\x16\xba\xa6\x80\x04\xf4\x14\x3b\xa6\xa0\x3b\x01\x6e\
+\x12\xd8\x02\x67\x0e\x72\x4a\xc1\xe9\x04\xb8\x48\x08\x6d\x01\x07\
+\x09\xe1\x6b\x40\x75\x09\x43\xdf\xd9\x57\xfc\x86\x30\xf4\x2e\x50\
+\x31\x0d\xfc\x56\x78\xf6\x00\x77\x17\xf1\xf8\xff\x0b\x00\x00\x00\
+\x3c\x98\x1f\x94\x4c\x74\x5a\x3b\x63\x10\xa6\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xad\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x00\x74\x49\x44\x41\x54\x78\x9c\xad\x93\xb1\x0d\x00\x21\
+\x08\x45\xc5\xd8\xd2\x38\x23\x63\x39\xa3\x8d\x03\x78\xd5\x5d\x90\
+\x08\x78\xc1\xd7\x89\xf1\x0b\x1f\x80\xa4\x30\x5a\x9d\x32\x86\xd4\
+\x41\xc6\xb2\x26\x70\xca\xa2\xc8\x7f\x45\xea\xe0\x9d\x17\x01\x2f\
+\x65\xed\xbe\x58\xe9\xed\x1e\x49\xc2\x1e\xe4\xd1\xea\x1c\xad\xce\
+\x9d\xc3\x16\xaf\x27\x5f\x06\x7f\x44\xb8\xa1\xf1\x12\xae\x09\xc8\
+\x3e\x5b\xf0\x72\xcd\x3e\x7b\x20\x75\x08\x97\x60\x0e\x92\x37\x89\
+\x29\xdd\xdc\x05\xc9\xe9\x3a\x3f\x58\x75\x4d\x5f\x71\x4c\xf5\x11\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xc9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
+\x00\x00\x00\x90\x49\x44\x41\x54\x78\x9c\xbd\x54\x31\x12\x80\x20\
+\x0c\x2b\x9c\xab\x0b\x6f\xf4\x59\xbc\xd1\x85\x07\xe0\xe4\x1d\x16\
+\xd2\x14\x4e\xcd\x86\xa6\xb9\x92\x18\x83\x10\x94\x9c\xaa\x7e\xb6\
+\x1f\x67\x40\xfc\xc8\x04\x67\x41\x05\xf5\x36\xd6\x76\x22\x22\xdd\
+\xcb\xf6\x8a\xd6\x30\xe2\x45\x44\x1a\x9d\x3d\xbc\x0d\x6d\xc0\x44\
+\x11\xbe\x0d\x85\x19\x8e\xf0\xf0\xb0\xe4\x54\xbd\x41\x30\xb1\x92\
+\x53\x8d\xed\x61\x65\x3b\x3d\xff\xff\x87\xbd\x2c\xb8\x1a\x88\x9e\
+\x37\x9b\x32\x2b\x26\x42\x9a\xe2\x45\x3b\xf7\xba\x87\xb4\x7a\x23\
+\x6f\xad\x9b\x98\x4d\x41\x41\x59\x3c\x57\xb2\x33\x4d\xa2\x1e\x7a\
+\x7f\x69\x37\x2e\x18\x9e\x4d\x69\x2d\x0d\x88\xa8\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x0d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\xd4\x49\x44\x41\x54\x78\x9c\xed\x57\x41\x0e\xc3\x20\
+\x0c\xa3\xd5\xae\xbd\xf0\xc6\x3d\x8b\x37\xee\xc2\x03\xd8\x29\x52\
+\x85\x68\x70\x1c\x3a\x98\x54\x1f\x5b\x12\x1b\x1c\x20\x6c\x81\x44\
+\x4e\xb1\xd4\xdf\x8e\xf7\x67\xb3\xe6\xd9\x59\x01\xa3\x40\x0b\xa8\
+\x67\xcb\xcc\xfe\xc1\x12\x50\x7d\x3b\x57\x3a\xe3\x31\x12\x7f\x59\
+\x84\xf5\x36\x6b\x6d\x3b\x94\x5c\x8b\x7f\x59\x92\xf6\x12\x32\xab\
+\x64\x16\xa0\xad\x84\xfc\xb3\x08\xb9\xb4\xa0\xb5\xcf\x51\x1b\x72\
+\x8a\x05\x3d\x27\x60\xa5\xd6\x1a\xd0\x48\xcf\x80\x4e\x42\x86\x1c\
+\x8d\x9b\x7f\x17\xe4\x14\x0b\x52\x58\x2c\x7a\xb9\x77\x64\xe0\x1d\
+\x10\xbe\xf9\x16\x2c\x23\xe0\xd7\xf7\xb9\xf0\x41\xa4\x9e\xfa\xe8\
+\x4d\x6c\x1d\x0b\x34\xb0\xf6\x20\x71\xa6\x7e\xc0\x62\x45\x3d\x7e\
+\x48\x3f\x80\xae\x44\x4b\xec\xb0\x7e\x40\x44\x4c\xeb\x07\x3c\x64\
+\x2d\x98\xfa\x01\x4b\xe2\xe7\xdd\xf0\x37\x70\xf9\xe2\x7d\x37\x84\
+\xe0\x38\x8a\xbd\xef\x06\xc1\x17\x2d\x39\x82\xb7\xde\xca\x7a\xc3\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x2f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x28\x00\x00\x00\x28\x08\x06\x00\x00\x00\x8c\xfe\xb8\x6d\
+\x00\x00\x00\xf6\x49\x44\x41\x54\x78\x9c\xed\x98\x41\x0e\xc3\x20\
+\x0c\x04\x49\xd4\x6b\x2f\xbc\xb1\xcf\xe2\x8d\xbd\xf0\x00\x7a\xa2\
+\x8a\x50\x08\x5e\x7b\x11\x6d\xe4\xb9\x25\x0a\x66\x59\x30\xc1\x6c\
+\x81\x44\x4e\xb1\xb4\xef\x9e\xaf\xf7\x66\x8d\xbb\x5b\x03\xcc\x86\
+\x26\xb0\x75\x8b\xe1\x9e\xe3\x38\x02\x44\x99\x76\xdc\xe3\x18\xd9\
+\x89\xc4\x1b\x6e\x33\xed\x06\x7c\xb6\x21\x23\xa0\xf1\x1e\x96\xce\
+\x24\x9d\x58\x1d\x37\x09\x94\xb8\x59\xbf\xd1\x0a\x1d\x4e\x71\xef\
+\x0f\x81\x4e\x75\x4f\xe8\x48\xb8\x6a\x54\x96\x75\x88\x3a\x09\xff\
+\x8b\xd9\x49\x32\x02\x12\x68\x15\xa7\x89\x73\x9f\xe3\x16\xcb\x3d\
+\x34\xde\x9e\x53\x2c\xec\xce\x59\xe4\x14\xcb\x7e\x7c\x58\x29\xa6\
+\xa5\xea\xb9\xcf\x1a\x5c\xc5\x57\xe0\xaf\xd5\x10\x55\x8f\x58\xd4\
+\x8c\x35\x2a\x31\x45\x3c\xc5\x6c\x87\xa5\xf1\xfe\x67\x0d\x4a\x60\
+\xb9\x88\xc4\x81\x1d\xb4\x8a\x44\xdb\xab\x6b\x12\x4d\xd2\x9c\xb5\
+\x9d\x56\x93\xa0\x4e\xf4\x06\x36\xb5\x26\x91\xb8\xb9\xb4\x26\x61\
+\x89\xb8\x42\x5d\x93\x68\xf1\x5b\x30\xc7\x21\x43\xcd\x20\xf6\x2d\
+\x58\x08\xc4\xd3\x0c\xfb\x16\xac\xf2\x01\xbf\xa1\x8d\x7f\x88\xf0\
+\xfc\xf2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x7d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x01\x44\x49\x44\x41\x54\x78\x9c\xed\x9b\x4b\x0e\x83\x30\
+\x0c\x44\x01\x75\xdb\x0d\x67\xec\xb1\x38\x63\x37\x1c\x80\xae\xa8\
+\x22\x54\x55\x90\x8c\x3d\xad\xf2\xde\xae\x95\xb0\x9d\x89\x1d\xf2\
+\x63\x1c\x4c\xac\xcb\xbc\x1d\xff\xbb\x3f\x9e\x63\x76\x1c\x53\xb6\
+\xc3\x5f\xc3\x26\xc0\xb1\xb7\x1d\xbd\x0f\x00\x00\x00\x00\xd0\x31\
+\x4d\xf3\xef\x72\x45\xe7\x98\xcb\x2b\xfc\x57\x2f\x86\x8e\xcb\xd9\
+\x4f\xcb\xdb\x48\x54\xfe\x6f\x9a\x70\xae\xf1\x2d\xd8\xec\x4c\x4a\
+\x13\xe0\x6c\x0f\x65\x97\x55\xf8\x18\xa0\x28\x8d\x33\xb6\x6b\xc5\
+\x0a\x55\x58\x39\x2e\x44\x65\x43\x88\xd1\xc8\x01\x51\x2d\x84\x7c\
+\x4b\x2c\xfa\x6d\xa0\xb6\xcf\xa6\xa8\xd2\x58\xd6\x5c\x40\xe9\x47\
+\x26\x80\x7b\x22\x54\x0b\x25\xa0\x30\x92\xdd\xfb\x4a\xbf\x64\x80\
+\x3b\x00\x37\xcd\x02\xb8\xd2\x5f\xe5\x7f\x5a\x97\x79\x73\x37\xc2\
+\xc5\xba\xcc\xdb\x54\xfe\x70\x06\x93\xcd\xde\x5e\xc6\x00\x77\x00\
+\x6e\xde\x02\xf4\x76\x3e\xbf\xb7\xb7\xb9\xd1\xbf\x30\x76\xb4\x74\
+\x5e\x73\x09\xb8\x33\xa7\xd5\x3f\x63\x80\x3b\x00\x37\x12\x01\x5c\
+\x65\xa0\xf0\x4b\x06\xa8\x0c\x65\x67\x81\xca\x9f\x34\x03\xb2\x44\
+\x50\xfa\xa1\x04\xd4\x06\xa3\xb3\x40\x6d\x9f\x93\xa1\x96\x87\xbb\
+\x3e\x1b\xbc\x7a\xdd\xbd\x46\x88\xab\xf6\x6a\x44\x48\x3b\x1e\x2f\
+\x83\xeb\xf2\x7e\x40\x89\x7b\x01\x55\x52\xfd\x16\x70\xdf\xf7\x77\
+\xfb\x07\x00\x00\x00\x00\xf8\x73\xac\xf3\x67\xf7\xf7\x06\xc3\x60\
+\xdc\x13\x74\x7f\x6f\xb0\xf3\x02\x31\x11\xa5\x93\xc9\xf3\xed\xb7\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xd6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
+\x00\x00\x02\x9d\x49\x44\x41\x54\x78\x9c\x6d\x93\xcf\x4b\x54\x51\
+\x14\xc7\xbf\xe7\xdc\xf7\xee\xfc\xd0\xd1\x14\xcd\xb0\x52\x23\x63\
+\xd2\x4c\xc8\x16\x13\x09\x0d\x04\xa1\x9b\x6a\x61\xd9\xa6\xda\x14\
+\x41\xab\x40\x70\xdb\x9b\xb7\x68\x21\xd4\xa2\x45\xff\x42\x44\x16\
+\x08\x41\xb4\x28\x14\x72\x11\xba\x4a\x6a\x30\x2c\x22\x53\x28\x0d\
+\x1d\x47\x9f\xe3\xbc\x79\xef\x9e\x16\x26\x39\xea\x67\x77\xbf\xf7\
+\x7b\x0e\x7c\xe1\x7c\x81\x5d\x08\xa5\x9d\x51\x0b\x22\xb4\x4b\xc3\
+\x76\x6d\x2f\xa4\xdc\x90\x1c\x1a\x4f\xb4\x3e\xfe\x50\x55\xe6\x71\
+\x1c\xde\xfe\xa4\xb2\x0f\xd7\x35\xed\xce\x73\x2d\xaa\xee\x2e\x91\
+\x5c\x13\x63\x8e\x42\x84\xa0\xac\xef\x0c\xbc\x54\xb9\xb9\x27\x53\
+\x8f\x6e\x7a\x5b\xde\xff\x0b\xfe\x09\xad\xce\xeb\x43\xda\x8a\xbc\
+\xe0\x68\x45\x4a\xfc\x22\x24\x0c\x00\x08\x48\xd9\x20\x1d\x81\xd9\
+\x58\x9f\x42\xe0\xf7\x65\xdd\xde\xaf\x5b\x33\xbc\x95\xab\xd9\x19\
+\x8d\xda\xa4\x46\x54\xa4\x22\x15\x78\x39\xdf\x94\x0a\x46\xc2\x92\
+\x88\x09\xc4\x94\x0a\x26\xf0\x72\x3e\xeb\x68\xa7\x30\xbf\x4a\x0e\
+\x8d\x27\xb6\x22\x73\xda\x19\x53\x70\x5d\x13\x87\x7f\x47\x55\x54\
+\x9f\xf6\xd7\x72\x3e\x40\x9a\x88\x18\x44\x64\x04\x24\x20\x66\x90\
+\x0e\xbc\xbc\xcf\xb1\xaa\xe3\xca\x5b\x1b\x80\xeb\x9a\x74\x66\x4c\
+\x11\x44\x08\x44\xd2\x76\xff\xcd\xa4\x8a\xc5\xbb\xe0\x6f\x88\x00\
+\xaa\x18\x84\xd0\x16\xc3\x56\x8c\x20\x14\x84\x46\x40\x04\xa3\xa3\
+\x31\x14\x0b\xeb\x33\xd3\xd9\xfc\x09\x0c\x5f\x35\x0c\x22\x49\x0e\
+\x8d\x27\x7c\x23\x2d\xf5\x31\xe6\x0b\x6d\xfb\xf9\x56\x77\x0b\x2e\
+\x75\x36\x22\x62\x29\xdc\x48\x35\xa1\xef\xd4\x41\xe4\x0a\x3e\xce\
+\x27\xeb\xe9\x64\x43\x9c\xbd\x62\x78\x38\xd5\x5d\x5b\x07\x90\x30\
+\x00\x54\x47\x2d\x12\x08\x29\x22\xd4\xc4\x6d\x2c\xaf\xfb\x38\x77\
+\xac\x0e\x1d\x8d\x55\x98\x5b\x2e\xc0\xb6\x18\xc9\x86\x04\x9a\x6b\
+\xe3\xf8\xf2\x7b\x15\x31\xcd\xb4\xea\x2b\x02\x00\x86\x08\x4d\xdc\
+\x3b\x93\x17\x91\x59\xb2\x6d\xa3\x14\x9b\x62\x60\xf0\x74\xf2\x27\
+\xae\xa7\x9a\xa0\x15\xe3\xfd\xcc\x22\x6e\x77\x1f\xc1\xfc\x4a\x41\
+\x16\xbc\x40\xb4\x52\xf3\xd9\x96\xc5\x45\x00\xc4\xe9\xcc\x98\x02\
+\x80\xd0\xe0\x59\x48\x9a\x97\xd7\x8a\x26\x34\x82\xe9\x5f\x79\xbc\
+\x9b\x5e\x40\x4d\x85\xc6\xc7\xb9\x15\x44\x6c\x85\x4f\x73\x2b\x61\
+\x24\x5e\x49\x02\x0c\xa3\xbf\x3f\x4c\x3b\xa3\x8a\x00\x21\x38\x19\
+\xea\xac\x3c\x1b\x2b\x79\x98\x50\xb1\x44\x7b\xe0\xe5\x7d\x56\x64\
+\x15\x4b\x21\xd9\x8a\x41\x44\x12\x84\x26\xb0\xe3\x95\x1a\x7e\xe1\
+\x07\x8c\xe9\xca\x66\x7a\x96\x37\x23\x80\x04\x00\xa6\x06\x7b\x3c\
+\x12\xb9\x6c\xfc\x8d\xcf\x56\x62\x9f\x86\xd2\x1c\xd5\x36\x11\x2b\
+\x62\x4b\x73\xb4\xaa\x46\x23\x0c\xbe\x85\xa5\xd2\xc5\xac\xdb\xbb\
+\x84\x4c\x86\x40\x24\xbb\x4e\x39\x39\x38\x92\x50\x89\xca\x01\x80\
+\xae\x18\x09\x5a\x48\x88\xa0\xd4\x2c\x40\x23\x14\xfc\x79\x98\x75\
+\xfb\x97\xb6\x9f\x72\x39\x3b\x8a\xd2\xf1\xe0\x6d\x43\xbb\x33\x7a\
+\xa0\xac\x64\x3b\x3c\x7b\x36\x72\xb3\xba\xe5\xec\xae\xf8\x26\x7f\
+\x01\xc8\x4d\x38\x5a\x2a\xc8\x4e\x07\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x04\xec\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x04\xb3\x49\x44\x41\x54\x78\x9c\xa5\x96\xcb\x6f\x55\x55\
+\x14\xc6\x7f\x6b\xef\x7d\xce\x7d\xb4\xa5\x50\x28\x46\xc0\x14\x22\
+\xd1\x72\x51\x21\xd6\xb7\x83\x4a\x34\xa2\xa2\x03\x07\xb7\x46\x23\
+\x46\x63\xe2\xcc\x3f\xc0\x44\x3d\xdc\x18\x8d\x03\x8d\x23\x13\x4d\
+\x9c\x18\x13\x35\xb7\x46\x1d\xe0\x00\x06\xd6\x57\x8c\x8f\x6a\x14\
+\xc8\x0d\x10\x8d\x1a\x54\xc0\x16\xb1\xde\xf6\x3e\xce\x3d\x7b\x2f\
+\x07\xb7\x94\x0a\x94\xf8\x58\xb3\xb3\xb2\xd6\xb7\xd6\x3e\xdf\x5e\
+\xdf\xda\xc2\xbf\x31\x55\x01\x40\x04\x40\xff\x55\xee\x92\x56\xae\
+\xda\x72\x55\xed\xd9\xee\xaa\x2d\x57\xab\x16\x90\xff\x06\x9c\x24\
+\x06\xf4\x6f\xc9\x23\xcf\x4e\xf6\x6f\x79\x61\x62\xf9\x59\x98\x89\
+\x9a\xa5\x60\xce\x5d\xbd\x5c\xb5\x8c\x8f\x79\x80\xd2\x53\x13\xb7\
+\x29\x7a\x0f\xc1\x8f\xa0\xe1\x42\x40\x10\x39\x8e\x98\x6f\xd5\xb8\
+\xf1\x83\x8f\xdf\xf4\x2e\xa0\x8b\x73\xce\x5f\x60\x3e\xf0\xd2\xc7\
+\xdf\xbd\xd4\xe6\xfa\x5e\x14\x17\xdf\x2c\x62\x50\xdf\x41\x7d\xd6\
+\x8d\x31\x16\xe3\x62\x14\x45\x3b\xe9\x67\xbe\xd9\x7c\xf4\xd0\x33\
+\x3b\x26\xcb\xd5\xaa\x1d\x1f\xfb\x7b\x11\x39\x27\xf8\x13\xbb\xb7\
+\xb9\x5c\xef\x5b\x38\x37\xe0\x9b\xb3\x1e\x41\x05\x0c\xca\x29\x92\
+\x55\x55\x15\xc0\xe6\x8b\x56\xbd\x6f\x86\x4e\xeb\xfe\x83\x95\xdb\
+\xdf\x2e\x97\xab\x76\x7c\xd1\x49\x4e\x17\x48\xd4\x50\x41\x4b\xc9\
+\x9e\x8b\x71\xf1\x24\x22\xfd\x21\x6d\x65\x62\x8c\x5b\xea\xff\x02\
+\x28\x9a\x19\xe3\x1c\xc6\x74\x7c\x27\xbb\xe1\x50\xe5\xd6\xc9\x2e\
+\x96\x04\x80\x45\xe4\xec\x02\x44\x15\x5e\x31\x51\xee\x1f\x81\x77\
+\x3b\x14\x17\x7c\xe6\xc5\xb8\x48\x34\xbc\x5a\x4a\xaa\x71\x17\xab\
+\xdb\xbc\x01\x28\x97\xab\x96\x4a\x25\x0c\x27\x7b\x6e\x35\xf9\x9e\
+\xd1\xac\x59\xf7\xd6\x59\x07\x60\x8d\xcc\x5f\xfb\x6e\x86\x11\xc1\
+\xc8\x69\x1f\x80\x31\xc6\x6a\xa7\x91\xb9\x9e\x65\x25\xa5\x7f\x8c\
+\x4a\x25\x8c\x26\x13\x76\xa1\xc0\x6f\xa5\xc1\x6e\xb8\xe1\x7e\x31\
+\x46\x55\xd1\xd9\x56\x97\xd0\x99\x66\x07\x1f\x14\x23\x42\x16\x94\
+\x46\x9a\x31\x97\x66\xa4\x59\x40\xa4\x3b\x73\x69\xe6\x69\xb4\x03\
+\xa2\x41\x11\xdd\x09\xf0\x61\x6d\x4a\xe7\x9b\x52\x01\x81\x24\x91\
+\x61\xb9\x7e\xbf\xb8\x7c\x29\xd2\x34\x5c\xb7\x61\xa5\xf9\xf8\xbb\
+\x69\x6e\x19\x5e\xcd\xe7\x3f\xfc\xce\xf4\x5c\xca\xea\xbe\x1c\x1b\
+\x56\xf5\xe0\x8c\x70\x74\xa6\xc5\x8f\x27\xe6\x50\x60\xe3\x60\x2f\
+\x03\xc5\x48\x3f\x3f\x52\x97\x82\x84\xa3\x79\x5d\xb9\xf1\xab\xca\
+\x55\x0d\x54\xc5\xcc\x0f\xbc\x8e\x14\xee\xea\x33\xc8\x05\x3e\xeb\
+\x50\x88\x8c\x3c\x7c\xe3\x7a\xb2\xa0\x3c\x76\xdb\x30\x4f\xee\xd8\
+\xc4\x89\xd9\x36\x17\xf6\xe7\xb9\x7b\xeb\x1a\x86\x06\x8a\x3c\x70\
+\xdd\x10\x8d\xd4\xd3\xea\x78\x1e\xbc\x7e\x88\x35\xfd\x05\x5a\xed\
+\x14\x84\x55\x0d\x37\x33\xd8\xa5\x75\x97\x2c\x90\x9c\xe5\xea\xa2\
+\xd2\x25\x46\x15\xfe\x6c\x65\x14\x63\xcb\x27\xdf\x4f\x73\xc1\xb2\
+\x3c\x63\x23\x17\x71\x6c\xa6\x45\x6c\x0d\xef\x7c\xf3\x0b\xeb\x57\
+\x16\x59\x5e\x8c\x58\xbb\xbc\xc0\xaa\xde\x1c\xef\x1d\x38\x4a\x7f\
+\x3e\xc2\xab\xe2\xc9\x16\x70\xcd\xa9\x8b\x7a\xc9\xa7\x53\x75\x54\
+\xa7\xc4\x3a\x10\x51\x33\xef\x8f\xac\x61\xd7\xee\x1a\x0f\xdd\x30\
+\xc4\xda\x15\x05\x00\x7e\xf9\xa3\xc5\xcf\x27\x9b\x6c\x59\xb7\x9c\
+\xab\x87\x56\x70\xf0\x58\x9d\x93\x8d\x14\x17\x39\x08\x7a\xd2\x65\
+\xf1\xd4\xfc\x09\xd4\x80\xe8\x68\x32\xe1\xc6\xc7\xc7\xbc\x20\xdf\
+\x8a\x8d\x14\x34\x04\x55\x54\x95\x42\x64\xf9\x7e\x7a\x8e\x37\xbe\
+\x3c\x42\xe5\xce\x12\x8d\xd4\x93\x73\x86\xbd\xb5\xe3\xdc\x32\xbc\
+\x9a\x6b\xd6\x0f\xb0\xb7\x76\x9c\x62\xec\x82\x9a\x48\xc5\x98\x5a\
+\xad\xb2\x6d\x96\x44\x0d\x22\x5d\x91\x5a\xbd\xf9\x26\x05\x50\x31\
+\xaf\x83\x8a\x28\x52\x8c\xbb\x23\x10\x3b\xc3\x60\x6f\x8e\xd7\xbf\
+\x3c\xc2\x54\xbd\xcd\xe6\x35\xcb\x88\xac\xe1\xa3\xef\xa6\xd9\xb2\
+\xae\x9f\xc1\xbe\x1c\x5f\x1f\xf9\x83\x62\x6c\x14\xe3\x44\xe0\x4d\
+\x80\x51\x3e\x30\x0b\xc3\x00\x08\x49\x22\xe5\xcd\x9b\x65\xdf\x81\
+\x65\x5f\xe4\x7b\x7a\xaf\xdc\x34\x60\xfd\xfe\x5f\xeb\xb6\xb4\xa6\
+\x8f\xc3\xc7\x66\x99\x4b\x33\x06\x7a\x62\x36\x0e\xf6\x32\xf9\xd3\
+\x49\x7c\x50\x2e\x5f\xdb\x4f\x2b\x0b\x1c\x3e\x56\xf7\xc5\x62\xc1\
+\xfa\x4e\xfb\xc7\xa8\x7e\xfc\xb2\x7d\xcf\xed\x6c\x74\x91\x45\xcf\
+\x90\x0a\x09\xa5\x64\xcf\x56\x75\xd1\x67\xad\xb4\x93\xcb\x59\xcd\
+\x5a\x9d\xe0\xf2\xce\x62\x0c\x64\x5e\x69\x67\x81\x9e\xd8\x82\x40\
+\x33\x0d\x88\xa8\x2f\xc4\x91\x60\x63\xa3\x69\xeb\xe6\x5a\x65\xfb\
+\xfb\x8b\x95\xf5\xb4\x54\x54\x24\x94\xcb\x55\x5b\xab\x6c\xff\x46\
+\xb3\xf6\x7d\xbd\x85\x7c\xdb\xc6\x05\x57\x8c\x4d\x26\x82\xd7\xa0\
+\xea\x8c\x68\x6f\xce\xaa\xaa\x6a\x08\xf8\x42\x2c\x59\xb1\x50\xb4\
+\xd8\xc8\xf8\xf6\xec\x23\xb5\xca\xf6\xf7\xcb\x67\xc8\xf6\xd9\x72\
+\x5d\xad\x5a\xc6\xc6\xfc\xa6\x27\x76\x5f\x4b\x5c\x7c\xc9\xc6\xf9\
+\xad\x1a\x3c\x9a\xa5\x68\xe8\xe6\x89\xb1\x88\x8d\x10\xeb\x08\x69\
+\xfb\x70\x68\x35\x1f\x3d\xf8\xf4\x1d\x7b\x47\x93\x09\xf7\x61\x65\
+\x5b\xb6\x18\xee\xbc\x0b\x67\xe4\x91\x97\xa3\xd6\xba\x8d\xf7\xaa\
+\xc8\x3d\xaa\xfe\x0a\x82\x0e\xaa\x20\x82\x9c\x10\x91\x9a\x2a\x6f\
+\x45\x7f\xfe\xfa\xda\xbe\xe7\x1f\x98\x3b\xd7\x2e\x58\xba\xc0\x22\
+\x4e\x4e\x7d\x8e\x24\x93\xc5\x86\x9b\x19\x0c\xce\x88\x6d\x31\x5d\
+\xab\x6c\x9b\x3d\xb3\xa1\x25\xb1\xce\x63\x52\xae\xaa\x3d\xe7\xce\
+\x4d\x12\x33\x9a\x4c\xb8\x33\xf7\xf6\xff\x30\x15\x92\xc4\x90\x24\
+\x66\xe1\xf9\xf2\x0f\xec\x2f\xc4\x18\x28\x94\xd0\x8a\xde\x56\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\x9a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x06\x61\x49\x44\x41\x54\x78\x9c\xc5\x97\x6f\x8c\x54\x57\
+\x15\xc0\x7f\xe7\xde\xf7\xde\xbc\xfd\x33\xbb\xc0\x42\x0b\x4a\x6d\
+\x6d\x53\x58\xba\xac\x31\xa0\xb5\x21\xa9\x0b\x29\x76\x03\x49\x49\
+\x49\x9d\x25\x46\x63\xfc\xe6\x07\x63\x93\x9a\x26\x46\x89\xfb\x76\
+\x68\x25\x36\x36\x7e\xd0\x0f\xfe\xfb\x66\x34\x36\xb3\x24\x60\x2a\
+\x28\x12\x29\x9b\x34\x52\xb0\x06\x6c\x70\x00\xb5\x95\x96\x58\x83\
+\xb8\xbb\x94\x65\x77\xe7\xcf\x7d\xf7\xf8\x61\x66\x76\x67\x96\xa5\
+\xd4\x82\xe9\xf9\x34\xf7\xdd\xf7\xce\xf9\x9d\x73\xcf\x3d\xe7\x0c\
+\x7c\xc0\x22\xb7\xf4\xad\x6a\xfd\x97\x00\xe8\xff\x1f\x20\x49\xcc\
+\x00\x9b\xcd\x58\xf1\xb2\x32\x3a\x94\xb6\xee\xa9\x19\xe0\x98\x19\
+\x63\xb3\x27\x2f\xfe\xf6\x02\x24\x89\xa1\xaf\x4f\x18\x6a\x32\x9a\
+\xa8\xe9\x8f\x0f\x76\x43\x37\xd1\xb2\xb6\x6b\x7f\xfa\xf2\x27\xaa\
+\xcd\x7b\x30\x02\xf9\xfc\x4d\x41\x6e\x0e\x50\x28\xd8\x86\xe1\xde\
+\xe4\xc8\x1a\x1b\xd8\xc7\xbd\xf7\x0f\x83\x5f\xa3\xaa\xcb\x11\x41\
+\xd0\x2b\x60\xfe\x8e\x31\xc7\xc5\xb9\x03\xc5\xfc\xe0\xe9\x85\xdf\
+\xbe\x3f\x80\xba\x82\xb5\x5f\xdf\x7f\x8f\xe9\xe8\x1e\x16\xf1\x9f\
+\x33\x51\x47\xac\xde\xa1\xa9\x03\x5f\xd7\x6d\x2c\x62\x03\xc4\x58\
+\xd2\xf2\x8c\x17\xb1\xfb\x9d\x9b\xdd\xf3\xd7\xfc\xf6\xd7\x6e\x06\
+\x71\x43\x80\x81\xe4\xa5\x60\x2c\xbf\xc5\xad\xfd\xd6\xc1\x27\x6c\
+\xd4\xfe\x63\x13\x65\x7a\xd2\xd9\x29\x14\x75\xa8\x48\xcd\x71\xad\
+\x7d\x2f\xa2\x80\x6a\xed\x41\x60\xe3\x2c\xde\x95\x4b\x9a\xba\xa7\
+\xce\x26\x8f\xfe\xe8\xdd\x20\xcc\xbb\x19\xef\x1d\x3e\xf4\x54\xd0\
+\xde\xbd\x0f\x4d\x7b\xdc\xf4\x3b\x0e\x50\x41\x02\x11\x2c\x60\x10\
+\x11\x44\xa4\xae\xc7\x0a\x12\x80\xe0\x4a\x53\x4e\x53\x17\xdb\xb6\
+\xec\x0f\x7b\x47\x0e\x7f\x97\xa1\xa1\x74\x20\x79\x29\x78\x6f\x11\
+\xa8\xd3\xae\x4b\x0e\x3e\x6e\xe2\xee\xfd\xbe\x32\x93\xa2\x5e\x40\
+\x16\x85\xbd\xa1\xa8\xaa\x0a\x69\xd8\xb1\x34\xa8\x4c\x8d\x3f\x79\
+\x7e\xcf\xf6\x1f\xe4\x0a\x05\x3b\xba\x20\x12\xad\x00\x49\x62\x18\
+\x19\xd1\xfe\x91\xdf\x7c\xd8\x99\xe8\x8c\x18\xc9\x6a\x5a\xe5\x7f\
+\x36\xde\x04\x81\xb5\xa9\x48\x20\xde\x95\x1e\x3c\x97\xdf\x76\x8a\
+\x5c\xc1\x34\x5f\xe1\x16\xc5\xb9\xbe\x3e\x41\x44\x1d\xe6\x59\xdb\
+\xd6\xd1\xed\xab\x15\xff\xbe\x8d\x03\x88\x88\xa6\xa9\x48\x10\x5a\
+\x81\xef\x01\xca\x03\xb9\x96\x82\x35\x1f\x81\x24\x31\xe4\xf3\xbe\
+\xef\x99\x43\xf7\x79\x1f\x9c\x05\x6c\x3d\xc9\x6e\xa5\x5a\xd6\x45\
+\xbd\x09\x63\xa3\x95\x99\x87\x8b\xf9\xed\x2f\x37\x27\xe5\x9c\x77\
+\x03\x6c\x36\x00\x69\x6a\x3e\x6b\xe3\x6c\xa8\xea\xfd\x62\xc6\x65\
+\x11\x9c\x86\x4b\x0b\xb7\x04\x50\x05\x05\x2f\x41\xa4\x5e\xec\xe7\
+\x01\x06\xfe\xb2\x62\xee\xd5\x39\x80\xb1\xe2\xe5\x86\x9e\x4f\xab\
+\x4f\x11\x6d\x35\xd5\x50\x56\x71\x1e\xb3\x80\x22\x30\xb5\x75\xaa\
+\x3a\x07\x21\x80\xf3\x4a\x60\x05\x83\x18\xef\xaa\x22\x5e\x37\x01\
+\x8c\xe5\x37\x2f\x92\x03\xa3\x43\x29\xb9\x82\x05\x59\x83\xaf\xa2\
+\xaa\x62\x44\xf8\xe9\x17\x36\x72\xd7\xd2\x36\x3a\x32\x01\xbf\xfe\
+\xca\x26\x3e\xf5\xd1\x65\x4c\x95\xaa\x78\x55\xee\xec\x8a\xf9\xfe\
+\xae\x8f\xb3\xb2\x2b\xe6\x67\x5f\xfa\x24\x77\x64\x63\x2a\xa9\x27\
+\x30\xc2\xe4\x6c\x95\x2f\x3e\x74\x37\x4f\x6f\x5d\xc3\x95\xd9\x8a\
+\x18\xef\x50\x91\xbb\x7b\xf7\x1e\xe9\x01\xd1\x46\x0d\xa9\x01\xd4\
+\x17\xfd\x1b\xda\xbb\x50\x7a\xd4\xa7\x20\x35\x67\xee\x5d\xd1\x41\
+\x14\x18\x8c\x08\xf7\xad\xe8\xe4\xb9\x9d\xfd\x64\xe3\x90\x8a\xf3\
+\x84\x56\x58\xb7\x32\xcb\x85\xf1\x69\x00\x1e\xeb\x5f\xc5\xb5\xb2\
+\x43\x44\x88\x03\x43\x6e\xe3\x6a\x4e\xbe\x39\x51\x2b\x15\x9a\x22\
+\x42\xb7\x3a\xb7\x1c\x80\x91\x11\x69\x8d\x00\x90\x96\x82\xf9\xea\
+\x56\x97\x72\xd5\xe3\x3d\xb4\x47\x96\x53\x17\xaf\x70\x61\x7c\x86\
+\x67\x77\xf4\x31\x39\x53\xc5\x88\x50\x76\x1e\xaf\xf0\xf3\x13\x6f\
+\xb1\x6d\xfd\x9d\xc4\x81\xe5\x6a\xa9\xca\xa6\x7b\x7b\x50\x55\x0e\
+\x17\x2f\xd1\x15\x87\xa4\xbe\x76\xc2\x9a\xb6\x9e\x5f\x0d\xa0\x56\
+\x4a\x59\x41\xe6\xaa\x88\x99\x14\xb1\xa0\xb5\xdc\x6a\xbc\xae\x28\
+\xed\x91\xe5\x6b\xfb\xfe\xcc\x96\xb5\x2b\x78\xec\x63\xab\x98\x9c\
+\xae\x60\x44\xe8\x8a\x03\x8e\x9c\xbb\x44\x36\x0e\xd9\xf0\x91\x25\
+\x8c\x4f\x57\x78\x62\xc3\x6a\x7e\x7f\xfe\x32\x53\x25\x87\x35\x20\
+\x62\x50\xb8\x16\x45\xe5\xc9\x7a\x04\xb4\x35\x02\x89\x9a\xb1\xfc\
+\x16\xa7\xa2\xaf\x8b\x0d\x50\x69\x1d\x30\x54\x21\x0e\x2d\x97\xae\
+\x96\x19\x7e\xb1\xc8\x73\x3b\xfb\xe9\x6a\x0b\x29\x3b\x4f\x14\x18\
+\x2e\x5d\x2d\x73\xfc\x8d\x71\xb6\xad\x5f\xc9\x92\xb6\x90\x0d\x77\
+\x2d\x61\xff\xa9\x7f\x92\xcd\x04\x78\x45\x09\x42\x50\xbd\x78\xe6\
+\x9b\x3b\xfe\xdd\xec\x74\xd3\x35\x3c\x66\x6a\x9e\xfa\x3f\x60\x83\
+\xb9\x08\x78\x9d\xe7\xa8\x38\xcf\xb2\x8e\x88\x17\x5e\xbd\xc8\xe9\
+\x8b\x57\xf8\xce\xce\xf5\x4c\x95\x6a\x63\x40\x7b\x64\x39\x70\xfa\
+\x6d\xfa\x56\x75\xb1\x6b\xe3\x6a\x2e\x4c\x4c\x53\xfc\xd7\x55\xda\
+\x22\x8b\x57\xf5\x26\x88\x54\x8c\x39\x89\x88\x36\xf7\x85\xf9\x6b\
+\xc8\x31\x0f\x20\x6a\x46\x7d\x69\x5a\xc5\x88\x01\xb4\x33\x13\x60\
+\x44\x10\x81\xce\x4c\x80\x57\xa5\x2b\x0e\xf9\xc6\xaf\xce\x70\xff\
+\x1d\x59\xfa\x3e\xd4\x45\xa9\xea\xe9\xcc\x04\xfc\xf1\xcd\x49\x66\
+\xab\x29\xcf\xec\xe8\xe3\x17\x27\x2e\xce\x5f\x57\xa5\x56\x11\xbd\
+\x7f\x01\x60\xac\x6f\xee\xca\x37\x1d\x41\x3e\xef\x73\xb9\x82\x3d\
+\x97\x1f\x3c\xa3\xde\xbd\x68\xe3\x4e\xa3\xf8\xf4\xf8\x1b\x13\x4c\
+\x57\x1c\x65\xe7\x79\xe5\x1f\x13\x78\xaf\x64\x02\xc3\xf8\x74\x85\
+\xa7\xf7\xbd\x56\x7b\xa6\x8a\x08\x54\x53\xcf\x81\xd3\x6f\x73\xf2\
+\xc2\x24\x2f\xbf\xfe\x1f\x3a\xe3\x80\xd4\x6b\x6a\x33\xed\x36\x2d\
+\x4f\x9f\x2a\x32\xf8\x3b\x92\xc4\x34\xb7\xe6\x05\xcd\x48\x0d\x79\
+\xf4\xfe\x3d\x47\x7a\x03\xb1\xa7\x51\xb5\xa5\x72\xc5\x64\x02\x2b\
+\x00\xe5\x34\x25\x0e\x6c\x8d\x5c\x84\x52\x35\x25\x55\xa5\x2d\xb4\
+\x34\x12\xb6\xe2\x3c\x95\xd4\xd3\x11\x05\x75\xdf\xc5\x99\x30\x0e\
+\xb5\x3c\xfb\x48\x31\x3f\x78\x74\xe1\x6c\xd0\xda\x68\xf2\xe2\x29\
+\x8c\x9a\xbf\x0d\x3f\x7a\x56\x5d\xf9\xab\x36\xee\xb4\x6d\x51\xe0\
+\x04\x55\x11\x68\xaf\x1b\x6a\xe4\x46\x1c\xda\x86\xa1\xb9\x44\x8d\
+\x02\x43\x36\x13\xd6\x96\xaa\x2e\xe8\x58\x12\xa6\xa5\x6b\x7b\x8b\
+\xf9\xc1\xa3\xb9\x45\x06\x93\xeb\x3b\x5d\x7d\x78\x38\x97\xdf\xfe\
+\x13\x37\xf3\xce\xf3\xb6\xbd\x3b\x44\x04\x55\x6d\x5c\xe5\x16\x88\
+\xe6\x24\x6d\x40\x78\xaf\x29\xe0\xc3\xce\xa5\xa1\x9b\x9a\xf8\xe5\
+\xb9\x3d\xdb\x77\xd7\x67\x81\xeb\x86\xd4\x1b\x76\xba\xc6\xf0\xb0\
+\x2e\x7f\xf8\x49\xb1\xd1\xf3\x62\x83\xd0\x97\xa7\xbd\x82\x17\x30\
+\x28\x32\xdf\x99\x14\x10\x55\xd4\x8b\x8a\x98\x4c\x6c\x01\xd4\x55\
+\xf6\x16\x87\x3f\xb3\xbb\x76\xb4\xb5\xb1\xed\x3d\x03\xd4\x29\x2c\
+\xa3\x43\xe9\x03\xc9\x6f\x1f\xc4\x86\xdf\x16\x6b\xb7\x4a\x10\xa1\
+\xae\x82\xa6\x0e\xad\x0f\xa5\x62\x0c\x98\x10\x13\x84\xa8\x4f\xd1\
+\xd4\xbd\x92\xfa\xf2\xc8\xf9\x64\xdb\xe1\x7a\x9b\x5f\xd4\xf8\xcd\
+\x01\x9a\x22\x01\xb0\x3e\x7f\x74\xc0\x8b\xdf\x85\xf2\x90\xaa\xbf\
+\x07\xfc\x12\x10\x10\x99\x42\xcc\x5b\x88\xbc\x8a\x32\x7a\x76\xf8\
+\x91\x43\xc0\x6d\x18\xcb\x1b\x92\xa8\x61\x04\x6d\x54\x2f\x80\xde\
+\xbd\x27\x7a\xd4\x4d\x2c\x87\x88\xd0\xea\x95\x33\xbb\xb7\x5e\x5a\
+\x40\x6e\xaf\xfb\xf7\x74\xcb\x92\x2b\xd8\x1b\x4d\xb7\xb5\x6d\xb5\
+\xb9\x42\xc1\xde\x68\xff\xf6\x8a\xaa\x90\x24\x86\x24\x31\xb7\x6f\
+\x74\xfb\x00\xe4\xbf\x2a\xb2\x14\xa4\xc6\xe8\xf3\x27\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x8f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x30\x00\x00\x00\x30\x08\x06\x00\x00\x00\x57\x02\xf9\x87\
+\x00\x00\x0a\x56\x49\x44\x41\x54\x78\x9c\xed\x99\x5b\x70\x5d\xd5\
+\x79\xc7\x7f\xdf\x5a\x7b\x9f\x7d\x74\x8e\x64\x39\x36\x10\xb0\xa1\
+\x06\x9b\x8b\x6c\x01\x19\x08\xc5\x04\x8c\x65\x27\x30\x80\xc3\xa4\
+\x0d\xe9\x51\xdb\x64\x3a\xd3\x3c\x64\x62\x4a\x3b\x93\xb6\x0f\xc1\
+\xd3\x24\x47\x07\x4c\xd2\xa6\x0f\x69\x1f\x92\x69\x3b\xd3\x99\x84\
+\x0c\x49\x39\x67\x1a\x42\xd2\x61\xb8\x24\xb1\x35\xd0\x71\x1b\x4c\
+\x42\x0a\x36\xb6\xb9\xa4\xbe\x90\xd6\xc6\x48\xb2\x64\x9d\xdb\xde\
+\x6b\x7d\x79\x38\x17\x49\xd6\x91\x2c\x5b\x36\x4f\xfc\x67\xf4\xa0\
+\xbd\xd7\xe5\xff\xdf\xdf\x65\x7d\xeb\x3b\xf0\x3e\xde\xc7\xa2\x20\
+\xe7\x6f\x69\x15\x74\xfa\x4e\xa2\x73\x0e\x5d\x04\xce\x9d\x80\xbc\
+\x9a\x01\x76\x1a\x80\xe1\xa1\x4d\x6e\x16\x61\x55\xc9\x95\x4a\xe6\
+\xd8\x9e\x0b\x65\x98\x4d\x9e\x82\x28\xb0\x68\x51\x8b\x16\x90\x2b\
+\x16\x6d\x29\x97\xf3\xa7\x12\xfe\x70\xfe\x47\x99\x7a\xfa\x03\x11\
+\x40\xdd\x48\xb2\xff\x8b\x1b\x26\x66\xcf\x55\x5b\x1a\xc4\xc3\xd9\
+\x5b\xe7\xec\x05\xe4\x8a\x96\xd2\xa0\x6b\xfd\xbb\xf6\xa1\x9f\xf6\
+\x63\xec\x7a\x71\xc9\x6d\x5e\x7d\xbf\xa0\x2b\x41\xb2\x8a\x02\x1a\
+\x0b\x72\x48\x45\xde\x14\x09\x76\x59\x23\xff\xf9\xea\x97\x36\xef\
+\x6e\xaf\x55\x2c\x5a\x06\xa7\xd6\x3a\xef\x02\x72\xc5\xa2\x2d\x35\
+\x37\xec\xdf\xfe\xb3\x4f\xa9\x67\xab\xe2\x37\xdb\xa8\xcb\x02\xa8\
+\x4b\x50\xe7\x40\x7d\x73\x17\x41\x6c\x80\x98\x00\x44\xf0\xf5\x2a\
+\x8a\x7f\x09\xe4\x5f\x27\x46\xde\xfd\xf6\x91\x6f\x0c\x56\xc8\xab\
+\x61\x08\x3d\xd3\x58\x39\x33\x01\xf9\xbc\x61\x68\x48\x11\xd1\xb5\
+\x85\x67\x3f\x26\x26\xd8\x2e\x41\x78\x0b\x80\xaf\x95\x51\x55\x87\
+\xa0\x82\x08\x20\xa8\x4e\xad\x2f\xe2\x15\x55\x00\x51\xac\x49\xa5\
+\x45\x6c\x88\x4f\xea\x07\x7c\x9c\x3c\xb2\xaf\x70\xe7\xa3\xcd\xaf\
+\x33\xc3\xb2\xe7\x4e\x40\x3e\x6f\x28\x14\x3c\xe4\xcd\xda\x87\x36\
+\x3c\x22\x36\x7c\x50\x44\x70\xb5\x8a\x13\x04\x04\xbb\xe0\xb5\x00\
+\x50\xaf\x8a\x9a\x30\xb2\x26\x4c\xe1\xe2\xda\xf7\xca\xef\x1c\x7c\
+\xe0\xe0\x3f\x7e\x76\xec\x4c\x5c\x6a\x61\x02\xf2\x6a\x28\x88\xbf\
+\x72\x5b\xf1\xc2\x54\xe6\x82\xef\x98\x28\x73\x8f\x2b\x9f\xf0\xaa\
+\xa8\x9c\x31\xf1\x53\xa1\x5e\xc1\x07\x5d\xbd\x81\x8f\x2b\xaf\xb8\
+\xea\x89\xcf\xec\xdf\xfe\xc9\x57\x16\x6a\x09\x73\x7a\xf2\x79\xc3\
+\x10\xda\xf7\xd5\xe7\x96\x87\xe9\x65\xcf\x99\xa8\xeb\x9e\x64\x72\
+\x2c\x06\xcc\xe2\xc9\x03\x88\x11\x24\x48\x26\xc7\x12\x31\xc1\x75\
+\x36\xea\xfd\xd9\xd5\xf9\x27\xaf\xa7\x34\xe8\x72\xb9\xe2\x69\xd7\
+\x3f\x9d\x05\x64\x20\xbf\xc3\x0e\xb3\xc9\xaf\x95\x9f\x3c\x65\x33\
+\xdd\x77\x25\x93\x63\xb1\x88\x09\x17\x4f\x7c\x36\xd4\xfb\xc4\xa6\
+\xb3\x81\x4f\xea\x6f\x8a\x4b\x6e\xde\xcb\xae\x31\x80\x86\xeb\x76\
+\xc6\xfc\x16\x28\x16\xcd\x70\x61\x73\xb2\x56\x9f\x7e\x24\xc8\xf6\
+\xdc\x95\x4c\x9e\x38\x6f\xe4\x01\xc4\x98\xc0\x55\x27\x13\x1b\x65\
+\xd6\x28\x3c\x4a\xa1\xe0\x73\xfd\xfd\xf3\x7e\xe4\xb9\x5f\x36\x7d\
+\xb0\xef\xcb\xcf\x0e\xd8\x74\x6a\xa7\x4f\x6a\x09\x8a\x9d\x77\xce\
+\x39\x82\xaa\xc6\x41\xb6\x37\x4c\x26\x47\x1f\xd8\x57\xd8\xf2\xad\
+\xc6\x81\x27\x1d\xe3\x61\x6e\x32\x79\x35\x30\x44\x1f\xb7\xec\xb6\
+\x51\xf6\x06\x5f\xab\xb8\x33\xcf\x34\x67\x09\x55\x95\x20\x54\xf5\
+\x6e\x5c\x43\xb9\x72\xdf\xb6\x3b\x46\x18\x1a\x92\x4e\xae\xd4\xd1\
+\x85\x06\xf2\x3b\x02\x0a\xe2\xd7\xf2\x91\x4f\xd8\x74\xcf\x0d\xae\
+\x56\x7e\xef\xc8\x03\x88\x88\x8f\x63\x6f\xd3\x3d\x4b\xb5\xe6\xff\
+\x02\x11\x1d\x60\x53\x47\xae\x1d\x1f\x6e\x62\x67\x4b\xe9\x17\x40\
+\xf5\x3d\xf0\x9a\x59\x10\x23\xc6\xd7\x2b\x6a\x84\xcf\x7d\x38\xbf\
+\x3b\x33\x5c\xd8\x9c\xd0\x81\xc8\x6c\x01\xf9\xbc\x29\x14\x0a\xfe\
+\x9a\x87\x7e\x7a\x0d\xd6\xde\xe6\x6b\x65\xce\x4d\xba\x3c\x63\x18\
+\x9f\xd4\xbd\x4d\x67\x57\x4c\x32\x72\x77\x93\xdb\x2c\x1e\xb3\x04\
+\xb4\x4c\x25\xde\x6d\xb4\x51\x26\x50\x74\x46\xf0\x08\xb3\x3f\x83\
+\x48\xe3\xaf\x13\xa6\x3f\x9f\x6f\x5c\xfb\xfd\xcc\xcd\x14\x31\x2a\
+\x86\x8f\x36\xb9\xcd\x9a\x33\x67\x1a\x15\xb8\xb5\x93\xeb\xc4\x4e\
+\x89\xfd\x54\xbd\xe5\xbc\x52\x4f\x3c\x71\xa2\x48\x07\x76\xf5\xc4\
+\xe3\x55\x11\x81\x5a\xec\xa9\x27\xda\xd1\x21\x05\xa8\x25\x9e\xba\
+\xd3\xb6\x48\x41\x44\x5d\x2c\xa8\x5f\x4f\x3e\x6f\x86\x87\x36\xcd\
+\xca\x44\xb3\x04\x4c\x0d\xf2\x7d\xea\x12\x9a\x85\x19\x02\xd4\x9d\
+\xe7\x9f\x3e\x73\x23\x43\x1f\x5f\x47\xa5\xee\xa8\xd4\x1d\x5b\x37\
+\xae\xe6\x89\xad\xb7\xb2\xf6\x92\x1e\xca\xb5\x04\x6b\x1a\x33\x62\
+\xef\x59\x9a\x49\xf1\xc3\xad\xb7\xb2\xe9\xea\x0b\xe9\x4d\x87\xfc\
+\xf8\x81\xdb\xc8\xdd\xb8\x92\x89\x6a\x63\x5c\x0b\xd6\x08\xe3\xd5\
+\x84\xfb\x37\xae\xa6\xf4\xb9\xf5\xa4\xac\x69\x88\x46\x8d\x26\x31\
+\x20\x97\xdf\x3c\xb2\xbe\x1b\x11\x9d\x51\x20\xce\x12\xa0\x2a\x88\
+\xe8\xba\x3f\x2b\x76\xab\xc8\xa5\xea\xe2\x16\xf7\xe6\x6b\xb8\x7e\
+\x65\x2f\x57\x7f\xb0\x1b\xaf\x8a\x57\x65\xd5\xb2\x0c\xd7\xae\x58\
+\xc2\xc3\x9f\xe8\x27\x15\x18\x9c\x6f\x7c\x61\x55\x08\xad\xd0\xbf\
+\x62\x09\x97\x2e\xcd\xf0\xfa\xb1\x93\x2c\xcb\x84\x7c\x7e\xe3\x6a\
+\x02\x2b\x78\x9d\xb2\x62\xe2\x95\x9e\x74\xc0\xe7\x6f\x5f\xcd\x58\
+\x25\xe6\xd8\x44\x8d\xd0\x9a\x46\x6d\xed\x9d\x62\x4c\xef\x68\x6f\
+\xb0\x12\x80\x21\xe6\x11\xd0\x42\xb4\x24\x85\x6a\x0f\xaa\x9c\xaa\
+\xb8\x5c\x4f\xa8\xc4\x53\x96\x4c\xbc\x12\x3b\xcf\xf5\x2b\x7b\xf9\
+\xc2\x47\xaf\x64\xac\x1c\x63\x8d\x69\x0b\xf6\xaa\x78\x94\x72\xec\
+\xf8\x97\xe7\x7f\xcd\xaa\x65\x19\xae\x5b\xd9\x4b\xb9\xee\x1a\xc5\
+\x94\x11\x26\x6b\x09\x1b\xae\xbc\x80\xee\x28\xe0\x9f\x9f\x7f\x8b\
+\xc0\x4c\xbb\x4e\xab\x22\xc6\x86\x58\xdf\x03\xc0\xde\xd2\xe9\x05\
+\xd8\x28\xd1\xb9\xae\x79\x46\x04\xd3\x74\x52\xaf\x90\x4d\x59\x0e\
+\x8f\x56\xf8\xfe\x8b\x87\xb9\x7f\x60\x0d\xeb\xaf\x58\xc6\x44\x35\
+\xc6\x36\xc7\x18\x11\xd4\x43\x77\x2a\xe0\x99\xd7\x8e\x92\x78\xe5\
+\xf7\x3f\xb4\x82\x5a\xec\xdb\xbe\xee\xbc\xf2\xe9\xdf\xbd\x8c\xdf\
+\x8c\x55\x78\xf1\xe0\x28\xd9\x28\xc0\x4f\x8b\x33\x54\x11\x6f\x3b\
+\xf3\xe9\xf4\xb0\x2b\x32\x0e\xa8\xcd\x9b\x32\x5a\x6b\x03\x51\x60\
+\x78\xf8\xa9\xd7\x38\x3a\x51\xe5\xeb\xf7\x5d\x47\x68\x0d\x4e\xa7\
+\x82\x55\x51\xa2\xd0\x70\x68\xa4\xcc\x8e\xfd\xc7\xf8\xbd\x0f\xad\
+\xa0\x37\x13\xe2\xbc\x52\x4b\x1c\xab\x96\x67\xd8\x78\xd5\x05\x7c\
+\xef\xc5\xc3\x94\x6b\x6e\x46\x7c\x34\xee\x45\xea\x54\x5d\xfd\xf4\
+\x02\x9a\x41\xf2\xf3\xc2\x96\x71\x51\x8e\x88\x0d\x40\x64\xce\x4a\
+\x10\x1a\x6e\x12\x05\x86\xd1\x72\x9d\x6d\x4f\xbc\xca\x55\x17\x75\
+\xf3\x97\x77\x5c\xd5\x74\xa5\x29\x22\x0a\x04\x46\x78\xec\xe7\x87\
+\x58\x96\x4d\xb1\xfe\xf2\x65\x54\x63\x47\xa5\xee\xd9\x72\xed\xc5\
+\x08\xc2\x93\xbf\xfa\x0d\xd9\xc8\x4e\xc5\x87\xaa\x8a\xb5\xa2\x3e\
+\x99\x48\x27\xc9\x21\x00\x8a\xb9\x19\x7c\x66\x59\x20\x57\x6a\x3c\
+\x13\xe1\x4d\x31\x01\xad\x6b\xe0\x7c\x48\xbc\xb2\xb4\x2b\xe4\x99\
+\xbd\x47\x29\xbe\x74\x84\xad\xb7\xaf\xe6\x23\x57\x2c\x63\xbc\x1a\
+\xb7\xc7\x78\xaf\x64\xa3\x80\x5d\x6f\x8d\x70\x6c\xa2\xc6\x1f\xde\
+\x74\x29\xb5\xc4\x13\x05\x86\x3f\xbe\xe9\x77\x78\xe1\xcd\xe3\xbc\
+\x75\x7c\x92\x74\x68\xa7\x76\x14\xf1\x62\x03\x04\x8e\xf4\xdd\x58\
+\x1e\x6f\x25\x99\x79\x05\x1c\xdb\xb3\x53\x00\xbc\xca\xae\x85\xb8\
+\x50\x0b\x4e\xa1\x27\x1d\xb0\xfd\xa9\xd7\x38\x3a\x5e\xe5\xef\x3f\
+\x75\x3d\x51\x60\x66\x14\x22\x41\x33\x5d\x96\x7e\x71\x84\x8f\xf5\
+\x5d\xc4\x92\xae\x90\xb5\x97\xf4\xb0\xe6\xc2\x2c\x8f\xfe\xd7\xc1\
+\x53\x5c\x07\x94\x46\x51\x07\x66\x77\x69\x70\xd0\x0d\x0c\xed\x3c\
+\xfd\x49\x3c\xdc\xff\x4e\x43\xa1\xd5\xe7\x7d\x5c\x45\x74\x61\x65\
+\x84\xaa\x12\x5a\xc3\x58\x25\xe6\xc1\x1f\xbe\x4a\xdf\xc5\x3d\xfc\
+\xf5\x1d\x57\x13\x3b\x8f\x98\xa9\xa0\xcf\xa4\x2c\x3f\xf8\xe5\xdb\
+\xa4\xac\xe1\xd6\x2b\x96\x73\x4f\xff\xc5\x8c\x55\x62\x9e\x7f\xe3\
+\x38\xd9\x28\xc0\xcd\x08\xde\xc6\xc1\x2f\xaa\xc3\x73\xed\x3b\x3b\
+\x88\x07\x07\x1d\xaa\xb2\xaf\xef\xc4\xcb\x3e\x8e\x7f\x65\xa2\x2e\
+\x60\xaa\x16\x77\x5e\x67\xe4\x70\xaf\xda\xde\xd4\x35\x5d\xe9\xd9\
+\xbd\x47\xf9\xfe\x8b\x87\xb9\xef\x86\x95\x58\x23\xd4\x93\x46\xc6\
+\xf1\xaa\x74\xa5\x2c\x07\x8e\x9e\xe4\xa5\x43\xa3\x7c\xf6\xb6\xcb\
+\xf9\xf8\xb5\x97\xf0\x83\x5f\xbe\xcd\x89\x4a\x4c\x30\xc3\x02\xaa\
+\x62\x03\xe3\xaa\x93\x63\x09\xa9\xff\x80\xe9\x87\xec\x7c\x02\x80\
+\x81\xa1\x9d\x8d\xae\x80\xe5\x5b\x62\x43\x69\xf7\x77\x80\xa5\x5d\
+\x21\x3d\x51\xd0\x68\x57\x29\x64\xa3\x80\xa5\x99\xa9\x4b\x9a\x53\
+\xa5\x27\x1d\xf2\xb5\x67\xf6\xf3\xbf\xef\x96\xb1\x46\x1a\x87\x52\
+\x53\x73\x8b\xe2\xb7\x77\x1d\x64\xc3\x9a\xe5\xac\x5a\x9e\xe1\xdf\
+\x76\x1f\x26\x93\x0a\xd0\x69\x1f\x46\xc1\xd9\x28\x23\xea\xfd\xe3\
+\x07\x0a\x9b\x8f\xe7\x8a\x45\xdb\xa9\x67\x14\x74\x12\x30\x5c\xd8\
+\xe4\x50\x95\x93\x7f\x55\xfa\x6e\x77\x8f\xfe\x8d\x49\x45\x97\x69\
+\x52\xf7\xd6\x88\xf9\xf7\x97\xdf\xe6\xdd\x93\xf5\x06\x29\x03\x2f\
+\xbc\x71\x9c\xb7\xc7\x2a\xed\xb3\xa1\x75\x02\x8f\x57\x62\x1e\x7c\
+\xe2\x15\xfe\xe8\xa6\xcb\x78\xfd\xd8\x04\xa9\x66\x3c\xa8\x2a\xd9\
+\xc8\xf2\xc2\x1b\xc7\x29\xfd\xe2\x08\xff\x77\xa2\xca\xaf\x8f\x4f\
+\x92\x0e\x0d\xd3\xbc\x47\x45\xac\x71\xd5\xc9\xd8\x07\xf2\x77\xa0\
+\x52\xda\xd3\xb9\x8f\x3a\x77\x94\x16\xd5\x32\x28\xee\x9a\xfc\xd3\
+\x9f\x0e\x33\x4b\x1e\x4b\x2a\xe3\x89\x41\x82\xf1\x5a\x82\x15\x21\
+\x9b\xb2\x20\x50\xae\x3b\x12\xd7\x28\x05\xa6\xc3\x88\x50\x8d\x1d\
+\xd5\xd8\xd1\x95\xb2\x6d\x01\x6d\x86\x0a\xe3\xd5\x46\xaa\x6d\x59\
+\xb4\xfd\xce\xfb\x24\xe8\xfe\x40\x90\x9c\x1c\xf9\xfa\xbe\x87\xb6\
+\x7c\x71\x7a\x27\x70\xe1\x02\xa0\xdd\xb3\xec\xfb\xca\xd3\x8f\x07\
+\xdd\xbd\x83\xc9\xc9\xb1\x24\x08\x6c\xd0\x2a\x11\x5a\x44\x45\x98\
+\x19\x7c\xd3\x44\xb4\x7c\xbf\x53\x32\x6e\x65\x9d\xe9\x73\x55\xd5\
+\xd9\x28\x63\x7d\x5c\xfd\x9f\xb2\x0f\xd7\xdf\xbc\xf7\x9d\xb8\x54\
+\x9c\xdd\x3c\x5e\x98\x00\x55\xc9\x0f\x21\x8f\xf1\xdf\xdd\xa1\x9d\
+\xd8\x65\xc2\x68\x9d\xab\x4c\x26\x62\x4c\x47\xd7\x5b\x2c\x54\xd5\
+\x99\x20\x34\x60\xc6\x93\xa4\x76\xcb\x81\xc2\xdd\xfb\x5a\x4d\xb5\
+\xb9\xe6\xcc\xdf\x56\x11\xd1\xc2\xde\x92\xbc\x51\xb8\x65\x3c\xa9\
+\xd7\xfe\x40\x5d\x72\xdc\xa6\xb3\x81\x7a\x9f\x9c\x17\xf2\x36\xb4\
+\x18\xab\xae\x5e\xf9\x93\x03\x85\xbb\xf7\xe5\x8a\x45\x3b\x1f\x79\
+\x58\x48\x67\xae\x34\xe8\x28\x16\xed\xeb\xdb\xef\x7d\x2d\x2e\x9f\
+\xb8\x53\xbd\x3b\x10\x64\x97\x04\x8a\x4f\x66\xa4\x8d\x45\x71\xd7\
+\xd8\x46\x19\x8b\x31\xa3\x49\xf5\xe4\x7d\xfb\x1f\xde\xf2\xe3\x81\
+\xfc\x8e\x60\x2e\xbf\x3f\x33\x01\xd0\x38\x1b\x8a\x45\xfb\xfa\x57\
+\x3f\xf9\x72\x7d\xf2\x9d\x0d\xae\x5e\xf9\x51\x90\x59\x1a\x60\x03\
+\x51\xf4\xec\x84\xa8\xaa\xa2\x09\x88\x04\xd9\xde\x50\xd5\xef\x26\
+\xae\x6c\x38\xf0\xf0\xbd\x4f\x0e\xe4\x77\x04\xcd\x4b\xfc\x69\x71\
+\x66\xed\x86\x69\x0d\xd7\x75\x85\x9f\xfc\x39\xd6\x7c\xd9\x84\xe9\
+\x8b\x7c\xbd\x8a\x4f\xea\x53\xad\x75\x55\x33\xed\x22\xd7\x26\x8c\
+\x34\xae\x08\x28\x62\xac\xb5\x26\xca\xe0\xe3\x5a\x19\xe7\xbf\x39\
+\x3e\x36\x92\x3f\xf2\x8d\xc1\xca\x7c\x4d\xac\xc5\x0b\x68\x10\x69\
+\xcc\x11\xd1\x6b\xb7\x3d\xf9\x41\x97\xe9\xbe\x5f\x54\xfe\x54\xc2\
+\xd4\x2a\x31\x06\x75\x31\x9a\xc4\xa8\x77\xb4\x2d\x23\x22\x62\x6c\
+\xe3\x47\x0e\x1b\x82\x08\xae\x56\x1e\x11\x63\x1e\xf7\xb1\xfb\x87\
+\x7d\x85\x3b\x0f\x00\x9c\x2e\x60\xcf\x8d\x80\x26\xa6\xe7\xe6\x75\
+\xf9\x1d\xdd\x12\xea\x5d\xaa\xba\x11\xf5\xeb\x55\xfd\x1a\x54\x97\
+\x4b\x90\x12\x14\xd4\x3b\x54\xfd\xa8\xc0\x11\x8c\xdd\x2d\x62\x86\
+\x49\xca\xcf\xec\x2d\xdc\xfb\xff\x40\x33\x5d\xe7\xce\xea\xb7\xb2\
+\xc5\x75\xac\x54\x25\x57\xc2\x9c\x6a\xf2\xd5\x7f\xfb\x5c\x6f\x57\
+\x5d\x57\x88\x09\xb3\x71\x1c\x13\x62\xea\x92\x8e\x0e\xbf\xb2\xed\
+\xf6\xd1\xe9\xe3\x72\xc5\xa2\x2d\xed\xd9\xa3\xf3\x75\x9f\xdf\x23\
+\xa8\xe4\x8a\x6a\x07\xf2\x3b\x02\xd0\x79\x3f\x4a\x7b\x9c\xce\x3f\
+\x6e\xa1\x38\x3f\x3d\x43\x55\x61\x08\x69\x5f\xc0\xd7\xe5\xf4\x6c\
+\x7e\xc0\x7b\x1f\xef\xe3\x3d\xc0\x6f\x01\x41\x28\x18\x67\xda\xa2\
+\xe1\x78\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0e\x1e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x0d\xe5\x49\x44\x41\x54\x78\x9c\xed\x9b\x6b\x8c\x5d\xd5\
+\x75\xc7\x7f\x6b\xef\x73\x5f\x33\xe3\x79\xf9\x85\x6d\x08\x98\x87\
+\x6d\x3c\x60\x9e\xe6\xd1\x94\xd8\x6e\xe2\xb8\x81\x40\x48\xa5\x3b\
+\xa9\x5a\x55\xaa\x5a\x70\x08\x29\x0a\x7d\xa0\x8a\xb6\x70\xe7\x42\
+\x48\x9a\x42\x43\xa4\xa4\x95\x20\x55\xa3\x0a\x82\xca\x1d\x12\x95\
+\x24\x08\x82\xa1\xb6\x95\x96\x06\x23\x70\x71\x3c\x7e\xc5\xbc\x0c\
+\xc4\xc6\x36\xd8\xcc\xe3\xbe\xce\xd9\x7b\xf5\xc3\x99\xb1\x3d\x9e\
+\x7b\xc7\x73\xc7\x63\xb0\x54\xff\xbf\x5d\x9d\x7d\xf6\x5e\xeb\xbf\
+\xd7\x5a\x7b\x9d\xbd\xd6\x85\x53\x38\x85\x53\x38\x85\xff\xc7\x90\
+\x8f\x6d\x65\xd5\xd1\x6b\x8b\x00\xe8\x47\x2d\xc6\x47\x43\x40\x2e\
+\x67\xb2\x5d\x3d\xb2\xb7\x6f\x9d\xac\xdf\xb2\x4f\xe9\xed\xf6\xd4\
+\x52\x36\xa7\x66\x19\xeb\x0c\xc0\x7a\x96\x7b\xf2\xa2\x35\xc7\x4d\
+\x21\x4e\x1c\x01\xaa\x92\xed\xc5\xf4\x76\xe3\x41\xc6\x28\x71\xd1\
+\x83\x1b\xdb\x39\x78\x10\x00\x9f\x9e\x2e\xbf\x7a\x65\x5b\x3f\xbd\
+\xdd\xee\xe8\x71\xd9\x82\xda\xde\xbe\x1e\x25\x9f\xf7\x27\x42\xcc\
+\xa9\x27\xe0\x90\xe2\x72\x48\x99\xae\x07\xd6\x9f\x21\xe5\xf0\x72\
+\xaf\x7a\x99\x3a\xb7\x14\xa4\x03\x91\x73\x55\x15\x54\x11\x1b\x80\
+\x8b\xf6\x60\xec\x6e\x31\x76\x13\x22\xaf\x22\x76\xc3\xcc\xaa\xdb\
+\xb1\x3e\xbf\x22\x02\xa0\x50\xb0\xf4\xf5\x4d\x39\x11\x53\x4a\x40\
+\xb6\x50\xb0\xbd\xdd\xf1\x2e\x5e\x70\xe7\x93\xb3\x7d\x4b\xeb\x0d\
+\xa8\xfe\xb1\x3a\x77\xb1\x49\xa6\x9b\xc4\x04\xa8\x8f\x40\x3d\x1a\
+\x85\xa3\x5f\xb6\x01\x62\x2c\x62\x2c\xa8\xe2\xaa\xc5\x08\xb1\x3b\
+\x40\x7a\x6d\xc4\xbf\x6f\xce\xaf\xd8\x06\xc4\x44\x74\x67\x6b\x5a\
+\xd5\x64\x30\x35\x04\x8c\x04\x34\x11\xbd\xe0\xce\x27\x67\xbb\xa6\
+\x96\xaf\x80\xdc\x62\x93\xe9\xd9\xea\x42\x7c\x58\x41\xbd\x3a\x44\
+\x15\x15\x11\x01\x54\xcd\x51\x52\x28\xf1\x00\x45\x11\x11\xb1\x12\
+\x24\x31\x89\x14\xbe\x5a\xaa\xa8\xca\x63\xea\xc2\x6f\x6f\xcb\xaf\
+\xda\x0c\x40\x4e\x0d\x79\x39\x6e\x6b\x38\x7e\x02\x0a\x05\xcb\xf0\
+\xae\x2f\xbe\xf7\xf9\xdb\x10\xf3\x77\x26\x91\x9a\xe5\x2b\x45\xbc\
+\x8b\x9c\x08\x12\xaf\x23\x8d\xae\xa5\x80\xaa\xaa\x8a\x88\xb5\xe9\
+\x16\x5c\x54\xa9\xe2\x79\xa8\x32\xb4\xff\xae\xd7\xbf\xd5\xfd\xe1\
+\x91\x6b\x4f\x16\xc7\x47\xc0\xb0\x00\x8b\xfe\xe6\xe9\x39\x92\x4e\
+\xfc\xc0\xa6\x9a\x56\xf9\x4a\x11\xef\xa3\x48\x14\x8b\x34\xac\x74\
+\x3d\xa8\xaa\x7a\x11\xb1\x36\x33\x0d\x1f\x56\x76\x48\xa5\xf8\x27\
+\x7d\xf7\x5e\xf7\xdf\xc7\x4b\x82\x39\xf6\x90\xda\x58\x96\x5b\x1b\
+\xd0\xdd\xed\xba\xee\x7a\xea\x93\x26\x93\x7a\xd9\x26\xd3\xab\x5c\
+\xa9\x3f\x52\x17\xa9\x20\xc1\x14\x2a\x0f\xc4\x2e\x01\x68\x34\xf4\
+\x61\x24\xb0\x40\xd3\xcd\xeb\x16\xf7\x3c\xf7\x65\xba\xbb\x1d\x85\
+\x82\x05\x9d\xd4\x7a\x93\x13\x32\xb7\x36\x20\xbf\x22\x5a\x74\xf7\
+\x33\x37\x9b\x74\xe6\x9f\x71\x51\xe0\xa3\xd0\x0d\x0b\x79\xe2\xe1\
+\xd5\x63\x44\x6c\xa6\x45\x5c\x79\xe8\xa1\xad\xb9\xcf\xde\x12\xc7\
+\x84\x38\x8e\x34\x32\x55\xe3\x04\x14\xd4\xd2\x2d\x6e\xd1\xdd\x4f\
+\xdd\x6c\x33\xad\x0f\xfb\x6a\x49\x71\x5e\x31\x32\x69\x6b\x9a\x14\
+\x54\x15\xf0\xb6\xa5\xdd\xba\xc1\x0f\xbf\xbf\x35\xbf\x6a\xf5\x88\
+\x6c\x8d\x4c\xd3\x98\xd0\x85\x42\xac\xfc\x5d\x3f\xb9\xda\x24\x33\
+\x0f\xf9\xb0\xec\xd1\x8f\x41\x79\x00\x11\x41\xc4\x46\x83\x07\xc3\
+\x60\x5a\xfb\xcd\x8b\x72\xcf\xdc\x4e\xb7\x38\x72\x6b\x83\x86\xa6\
+\x99\xf0\xc8\x5c\xce\x90\xef\xd1\x0b\xee\x7c\x7e\x96\xcb\xb0\x49\
+\x44\x66\x6a\x18\x7e\x3c\xca\x8f\x86\x22\x38\x93\x48\x07\xae\x34\
+\xf8\xd9\x6d\xf7\x5e\xb7\xa6\x91\xc0\x38\x71\xe1\xb7\x74\x09\x88\
+\xba\x94\x7f\xc4\x24\xd3\xb3\x34\x0a\xfd\x49\xa0\x3c\x80\xa0\x6a\
+\xd4\x45\x2a\x89\xe4\x23\x4b\x72\x3f\x9f\x45\x36\xeb\xc9\xe5\x26\
+\x24\xdb\xc4\x14\x28\x14\x2c\xbd\xdd\x6e\xd1\xdd\x4f\x7f\xd5\x36\
+\x4d\x5b\xe9\xcb\x83\x11\x1f\x55\xc0\x9b\x10\xc4\xf8\x30\xf4\x36\
+\xd5\x3c\xbb\x8a\xff\x1e\x22\x1a\x6f\xd8\x04\xde\x3c\xe6\x88\xe1\
+\x2c\x6f\xd1\x37\x9f\xeb\x24\xe4\xd7\xc6\x98\x36\x8d\x42\x99\xe2\
+\x63\x6e\xaa\xe0\x4c\xaa\xc9\x52\x2e\xaf\xe8\xcb\xaf\x5c\x37\x11\
+\x57\x38\xb6\x05\xf4\x62\x10\x51\xa9\x44\xb7\x05\x99\xe6\x0e\xef\
+\x42\x7f\x92\x2a\x3f\xf2\xe1\xac\x4e\x5d\x0e\x80\xbe\xec\x31\x8f\
+\xc4\xf1\x15\x51\x15\x04\x16\xe4\x7e\x3a\xdd\x9a\xf4\x36\x11\xd3\
+\xa9\x2e\xe2\xa4\x25\x00\x00\xf5\x26\x99\x31\x54\xaa\x13\xb2\x82\
+\xf1\x2d\xa0\x67\x9d\x05\xd1\x40\x92\x5f\xb4\xe9\x96\xe9\xde\x45\
+\x27\xef\xee\x0f\x43\xc1\x8b\x0d\xf0\xf8\xd5\x00\xd9\xde\xf1\xc7\
+\x8f\xaf\x4c\x4e\x0d\x5b\x7a\x65\x51\x57\xdb\x0b\x36\x99\x59\xea\
+\x2b\x25\x8f\x70\x12\x05\xbf\x1a\x50\x55\x31\x16\x8f\x0e\xa9\x2f\
+\x2e\xdc\x9e\xbf\xf1\x37\xb1\x25\xd7\xce\x10\xeb\x5b\x80\xaa\x90\
+\x17\x7f\xd1\x79\x99\xd3\x44\x4c\x97\x86\x65\x01\x3d\x19\x8e\xbd\
+\xf1\x21\x22\xaa\xce\x07\xa9\x4c\x4b\xc2\xa6\xaf\x00\xa0\xb7\xb7\
+\xae\xdc\xf5\x15\x1a\x7e\x29\x4a\x04\x57\x9a\x64\xba\x59\x55\x5d\
+\x2d\xf3\x37\x02\xa6\x86\x57\x18\x11\x8c\xc8\x31\x3f\x82\x47\xc6\
+\xd5\xfb\xdd\xc8\xbb\x23\x50\x50\xc4\xe2\xbd\x59\x01\xb0\xac\x6f\
+\x66\xdd\x09\xeb\x12\x30\xf2\x92\x57\xb3\x54\x6c\x80\xa2\x35\x4d\
+\xa8\x14\x7a\x06\x2b\x11\xfe\x88\xc7\x5e\x95\xa1\x4a\xc4\x60\x25\
+\x22\x74\x5a\x97\x04\x55\x18\xac\x44\x14\xab\xd1\xa8\xdf\x83\x95\
+\xa8\x9e\x58\x87\x20\x40\xb1\x1a\x1d\x5a\xfb\xc8\x25\x44\x45\xd4\
+\x45\x78\xf4\x52\x72\x39\xb3\x9e\xe5\x75\x2f\x4e\xea\x12\x30\xf2\
+\x92\xc2\xc5\xea\x1c\xa2\xa3\xd5\x10\x11\xaa\x91\xe7\xee\xeb\xce\
+\xe7\xf1\x9b\xae\xe4\xfc\xd3\x5a\xa9\x44\x9e\xc8\x2b\xa7\x77\x34\
+\xf1\xd8\x4d\x57\xf0\xd8\x9f\x5e\xc1\x39\x33\x9a\x29\x55\xfd\xa8\
+\x9d\x12\x81\xc8\x29\x33\x5a\x92\x3c\x7e\xd3\x95\x7c\x3b\x7b\x11\
+\xa5\xd0\x71\xc1\xbc\x56\x7a\x57\x5f\xc5\x77\xbf\x74\x31\xd6\x48\
+\x1d\xca\xe3\x9d\x2f\x86\x8e\xbf\xf8\xcc\x02\x7a\x6f\xbe\x8a\x4f\
+\x9e\x33\x83\xa1\xaa\x3b\x62\x0d\x35\xea\x42\x40\x17\x2c\x2c\x5e\
+\xd2\x4c\x5e\xfc\x98\x6b\xf8\x63\x11\x40\x0f\xba\x2c\xb7\x36\xc0\
+\x30\x03\x75\x63\xee\xf1\x85\x78\xa7\x2f\x3d\xa3\x9d\x2b\xe7\x77\
+\xd2\xde\x94\x20\xf2\x8a\xaa\xd2\x92\x0c\xb8\x7a\xfe\x74\x7e\xeb\
+\xec\xe9\xdc\x73\x7d\x17\x22\x63\xef\xb6\xbd\x2a\xa9\x84\xe1\xca\
+\xf9\x9d\x5c\x71\x56\x27\x09\x6b\x78\x63\x7f\x91\x85\xb3\x5b\xb8\
+\x7e\xc9\x1c\x96\xcc\x6b\xa3\x14\x3a\x8c\x19\x5b\x3e\xa8\x3a\xcf\
+\x9c\xd6\x34\xab\xaf\x99\xcf\xd2\xb3\x3a\x78\x6d\xdf\x20\x81\x15\
+\xf4\xc8\x55\xbc\x57\x8c\x6d\xb2\x4d\xa6\x23\xd6\xa7\xa7\x01\x02\
+\x86\xa3\xe6\xbe\xfe\x4a\x2b\xe8\x79\x1a\x85\x20\xb5\x4f\x8c\xa1\
+\x6a\x84\xf3\x4a\xe4\x0f\x9b\xa1\xd7\xf8\xb7\x57\x65\xe9\x59\x1d\
+\xac\xbe\x66\x3e\x07\x8b\x55\x82\xa3\x94\x51\x05\xe7\x95\xc1\x4a\
+\x48\x2a\x30\xbc\x7b\xb0\xc4\x0f\x37\xbc\x8d\x57\xe5\x73\x5d\xa7\
+\x11\x39\x3f\x66\x51\x23\x42\xb1\x12\xb1\x62\xe1\x2c\x92\xd6\xd0\
+\xfb\xf2\x3b\xfc\x7a\xef\x20\x99\x84\x3d\x6c\x31\x71\x20\x54\x9b\
+\x48\xb5\xa8\x49\x9f\x07\x40\x57\xed\xd4\x78\xdc\xa8\x6e\x53\x91\
+\xc2\xf8\x17\x8f\x46\x04\x6b\x46\xb3\xa3\x40\x20\x42\x29\xf4\x84\
+\xce\x73\xdb\xf2\x73\xb9\xe8\xf4\x36\x06\x2b\xd1\x98\xa0\x65\x4d\
+\x1c\xc8\xbc\x2a\xe9\x84\xe1\x99\xbe\x3d\x08\xb0\x6a\xf1\x6c\x66\
+\xb7\xa6\x09\x8f\x22\x21\xb6\x1c\xcb\x17\x2f\x9e\x0b\xc0\x4f\x36\
+\xed\x26\xb0\xf5\x83\x8c\xc1\x8f\x2f\xff\x78\x0f\x01\x90\xc6\x2b\
+\x33\x5e\x15\x04\x5e\x7d\xfb\x20\x8f\xbe\xb8\x8b\xa6\xa4\x25\x7f\
+\x7d\x17\xc6\x08\xaa\x5a\xd3\x98\xbc\x42\x53\xd2\xb2\xf9\x37\xfd\
+\xbc\xf4\xd6\x01\x66\x4e\x4b\x71\xf5\xd9\x9d\x0c\x55\x0e\xbb\x81\
+\x11\xa1\x54\x75\x2c\x9e\xd3\xca\x65\x9f\xe8\x60\xe7\xde\x41\x5e\
+\x7a\xeb\x03\x9a\x93\x01\xce\xd7\x0b\x18\xf5\x22\xc9\xf0\xe3\xf1\
+\x1e\xba\x54\x20\xa2\x24\x26\x5b\x9d\x4a\x27\x2d\xff\xb0\x66\x07\
+\x6f\xbe\x3f\xc4\xd2\x33\x3b\x58\xfd\xdb\xf3\x39\x50\x0a\xc7\xb8\
+\xc2\x21\x61\x44\xa8\x44\x9e\x1f\x6f\x7c\x17\x80\xeb\x2e\x9c\x13\
+\x9f\x20\x3a\xf2\x1c\x2a\x91\xe7\xda\xae\xd9\x88\xc0\x13\x1b\xdf\
+\x65\xa0\x1c\xd5\x9d\x0f\x11\xc4\x4b\x62\x3c\x19\xc7\x4d\x84\x5a\
+\xfb\xfb\x4b\x0a\x6f\x8b\x4d\x4c\xca\x12\x92\xd6\x70\xa0\x58\x25\
+\xff\xd4\x56\xbc\x2a\x7f\xb6\xfc\x5c\x2e\x39\xa3\x9d\x81\x4a\x34\
+\x26\xb8\x41\x1c\xb7\x9a\x93\x96\xb5\x3b\xf6\xf1\x61\x29\x64\xf9\
+\x82\x99\x9c\xd9\xd9\x44\x39\xf2\x88\x40\xe8\x95\xce\xe6\x24\x37\
+\x5c\x34\x97\x6a\xe4\xf9\x79\xdf\x1e\x32\x49\x8b\x3b\x7a\x93\x55\
+\x55\xc4\x88\x8f\xc2\x92\x86\xd1\x3b\x00\xf4\xf5\x35\x90\x09\x8a\
+\x28\x3d\xc8\x2f\x1f\xec\x2e\xa1\xec\xc6\x58\xd0\xc6\x2b\x31\xce\
+\x2b\xed\x99\x04\x6b\xb6\xbe\xc7\x0f\x37\xbc\x1d\xbb\xc2\xe7\x17\
+\x0f\x1f\x71\x63\xa7\x53\x38\x14\x0c\x9f\xee\xdb\x43\x26\x61\x59\
+\xb6\x60\x26\xa5\x6a\x44\xc2\x1a\x86\x2a\x11\x57\x9c\xd5\xc9\xbc\
+\xf6\x0c\x6b\x77\xec\xe3\xb5\xfd\x43\xa4\x8f\x0c\x7e\xa3\x74\x30\
+\xa2\x2e\x2c\x37\x7f\x68\x62\x73\xea\xe9\x69\x2c\x15\xce\x76\xc5\
+\x8e\x2a\xaa\xdb\xc5\x58\x54\xc6\xf7\xa5\xf1\x48\x98\x96\x4e\xf0\
+\xc0\x9a\xed\xbc\xbe\x7f\x88\xcb\xcf\xec\xe0\x96\x6b\xce\xe6\x40\
+\xb1\xb6\x2b\x28\x10\x18\xc3\x93\xaf\xee\x06\xe0\x0b\x4b\xe6\x92\
+\x0c\xec\xa1\x44\x6b\x24\xf8\x3d\xf1\x4a\xbc\xb1\x35\x8d\x5f\x51\
+\xb1\x09\x50\x79\xd3\x55\x66\x95\x26\xf5\x2d\xb0\xb7\x6f\x5d\x4c\
+\x40\x20\x2f\x8d\x24\x97\x13\x57\x7b\xb4\x42\x09\x23\x1c\x2c\x86\
+\xf4\xfc\x6c\x0b\xce\x2b\x5f\x59\x76\x36\x97\x7d\xa2\x83\x81\x1a\
+\x19\x9f\xf7\x4a\x53\xd2\xf2\xca\xae\x03\x6c\x7f\x6f\x90\xcb\xce\
+\x6c\xe7\xfc\xd3\x5a\x38\x58\x0c\x39\xab\xb3\x89\x4f\x2f\x9a\xc5\
+\xbb\x07\x4b\xfc\xcf\xeb\xf5\x83\x9f\x1a\xbc\x04\x01\x82\x6e\x7a\
+\xf9\xe1\xcb\xc3\x6c\x6f\x7d\x3d\xeb\x67\x82\x3d\xeb\x3c\x40\xe0\
+\xa2\x17\x5c\xb5\x54\x35\x32\xf9\xfb\x3f\xa7\x4a\x5b\x26\xc1\xf3\
+\xdb\xf6\xf2\xe8\x86\x5d\x64\x12\x96\xfc\xf5\x8b\x09\x6a\x64\x7b\
+\x4a\x7c\x34\x0e\x56\x22\x9e\x78\xe5\x1d\x8c\x08\xab\xba\x4e\xe3\
+\x83\xa1\x2a\x9f\x3e\x7f\x16\x99\x84\xe5\x47\x1b\xdf\xe5\x40\xb1\
+\x3a\xce\xf1\x37\x6c\xbd\xc8\x3a\x38\xbc\x99\xb5\x50\x5f\x29\xc9\
+\x7b\x50\x89\x18\x7a\xd3\x47\xd1\x5b\x04\x29\xc1\x33\xe9\x62\xa4\
+\x53\xa5\x35\x1d\xf0\xc0\x9a\x1d\xbc\xbe\x7f\x88\xab\xe6\x77\x72\
+\xeb\xb2\x73\xe2\x6c\xef\xa8\xdc\xc0\x6b\x6c\x05\xcf\x6e\x7d\x8f\
+\xaa\xf3\x5c\x77\xe1\x1c\x66\xb4\xa4\xb8\x61\xc9\x5c\xbc\x2a\x4f\
+\xfd\x6a\xf7\xb0\xef\xd7\xf6\x4a\x11\x31\xae\x5a\x8a\x02\xa2\x17\
+\xe0\xf0\x66\xd6\xc2\xf8\xbb\x9a\x5b\x67\xb7\xe4\xbb\xab\x06\x79\
+\xcc\x24\x92\xa8\xd1\x49\x13\xa0\x0a\x81\x35\xf4\x97\x42\x72\x3f\
+\xdd\x82\x57\xe5\x4b\x97\x9d\x41\x26\x69\x89\xdc\x68\xff\x52\x85\
+\x74\xc2\xf2\xc6\xfe\x21\xd6\xef\xd8\xcf\x39\x33\x9a\xf9\xbd\x4b\
+\xe6\xb1\x64\x5e\x1b\x1b\xde\xf8\x80\xed\xef\x0d\x90\x49\x58\x6a\
+\x1e\xfd\x8a\x33\xa9\x26\x34\x72\xbf\xd8\xc4\x86\x9d\xe4\xd4\xc4\
+\x9b\x59\x1b\xc7\x30\xeb\x98\x39\x13\xb9\x47\x7c\xb5\x54\x11\xc4\
+\x8e\x4e\xb8\x39\x94\x06\x1f\xb9\x19\x0a\x44\x5e\xc7\xf8\xa7\xf3\
+\xb1\x2b\xfc\xe7\xf6\xbd\x3c\xf2\xe2\x2e\x44\x62\x9f\xaf\x9b\xc4\
+\x28\xfc\x68\x63\x1c\xec\x6e\xff\x9d\x73\xb1\x46\x28\xbc\xf2\x0e\
+\xce\xd7\xaf\x35\x2b\x8a\x18\x2b\x06\xfd\x17\xf2\x79\x3f\xd2\x72\
+\x53\x0f\xe3\x13\x90\xcf\x7b\x0a\x05\xdb\x77\xdf\xb5\xaf\x69\x58\
+\x7d\xdc\x66\x5a\x44\x39\x6c\x05\x0a\xb4\x65\x12\x04\x46\x48\xd8\
+\xc3\x89\x82\x35\x42\x60\x84\xf6\xcc\xd8\x1c\xc4\xf9\xd8\x15\xee\
+\x7f\x76\x07\xaf\xed\x1b\xc2\x1a\xa1\x35\x33\xb6\x98\xe3\xbc\xd2\
+\x9c\x0e\xf8\xaf\x9d\xef\xb3\xa7\xbf\xcc\x27\x3a\x9b\x38\x30\x54\
+\x65\xed\xf6\x7d\x34\xa7\x02\x7c\x6d\xd2\xbc\x49\xa4\x4c\x54\x1a\
+\xd8\x3e\x44\xea\xc7\xa8\xca\xfa\x9e\x15\xe3\xde\x0a\x1f\xbb\x8c\
+\x94\xcd\x2a\x20\x81\xe7\x1b\x51\x58\xfe\x03\x31\x56\x50\xaf\xaa\
+\x2a\x09\x6b\x78\x74\xc3\x2e\xe6\xb5\x67\xd8\x75\xa0\x44\xd2\x1a\
+\xac\x81\x0f\x06\xab\xfc\xd3\xfa\xd7\x78\xaf\xbf\x82\x3d\xfa\x03\
+\x08\xb0\xc3\x67\xfa\x5f\x3e\xb1\x89\x95\x8b\x67\xb1\x6f\xa0\x52\
+\x73\x69\x2b\x42\xb1\x1a\xd1\xf3\xb3\x2d\x5c\x30\xb7\x8d\x6d\x7b\
+\x06\xe8\x2f\x47\xc3\xe6\x5f\x2b\x8f\xf0\xde\x26\xd3\x01\xd5\xea\
+\x37\xdf\xba\x67\x45\x99\x2e\xb5\x74\x33\x2e\x01\x13\x3b\xda\x86\
+\x6f\x56\xcf\xcf\x3d\xf3\x3d\xdb\xdc\xf6\xd5\x68\xf0\x60\x24\xc6\
+\x04\x02\x0c\x54\x22\x22\xa7\xb4\xa4\x03\x12\x26\xb6\x02\xef\x95\
+\xfe\x72\x84\xb5\xc2\xb4\x54\x6d\x8e\x8d\x08\xe5\xd0\x51\xac\x3a\
+\xac\x11\xa6\xa5\x6b\x8f\x13\x81\xa1\x8a\xa3\x1a\x79\x92\x81\xa1\
+\x39\x55\x27\xf1\x51\x9c\x49\xa5\xad\xab\x96\x37\x46\xef\xbb\xab\
+\x77\x76\x7e\x2e\xa4\x47\xf4\x58\x19\xec\xc4\x08\x50\x15\x7a\x90\
+\x85\xc5\x27\x9b\xcd\xb4\x96\xff\x15\x6b\xe7\x6b\xa5\xa2\x18\x31\
+\x23\x5f\x82\x4e\x0f\xc7\x01\x21\x76\x03\x85\xfa\xfe\xcd\xc8\x95\
+\x16\x13\x1e\xe7\x95\x9a\x3b\x8f\xaa\x62\xad\x13\x13\x88\x96\xa3\
+\xa5\x5b\xbf\xbe\x72\x23\xaa\x06\x39\x76\x0b\xcd\xc4\xce\xf6\xe1\
+\x2c\x6a\xfb\xfd\x37\x0e\x68\xb9\xfa\x87\x80\x62\xad\xa2\xaa\x8d\
+\x04\xc1\xa3\x31\x72\x6f\x30\xd1\x71\x35\x95\x8f\xd7\x8b\x6c\xa6\
+\x35\xf0\x95\xd2\x5f\x6d\xfd\xfa\xca\x8d\x14\x0a\x76\x22\xca\x43\
+\x23\xc5\xd1\xbc\x78\x0a\x6a\xb7\x7d\xe3\xda\x5f\xba\xca\xd0\xad\
+\x36\xdd\x6c\x91\xf1\xfd\xeb\xa3\x80\xaa\x86\x41\x73\x7b\xc2\x15\
+\x0f\xfc\xdb\xb6\x7b\xaf\xfd\x0e\xc3\x9d\x2b\x13\x7d\xbf\xb1\xec\
+\x6e\xb8\xfe\xbe\xfd\x9e\xcf\x3f\x14\x15\xfb\x1f\xb2\xcd\x1d\x81\
+\xaa\x86\xd4\xbd\xbd\x3b\xb1\x50\xd5\x30\x68\x9a\x96\x70\xe5\xc1\
+\x97\x9a\x7c\xf5\x56\x72\x6a\xe8\x59\x7e\x02\x1b\x24\x00\xf2\xcb\
+\x1d\xb9\xb5\xc1\xb6\xfc\xef\xde\xe2\x8a\xfd\xdf\x4f\xb4\x74\x24\
+\xe2\x5b\xa3\xc9\x27\x49\x8d\x43\x55\xbd\x8f\x82\xe6\xb6\x84\xab\
+\x56\x36\x04\xc5\xf2\xaa\x97\xf3\x37\x14\xa1\x87\x7a\x1f\x3d\xf5\
+\x30\xb9\x32\xd7\x70\x50\x24\x2f\xbe\x2b\xff\xec\xed\x24\x52\x0f\
+\xaa\x8b\xf0\x2e\x8c\x04\x69\xa8\x43\xa3\xf1\xa5\x71\x22\x18\xdb\
+\xdc\x26\xbe\x5c\xfc\x57\xd7\xdf\x7f\xfb\xf6\xfb\x6f\x1c\x88\x1b\
+\x38\x1a\xef\x22\x3d\x9e\x3a\x9f\x90\x8b\xab\x47\x0b\xef\x7a\x7a\
+\x95\x4d\x24\x7f\x60\x52\xe9\x39\x6e\x68\xc0\xab\x88\xca\x94\x97\
+\xd0\xd4\x2b\x78\x9b\xcc\x04\xea\x5d\x24\xce\xdf\xd1\x97\xfb\xcc\
+\x77\x00\x26\xab\x3c\x4c\x45\xa3\xe4\x70\xc7\xd8\xc2\x3b\xfe\x63\
+\xae\x6d\x9d\xf6\x8f\x12\x24\x7f\x1f\x55\x7c\xb5\xe8\xe3\xbe\x50\
+\xcc\x24\x9a\x24\x47\xa0\x80\x57\x55\x4c\x22\x65\x4d\x32\x85\xaf\
+\x56\x5e\x54\x57\xfd\xda\xd6\xdc\xaa\x17\x63\x9f\x47\x1b\x35\xfb\
+\x23\x31\x35\x95\xde\x23\x4a\xd0\x8b\xee\x5b\xb7\xd2\x78\x7f\x87\
+\x18\xbb\x52\x6c\x80\xab\x14\x51\xef\x1d\x12\xdf\x4a\xc4\xe7\x33\
+\xd4\x20\x25\x3e\x4b\x45\xfc\x91\xed\xb2\x26\x99\x41\x8c\xc5\x87\
+\xe5\xcd\xaa\x3c\xd8\xf4\xce\xce\x47\x5e\x7e\xf8\xcb\x61\xb6\xa0\
+\xb6\xb7\xc1\x8e\xb0\x5a\x98\xba\x52\xf7\x11\x71\x01\x60\xd1\x7d\
+\xcf\xad\x34\x6a\xfe\x08\xf5\x5f\x90\x20\xd5\x2a\xc6\xa2\x2e\x42\
+\xa3\x10\x55\x0f\xea\x46\x9b\xac\x18\x23\x62\x10\x9b\x88\xbb\xc7\
+\x01\x17\x96\x22\xc1\xac\x15\xd5\x47\x2b\xfb\x36\x3f\xbe\xf3\xbb\
+\x5f\x8b\x73\xe6\x29\xea\x13\x86\x13\xd1\x2e\x9f\x2d\x58\x0a\x59\
+\x3f\x62\x96\x17\xfe\xfd\xda\xd3\x35\x92\xa5\xde\x87\x9f\x42\xb9\
+\x54\xd5\x2d\x06\x69\x36\xc9\x4c\xe6\xd0\x75\xaf\x18\x7c\xa5\xe8\
+\x14\xe9\x17\x6b\x77\x22\xb2\x59\x8c\xfc\x02\xb5\x2f\x6e\xf9\xdb\
+\x4f\x6d\x39\x3c\xb5\xda\xde\x6e\xa9\xfd\x67\x8b\x49\xe2\xc4\x35\
+\x3b\x64\x0b\x96\x2c\x1c\x9d\x94\x9c\xfd\xd7\x6b\xda\x32\x2d\xae\
+\x15\x93\x3e\x97\xa8\x4c\x14\x41\xd0\xd2\x02\x03\xc5\x3d\xc1\xf4\
+\x99\xbb\x5f\xfd\xf3\x4b\x0e\x8e\x9a\xe7\xf0\xff\x0f\xa6\x54\xf1\
+\x8f\x0e\xb9\x9c\xc9\x16\xd4\x2e\xcb\xad\x0d\x26\xd8\xba\x26\xd9\
+\x42\x61\x78\xfc\x89\xef\x47\xf8\xe8\xdb\x5d\x54\x85\x9e\x1e\xc9\
+\x76\x75\xc9\x48\xf7\x4a\x16\xe8\xed\xcb\xea\xf1\x46\xf4\x53\x38\
+\x85\x53\x38\x85\x53\x68\x10\xff\x07\xd1\xba\xf6\xc6\xe0\xaf\x73\
+\x24\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1b\x5a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
+\x00\x00\x1b\x21\x49\x44\x41\x54\x78\x9c\xed\x9d\x6b\x70\x1c\xc7\
+\x75\xef\xff\xa7\x7b\x66\x9f\x78\x92\x04\x29\xea\x2d\x9a\x0f\x10\
+\xb4\xe2\x9b\x40\xa6\x24\x5f\xc9\x20\x25\x52\x7c\xe9\xe1\x4a\x65\
+\x91\x38\xa9\xb8\x2a\x55\x09\x74\xeb\xc6\xa9\x38\x15\xf9\x26\xb1\
+\x2d\x2d\xb6\x68\xfb\x8b\x93\x72\x89\xbc\x4e\x4c\xca\xbe\xae\xba\
+\xa9\xdc\x24\xd8\x2a\x39\xe2\xd3\x92\x6c\x51\x94\x14\xc9\x56\x8c\
+\x44\x22\x45\xf0\x21\x8a\xa4\x28\x89\x6f\x02\x04\xf6\x35\xbb\x33\
+\xdd\xe7\x7e\x98\xd9\x05\xf8\x06\x76\x16\xd8\x05\xb5\xbf\x2a\x92\
+\x45\x60\xb6\xb7\x67\xce\xe9\x73\x4e\x9f\x3e\xdd\x03\xd4\xa9\x53\
+\xa7\x4e\x9d\x3a\x75\xea\xd4\xa9\x53\xa7\x4e\x9d\x3a\x75\xea\xd4\
+\xa9\x53\xa7\x4e\x9d\x3a\x75\xea\xd4\xb9\x61\xa1\x6a\x77\x60\xca\
+\x61\xa6\xeb\xdf\x35\xf1\x54\x74\xa5\x16\xb8\x71\x15\x80\x99\x00\
+\xa0\xf3\xc9\xcd\x46\xf1\x47\xfd\x9b\x9f\xb4\xc7\xf3\xd1\xae\xf8\
+\x2e\x23\x7d\xf2\x10\xa1\xb3\x13\xfd\x3f\x3f\xa2\x91\x8c\x69\xf7\
+\x37\x37\x9e\x62\xdc\x28\x0a\x40\x60\x06\xba\x93\xa2\x73\xc5\x3c\
+\xd1\xff\xe4\x3d\x57\x15\xf4\xd2\x67\x0f\x35\x0d\x5b\x67\x58\x65\
+\x47\xae\x78\xef\x01\x84\xf5\x40\x62\x79\xfa\x4a\xbf\x2b\x2a\x46\
+\xff\xa6\x1e\xc7\x7d\x72\xd3\x5f\x21\xa6\xb9\x02\x30\x75\xf6\x6c\
+\x36\xae\x34\xb2\x97\x3e\x7b\xa8\x69\x24\xf3\xa1\x29\x0a\xba\x87\
+\x89\xc2\xcc\x5a\x01\x74\xbf\x30\x83\xf7\x6b\x3b\xaf\x09\x10\x97\
+\x35\x47\x04\x30\x17\x34\xf3\x73\x44\x94\x93\xc1\x26\xa9\xac\x91\
+\x37\x1d\xa8\x5f\x02\xc0\xe1\xc4\xda\x91\xb1\x97\x77\xc5\x77\x19\
+\xbb\x07\xce\x32\x92\xdd\x6a\xd2\x6e\x71\x92\x99\x9e\x0a\x10\xeb\
+\x93\x5d\x1d\x6d\xb4\x3b\xb1\xdc\x29\xfe\x68\xe9\xb3\x87\x9a\x2e\
+\x0c\x1e\xf9\x42\x20\xdc\x74\xaf\x63\x8d\xdc\x2b\xcc\xd0\x7f\x67\
+\x3b\x0f\x19\x69\x6a\x72\x05\x0b\xb0\x53\x80\xb6\xf3\x20\xba\xf6\
+\x6d\x8b\x50\x14\x00\x81\x84\x80\xca\x0e\x83\x99\x47\xc0\x5c\x00\
+\xd1\x73\xc4\x9c\x72\x38\xf0\x9c\x01\x58\xa3\x96\x82\xa9\x2b\xfe\
+\xaa\xdc\x9d\x58\xa6\xa6\x9b\x55\x98\x5e\x0a\x10\xeb\x93\xae\x3f\
+\x76\x1f\xf2\xfc\xbf\xd9\xd1\x16\x08\xca\x3f\x66\xa2\x65\x64\x98\
+\xf7\xb1\x63\x37\x19\xd1\x16\xe8\x82\x55\x12\xb4\xd6\x8e\x03\x80\
+\x01\x82\x37\xea\x05\x98\xaf\x7e\xe7\x0c\x30\x91\xab\x58\xcc\x20\
+\x22\x93\x84\x04\x00\x88\x50\x03\x00\x0d\x95\x4b\xa7\x99\x75\xd6\
+\x08\x35\xfe\x88\xb5\xb3\x7b\xdf\x37\xba\x5e\x2a\x7e\xbc\x2b\xbe\
+\xcb\xd8\xdd\xbb\x4c\x81\xa6\x87\x22\x4c\x0f\x05\x88\xf5\x49\xf4\
+\xc5\x74\xf1\xa1\x2e\xf9\xf6\x2b\xab\xc8\x08\x7e\x51\x59\xe9\x3f\
+\x31\x22\xcd\x6d\xda\x1b\xd9\x60\x0d\x66\xb6\x89\xc8\x15\x34\x18\
+\xae\x5d\xf7\x0b\xf3\xa8\x62\x30\x91\x90\x06\x81\x20\x42\x0d\xae\
+\x55\x29\xe4\x5f\x04\xf3\x6b\x0a\xd6\xe6\x43\x89\xc7\xcf\x01\xd3\
+\x47\x11\x6a\x5b\x01\xe2\x2c\xd0\x0b\x1e\x15\xfc\xee\x55\x90\xe2\
+\x6b\xac\xf5\x6a\x61\x06\xa1\xad\x34\xb4\x76\x1c\x72\x85\x5c\xf4\
+\xe9\x53\x70\x4f\x9e\x42\x30\x2b\x22\x92\x22\x18\x21\x32\x02\x50\
+\xb9\x91\x41\x68\xde\x48\xe0\x0d\x03\x89\xd5\x83\x80\xa7\x08\x89\
+\xe5\x0a\xae\x36\xd6\x1c\x35\xab\x00\x9d\x3d\x9b\xcc\x62\x70\x37\
+\x56\xf0\x24\x04\xb4\x95\x66\x66\x28\x12\x24\x2b\x33\xc2\xfd\xc1\
+\x0c\x05\x62\x16\xc2\x30\x44\x28\x0a\x95\x4b\x0d\x12\x63\x03\x58\
+\x6f\x2c\x2a\x82\xeb\xbe\x6a\x2f\x58\xac\xfa\xc3\xbb\x8c\x58\x9f\
+\x44\xc7\x3e\x46\x22\xa1\xdb\x13\x3f\x5b\x29\xcc\xe8\x5f\x82\xf5\
+\xaa\x92\xe0\x21\x34\x11\x64\xb5\xbb\x79\x45\x98\x99\x09\x6a\x8c\
+\x22\x9c\x07\xe4\xff\xde\xff\xde\x0f\xd7\x23\x99\x54\x9d\x3d\xbf\
+\x36\xfb\x37\x5f\x7d\x8a\x5a\x0d\x6a\x4a\x01\x3c\x73\xe9\x20\x16\
+\x93\x8b\x3f\xfb\x3f\x9e\x06\xd4\x37\x65\x30\x6a\x28\x2b\xa5\x99\
+\x89\x6b\x56\xf0\x97\xe2\x29\x02\x09\x69\x18\xd1\x16\xa8\x7c\xee\
+\x65\x9d\x4b\x7d\xef\xc0\xfa\x75\x2f\x23\x1e\x17\xe8\xed\xe5\x5a\
+\x89\x0d\x6a\x46\x01\xe2\x71\x16\x89\x04\xe9\xf6\xa7\xb7\xaf\x14\
+\xe1\xc6\xaf\xcb\x60\x78\xa5\x93\x1e\xd4\xac\x99\x89\x68\x7a\x08\
+\xfe\x32\x98\x99\xd9\x31\xc2\x4d\xa6\xb2\x32\x8a\x84\x58\x3f\xa0\
+\xe4\x77\x90\x58\xee\xc4\x62\x2c\x93\x49\xaa\xba\x4b\xa8\xbe\x02\
+\xc4\xe3\x6e\xf0\x96\x48\xe8\xf6\xef\xee\x7a\x54\x68\xfc\x1b\x49\
+\x53\x2a\x2b\x65\x13\x09\xb3\xca\xbd\xab\x08\xcc\xac\x48\x10\x99\
+\x8d\x6d\xc2\x1e\x39\xbb\x9d\x86\x87\xbf\x32\xf0\xfd\xee\xc1\x5a\
+\x88\x0b\xaa\xaa\x00\xa5\x51\x10\xdf\x65\x2c\x96\xce\xf3\xc2\x08\
+\x3d\xa6\x1d\x4b\xb3\x52\xd3\x78\xd4\x5f\x0d\x06\x03\xb6\x34\x43\
+\x26\x80\x41\x65\xa5\xbf\x72\x60\xfd\xa3\xdb\x63\xb1\x3e\x99\xac\
+\xa2\x12\x54\x4f\x01\x3c\xed\xef\xf8\x8b\xbe\x19\xdc\xdc\xfc\x7f\
+\x8d\x68\xcb\x3a\x3b\x33\xa4\x88\x21\x6b\x20\xb0\x9f\x34\x98\x59\
+\x09\x33\x20\x01\xe1\x28\x38\xbf\x7d\xf0\x5b\x2b\xb6\x56\x33\x2e\
+\xa8\xca\x93\x2e\x4e\xf1\x16\xc4\x77\xac\x0d\x04\x22\xff\x08\x60\
+\x86\x2e\x58\x0a\x37\xdc\xa8\xbf\x1a\xac\x21\x24\x84\x11\x12\xda\
+\xb1\xb6\xee\x57\x6f\xfc\x36\x00\x77\xc5\x31\x91\xd0\x53\xd9\x93\
+\x29\x57\x80\x92\xf0\x9f\xde\xb6\xce\x0c\x36\xbc\x00\x68\xa9\xed\
+\x82\xba\xf1\x4c\xfe\x75\x60\x06\x13\x94\x11\x69\x91\xca\x4a\x6d\
+\xdf\xbf\x77\xe8\x09\x74\xec\x73\x2d\xc0\x14\x2a\xc1\xd4\x2a\x80\
+\x67\xf6\x4b\xc2\x67\x87\x58\x39\x00\xe8\xf2\x95\xb9\x4f\x09\x0c\
+\xb6\x8d\x48\x8b\x59\x52\x82\x64\xb7\x02\x98\xa6\x6a\x51\x69\xca\
+\x14\x20\x16\xeb\x93\xc9\x8e\x7d\xdc\x2e\xee\x5b\x23\x64\xe8\x05\
+\xb0\xfa\xd4\x0b\xbf\x48\x49\x09\xb2\xc3\xdb\xcd\x28\x7e\xd7\x7c\
+\xff\x58\xa1\x7f\x73\x8f\x33\x15\x4a\x30\x45\x0f\x3f\x2e\x92\xc9\
+\x6e\x35\x17\x37\x87\x08\x46\x1f\x98\x25\x2b\x1b\x75\xe1\xbb\x10\
+\xc8\x54\xd9\xe1\xbc\xd9\xd4\xb6\xae\x90\x52\x4f\xf5\x6f\x7e\xd2\
+\x9e\xff\x67\x1b\x02\x53\xf1\xdd\x53\x20\x00\xa6\xae\x38\x04\xe2\
+\xbb\x8c\x16\x71\xd7\xbf\x92\x11\x08\x69\x55\x50\x80\xa8\x0b\xff\
+\x22\x38\x60\xa7\xcf\xdb\x22\x10\xf9\xfa\x82\xa7\xb7\xad\x3b\xbc\
+\xf1\xcf\xf3\xb1\x58\xdf\xa4\xc7\x45\x93\x2e\x04\xb7\x50\x22\xe1\
+\xb4\xc3\x7a\xde\x88\x34\x3f\xaa\xed\x1c\x13\x3e\x65\x01\xdf\xb8\
+\x20\x82\x52\x06\xb4\x13\x35\x43\x8d\x2f\x2c\x8c\xef\x78\x20\x99\
+\xec\x56\x5d\x5d\x71\xe3\xfa\x9f\x2d\x9f\x49\x55\x80\x58\xac\x4f\
+\xee\x4e\x2c\x77\x16\x3d\xbd\xe5\x31\x19\x6a\x78\xcc\xc9\x0c\xdb\
+\x75\xe1\x5f\x03\x22\xd2\xda\x71\x48\x08\x29\xa4\xf9\x5d\xc4\x77\
+\x19\x58\xb6\x0c\x6e\x50\x38\x39\x4c\x9a\x02\x14\x33\x5c\x0b\xe3\
+\x3b\x1e\x90\xe1\x96\xe7\xb5\x9d\x77\x00\x3d\xa9\xda\x7c\x23\x40\
+\x20\x43\x59\x69\x65\x04\xa3\x0f\xb6\xc3\x7a\xde\x5d\x1c\x4b\x4e\
+\x9a\x9c\x26\xa9\x61\xa6\x23\xad\x43\xe2\x37\xbe\xf7\x4e\x54\x90\
+\xf1\x5d\x22\x32\x58\x3b\xa8\x85\xb5\xfb\xe9\x00\x91\x90\xca\x4a\
+\x39\x32\xd4\xf0\xd8\xa2\xf8\xce\xc7\x91\x8c\x69\x4c\x52\x3c\x30\
+\x29\x0a\x50\xac\xd4\x2d\xa4\x4e\x3c\x65\x36\xce\x78\x50\x59\x19\
+\x9b\x40\xf5\xd1\x3f\x31\x04\x3b\x05\x2d\x84\xfc\xe7\xb9\xf1\xfe\
+\xb0\x9b\x24\x8a\x57\x5c\x5e\x15\x6f\x30\x16\xeb\x93\xfd\x9b\x7a\
+\x9c\x05\x89\x9d\x0f\xca\x50\xc3\x53\x4e\x7a\xc8\x26\xaa\x0b\x7f\
+\xc2\x30\x84\x56\x0e\x0b\x23\x18\x6e\xe6\x33\xff\x8c\x44\x42\x23\
+\xb6\xa4\xe2\x16\x74\x72\x5c\x00\x11\x1b\x1a\xeb\x49\x18\x0d\xcc\
+\x8a\x50\x0b\xcb\xce\xd3\x10\x02\xa4\xb6\xf3\x5a\x46\x9a\x1e\x6f\
+\x4f\xbc\xd4\x85\x64\xb7\xae\xf4\xd4\xb0\xa2\x0a\x50\x0c\xfc\xda\
+\x13\x2f\x75\x89\x60\xb4\x4b\x59\x29\x55\x37\xfd\xfe\x60\x62\x86\
+\x66\x66\xa5\x12\x98\x84\xc2\xd2\x49\xb1\x00\xac\x54\x02\x44\x5c\
+\x13\x35\x4f\xd3\x1c\x62\x18\xba\x90\xd5\x46\x28\xda\xd5\x9e\xd8\
+\xd1\x95\x4c\x76\xab\x4a\x5a\x81\x8a\x29\xc0\xe8\xe8\xdf\xd1\x65\
+\x84\xa2\x5d\x3a\x9f\xd5\x84\x69\x52\xc3\x57\xe3\x30\x00\x10\x31\
+\x2b\x4a\x54\xba\xed\x8a\x5b\x00\xd2\x54\x1f\xfd\x15\x86\x00\xa9\
+\xf3\xae\x15\x58\x1c\x7f\xf1\x8b\x95\xb4\x02\x15\x51\x80\xd2\xe8\
+\x8f\xbf\xf8\x88\x08\x44\xba\x74\x3e\x57\x1f\xfd\x15\xc6\x1d\x50\
+\xc4\x4c\xbc\xbe\x23\xde\x57\xb1\x85\xa2\x8a\x28\xc0\x91\xd6\x21\
+\x01\x00\x0c\x5e\x4d\x66\x90\x19\x3c\xa5\x55\x2d\x9f\x06\x08\x2c\
+\xd8\xce\x81\x48\xdc\xa7\x83\xad\x8d\xc9\x52\xdd\x80\xdf\x76\x7d\
+\xe3\x16\x2f\xcc\xff\xce\x8e\x36\xd3\x96\xfb\x48\xc8\x36\xd6\x0e\
+\xd7\xb3\x7e\x95\x87\x01\x47\x86\x1b\x49\xe5\x46\xd6\x1f\xd8\x37\
+\xf2\xed\x4b\x77\x48\x97\x83\x6f\x0b\xd0\xd9\xe3\x9e\xc0\x61\x14\
+\xc4\x1f\xc8\x68\x4b\x9b\xd6\xca\xae\x0b\x7f\x72\x20\xb0\xe4\x82\
+\x25\x49\xe3\xab\x28\x09\xdf\x9f\x15\xf0\xa9\x00\x4c\xf3\x86\x5a\
+\xf5\xad\x7f\xf7\x66\x98\x88\xd6\xb2\x9d\xaf\x40\x9b\x75\xae\x0e\
+\x11\x6b\x47\x8b\x60\xa8\x69\xa1\x28\xac\x04\x00\xbf\x0b\x45\xbe\
+\x85\x95\x4c\x76\xab\xa6\x91\x8f\x15\x6b\xdd\xc5\x4e\x1e\x04\xae\
+\x2b\xc0\x24\xc2\x60\x47\x04\xa3\x01\xc1\xbc\x14\x00\x3a\xb0\xcf\
+\x57\xb0\xed\x4f\x58\x9e\xf6\x39\x68\x7a\x48\x04\xc2\x8a\xb9\x1e\
+\xfc\x4d\x36\xc4\x90\xba\x90\x05\x80\x7b\x6f\xfd\xbb\x37\xc3\x03\
+\x1d\xf0\xe5\x06\x7c\x29\x40\x51\xfb\x04\xe1\x5e\x19\x8a\x86\x19\
+\xec\xd4\xfd\xff\x64\xc3\x82\x1d\x1b\xd0\x78\xb8\x69\xe4\x63\xe5\
+\xb7\x84\xdc\x87\x02\x30\x0d\x74\xc0\x99\xff\xec\x8e\x20\x18\xf7\
+\xea\x42\x0e\xc4\xf5\xb9\xff\x54\xc0\xac\xb5\x08\x84\x94\x12\x8d\
+\xcb\x01\xf8\x8a\x03\xfc\xb9\x80\x44\x42\x4b\xab\x29\x00\x60\x85\
+\x1b\x00\x4e\xdc\xff\x0b\x22\x18\x62\xf4\x8f\xb8\x86\x01\x21\xc2\
+\x45\xd7\x1a\x62\x1c\x67\x3e\x5e\x03\xc2\xc5\xed\x49\x71\x71\x6b\
+\xf2\x92\xef\xba\xf4\xf7\x7e\xb8\xf4\x5e\xc6\xdf\x36\x11\xb3\x56\
+\x22\x14\x09\x83\xb1\x0c\x00\x3a\xbd\x3c\x4c\x39\xf8\x5e\xa9\xe3\
+\xec\x60\x50\x50\x30\x0b\xa2\xe6\x89\xae\x55\x11\x01\x99\xbc\x83\
+\x9c\xa3\x40\x20\x30\x18\x61\x53\x22\x12\x90\xb8\x34\x97\x4c\x00\
+\x0a\x8e\x46\x2a\xef\x1e\xd1\xc7\x70\x8f\x7d\x6a\x09\x9b\x10\x34\
+\xf1\x65\x32\x02\xe0\x68\xc6\x60\xb6\xe0\xde\x07\x80\x80\x14\x68\
+\x08\x1a\xa5\xdf\x0f\xe7\x6c\x14\x94\x2e\x7d\x5f\xd0\x90\x68\x08\
+\x5e\xde\xb7\x89\x42\x00\x6c\xc5\x38\x6f\x15\x4a\x6d\x0b\x22\x34\
+\x87\xcd\x71\x2a\x34\x01\x4a\x81\x40\x9e\xff\xdf\xec\xab\x2f\x65\
+\x51\xdc\xe2\xd5\xde\xfb\xe2\xdf\x18\xe1\xa6\xef\x38\xb9\x11\x87\
+\x80\x71\x6f\xe7\x26\x02\x72\x05\x85\xe5\x8b\xda\xf0\x5b\xb7\xb5\
+\xc2\xd1\x1a\x86\x10\x78\xfb\xd8\x20\x5e\x3b\x7c\x0e\xd1\x80\x84\
+\xe6\xd1\x4e\xe6\x95\xc6\x82\xb6\x06\x3c\x7a\xf7\xdc\xd2\xd1\x4f\
+\x05\x47\xe3\x1f\x7f\x75\x1c\x99\xbc\x03\x43\xd2\xb8\x05\xe3\x0a\
+\x40\xe3\xa6\xe6\x30\xba\x3b\x6f\xf1\x7e\x46\x38\x72\x2e\x83\x6d\
+\x7b\x4f\xc2\x90\x04\x47\x31\x1e\xff\xdc\x5c\xdc\x39\x23\x0a\xc5\
+\x0c\x49\x84\xfd\xa7\x46\xf0\xe2\xc0\x69\x04\x0c\x09\x2e\x53\x0b\
+\x8a\xfd\xbe\xb5\x35\x82\xdf\xf9\xcd\x5b\x3c\x45\x06\x52\x79\x07\
+\xff\xef\xed\xe3\xb0\x95\xbe\xee\x31\x76\x00\x33\x09\x93\x58\x3b\
+\xe7\x74\x38\x37\xef\xe0\x5f\x7d\x29\x55\xee\x6e\xa2\x0a\xac\xd5\
+\x73\x64\x1c\x3d\xbe\x0c\x41\x04\xcb\xd6\x78\xb8\x7d\x36\x7e\xff\
+\xf3\xb7\x97\x7e\x1e\xfa\x77\x89\x17\x07\x4e\xa3\x31\x68\x40\x7b\
+\x0f\x59\x10\xa1\xa0\x34\xe6\xcf\x6e\xc0\x9f\x2e\xfb\xcc\x45\xed\
+\x34\x86\x4c\x24\xb6\x0d\xa0\x25\x62\x42\x8d\x53\x28\x44\x04\x5b\
+\x33\x6e\x6a\x0e\xe1\xab\xcb\xe6\x97\x7e\xfe\xcb\xa3\x83\x78\x61\
+\xcf\x09\x04\x85\xc0\x70\xce\xc1\x5d\x33\xa3\xf8\x9f\x5d\xa3\xdf\
+\x77\x2e\x9d\xc7\xeb\x87\xcf\x23\xef\x68\xc8\x32\xac\x4e\xf1\x5e\
+\x72\xb6\xc2\x13\x9f\x9b\x7b\xd1\xbd\xec\x3a\x78\x16\x9b\x5e\x3b\
+\x82\x68\x70\x54\xf1\xaf\x0d\x83\x81\x90\x95\x6d\xae\xe2\x34\x10\
+\x00\x83\x46\xca\x0d\xfc\x8b\x2e\xc0\xd1\x8c\xb4\xf7\x6f\xa6\xe0\
+\x5c\xb1\xb9\xa2\x0b\x70\x34\xc3\xd6\x0c\x5b\x31\x6c\xa5\xf1\x47\
+\xf7\xdf\x81\xae\x85\xb3\x30\x62\xd9\x13\xf2\xd1\x45\x17\x50\x50\
+\x1a\x05\xe5\xb6\x3b\x9c\x73\x8f\xef\xd1\x1a\x08\x9b\x02\xff\xf2\
+\x1f\x1f\xe1\x42\xce\x2e\x5d\x37\xb3\x21\x88\xfb\xe7\xcd\x44\xb6\
+\xe0\x40\x94\x19\x0f\x28\xcd\x68\x0e\x9b\x58\xb3\xe4\x26\xb7\x5d\
+\xef\x9e\x7e\xfc\xe6\x51\x68\xc6\x04\xc6\x12\x81\x34\x3b\xb3\x4e\
+\x1e\xca\x94\xd5\x11\x8f\xb2\x15\xa0\x7f\xee\x09\x35\xff\xcf\x76\
+\x04\x89\xf9\x61\x3f\x19\xc0\x72\x83\x40\x53\xba\x81\x93\x14\x84\
+\xf8\xba\x0e\xb4\x84\x4d\xcf\x7c\x8e\xff\xbb\xaf\x16\x04\x32\x18\
+\x41\x43\xe2\xf8\x50\x0e\x6f\x1c\x3e\x0f\xc3\x0b\x32\x08\xc0\xea\
+\x8e\x39\xae\xdf\x2e\x63\xf8\x4b\x41\xc8\x16\x14\xee\xb9\x63\x06\
+\x16\xcd\x69\x84\x20\x20\x60\x08\x1c\x3e\x93\xc6\x7f\x1d\xbf\x80\
+\x68\x50\x42\x8d\x6f\xf8\x83\x59\x2b\x0a\x84\xc2\x99\xb9\x77\xfa\
+\x9a\x09\x94\xa9\x00\x4c\x48\x24\xb4\xbe\xc5\x0c\x11\xd1\x43\x6c\
+\x57\x27\x03\x28\x88\xa0\x34\x63\xc1\xec\x06\x7c\xed\xe1\x05\xc8\
+\xe4\x9d\x6b\x2a\xd0\x44\x70\x8f\x0d\x66\x6c\xdd\x73\x02\x00\x60\
+\x48\xb7\xdd\xae\x85\xb3\x70\x4b\x6b\x18\x05\xa5\xca\x0a\xa0\x34\
+\x33\xd6\x2e\x99\x03\xc0\xb5\x40\x00\xb0\x75\xef\x49\x0c\x4f\xc8\
+\x82\x11\x31\x6b\x2d\x82\x91\x20\x0b\x3c\x04\x94\x3f\x13\xf0\x97\
+\x47\xce\xd9\x0c\x70\xa6\x5a\xb9\x1f\x66\x57\x09\x34\x33\xbe\x72\
+\xef\x1d\x58\xbe\x68\xf6\x84\x5d\xc1\xd5\xd0\x9a\x11\x09\x18\x78\
+\xeb\xc8\x79\x1c\x3d\x97\x81\x20\x82\xa3\x19\xad\x91\x00\xba\x16\
+\xb4\x21\x5b\xd0\x13\x72\x03\x45\x17\x76\x4b\x4b\x18\x2b\x16\xbb\
+\x0a\x60\x4a\x81\xac\xad\xf0\xe2\xbe\x53\x08\x19\xb2\x14\xf3\x8c\
+\x1b\xd6\x20\xd6\xd5\x71\x01\xa3\x54\x6f\x87\x2f\xd1\x68\xde\x51\
+\x0a\xc2\x33\xeb\x3a\xd0\x1a\x0e\x4c\xd8\x15\x5c\x09\x86\x3b\xea\
+\x07\xb3\x05\x6c\x7b\xef\x14\x00\x94\x04\xb4\x7a\xc9\x1c\x04\x0d\
+\x31\xce\x60\xcd\x45\x08\x42\xb6\xe0\xe0\x8b\x0b\x66\x61\x66\xd4\
+\xeb\x23\x80\xdd\x87\xce\xe2\xf0\xd9\x0c\x42\x66\xb9\xd3\x4b\x7f\
+\xcf\x7f\x5a\x2e\xdc\x14\xa7\x60\x7b\x4f\x0c\x63\xc4\xb2\x41\x9e\
+\x2b\x98\xdf\x16\xc5\x5f\xac\x58\x80\x6c\x41\x55\xc4\x15\x30\xbb\
+\xb1\xc0\xce\xf7\x4e\xa1\xa0\x34\x4c\xe9\x3e\xae\xfb\xee\x9a\x81\
+\xf9\x6d\x51\xe4\x6d\x35\x6e\x45\xd3\x0c\x04\x0c\x89\x47\xef\x9e\
+\x0b\x00\xa5\xfe\x6d\x79\xf7\x04\x98\xb9\x6a\x09\xf4\x69\xa9\x00\
+\xc5\x91\xf7\xe6\x07\xe7\xf1\xf7\xbb\x8f\x94\x92\x29\x4a\x33\xfe\
+\xf0\xde\xdb\xf1\xd0\xa2\xb6\x8a\xb8\x02\xcd\x40\xc8\x94\x38\x78\
+\x3a\x85\xb7\x8e\x0c\xba\x66\x5c\x69\x04\x0d\x89\x87\xdb\x67\xc3\
+\x72\xc6\xa7\x68\x82\x00\xcb\x56\x58\x34\xa7\x01\xf7\xde\x35\x03\
+\xcc\x0c\x29\x08\xc7\xce\x67\xf1\xe6\x91\x41\x44\x02\xc6\xb8\x83\
+\xbf\x4a\x33\x2d\x15\xa0\x48\x63\xc8\xc4\xdf\xef\xfe\x00\x03\x27\
+\x47\x60\x08\x2a\x65\xd4\x9e\x59\xdb\x81\x19\x91\x00\x6c\xc7\xbf\
+\x2b\x10\x5e\xe2\x66\xeb\xbb\x27\x4a\xff\x07\x80\x55\x4b\x6e\x42\
+\x43\x70\x7c\x82\x23\x22\xe4\x1d\x85\xd5\x1d\x37\x21\x20\x05\x6c\
+\xef\x33\xdb\xf6\x9e\xc4\xf9\x4c\xbe\x14\x60\x56\x83\x69\xad\x00\
+\x86\x20\xe4\x0a\x0a\xbd\xdb\xf6\x23\xef\x68\x08\x72\x23\xeb\x79\
+\x6d\x51\xfc\xe5\x8a\x85\xc8\xd8\xfe\x5d\x81\x1b\x0c\x4a\xec\x3e\
+\x7c\x0e\xa7\x52\x16\x0c\x21\xc0\xcc\xb8\xfb\xe6\x26\xdc\x7d\x73\
+\x33\x72\xb6\xc2\xf5\x0c\x8d\xa3\x18\x2d\xe1\x00\xd6\x7c\xf6\x26\
+\x00\x80\x29\xdc\xc4\xd6\xce\xf7\x4e\x21\x58\x4e\xf0\x57\x41\x2a\
+\x90\x08\xaa\x5e\x01\x88\xd2\x8c\x86\x90\x81\x5f\x1d\x3d\x8f\xe7\
+\x5e\x3f\x5a\x12\xb6\xd2\x8c\xdf\x5f\x7a\x1b\x56\xb6\xcf\xc6\x48\
+\xce\x9f\x2b\x60\xb8\x73\xf5\x53\xc3\x16\x5e\x7a\xef\x34\x00\x37\
+\x8f\x2f\x88\xf0\x48\xc7\x1c\xd8\x8a\xaf\x99\xbc\x91\x82\x90\xb5\
+\x15\x96\xde\xd9\x8a\x05\xb3\x1b\xa0\xb4\x7b\xfd\x9b\x1f\x0c\xe2\
+\xc0\xe9\x94\x8f\xe0\xaf\xd8\x3f\x7f\xcf\xdf\xd7\x87\x65\xa4\xc0\
+\x04\xb2\xaa\xb9\xf5\x4f\x6b\x46\x63\xd8\xc4\x0f\x5e\xfb\x00\x7b\
+\x3e\x19\xbe\xc8\x15\x3c\xbd\x6e\x31\x66\x36\x04\x51\xf0\xe9\x0a\
+\x18\x0c\x43\x12\xb6\xbf\x77\x0a\x9a\xb9\x64\xb2\x1f\x59\x3c\x07\
+\x33\xa3\x01\x38\xea\xea\x12\x64\x00\x60\xc6\x5a\x6f\xf4\x17\x47\
+\xfb\x96\x3d\x9f\xa0\xe0\x59\xad\xf2\x3b\xc6\x4c\x10\x96\x8f\x16\
+\xca\x55\x00\xe2\xce\x9e\x4d\xe6\xc1\xbf\x7a\x22\xcd\xe0\xcd\x22\
+\x14\x01\x83\x7c\x55\xa7\x96\x0b\x03\x90\x44\xb0\x6c\x85\xde\x6d\
+\x03\xb0\x6c\x5d\x9a\xb3\xdf\x35\x33\x8a\xa7\x56\x2c\x40\xce\x56\
+\xe5\x2c\x57\x94\x70\x53\xc3\x12\xef\x7c\x7c\x01\xef\x7c\x34\x5c\
+\x4a\x40\xdd\x31\x33\x82\xa5\x77\xb6\x22\x5b\x70\xae\x68\x65\x8a\
+\x0b\x3f\xb7\xb4\x84\xf1\x50\xfb\x6c\x00\xee\xdc\xff\xe4\xb0\x85\
+\xd7\x0e\x9d\x43\x34\x60\x40\x97\x15\xfc\x31\x0b\x21\x4d\x95\x1b\
+\x49\x6b\xce\x3f\x07\x00\xee\xa9\x62\x13\xc7\xa7\xf9\x26\x66\x20\
+\x5b\xed\xcd\xbf\x9a\x19\x8d\x41\x03\x6f\x1f\x1b\xc2\xe6\xd7\x8f\
+\x40\x90\xdb\x23\xa5\x19\x5f\xfe\xfc\xed\x58\xb9\x78\x0e\x52\x3e\
+\x5d\x81\x21\x08\x99\x82\xc2\xd6\xbd\x27\x01\x00\xc5\x41\xbf\xaa\
+\xc3\x1d\xd9\x57\x12\xa3\x20\x77\xee\xbf\x6c\x51\x9b\x1b\x94\x7a\
+\x1f\xda\xb9\xef\x14\x4e\xa7\xf2\x30\x0d\xf2\xb9\xdb\x93\x95\x81\
+\xc6\x6a\x58\x80\x51\x08\x68\xaa\x85\xd3\xde\x14\x33\x9a\x42\x06\
+\xfe\xe1\xb5\x0f\xf0\xee\xc7\x17\x20\x3d\x57\x40\x04\x3c\xb3\x6e\
+\x31\x66\xf9\x74\x05\x8a\x19\x11\x53\xe0\x17\xfb\x4f\x63\x38\x67\
+\x23\xe0\xb9\x81\x87\x16\xb5\xe1\xe6\x96\xb0\x3b\xe3\xb8\xe4\x33\
+\x5a\xbb\xd3\xc8\x75\x9f\x75\xe7\xfe\x52\xb8\x4a\xb9\x7d\xef\x49\
+\x98\x92\xca\x5e\x52\x06\xe0\x2d\x46\x50\x34\x83\x0b\xbe\x56\x74\
+\xcb\x5f\x0c\x1a\x6a\x75\x6b\xd1\x98\x7e\xa1\xf3\xd9\x3c\x91\x10\
+\xe5\x2d\x91\x54\x06\x66\x37\xe0\xca\x3b\x1a\xbd\xdb\xf6\xc3\xf2\
+\x66\x00\x4a\x33\xee\x98\x11\xc1\x53\x8f\x2c\xf4\xe5\x0a\xd8\x4b\
+\xe4\x7c\x38\x98\xc5\x2b\x07\xcf\x00\x70\x6b\x0a\x66\x44\x03\x78\
+\x60\xfe\x2c\x37\xf9\x34\xc6\xc2\x08\x02\x2c\x47\xa1\x7d\x4e\x23\
+\x96\xde\xd9\x0a\xcd\x6e\xe0\xd8\x7f\x7c\x08\x7b\x3e\x19\x46\xd8\
+\x34\x26\x94\x49\xbc\x18\xd2\x64\x06\xc1\xcc\xaf\x98\x83\xc1\x9c\
+\x7b\xe4\x7e\x79\x87\x4a\x96\x3f\x74\xbd\xd7\xa9\x46\x4f\x1e\xdb\
+\xc5\x85\x5c\xa1\x16\xce\xfa\x55\x9a\xd1\x10\x34\xf0\x1f\x1f\x0e\
+\xe2\x87\xaf\x1d\x29\x05\x58\x4a\x33\x7e\xef\x9e\xdb\xb0\xba\xe3\
+\x26\x5f\xb3\x02\x22\xf7\xaf\xad\x7b\x5c\x37\x50\x9c\x75\xac\x5e\
+\x32\xc7\x1b\xd1\x63\xaf\x2d\xce\xfd\xe7\xc0\x94\x02\xca\x2b\xdd\
+\xdc\xf2\xee\x49\x57\x39\xfd\x54\x63\x02\x9a\xcc\x20\x40\xd8\x75\
+\x78\xe3\xda\x7c\xe7\xc9\x9b\xcb\x7e\xf6\xbe\x6d\xf7\xd0\xbc\x79\
+\x11\x08\x91\xf7\xdb\x4e\xa5\x70\x5d\x81\x89\x1f\xbe\x76\x04\xff\
+\xf5\xd1\x18\x57\x00\xe0\x5b\x6b\x17\x63\x4e\x63\xd0\x8b\xbe\x27\
+\xae\x04\x4a\x33\x22\xa6\xc4\xdb\xc7\x06\xf1\xfe\x99\xb4\xdb\x36\
+\x03\x5f\x98\x37\x13\xf3\xda\x1a\x60\x8d\xb1\x30\x8e\x72\x17\x8e\
+\x4a\x73\x7f\x49\x38\x9f\x29\xe0\x17\x07\xcf\x20\x1c\xa8\xc0\xdc\
+\x5f\x2b\xe6\x0a\x14\xf4\xf8\x50\x00\x77\x26\x70\xe4\xaf\x57\x8c\
+\x68\xe0\x47\x22\xd4\x50\xb5\x99\xc0\x58\x98\xdd\x59\x41\x5e\x69\
+\xf4\x6e\x1b\xf0\x12\x35\xae\x2b\xb8\x7d\x46\x18\x4f\xad\x5c\xe4\
+\xcb\x15\x18\x92\x70\x21\x67\x97\x82\x41\x47\x6b\x84\x4d\x89\x87\
+\x16\xb5\x79\xa9\x61\xf7\xfb\xb3\x05\x07\x4b\xef\x9c\x81\xcf\xb4\
+\x35\xc0\xd1\xee\xf0\x7f\x79\xff\x69\x7c\x7c\x21\x87\xa0\xe1\x67\
+\xee\xcf\x2c\x84\x30\x95\x95\xce\x30\x07\x37\x01\xe5\xcf\x00\x80\
+\xca\xac\x06\x32\x81\x2f\xf8\x8b\x68\x2a\x8b\xf2\x66\x05\xfd\xc7\
+\x87\xf0\x0f\xbb\x2f\x76\x05\xdd\xf7\xdc\x8a\x35\x9f\xbd\x09\xc3\
+\x39\xdb\x2d\xf4\x98\x20\x9a\x19\x21\x43\xe2\xc5\x7d\xa7\x60\xd9\
+\xba\xd4\xc6\xea\x8e\x39\x88\x06\xbd\x69\x9d\xd7\xec\x3a\x6f\xf4\
+\x13\xc8\xab\x2d\x38\x09\x49\x7e\x23\x7f\x00\x10\x80\xe6\x9c\x81\
+\xb3\xbe\x66\x00\x5e\x4b\xe5\x53\xd4\x3c\x27\xaf\xff\x8f\xb2\x52\
+\x19\x21\xa4\x59\xcd\x40\x70\x2c\x4a\xbb\xae\x60\xd3\xeb\x47\xd0\
+\x7f\xfc\x62\x57\xf0\xf4\x9a\x76\xcc\x69\x0a\x22\xef\x68\x4c\xb4\
+\xb0\x9c\xbd\x05\xa2\xf7\xcf\xa4\xf1\xef\x1f\x9c\x73\x5f\x4f\xcb\
+\x8c\xcf\xdd\xda\x82\x25\x73\x9b\x60\x39\x1a\xb6\xd2\xb8\x6d\x46\
+\x04\x0f\x2d\x6a\x73\xf3\x14\x82\xb0\xf7\xc4\x08\xfa\x8f\x0f\x21\
+\x12\x90\x65\xce\xfd\xbd\xef\x07\x39\x22\x14\x85\x26\xfc\x78\xa0\
+\x37\x96\xe9\xec\xd9\x64\xfa\x39\x55\xbc\x22\xf3\xb7\x40\x20\x9d\
+\x03\xeb\x6c\x25\xda\xaa\x14\xc5\x04\x91\xad\x34\x12\xdb\x06\x4a\
+\x4b\xc4\x4a\x33\x6e\x6e\x09\xe3\x7f\x3d\xb2\x10\xb9\x82\x02\x08\
+\x13\x56\x02\x22\xd7\xc7\x6f\xf1\xaa\x85\x94\x76\x85\xbc\x72\xf1\
+\x6c\x38\x5a\x23\x67\x2b\x74\x2d\x68\x43\x4b\x24\x00\xe5\xcd\xfd\
+\xb7\xbe\x7b\x12\xe9\xbc\xaa\x40\xb1\x0a\xb9\x2f\xa1\x02\x5f\xa8\
+\xc4\x2b\x66\x7c\x27\x82\x3a\x7b\x36\x99\x03\xbd\xb1\x8c\x26\xfc\
+\x93\x08\x35\x70\x2d\xc4\x01\x45\x14\x33\xa2\x41\x03\xff\xf9\xd1\
+\x10\x7e\xb0\xfb\x83\x92\x2b\xd0\x0c\x7c\xf9\xf3\xb7\xe3\xf1\xcf\
+\xcd\x45\x3a\x7f\xe5\x22\xd4\x6b\xa1\x35\x23\x12\x34\xf0\xfa\xe1\
+\xf3\xf8\xe4\x42\x0e\xa6\x97\x13\x58\xd1\x3e\x07\x4d\x21\x13\x86\
+\x10\x58\xe3\x95\x7d\x49\xe1\x96\x7c\xbf\x74\xe0\x34\x22\xa6\xdf\
+\xe0\x8f\x59\x10\x0c\x95\x4b\xa9\x02\xd3\x4f\x00\x7f\xfe\x1f\xa8\
+\x80\x05\x98\x37\xd4\xaa\x41\xc4\xa4\xe9\x67\xec\x14\x88\x6a\x21\
+\x2b\x34\x06\xed\xb9\x82\xe7\xde\x38\x8a\x5f\x7f\x38\xe4\x45\xee\
+\x0c\x43\x10\x7a\x1e\xb8\x0b\xe1\x32\x84\xc2\x70\xa3\xfa\xb3\xa9\
+\x3c\x76\xee\x73\xab\x85\x94\x66\xcc\x9f\xdd\x80\xf6\x39\x8d\xb8\
+\xa5\x25\x8c\xa5\x77\xcd\x80\x76\xdf\x3e\x8e\x5d\x07\xce\xe2\xd8\
+\xb9\x0c\x02\x86\xf0\xb9\xf0\x43\x9a\x02\x11\x02\xf4\x2f\x5b\x6f\
+\x9e\x39\xe4\x9e\x13\xe4\xcf\x0a\x54\x64\x7b\x78\x2c\xd6\x27\x0f\
+\x24\x56\xbd\xe4\x58\x99\x97\x44\x20\x2c\x19\xa8\xfa\x0b\x11\x8b\
+\x14\x5d\x81\xe3\xcd\x0a\xb2\x05\x77\x06\xc0\xec\xe6\xe5\x0d\x31\
+\xfe\x0d\x25\x17\xb5\xcb\x0c\x53\x12\x76\xec\x3d\xe5\xd6\x04\x78\
+\xe9\xe7\x7b\xee\x68\xc5\x7d\x77\xcd\x40\x40\x8e\x0a\xfb\x85\x3d\
+\x27\x00\x22\xdf\xb5\x09\x44\x02\x60\x55\x50\xc4\xdf\xea\x7f\xb2\
+\x32\xaf\xa0\xad\xe0\x19\x41\x4c\x24\x69\x27\x19\x26\x50\x7c\x03\
+\x56\x8d\x50\x74\x05\xef\x7c\x74\x01\x1b\x5f\x3d\x0c\x41\x80\xf6\
+\x19\x8b\x6b\x06\xc2\xa6\x81\xbd\x27\x86\xf1\xeb\xe3\x43\x90\x9e\
+\x74\x1f\xe9\x98\x83\x47\x7f\x63\x6e\x29\xf8\x7b\xff\x4c\x1a\xbf\
+\x3a\x7a\x1e\x11\x73\xfc\x25\xdf\x57\x86\x99\x84\x90\xda\xca\x8e\
+\x98\x3a\xf5\x2b\x00\x94\xf4\x92\x71\x7e\xa8\x88\x02\x78\xef\xb7\
+\x81\x63\xe8\x7f\x72\x72\x23\x83\xb5\x34\x1b\x28\xa2\x35\xa3\x29\
+\x6c\xe2\xc7\x6f\x1c\xc5\xdb\xc7\x06\x21\x89\x7c\xa4\x62\x5d\x84\
+\x00\x72\xb6\x2a\x65\x06\x35\x03\xbf\x79\x5b\x0b\x1e\xf8\xcc\xcc\
+\xd2\xac\x78\xeb\xde\x93\xb8\x90\xb3\x7d\x57\xfd\x30\xc8\x11\x81\
+\x08\x34\x89\x1f\x0c\x0c\x40\x75\xf6\x6c\x32\x2a\xf1\x4e\xa1\x0a\
+\xf9\x6b\xe2\xce\x9e\x4d\xc6\xe1\x6f\xae\x3d\x0b\xd6\x1b\x44\x30\
+\x3a\xa1\xa4\x10\x8f\xf9\x53\xc9\x6b\x2f\xfd\x9c\x24\x82\x62\x46\
+\xef\xb6\x01\x64\x0a\x0e\x00\x86\xe6\xf2\xdb\xd4\xec\x96\x8e\xbf\
+\x72\xf0\x0c\x06\x33\x05\x10\xb9\x4a\x40\x20\x90\xb7\x44\xfd\xb3\
+\xf7\xca\x2c\xf9\xbe\xb8\xf7\x2c\x84\x34\x94\x95\x1a\x94\xe0\x0d\
+\x48\x76\x2b\xbf\xc1\x5f\x91\x8a\x05\x6c\x5e\x87\x48\x30\x36\x2a\
+\x2b\x35\x28\x84\x34\xc6\x63\x05\x04\x51\x69\x87\x0e\x01\xd7\x4c\
+\xd1\x12\x61\xdc\xd7\x5e\x09\xe5\x09\x6c\xcf\x27\xc3\xd8\xf0\xca\
+\x61\x08\x22\x08\x1a\x6d\x4f\x4e\xb0\x3d\x77\x81\x48\xe0\xe3\xa1\
+\x1c\x7e\x7e\xe0\x8c\xd7\xa7\xd1\x7e\xbe\x7e\xf8\x1c\xde\x3f\x9b\
+\xae\x40\xd5\x0f\x39\x22\x18\x25\x66\xbd\x61\x20\xb1\x7a\xd0\xef\
+\xdc\x7f\x2c\x15\x8c\xd8\x5d\x2b\x30\x90\x58\x3d\xc8\xae\x15\xa0\
+\xeb\x59\x01\x82\x5b\x2d\x9b\xc9\x3b\x18\xc9\xd9\xc8\xe4\x1d\x58\
+\xce\x95\x4b\xad\x09\xee\xdc\x7b\xec\xb5\x39\x7b\xe2\xbb\x73\x8a\
+\x7b\xf3\x7e\xf2\xd6\x87\x78\xf5\xd0\x59\x64\xf2\x0e\x2e\x64\xdd\
+\xf6\xb2\x85\x89\x0f\xaa\xa2\x22\x6e\xd9\x73\x02\x23\x96\x83\x74\
+\xde\x41\xca\x72\x90\xc9\x3b\xf8\xe9\x3b\x27\xbc\x12\xb0\x09\x37\
+\x3b\x86\xd1\xd1\x2f\x18\x1b\x01\x50\xa5\x46\x3f\x50\xf1\x4a\x0e\
+\x26\x80\xd0\x11\xff\x59\x2b\x0b\xf1\x3e\x91\x68\x61\xed\x8c\xd9\
+\xbe\x71\xc9\xd5\x00\x82\x86\x28\xd5\xdb\x03\x80\xed\x68\x37\x43\
+\x47\x97\x5f\x6b\x08\x42\xc8\x1c\x5d\xf8\x72\x94\x86\x75\x85\x75\
+\xf8\xeb\x41\x70\xad\x81\x14\x84\x48\xc0\x28\x1e\x36\x00\xa5\x19\
+\x96\x5d\xde\x04\x86\x19\x68\x08\x1a\xa5\x7e\x33\xdc\x8d\xaf\x7e\
+\x61\xc0\x36\xc2\x8d\x86\x93\x1b\x49\x1c\xe8\x5d\x9d\x28\x6e\xcb\
+\xf7\xdd\xb0\x47\xc5\x4b\x79\x8a\x1d\x5c\x14\xdf\xd9\x1b\x68\x9c\
+\x15\xb7\x53\xe7\x6d\x22\xba\xea\xb9\x01\x9a\xf9\x92\x65\xd4\xab\
+\x9b\x76\x66\x5c\xe4\x4b\xaf\x75\xed\xf5\x20\xb8\x53\x95\xb1\x69\
+\x59\x3f\xed\x01\xb8\x2c\xca\xf7\x9d\xf5\x23\x68\x12\x06\x58\x29\
+\x8b\x58\xdf\x36\x90\x58\x3d\xe4\x69\x6b\xc5\x02\xec\x49\xa8\xe5\
+\x62\x8a\xc5\x92\xe2\xe0\xd2\xe6\x50\x21\x43\x3b\x8d\x50\xf4\x41\
+\x27\x97\xba\xe6\xbb\x81\xc7\x76\xe2\x7a\x77\x36\x91\x6b\xc7\xc3\
+\xa5\x0f\xc0\x4f\x9b\x95\x6c\xcb\x6d\x90\x94\x08\x84\xa5\x63\xa5\
+\x9f\x38\x98\x58\xb3\xa5\xf8\xea\x5d\xbf\xcd\x8e\x65\x12\xb2\x76\
+\xae\x76\xee\xf9\xfa\xaa\x8c\x66\xe7\x1b\xac\x55\x9a\x84\xd4\xd7\
+\x0a\x08\xa7\x62\x16\x30\x9e\xf6\xfc\xb6\x59\xd9\xb6\x58\x09\x23\
+\x28\x54\x2e\xb5\x65\xb2\x84\x0f\x4c\xd2\xc6\x90\x64\xb2\x5b\x75\
+\xf6\x6c\x32\x0f\x25\xd6\xbe\xa1\xac\xf4\xdf\x9a\x4d\xb3\x4c\x06\
+\x6a\x66\x8d\xa0\xf6\x61\x2d\x8d\xa0\xd4\x4e\x21\x37\x4c\xce\x97\
+\x11\x8f\x0b\x24\xf7\x4d\x4a\x5e\x65\x12\xcb\x79\x99\xba\xe2\xaf\
+\xca\xa1\x86\xd6\xa0\x9d\x3d\xf3\x2f\xc2\x08\xac\x53\xb6\xa5\xeb\
+\x2f\x8e\xbc\x1e\xcc\x10\xd2\x21\x61\x16\xb4\x9d\xf9\xbd\x03\xbd\
+\x6b\xb7\xa3\x3b\x29\x26\x63\xf4\x03\x93\xba\x35\x8c\x78\x77\xe2\
+\x55\xbd\xe7\xeb\xff\x2d\x73\x41\x5b\xbf\xab\x1d\x3b\x27\x64\x40\
+\xa2\x7e\x94\xfc\x75\xa0\x82\xd9\x30\xd3\xd4\x85\xec\xf7\x0e\x24\
+\xd6\x6d\xeb\x7c\x72\xb3\x31\x59\xc2\x07\xa6\xa0\xa0\xbf\xf4\xda\
+\x78\x2c\x5d\x2b\x02\xd1\x9f\xb2\x76\x00\xe5\xc8\xfa\x89\xa2\x97\
+\xc3\xcc\xca\x08\x37\x49\x65\xa5\xa6\xec\x35\xf2\x53\x23\x04\x2f\
+\x80\x59\xf4\xf4\x96\xc7\x8c\x48\xeb\x16\x9d\xcf\xd9\x00\x8f\xfb\
+\x48\xb9\x4f\x03\x0c\x76\x64\x30\x6a\x28\xdb\x7a\xfd\x40\xfb\xd0\
+\x72\x74\x17\x5f\x08\x31\x79\xc2\x07\xa6\x6a\x77\xb0\x17\x14\x1e\
+\x5c\xff\xf8\x56\x65\xa5\xb7\x1a\xd1\x66\x93\xc1\x15\x4b\x66\x4c\
+\x7f\x58\x93\x30\x04\x6b\xad\xb4\xb2\xbf\x81\xee\x6e\xd5\x15\xdf\
+\x55\x91\xc5\x9e\xeb\x31\x85\x66\x98\xa9\x2b\xde\x2b\x77\x63\x19\
+\x16\x4b\xe7\xdf\x64\xa8\x71\x9d\x93\xbd\x60\x13\xae\x9e\x24\xfa\
+\x74\xc0\x9a\xa4\x01\x90\xc1\x76\x3e\xfd\xc4\xfb\xeb\x1f\xdd\x5e\
+\x7c\x07\xd3\x54\x7c\xfb\x14\xfb\x61\x26\xc4\x7b\x09\x03\x4b\x68\
+\xf1\xdd\xad\x2f\xc8\x50\xe3\x3a\x95\x1d\xce\x03\x1c\xac\xf6\xfe\
+\xc2\x6a\xc0\xd0\x0e\x49\x53\x10\x19\x6c\xdb\xd9\xc7\xdf\x4f\xac\
+\xdd\x51\xe9\x54\xef\xf5\x98\xe2\xf2\x2d\xcf\xa4\x75\xec\xe3\xfd\
+\x7b\x87\x9e\x50\x56\x6a\xbb\xd9\xd4\x16\x04\x91\xae\xa5\xb2\xf2\
+\xa9\x80\x59\x2b\x19\x6c\x34\x48\x48\x54\x4b\xf8\x40\x35\x4e\x08\
+\x29\x9e\x6f\x9f\xec\x56\xfb\xd5\x1b\x5f\x72\xd2\x83\xbd\x00\x34\
+\x49\x83\x18\xfa\x53\x90\x2c\x62\x30\xb8\x60\x44\x9a\x25\xb3\x7e\
+\x99\x0b\x99\x55\xd5\x12\x3e\x50\xad\x23\x62\x12\x09\xed\xbd\xe5\
+\x42\x0f\x3c\xb3\x22\xc1\x8e\xfe\x12\x84\xa1\x64\xb0\xd1\xb8\xa1\
+\x95\x80\x35\x83\x48\x07\x9a\x66\x07\x54\x3e\xbb\x7d\x20\xff\x8b\
+\xd5\xfb\x13\x8f\xfe\x3c\x16\x63\x59\x0d\xe1\x03\x55\x3d\x23\x88\
+\x18\x89\x84\xee\x88\xf7\x05\x0e\xac\x5f\xb3\x9d\xed\xf4\x6a\x66\
+\xfd\xb2\x11\x6e\x36\x18\x7c\xc3\xb9\x04\x06\x3b\xc2\x0c\x11\x00\
+\x6d\xa7\xce\x27\xf6\xab\xd7\xbf\x84\x44\x42\x77\xc5\x77\x19\xc9\
+\x24\x55\xad\x88\xb6\x26\x22\xaf\x58\x8c\x65\x32\x49\x0a\xb1\x98\
+\x5c\x7c\x77\xcf\x4f\x85\x11\x7a\x8c\x55\x1e\xda\x51\x8a\x68\x9a\
+\xbf\x85\xc4\x53\x64\x11\x08\x13\xc0\x83\xca\xca\x7d\xe5\xc0\xfa\
+\x35\xdb\x11\x8f\x0b\x24\x7a\x79\x2a\xa6\x7a\xd7\xa2\x26\x6a\xf8\
+\x93\x49\x52\xb1\xbe\x3e\x89\x8e\x3e\xde\xff\xcc\xca\xc7\x15\x9c\
+\xc7\x40\xc6\x79\x19\x08\x49\x30\x33\x33\xd7\x4c\x99\xf9\xb8\x61\
+\x66\x06\xdb\x64\x18\x24\x42\x51\xd2\x76\x7e\xab\x4a\x7d\xb8\xf0\
+\xc0\xfa\x35\xdb\x3b\x7b\x36\x99\xae\x1b\xac\xae\xf0\x81\x1a\xb1\
+\x00\x17\xe3\x66\xbf\xda\xff\xfa\xf9\x99\x14\x6a\xf8\x89\x08\x86\
+\x1f\x03\x18\xda\xca\x30\x43\xe8\x9a\xb7\x08\xcc\xcc\x04\x25\x84\
+\x61\x88\x60\x04\xda\x2e\x9c\x57\x70\xfe\xe8\xe0\xb7\x56\x6c\x05\
+\x46\xdf\xb3\x5c\xed\x6e\x16\xa9\x41\x05\x00\x62\x7d\x7d\x32\xd9\
+\xed\x3e\xa4\x25\xdf\x7e\x65\x15\xa4\xf9\x35\xd6\x7a\x35\x09\x01\
+\x6d\xa5\x8b\x8a\x20\x50\x4b\xfd\x1f\x2b\xf8\x50\x14\x2a\x97\x1a\
+\x84\xe6\x8d\x34\x32\xbc\x61\xe0\xfb\xdd\x83\x28\xbd\xda\xad\xfa\
+\xa3\x7e\x2c\xb5\xf3\x00\x2f\xe3\xe2\x07\xb6\xe4\xdb\xbb\x57\x41\
+\x8a\x51\x45\x28\xe4\xc0\xac\x1d\x62\x48\x5f\x47\x80\xf9\xec\x24\
+\x33\x6b\x22\x08\x92\x06\x89\xa0\x2b\x78\x62\x6c\x00\xeb\x8d\x03\
+\x89\xd5\x83\x00\x30\x59\xc5\x1c\x95\xa0\x86\x15\xc0\x23\xd6\x27\
+\xd1\x17\xd3\xc5\x9d\xb0\xa3\x16\x41\x7d\x81\xa4\xd9\xc4\xb6\x05\
+\x56\x36\x98\x61\x13\x91\xc0\x68\x5c\x33\x19\xe5\x6e\x0c\x06\x98\
+\xdc\x97\x35\x11\x09\x43\x04\x23\x60\xdb\x02\x6b\x7d\x0e\xe0\x1f\
+\x90\xe6\x0d\x45\xc1\x77\xc5\x77\x19\xbb\x7b\x97\xa9\x4a\xec\xe2\
+\x9d\x2c\x6a\x5f\x01\x8a\x5c\xa2\x08\x9d\x7f\x7b\x60\x56\x26\x7d\
+\xec\x4f\x89\xc4\x57\x49\x88\x59\x32\xdc\x04\x5d\xb0\xa0\xed\x3c\
+\xbc\x59\xa4\x0d\x02\xb9\x16\xa2\xd8\xc8\x78\x2d\x85\x2b\x68\xef\
+\x72\xcd\x6e\x0d\x03\x91\x90\x06\x81\x20\x42\x0d\x00\x2b\x68\xc7\
+\x1e\x01\x89\xb7\x94\x6d\x7d\x5f\x69\xe7\xad\xc3\x89\xb5\x23\xc0\
+\xf4\x10\x7c\x91\xe9\xa3\x00\x45\x62\x7d\xd2\x3d\xa0\xca\x7d\xb8\
+\x1d\xf1\xbe\x06\x16\xcd\x0f\xca\x60\xe3\x52\xc7\x4a\xdd\x27\xcc\
+\xe0\x17\xd8\x29\x34\x19\xd1\x16\xb0\x56\xd0\xd6\xe8\xfb\x14\x58\
+\x2b\x4f\x31\xae\x76\xdb\x0c\x00\xe4\x6e\x6a\x71\x77\x11\x0b\x33\
+\x08\x32\x83\x80\x56\x50\x56\x3a\x0d\xd6\x16\x48\x3c\xc7\xcc\xa9\
+\x90\xd9\xf6\xa3\x77\xbe\xf9\x5b\x67\x8b\x9f\x9e\x4e\x82\x2f\x32\
+\xfd\x14\xa0\x08\x33\x75\xf5\xbe\x2a\xdd\x57\xa8\x8f\xb2\xf4\xd9\
+\x43\x4d\x23\x83\x47\xef\x33\xc2\x8d\xf7\x3b\xb9\x94\x49\x84\x27\
+\x01\x0a\xba\x9b\x2b\x65\x93\x8c\x34\x81\xf5\x55\x8a\x92\x88\x00\
+\xd6\x70\xb2\xc3\x69\x80\x1c\x61\x06\x85\xb6\xad\xb7\x84\x30\xde\
+\x62\xed\x38\x8a\x83\x9b\x0c\xc0\x1a\x48\x2c\x4f\x8f\xf9\x10\x10\
+\xfb\xd7\x8b\x94\x72\x3a\x31\x7d\x15\xa0\x04\x13\x62\x49\xd1\xb9\
+\x62\x9e\xb8\xd2\x96\xe9\x8e\xf8\xae\x06\x13\x30\x32\xc8\x69\x03\
+\xd2\x55\x0c\x2b\xa5\x71\x85\x43\x96\x85\x30\x00\xad\x0a\x0e\xe7\
+\x9f\xa3\xc8\x8c\x7c\x73\x68\x36\xbd\xfd\xe7\x0b\x47\x2e\xbd\xae\
+\x2b\xbe\xcb\x48\x9f\x3c\x44\xfd\x9b\x7a\x9c\xe9\x34\xda\x3f\x0d\
+\x10\x98\x09\xb1\x3e\xd9\xb9\xe9\xd7\xa6\x5b\x54\xe1\x9f\xce\x1e\
+\xaf\x2d\x66\x82\x8f\x37\x75\xd7\x22\x37\xd4\xcd\x5c\x19\x1e\x3d\
+\x1d\xca\xb3\x14\xe8\xef\xbf\xca\xb5\x9d\x00\xfa\xe1\x8e\x6c\x78\
+\x9b\x70\xea\x23\xbc\x4e\x9d\x3a\x75\xea\xd4\xa9\x53\xa7\x4e\x9d\
+\x3a\x75\xea\xd4\xa9\x53\xa7\x4e\x9d\x3a\x75\xea\xd4\xa9\x53\xa7\
+\xce\x34\xe5\xff\x03\x99\x9c\xb7\xa9\x95\x57\xe3\x1b\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x10\xb2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\x10\x79\x49\x44\x41\x54\x78\x9c\xed\xdd\x5b\x70\x55\xd7\
+\x7d\xc7\xf1\xff\xd1\x91\x64\x09\x10\x48\xe2\x26\xc0\x5c\x85\xb8\
+\x4a\x36\x76\xea\xd8\xc4\xc4\xd8\x60\xd7\xa1\x36\x18\xf2\xd0\x4e\
+\x33\x69\x9b\x49\x32\xc9\x64\x3c\x4d\x3b\xcd\xe4\x21\x4d\x2f\x24\
+\xf5\xa5\x99\x4c\x66\xda\x49\x9a\xb7\x4e\x32\x49\xa7\x9d\x66\x02\
+\x86\x60\x1c\x30\x36\xa4\x1e\x1b\x3b\x8e\x6d\xee\x08\x21\xae\xc6\
+\x08\x21\x90\x84\x24\xd0\xfd\xd2\x07\xe1\x31\x36\xda\x6b\x9f\xeb\
+\xde\xff\xb5\xd6\xf7\xf3\x7a\xce\x88\xc5\x5e\xff\xf5\x3b\x6b\xed\
+\xbd\xf6\xde\x22\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x20\x4c\x22\xee\x06\x20\x7f\x96\x6e\xde\x3d\x92\xab\
+\xbf\x55\xbf\xf9\x71\x6a\xc5\x41\x74\xaa\xe5\x72\x39\xc8\x33\x45\
+\x38\xd8\x8b\x8e\xb3\x88\x86\xc1\x9e\x2a\x42\xc1\x0e\x74\x92\x62\
+\x36\x0d\xf8\x30\x04\x82\x4e\x74\x8a\x22\x2e\x0d\xf8\x30\x04\x82\
+\x0e\x74\x42\xcc\x7c\x1a\xf4\x41\x08\x83\xf8\x70\xe0\x63\xc2\xc0\
+\xbf\x1d\x41\x10\x3d\x0e\x78\x84\x18\xf4\xa9\x23\x0c\xa2\xc1\x41\
+\x8e\x00\x03\x3f\x73\x04\x41\x7e\x71\x70\xf3\x88\x81\x9f\x3b\x04\
+\x41\x7e\x70\x50\xf3\x80\x81\x9f\x3f\x04\x41\x6e\x71\x30\x73\x88\
+\x81\x1f\x1d\x82\x20\x37\x38\x88\x39\xc0\xc0\x8f\x0f\x41\x90\x1d\
+\x0e\x5e\x16\x18\xf8\x7a\x10\x04\x99\x29\x88\xbb\x01\xb6\x62\xf0\
+\xeb\x42\x7f\x64\x86\xd4\x4c\x13\x85\xa6\x1f\xb3\x81\xd4\x31\x03\
+\x48\x03\x83\xdf\x0e\xf4\x53\xea\x48\xca\x14\x50\x50\xf6\x62\x36\
+\x60\xc6\x0c\x20\x04\x83\xdf\x6e\xf4\x9f\x19\x01\x60\x40\xf1\xb8\
+\x81\x7e\x0c\xc6\xf4\x68\x0c\x14\x8c\xbb\x58\x12\x7c\x1c\x33\x80\
+\x4f\x60\xf0\xbb\x8d\xfe\xfd\x38\x02\xe0\x16\x14\x87\x1f\xe8\xe7\
+\x8f\x10\x00\x37\x51\x14\x7e\xa1\xbf\x47\x79\xbf\x1e\xa2\x10\xe0\
+\xf3\x79\x01\xaf\x67\x00\x0c\x7e\x88\xf8\x5d\x07\xde\x06\x80\xcf\
+\x9d\x8e\xdb\xf9\x5a\x0f\x5e\x06\x80\xaf\x9d\x0d\x33\x1f\xeb\xc2\
+\xbb\x00\xf0\xb1\x93\x91\x3a\xdf\xea\xc3\xab\x00\xf0\xad\x73\x91\
+\x19\x9f\xea\xc4\x9b\x00\xf0\xa9\x53\x91\x3d\x5f\xea\xc5\x8b\x00\
+\xf0\xa5\x33\x91\x5b\x3e\xd4\x8d\xf3\x01\xe0\x43\x27\x22\x7f\x5c\
+\xaf\x1f\xe7\x03\x00\x40\x30\xa7\x03\xc0\xf5\xf4\x46\x34\x5c\xae\
+\x23\x67\x03\xc0\xe5\x4e\x43\xf4\x5c\xad\x27\x27\x03\xc0\xd5\xce\
+\x42\xbc\x5c\xac\x2b\xe7\x02\xc0\xc5\x4e\x82\x1e\xae\xd5\x97\x73\
+\x01\x00\x20\x75\x4e\x05\x80\x6b\xe9\x0c\x9d\x5c\xaa\x33\x67\x02\
+\xc0\xa5\x4e\x81\x7e\xae\xd4\x9b\x13\x01\xe0\x4a\x67\xc0\x2e\x2e\
+\xd4\x9d\x13\x01\x00\x20\x33\xd6\x07\x80\x0b\x29\x0c\x7b\xd9\x5e\
+\x7f\x56\x07\x80\xed\x07\x1f\x6e\xb0\xb9\x0e\xad\x0e\x00\x00\xd9\
+\xb1\x36\x00\x6c\x4e\x5d\xb8\xc7\xd6\x7a\xb4\x32\x00\x6c\x3d\xd8\
+\x70\x9b\x8d\x75\x69\x65\x00\x00\xc8\x0d\xeb\x02\xc0\xc6\x94\x85\
+\x3f\x6c\xab\x4f\xeb\x02\x00\x40\xee\x58\x15\x00\xb6\xa5\x2b\xfc\
+\x64\x53\x9d\x5a\x15\x00\x00\x72\xcb\x9a\x00\xb0\x29\x55\x01\x5b\
+\xea\xd5\x9a\x00\x00\x90\x7b\x56\x04\x80\x2d\x69\x0a\xdc\xca\x86\
+\xba\xb5\x22\x00\x00\xe4\x87\xfa\x00\xb0\x21\x45\x81\x20\xda\xeb\
+\x57\x7d\x00\x00\xc8\x1f\xd5\x01\xa0\x3d\x3d\x81\x54\x68\xae\x63\
+\xd5\x01\x00\x20\xbf\x08\x00\xc0\x63\x6a\x03\x40\xf3\xb4\x09\x48\
+\x97\xd6\x7a\x56\x1b\x00\x00\xf2\x4f\x65\x00\x68\x4d\x4b\x20\x1b\
+\x1a\xeb\x5a\x65\x00\x00\x88\x06\x01\x00\x78\x4c\x5d\x00\x68\x9c\
+\x26\x01\xb9\xa2\xad\xbe\xd5\x05\x00\x80\xe8\x10\x00\x80\xc7\x08\
+\x00\xc0\x63\xaa\x02\x40\xdb\xfa\x08\xc8\x07\x4d\x75\xae\x2a\x00\
+\x00\x44\x8b\x00\x00\x3c\x46\x00\x00\x1e\x53\x13\x00\x9a\xd6\x45\
+\x40\xbe\x69\xa9\x77\x35\x01\x00\x20\x7a\x04\x00\xe0\x31\x02\x00\
+\xf0\x18\x01\x00\x78\x4c\x45\x00\x68\x39\x21\x02\x44\x49\x43\xdd\
+\x17\xc6\xdd\x80\xb8\x55\x8c\x2b\x92\x37\xbe\xfd\x48\xe0\xe7\x43\
+\x23\x23\x52\xf7\xfd\x3d\x19\xfd\xed\xbf\x7b\xb4\x46\xbe\xfa\xe0\
+\xfc\xc0\xcf\x6f\xf4\x0f\xca\x86\x9f\xee\x97\x4b\x1d\xbd\x19\xfd\
+\xfd\x6c\xad\x5d\x32\x4d\x7e\xfc\x67\x2b\x02\x3f\xff\xde\xce\x7a\
+\xf9\xdf\x77\x2e\x8c\xf9\xd9\x5f\xdc\x3f\x47\xbe\xf3\xb9\x25\xc6\
+\xbf\xff\xd5\x5f\xbe\x2b\xfb\xcf\xb4\x66\xd3\xc4\xbc\xd8\xb4\x62\
+\x96\x3c\xfb\xd4\xf2\xc0\xcf\x4f\x5f\xb9\x2e\xeb\x7f\xba\x3f\xc2\
+\x16\xc5\x47\xc5\x0c\xc0\x57\xe3\x8b\x0b\xe5\x99\x0d\xcb\x25\x11\
+\x77\x43\x32\xb0\xe3\xf0\x25\xe9\x1f\x1a\x36\x7e\x67\xc3\xdd\x33\
+\x22\x6a\x4d\x7a\x36\xad\x98\x69\xfc\xfc\xd7\xef\x5d\x8c\xa8\x25\
+\xf1\x23\x00\x62\xb6\x72\xc1\x64\xf9\xd3\x3f\x9a\x1d\x77\x33\xd2\
+\x76\xad\x67\x40\xf6\x9e\x68\x31\x7e\xe7\xb1\xa5\xd3\xa5\xb4\x28\
+\x19\x51\x8b\x52\x33\xbb\xa2\x54\x3e\x35\xb7\x22\xf0\xf3\x81\xa1\
+\x61\xf9\xcd\xe1\xa6\x08\x5b\x14\x2f\x02\x40\x81\x6f\x3f\xb6\x48\
+\x66\x95\x97\xc6\xdd\x8c\xb4\x6d\x39\x60\xfe\xa5\x2c\x2d\x4a\xca\
+\xa3\x4b\xa7\x45\xd4\x9a\xd4\x6c\x5c\x31\xcb\x38\xe3\x7a\xf5\x44\
+\x8b\xb4\x77\x0f\x44\xd6\x9e\xb8\x11\x00\x0a\x8c\x2b\x4e\xca\x33\
+\x4f\xd9\xb7\x14\x78\xf3\x4c\x5b\xe8\xf9\x8b\xf5\x77\x99\xa7\xdb\
+\x51\x4a\x88\xc8\x53\x21\xcb\x12\x9f\xa6\xff\x22\x04\x80\x1a\xf7\
+\xcf\xab\x94\x3f\xbf\xcf\xae\xa5\xc0\xf0\xc8\x88\x6c\x3d\x68\x1e\
+\x30\x2b\x17\x54\xca\x94\x09\x77\x44\xd4\x22\xb3\x4f\xcf\xaf\x94\
+\x99\x93\x82\x67\x5a\x17\xaf\xf5\xc8\x9b\x0a\x4f\x5a\xe6\x53\xec\
+\x01\xa0\xe1\x52\x88\x16\xdf\x7a\x6c\x91\xcc\xae\xb0\x6b\x29\xf0\
+\xc2\x81\x26\x19\x1e\x09\xee\xc2\x64\x22\x21\x4f\xd6\x55\x45\xd8\
+\xa2\x60\x9f\x5f\x31\xcb\xf8\xf9\xd6\x03\x17\x25\xea\x62\x8c\xbb\
+\xfe\x63\x0f\x00\x7c\xa4\xb4\x28\x29\xcf\x3c\x55\x6b\xd5\x52\xa0\
+\xa9\xa3\x47\xde\x3a\xdb\x66\xfc\xce\x06\x05\xcb\x80\xf1\xc5\x85\
+\xf2\x98\xe1\x7c\xc4\xe8\x6c\xc6\x9f\x93\x7f\x1f\x22\x00\x94\xb9\
+\x6f\x6e\x85\x7c\xe1\xd3\x73\xe2\x6e\x46\x5a\xb6\x84\xac\x9b\x97\
+\x54\x95\xc9\xc2\xa9\x13\x22\x6a\xcd\xd8\xd6\xd5\x4e\x97\x12\xc3\
+\x15\x89\xd7\x4f\xb5\xca\xe5\xce\x78\xf6\x63\xc4\x89\x00\x50\xe8\
+\x5b\x8f\xd6\xc8\xec\x8a\x71\x71\x37\x23\x65\xaf\x9e\x68\x91\x8e\
+\x1e\xf3\x99\xf3\xb8\xf7\x04\x6c\x0c\x99\xfe\xff\xfa\xbd\x0f\x22\
+\x6a\x89\x2e\x04\x80\x42\x25\x45\x49\x79\x6e\xe3\x72\x29\x48\xd8\
+\xb1\x18\xe8\x1f\x1a\x96\x1d\x87\x2f\x19\xbf\xb3\xbe\x6e\x46\x6c\
+\xff\x9f\xb9\x95\xe3\xe4\xde\xd9\xe5\x81\x9f\xb7\xde\xe8\x97\x7d\
+\x27\xaf\x44\xd7\x20\x45\x08\x00\xa5\x3e\x35\xa7\x42\xbe\x78\xbf\
+\x3d\x4b\x81\xb0\x3d\x01\xd3\x27\x96\xc8\x7d\x86\x0d\x38\xf9\xb4\
+\x29\xe4\xd7\x7f\xdb\xc1\x26\x19\x1a\xf6\xf3\x5c\x34\x01\xa0\xd8\
+\xdf\xae\xad\x91\xb9\x95\x76\x2c\x05\x1a\x2e\x77\xc9\xd1\xa6\x4e\
+\xe3\x77\xe2\x58\x06\x14\x24\x12\xa1\xff\xee\x96\x03\x7e\x4e\xff\
+\x45\x08\x80\x58\x35\xb6\x5c\x37\x7e\x5e\x52\x58\x20\xcf\x6e\xac\
+\xb5\x66\x29\x10\x36\x0b\xf8\xe3\x65\xd3\xa5\xa4\x30\xda\x92\x5b\
+\xb9\xa0\x52\xaa\x26\x96\x04\x7e\xfe\xce\xf9\x76\x39\xd7\xda\x1d\
+\x61\x8b\x74\x21\x00\x62\xf4\x83\xdd\x0d\xd2\xd6\xdd\x6f\xfc\xce\
+\xbd\xb3\xcb\xe5\xaf\x1e\x98\x1b\x51\x8b\xb2\xf3\xd2\x91\x4b\xd2\
+\x3b\x18\x7c\x83\xd0\xf8\xe2\x42\x59\xb3\x24\xda\xad\xc1\xe1\x27\
+\xff\xfc\xda\xf9\xf7\x49\x04\x40\x8c\xda\xba\xfb\xe5\xfb\x3b\xeb\
+\x43\xbf\xf7\xcd\x35\x0b\x65\xfe\xe4\xf1\x11\xb4\x28\x3b\x5d\x7d\
+\x83\xf2\xf2\xf1\x66\xe3\x77\xd6\xdf\x15\xdd\x32\xa0\xec\x8e\x42\
+\x59\x6b\x08\x9c\x54\xda\xeb\x3a\x02\x20\x66\x2f\x1f\xbf\x2c\xbf\
+\x3d\x66\x2e\xc2\x3b\x0a\x0b\xe4\x59\x4b\xae\x0a\x84\xed\x09\x58\
+\x55\x3d\x45\x2a\xc7\x17\x47\xd2\x96\x75\xb5\x55\xc6\x25\xc7\x8b\
+\x87\xcd\x33\x16\x1f\x10\x00\x0a\xfc\xcb\xce\x7a\x69\xbd\x61\x5e\
+\x0a\xac\xb8\xb3\x5c\xbe\xb4\x52\xff\x52\xe0\x0f\xe7\xdb\xe5\xfd\
+\xb6\xe0\x35\x75\xb2\x20\x21\x7f\x52\x1b\xcd\xd6\xe0\xb0\xb3\xff\
+\xbe\x5e\xfb\xbf\x15\x01\xa0\xc0\xb5\x9e\x01\xf9\xde\x8b\xc7\x43\
+\xbf\xf7\xd7\x8f\x2c\x94\x05\x53\xf4\x2f\x05\xb6\x86\x9c\x0c\x8c\
+\x62\x6b\xf0\xfc\xc9\xe3\xe5\xee\x3b\x27\x05\x7e\x7e\xfc\x52\xa7\
+\xd4\x37\x77\xe5\xbd\x1d\xda\x11\x00\x4a\xbc\x72\xa2\x45\x76\x1e\
+\x0d\x5f\x0a\x3c\xbf\xb1\x56\x92\xca\x97\x02\xdb\x0e\x35\xc9\x90\
+\xe1\x06\xa1\xda\x99\x13\xf3\x7e\x4e\x63\xd3\x3d\x3c\xf5\x27\x15\
+\x04\x80\x22\xcf\xbc\x54\x2f\x57\xaf\xf7\x19\xbf\x53\x37\x6b\x92\
+\x7c\xf9\xc1\x79\xd1\x34\x28\x43\x2d\x5d\x7d\xf2\xfa\xa9\xab\xc6\
+\xef\xe4\x73\x4f\x40\x32\x91\x30\xce\x32\x7a\x07\x87\x65\xe7\x11\
+\xf3\xce\x45\x5f\x10\x00\x8a\x74\xf4\x0c\xc8\xe6\x17\xc3\xaf\x0a\
+\x3c\xfd\x70\xb5\x54\xc7\x7c\x73\x4d\x98\xb0\x93\x81\x4f\xd6\xcd\
+\xc8\xdb\x5d\x8f\x9f\xa9\x9e\x2c\xd3\xca\x82\x9f\x41\xb0\xfb\x58\
+\xb3\x74\xf5\x0d\xe6\xe9\x5f\xb7\x0b\x01\xa0\xcc\xde\x86\x96\xd0\
+\x7d\xf5\xc5\x49\xfd\x4b\x81\xdf\x9d\xbc\x22\x6d\x86\x13\x9b\xb3\
+\xca\x4b\xe5\xde\x39\xf9\xd9\x1a\xcc\x43\x3f\x53\x47\x00\x28\xf4\
+\xec\x6f\x4f\xc8\x95\x90\xa5\x40\xed\xcc\x89\xf2\x95\x55\xf3\xa2\
+\x69\x50\x06\x06\x87\x47\x64\xfb\x21\xf3\xfd\xf5\xf9\x58\x06\x4c\
+\x2c\x29\x32\x6e\x36\x3a\xdb\x7a\x43\xde\x7d\xbf\x3d\xe7\xff\xae\
+\xad\x08\x00\x85\x3a\x7b\x07\xe4\x9f\x77\x84\x5f\x15\x78\x7a\x75\
+\xb5\xd4\x4c\xd3\xbb\x14\x08\xdb\x1a\xfc\xb9\x65\x55\x52\x9c\xcc\
+\x6d\x09\x3e\x51\x67\xfe\x9b\x61\x4b\x13\xdf\xc4\x1e\x00\xf5\x9b\
+\x1f\xd7\x3b\x8f\x8d\xd1\xef\x4e\x5e\x09\xfd\x05\x2d\xfa\x70\x29\
+\x50\xa0\xf3\x10\x9e\xb9\x7a\x43\x0e\x5c\xb8\x16\xf8\x79\x59\x49\
+\xa1\x3c\xbc\x78\x6a\x4e\xff\x4d\xd3\xf4\x7f\x70\x78\x44\xb6\x85\
+\x1c\xd3\xa8\xc5\x5d\xff\xb1\x07\x00\x82\x3d\xb7\xeb\x84\xb4\x74\
+\x99\x97\x02\xcb\x66\x4c\x94\xaf\xad\x0a\x7e\xfb\x50\xdc\xc2\x66\
+\x01\x1b\x72\xb8\x35\xb8\x7a\xea\x04\xa9\x9d\x19\x7c\xed\x7f\x5f\
+\x43\x8b\xf1\xbc\x84\x8f\x08\x00\xc5\xba\x7a\x07\xe5\x9f\x76\x1c\
+\x0b\xfd\xde\x37\x56\x57\xcb\xe2\xe9\x65\x11\xb4\x28\x7d\xbb\x8e\
+\x35\x4b\x77\xff\x50\xe0\xe7\x0f\xd5\x4c\x95\xf2\xd2\xa2\x9c\xfc\
+\x5b\x9f\xe7\xe4\x5f\xda\x08\x00\xe5\x5e\x6b\xbc\x2a\x2f\x84\x3c\
+\x7a\xbb\xb0\x20\x21\xcf\x6d\xac\x95\x42\x85\x4b\x81\xee\xfe\x21\
+\xe3\xbd\x0e\x85\x05\x09\x59\x97\x83\xad\xc1\xc9\x44\xc2\x78\xa3\
+\x51\x73\x67\xaf\xbc\x71\xda\xaf\x47\x7e\xa7\x82\x00\xb0\xc0\xbf\
+\xee\x6a\x08\x7d\x60\xe5\xd2\xaa\x32\xf9\xfa\x43\x0b\x22\x6a\x51\
+\x7a\xc2\x4e\xbc\xe5\x62\x6b\xf0\x67\x6b\xa6\x18\xdf\x3f\xb0\xf5\
+\xc0\x45\xe3\xe3\xcb\x7d\x45\x00\x58\xa0\xab\x6f\x50\xfe\xf1\x37\
+\xe1\x4b\x81\xaf\x7f\x76\x81\x2c\xa9\xd2\xb7\x14\x38\xf8\xc1\x35\
+\x39\x73\xf5\x46\xe0\xe7\x77\xdf\x39\x49\xe6\x64\xf9\xe4\xa3\x8d\
+\x86\xe9\xff\xf0\xc8\x88\x6c\x3d\xa0\xeb\xe4\x9f\x16\x04\x80\x25\
+\x5e\x3f\xdd\x1a\x7a\x42\xad\xb0\x20\x21\xcf\x2b\x5d\x0a\x84\xcd\
+\x02\xb2\x79\x4e\x40\x79\x69\x91\x3c\xb2\x28\xf8\x6a\xc2\x9b\x67\
+\xda\xa4\xa9\xa3\x27\xe3\xbf\xef\x32\x15\x01\x10\xf7\xa5\x10\x5b\
+\xfc\x60\x77\x83\x34\x87\x2c\x05\x16\x4f\x2f\x93\x6f\xac\xae\x8e\
+\xa8\x45\xa9\xdb\x7e\xa8\x49\x06\x0d\x0f\xde\xcc\xe6\x6a\xc0\x13\
+\x75\x33\xa4\xc8\x70\xed\x5f\xeb\x6d\xbf\x1a\xea\x5e\x45\x00\x20\
+\x35\xd7\xfb\x06\xe5\x1f\xb6\x87\x2f\x05\xbe\xb6\x6a\xbe\x2c\x9b\
+\x31\x31\x82\x16\xa5\xae\xad\xbb\x5f\xf6\x35\x04\xbf\x4e\x7c\x76\
+\xc5\x38\x59\x71\x67\x79\x46\x7f\xdb\x74\xed\xbf\xbd\x7b\x40\xf6\
+\x36\xf8\xf9\xc8\xef\x54\x10\x00\x96\xd9\x7f\xa6\x55\x7e\xf5\xae\
+\xf9\x17\x2d\x79\x73\x29\x60\xfa\x55\x8c\x43\xe8\x9e\x80\x0c\xb6\
+\x06\x2f\x9a\x36\xc1\x18\x76\xdb\x0f\x35\xc9\xc0\x90\xdf\x4f\xfd\
+\x31\xd1\x55\x21\x48\xc9\x0f\x5f\x3e\x19\xba\xa6\xad\x99\x36\x41\
+\x9e\x56\xb6\x14\x78\xe3\x54\xab\x5c\x36\x6c\x6c\x5a\xb7\xbc\x2a\
+\xed\xd0\xda\x74\x0f\x4f\xfd\xc9\x06\x01\x60\xa1\x1b\xfd\xa3\x4b\
+\x81\xb0\x8b\x5a\x5f\x59\x35\x4f\x6a\x67\xea\x59\x0a\x0c\x8d\x8c\
+\xc8\x36\xc3\x9e\x86\x49\xa5\x45\xf2\x50\xcd\x94\x94\xff\x5e\xb2\
+\x20\x21\xeb\xeb\x82\x67\x0d\x07\x2e\x98\xaf\x3e\x40\x51\x00\x68\
+\x38\x21\x62\x93\xb7\xce\xb6\xc9\xaf\xde\xb9\x60\xfc\x4e\x32\x31\
+\xba\x41\x28\xd7\x37\xdc\x64\x23\xec\x15\xdc\xe9\x5c\x0d\x58\x5d\
+\x33\xd5\xf8\x80\x51\xcd\x3b\xff\xb4\xd4\xbb\x9e\xca\x40\xda\x7e\
+\xb8\xe7\xa4\x5c\xbc\x66\x5e\x0a\x2c\x9c\x3a\x41\x9e\x7e\x58\xcf\
+\x52\xe0\x42\x7b\x8f\xbc\x7d\x2e\xf8\x75\xe2\x0f\x2f\x9a\x2a\x65\
+\x25\x85\x29\xfd\x2d\xd3\xc9\xbf\x1b\xfd\x83\xb2\x2b\xe4\x69\xcb\
+\x20\x00\xac\xd6\xdd\x3f\x94\xd2\x52\xe0\xcb\x0f\xce\x93\xba\x59\
+\xc1\x37\xc9\x44\xcd\xb4\x27\xa0\x38\x59\x20\xeb\x96\x87\x6f\x0d\
+\xae\x1c\x57\x2c\xab\x0d\xd7\xfe\x77\x1e\x69\x96\x9e\x81\xe0\x7b\
+\x10\x30\x8a\x00\xb0\xdc\xef\xcf\xb5\xc9\xff\xfc\x21\x7c\x29\xf0\
+\xbc\xa2\xa5\xc0\x9e\xfa\xcb\xd2\xd5\x1b\xfc\x48\xae\x54\x96\x01\
+\x4f\xde\x35\xc3\xb8\xe1\x49\xf3\xf4\x5f\x13\x1d\x15\x71\x93\x96\
+\x75\x91\x6d\x7e\xb4\xe7\xa4\x5c\x68\x37\x2f\x05\x16\x4c\x19\x2f\
+\xdf\x5c\xb3\x30\xa2\x16\x99\xf5\x0d\x0e\xcb\xce\xa3\xc1\x8f\x3d\
+\xbb\x77\x4e\x85\xcc\x2a\x2f\x35\xfe\x0d\xd3\xf4\x7f\xf4\x45\xa5\
+\x1d\x19\xb7\x2f\xdf\x34\xd5\xb9\xaa\x00\x40\x66\x7a\x06\x86\xe4\
+\xbb\xdb\x8f\x86\x2e\x05\xbe\xb4\x72\xae\xf1\x59\xf9\x51\x32\x2d\
+\x03\x12\x62\x9e\x05\x2c\xad\x2a\x33\xde\xfe\xcc\xaf\x7f\xea\x08\
+\x00\x47\xbc\x73\xbe\x5d\xfe\xfb\xed\xf7\x8d\xdf\x29\xb8\x79\x55\
+\xe0\x8e\x88\xdf\xd0\x3b\x96\x63\x97\x3a\xa5\xe1\x72\xf0\x8b\x39\
+\x4c\x01\x60\x7a\xe1\x67\xdf\xe0\x70\xe8\x43\x55\xf1\x91\xf8\x2b\
+\x01\x39\xf3\xa3\x57\x1a\x8d\xaf\xe5\x12\x19\x7d\x63\xce\xdf\xac\
+\xa9\x89\xa8\x45\x66\xa6\x5f\xea\xf9\x93\xc7\x8f\xb9\xc3\x2f\x99\
+\x48\xc8\x13\x86\xe7\x07\xec\xa9\xbf\x2c\x9d\xbd\x03\x39\x69\x9f\
+\x0f\xd4\x05\x80\xa6\xf5\x91\x6d\x7a\x07\x86\xe4\xbb\xdb\x8f\x85\
+\xde\xf7\xfe\x97\x0f\xcc\x91\x7b\x66\x97\x47\xd3\x28\x83\x17\x8f\
+\x5c\x92\x7e\xc3\x36\xdd\xb1\xde\x21\xf8\x99\xea\xc9\xc6\x6b\xff\
+\xda\x1f\xfa\xa9\xad\xbe\xd5\x05\x00\xb2\xf3\xee\xfb\xed\xf2\x5f\
+\xbf\x4f\x6d\x29\x60\x7a\x73\x6e\x14\x3a\x7a\x06\xe4\x95\xfa\xe0\
+\x1b\x84\xd6\x2d\xaf\xba\xed\xe5\x21\xa6\xa5\xc1\x85\xf6\x6e\xe3\
+\x1e\x03\xdc\x8e\x00\x70\xd0\xbf\xbd\xda\x28\xe7\x43\x96\x02\x73\
+\x2b\xc7\xa9\xb8\x6d\xd8\x74\x83\xd0\x8c\x49\x25\xb2\xe2\x96\x99\
+\x4a\x69\x51\x52\xd6\x1a\x9e\xf9\xbf\xe5\x3d\xf3\x2e\x43\xdc\x4e\
+\x65\x00\x68\x9b\x26\xd9\xa6\x77\x70\x58\xfe\x7e\xdb\xd1\xd0\xa5\
+\x80\x86\x37\x0d\xbf\x75\xa6\xd5\xb8\x9b\xf1\xd6\x4d\x41\x6b\x97\
+\x4c\x93\xd2\xa2\xe4\x98\xdf\x1b\x1a\x1e\x91\x17\x0e\xea\x7e\xea\
+\x8f\xc6\xba\x56\x19\x00\xc8\xde\x81\x0b\xd7\xe4\x17\x6f\x99\x97\
+\x02\x1a\x8c\x88\x18\x07\xee\xad\xbf\xf8\x8f\x1a\x7e\xfd\x5f\x6b\
+\xbc\x1a\xfa\x36\x25\xdc\x4e\x6d\x00\x68\x4c\x4b\xdb\xfc\xfb\xde\
+\x46\x39\xdb\xaa\xff\x6e\x38\xd3\x03\x3b\x67\x4c\x2a\x91\xc5\xd3\
+\xcb\xa4\x38\x59\x20\xab\x16\x06\xdf\x29\xa8\xfd\xb6\x5f\xad\xf5\
+\xac\x36\x00\x90\xbd\xbe\x14\x97\x02\x71\x6b\xee\xec\x95\xfd\x67\
+\x82\x4f\xde\x3d\xb2\x78\xaa\x3c\xb0\xa0\x52\xc6\x15\x8f\x3d\xfd\
+\x6f\xe9\xea\x93\xd7\x1a\xcd\xaf\x23\xc7\xd8\x08\x00\xc7\x1d\xfa\
+\xa0\x43\x7e\xfe\xe6\xf9\xb8\x9b\x11\x6a\x8b\xe1\x17\x7c\xcd\xe2\
+\xa9\xb2\x66\x71\xf0\xf4\x7f\xdb\xc1\x26\x19\x52\x1e\x72\x5a\xa9\
+\x0e\x00\xad\xd3\x26\xdb\xfc\x78\xdf\x29\xf5\x0f\xc6\xd8\xdb\x70\
+\x45\xda\xbb\xc7\xde\xc0\xb3\x7c\xe6\x24\x79\x7c\xd9\xf4\x31\x3f\
+\x1b\x91\xf0\x47\x8d\xc5\x4d\x73\x1d\xab\x0e\x00\xe4\x46\xdf\xe0\
+\xb0\x7c\x67\xdb\x51\xd5\xbf\x92\x03\x43\xc3\xb2\xe3\xf0\xd8\x27\
+\x03\x13\x32\xfa\xb4\xa0\xb1\xbc\x7d\xb6\x4d\x2e\xb4\x9b\x2f\x79\
+\x22\x98\xfa\x00\xd0\x9c\x9e\x36\x39\x72\xb1\x43\x7e\xb6\xff\x5c\
+\xdc\xcd\x30\xca\xe4\x97\x9c\x93\x7f\xd9\x51\x1f\x00\xc8\x9d\x9f\
+\xec\x3b\x2d\xa7\xae\x5c\x8f\xbb\x19\x81\x1a\x5b\xae\xcb\x91\x8b\
+\xa9\xdf\xc6\xdb\xd1\x33\x20\x7b\x0c\x3b\x09\x11\xce\x8a\x00\xd0\
+\x9e\xa2\xb6\xe8\x1f\x1a\xbd\x2a\xa0\x79\x29\x90\xce\x2c\x60\xc7\
+\x61\xf3\xbd\x04\x71\xb3\xa1\x6e\xad\x08\x00\xe4\xce\xd1\xa6\x4e\
+\xf9\xcf\xd7\xcf\xc5\xdd\x8c\x40\x2f\x1d\x6d\x96\xde\x14\x1f\xe5\
+\xa5\x7d\xfa\x6f\x03\x6b\x02\xc0\x86\x34\xb5\xc5\x7f\xfc\xdf\x69\
+\x69\x6c\xd1\xb9\x14\xb8\xde\x37\x28\xbb\x8e\x5f\x0e\xfd\xde\x91\
+\x8b\x1d\x72\x52\xe9\xff\x41\xc4\x9e\x7a\xb5\x26\x00\x90\x3b\x03\
+\x43\x37\xaf\x0a\x18\xde\xd5\x17\xa7\x54\x6e\xe9\xe5\xa9\x3f\xb9\
+\x61\x45\x4a\xdd\x6a\xe9\xe6\xdd\x3a\xab\x16\xb8\xc9\x96\x5f\x7f\
+\x11\x66\x00\x80\xd7\xac\x0b\x00\x9b\xd2\x15\xfe\xb1\xad\x3e\xad\
+\x0b\x00\x00\xb9\x63\x65\x00\xd8\x96\xb2\xf0\x83\x8d\x75\x69\x65\
+\x00\x88\xd8\x79\xb0\xe1\x2e\x5b\xeb\xd1\xda\x00\x00\x90\x3d\xab\
+\x03\xc0\xd6\xd4\x85\x5b\x6c\xae\x43\xab\x03\x40\xc4\xee\x83\x0f\
+\xfb\xd9\x5e\x7f\xd6\x07\x00\x80\xcc\x39\x11\x00\xb6\xa7\x30\xec\
+\xe4\x42\xdd\x39\x11\x00\x22\x6e\x74\x06\xec\xe1\x4a\xbd\x39\x13\
+\x00\x22\xee\x74\x0a\x74\x73\xa9\xce\x9c\x0a\x00\x00\xe9\x71\x2e\
+\x00\x5c\x4a\x67\xe8\xe3\x5a\x7d\x39\x17\x00\x22\xee\x75\x12\x74\
+\x70\xb1\xae\x9c\x0c\x00\x11\x37\x3b\x0b\xf1\x71\xb5\x9e\x9c\x0d\
+\x00\x11\x77\x3b\x0d\xd1\x72\xb9\x8e\x9c\x0e\x00\x00\x66\xce\x07\
+\x80\xcb\xe9\x8d\xfc\x73\xbd\x7e\x9c\x0f\x00\x11\xf7\x3b\x11\xf9\
+\xe1\x43\xdd\x78\x11\x00\x22\x7e\x74\x26\x72\xc7\x97\x7a\xf1\x26\
+\x00\x44\xfc\xe9\x54\x64\xc7\xa7\x3a\xf1\x2a\x00\x44\xfc\xea\x5c\
+\xa4\xcf\xb7\xfa\xf0\x2e\x00\x44\xfc\xeb\x64\xa4\xc6\xc7\xba\xf0\
+\x32\x00\x44\xfc\xec\x6c\x04\xf3\xb5\x1e\xbc\x0d\x00\x11\x7f\x3b\
+\x1d\x1f\xe7\x73\x1d\x78\xfb\x1f\xff\x24\x5e\x39\xe6\x1f\x9f\x07\
+\xfe\x87\xbc\x9e\x01\xdc\x8a\x62\xf0\x0b\xfd\x3d\x8a\x00\xb8\x05\
+\x45\xe1\x07\xfa\xf9\x23\x04\xc0\x27\x50\x1c\x6e\xa3\x7f\x3f\x8e\
+\x83\x61\xc0\x79\x01\x77\x30\xf0\xc7\xc6\x0c\xc0\x80\xa2\x71\x03\
+\xfd\x18\x8c\x00\x08\x41\xf1\xd8\x8d\xfe\x33\xe3\xe0\xa4\x81\x25\
+\x81\x3d\x18\xf8\xa9\x61\x06\x90\x06\x8a\xca\x0e\xf4\x53\xea\x38\
+\x50\x19\x62\x36\xa0\x0f\x03\x3f\x7d\xcc\x00\x32\x44\xb1\xe9\x42\
+\x7f\x64\x86\x83\x96\x03\xcc\x06\xe2\xc3\xc0\xcf\x0e\x07\x2f\x87\
+\x08\x82\xe8\x30\xf0\x73\x83\x83\x98\x07\x04\x41\xfe\x30\xf0\x73\
+\x8b\x83\x99\x47\x04\x41\xee\x30\xf0\xf3\x83\x83\x1a\x01\x82\x20\
+\x73\x0c\xfc\xfc\xe2\xe0\x46\x88\x20\x48\x1d\x03\x3f\x1a\x1c\xe4\
+\x98\x10\x06\xb7\x63\xd0\x47\x8f\x03\x1e\x33\x82\x80\x81\x1f\x27\
+\x0e\xbc\x22\x3e\x85\x01\x83\x5e\x07\x3a\x41\x31\x97\x02\x81\x01\
+\xaf\x13\x9d\x62\x11\x9b\x02\x81\x01\x6f\x07\x3a\xc9\x72\x1a\x42\
+\x81\xc1\x6e\x2f\x3a\xce\x61\xb9\x0c\x07\x06\x39\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\xfd\x3f\xea\xe1\x5a\
+\x1e\x49\x49\x18\x84\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x03\
+\x00\x00\x68\x70\
+\x00\x61\
+\x00\x70\x00\x70\
+\x00\x03\
+\x00\x00\x7a\xbe\
+\x00\x73\
+\x00\x75\x00\x6e\
+\x00\x04\
+\x00\x07\x46\x5e\
+\x00\x6d\
+\x00\x6f\x00\x6f\x00\x6e\
+\x00\x06\
+\x03\x49\x57\x47\
+\x00\x31\
+\x00\x36\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x53\x57\x47\
+\x00\x32\
+\x00\x30\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x65\x57\x47\
+\x00\x33\
+\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x73\x57\x47\
+\x00\x34\
+\x00\x30\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x97\x57\x47\
+\x00\x36\
+\x00\x34\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x57\x57\x47\
+\x00\x32\
+\x00\x34\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x03\x7b\x57\x47\
+\x00\x34\
+\x00\x38\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x04\x5b\x57\x27\
+\x00\x31\
+\x00\x32\x00\x38\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x05\x89\x57\x27\
+\x00\x32\
+\x00\x35\x00\x36\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x07\x00\x00\x00\x0f\
+\x00\x00\x00\x1c\x00\x02\x00\x00\x00\x05\x00\x00\x00\x0a\
+\x00\x00\x00\x28\x00\x02\x00\x00\x00\x05\x00\x00\x00\x05\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x00\x86\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x01\x1f\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x01\xe0\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x02\xc5\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x04\x01\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x04\xb2\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x05\x7f\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x90\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x07\xc3\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x09\x44\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x1e\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x11\x0e\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x17\xac\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x22\x3f\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x30\x61\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x4b\xbf\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x07\x00\x00\x00\x0f\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x1c\x00\x02\x00\x00\x00\x05\x00\x00\x00\x0a\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x28\x00\x02\x00\x00\x00\x05\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x54\x5d\x44\xa9\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x00\x86\
+\x00\x00\x01\xa1\x54\x5d\x44\xaa\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x01\x1f\
+\x00\x00\x01\xa1\x54\x5d\x44\xab\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x01\xe0\
+\x00\x00\x01\xa1\x54\x5d\x44\xac\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x02\xc5\
+\x00\x00\x01\xa1\x54\x5d\x44\xad\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x04\x01\
+\x00\x00\x01\xa1\x54\x5d\x44\xa9\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x04\xb2\
+\x00\x00\x01\xa1\x54\x5d\x44\xaa\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x05\x7f\
+\x00\x00\x01\xa1\x54\x5d\x44\xab\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x90\
+\x00\x00\x01\xa1\x54\x5d\x44\xab\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x07\xc3\
+\x00\x00\x01\xa1\x54\x5d\x44\xac\
+\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x09\x44\
+\x00\x00\x01\xa1\x54\x5d\x44\x9f\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x1e\
+\x00\x00\x01\xa1\x54\x5d\x44\x9f\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x11\x0e\
+\x00\x00\x01\xa1\x54\x5d\x44\xa0\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x17\xac\
+\x00\x00\x01\xa1\x54\x5d\x44\xa1\
+\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x22\x3f\
+\x00\x00\x01\xa1\x54\x5d\x44\xa1\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x30\x61\
+\x00\x00\x01\xa1\x54\x5d\x44\xa4\
+\x00\x00\x00\xc8\x00\x00\x00\x00\x00\x01\x00\x00\x4b\xbf\
+\x00\x00\x01\xa1\x54\x5d\x44\xa9\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,287 @@
+"""Shared invoice database service.
+
+Serves DatabaseManager and the PDF renderer over HTTP/JSON so several
+workstations can use one database without opening it over a network share.
+Run it on the machine that holds invoice_app.db, then start the application
+on each desk with INVOICE_APP_SERVER=http://<server>:8765.
+
+Writes run one at a time on a single connection. Reads run at the same time
+on a pool of read-only connections; the database is switched to WAL mode so
+they never wait for a write. Backups and idle-time maintenance are scheduled
+here instead of on the workstations.
+
+Endpoints:
+    POST /api/<method>          {"args": [...], "kwargs": {...}} -> {"result": ...}
+    GET  /invoices/<id>.pdf     the invoice rendered with ?profile=screen|print|archive
+
+Usage:
+    python invoice_server.py [--db invoice_app.db] [--host 127.0.0.1] [--port 8765]
+        [--readers 4] [--token SECRET]
+"""
+import argparse
+import contextlib
+import hmac
+import json
+import logging
+import os
+import queue
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app import (DEFAULT_PDF_PROFILE, PDF_PROFILES, SCHEMA_VERSION, SERVER_PORT, SERVER_TOKEN_HEADER,
+                 DatabaseManager, _TrackedConnection, generate_bill_pdf, invoice_pdf_data)
+
+DEFAULT_READERS = 4
+
+# Methods that only read, run concurrently on the read-only pool. Backups
+# only read the database, so they do not hold up writes either.
+READ_METHODS = {
+    "get_all_companies", "get_company_by_gst", "get_company_by_id",
+    "get_all_products", "get_product_by_id", "get_product_details", "diff_catalogue",
+    "get_next_bill_number", "get_all_invoices", "get_all_invoice_details", "search_invoices",
+    "get_invoice_details", "get_invoices_details", "get_invoice_by_bill_number",
+    "get_payments", "get_open_invoices", "get_client_balances", "get_client_ledger",
+    "get_dashboard_data", "get_financial_years", "get_maintenance_log", "get_invoice_changes",
+    "list_backups", "create_backup",
+    "gst_report.get_periods", "gst_report.get_period_totals",
+    "gst_report.get_b2b_summary", "gst_report.get_hsn_summary",
+}
+# Methods that change the database, run one at a time on the writer connection
+WRITE_METHODS = {
+    "add_company", "update_company", "delete_company",
+    "add_product", "update_product", "delete_product", "import_catalogue",
+    "create_invoice", "update_invoice", "update_invoices", "delete_invoices",
+    "add_payment", "delete_payment", "archive_financial_year",
+    "refresh_dashboard_cache", "rebuild_gst_summaries", "run_maintenance", "save_export_checkpoint",
+}
+
+logger = logging.getLogger("invoice_app.server")
+
+
+class _PooledConnection(_TrackedConnection):
+    """Connection that stays open between requests; DatabaseManager methods
+    closing it only hand it back."""
+    def close(self):
+        pass
+
+    def shutdown(self):
+        sqlite3.Connection.close(self)
+
+
+class ServerDatabaseManager(DatabaseManager):
+    """DatabaseManager whose methods run on a pooled connection while a
+    session is open in the calling thread."""
+    def __init__(self, db_file, readers=DEFAULT_READERS):
+        self._local = threading.local()
+        super().__init__(db_file)
+        self._writer = self._open_pooled(read_only=False)
+        self._writer.execute('PRAGMA journal_mode = WAL')
+        self._writer_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self._open_pooled(read_only=True))
+
+    def _open_pooled(self, read_only):
+        conn = sqlite3.connect(self.db_file, factory=_PooledConnection, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys = ON')
+        if read_only:
+            conn.execute('PRAGMA query_only = ON')
+        return conn
+
+    def get_connection(self):
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            return conn
+        return super().get_connection()
+
+    @contextlib.contextmanager
+    def session(self, write):
+        """Run the DatabaseManager calls of this thread on the writer connection
+        (waiting for any other write to finish) or on a pooled reader."""
+        if write:
+            self._writer_lock.acquire()
+            conn = self._writer
+        else:
+            conn = self._readers.get()
+        conn.on_close = self._record_writes
+        changes = conn.total_changes
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            try:
+                # Whatever a failed call left behind must not leak into the next one
+                if conn.in_transaction:
+                    conn.rollback()
+                for row in conn.execute('PRAGMA database_list').fetchall():
+                    if row['name'] not in ('main', 'temp'):
+                        conn.execute(f'DETACH DATABASE {row["name"]}')
+                for row in conn.execute("SELECT name FROM temp.sqlite_master WHERE type = 'table'").fetchall():
+                    conn.execute(f'DROP TABLE temp.{row["name"]}')
+                conn.execute('PRAGMA foreign_keys = ON')
+                # Maintenance clears on_close so its own writes are not counted
+                if conn.on_close is not None and conn.total_changes > changes:
+                    self._record_writes(conn.total_changes - changes)
+            finally:
+                if write:
+                    self._writer_lock.release()
+                else:
+                    self._readers.put(conn)
+
+    def close(self):
+        self._writer.shutdown()
+        while not self._readers.empty():
+            self._readers.get().shutdown()
+
+
+class InvoiceRequestHandler(BaseHTTPRequestHandler):
+    server_version = "InvoiceServer/1.0"
+
+    @property
+    def db(self):
+        return self.server.db_manager
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.address_string(), format % args)
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorized(self):
+        token = self.server.token
+        if token and not hmac.compare_digest(self.headers.get(SERVER_TOKEN_HEADER, ""), token):
+            self.send_json(403, {"error": "Invalid or missing access token"})
+            return False
+        return True
+
+    def do_POST(self):
+        if not self.authorized():
+            return
+        match = re.fullmatch(r"/api/([a-z0-9_.]+)", self.path)
+        if not match:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        method = match.group(1)
+        if method == "server_info":
+            self.send_json(200, {"result": {
+                "schema_version": SCHEMA_VERSION,
+                "db_file": os.path.abspath(self.db.db_file),
+                "search_enabled": self.db.search_enabled,
+            }})
+            return
+        if method not in READ_METHODS and method not in WRITE_METHODS:
+            self.send_json(404, {"error": f"Unknown method {method}"})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            args, kwargs = request.get("args", []), request.get("kwargs", {})
+        except (ValueError, AttributeError) as e:
+            self.send_json(400, {"error": f"Invalid request: {e}"})
+            return
+
+        target = self.db
+        name = method
+        if method.startswith("gst_report."):
+            target = self.db.gst_report()
+            name = method.split(".", 1)[1]
+        try:
+            with self.db.session(write=method in WRITE_METHODS):
+                result = getattr(target, name)(*args, **kwargs)
+        except Exception as e:
+            logger.exception("%s failed", method)
+            self.send_json(500, {"error": str(e)})
+            return
+        self.send_json(200, {"result": result})
+
+    def do_GET(self):
+        if not self.authorized():
+            return
+        url = urllib.parse.urlsplit(self.path)
+        match = re.fullmatch(r"/invoices/(\d+)\.pdf", url.path)
+        if not match:
+            self.send_json(404, {"error": f"Unknown path {url.path}"})
+            return
+        profile = urllib.parse.parse_qs(url.query).get("profile", [DEFAULT_PDF_PROFILE])[0]
+        if profile not in PDF_PROFILES:
+            self.send_json(400, {"error": f"Unknown profile {profile}"})
+            return
+
+        with self.db.session(write=False):
+            invoice = self.db.get_invoice_details(int(match.group(1)))
+        if not invoice:
+            self.send_json(404, {"error": "Invoice not found"})
+            return
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = generate_bill_pdf(invoice_pdf_data(invoice),
+                                         os.path.join(tmp_dir, f"{invoice['bill_number']}.pdf"),
+                                         profile=profile)
+                with open(path, "rb") as f:
+                    body = f.read()
+        except Exception as e:
+            logger.exception("Rendering invoice %s failed", invoice['bill_number'])
+            self.send_json(500, {"error": str(e)})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Disposition", f'inline; filename="{invoice["bill_number"]}.pdf"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class InvoiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, db_manager, token=None):
+        super().__init__(address, InvoiceRequestHandler)
+        self.db_manager = db_manager
+        self.token = token
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default="invoice_app.db", help="database file to serve")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on, 0.0.0.0 to accept other workstations")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="port to listen on")
+    parser.add_argument("--readers", type=int, default=DEFAULT_READERS, help="read connections in the pool")
+    parser.add_argument("--token", default=os.environ.get("INVOICE_APP_TOKEN"),
+                        help="access token clients must send (default: $INVOICE_APP_TOKEN)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    db_manager = ServerDatabaseManager(args.db, readers=args.readers)
+    db_manager.start_backup_scheduler(
+        on_backup=lambda path, error: logger.info("Backup %s", error or path))
+    db_manager.start_maintenance_scheduler(
+        on_maintenance=lambda entries, error: logger.info("Maintenance %s", error or entries))
+    server = InvoiceServer((args.host, args.port), db_manager, token=args.token)
+    logger.info("Serving %s on http://%s:%d", os.path.abspath(args.db), args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        db_manager.stop_backup_scheduler()
+        db_manager.stop_maintenance_scheduler()
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())